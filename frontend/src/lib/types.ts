@@ -48,11 +48,28 @@ export interface RetrievalStage {
 	steps: RetrievalStep[];
 }
 
+export interface ContextBudget {
+	max_tokens: number;
+	history_budget_tokens: number;
+	history_tokens: number;
+	history_turns_kept: number;
+	history_turns_dropped: number;
+	retrieved_budget_tokens: number;
+	retrieved_tokens: number;
+	chunks_kept: number;
+	chunks_truncated: number;
+	chunks_dropped: number;
+	duplicate_chunks_removed: number;
+	overlap_chars_removed: number;
+	total_tokens: number;
+}
+
 export interface ContextStage {
 	total_chunks: number;
 	total_chars: number;
 	sources: string[];
 	preview: string;
+	budget?: ContextBudget | null;
 }
 
 export interface ChatSource {
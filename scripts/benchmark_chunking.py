@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark corpus chunking: legacy serial path vs cached chunkers + process pool.
+
+The legacy path rebuilds a ``TextChunker`` for every document whose source
+config differs from the default and walks documents serially. The current
+path reuses chunkers per resolved config and fans documents out over a
+process pool. Both must produce identical chunks (ids, order and content).
+
+Usage:
+    python scripts/benchmark_chunking.py
+    python scripts/benchmark_chunking.py --workers 1 2 4 8 --repeat 3
+    python scripts/benchmark_chunking.py --output data/evals/benchmark_chunking.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+from src.ingestion.steps.chunking import config
+from src.ingestion.steps.chunking.core import TextChunker, chunk_documents
+
+
+def _legacy_chunk_documents(documents: list[dict]) -> list[dict]:
+    """Previous behaviour: serial walk, fresh TextChunker per non-default document."""
+    base = TextChunker()
+    cfg_map = TextChunker._resolve_config_map(config.get_source_chunk_configs())
+    structured = config.is_structured_chunking_enabled()
+    chunks: list[dict] = []
+    for doc in documents:
+        active_cfg = cfg_map.get(base._source_kind(doc.get("source", "unknown")), {})
+        doc_chunker = (
+            base
+            if base._matches_self_config(active_cfg)
+            else TextChunker(
+                chunk_size=int(active_cfg.get("chunk_size", base.chunk_size)),
+                chunk_overlap=int(active_cfg.get("chunk_overlap", base.chunk_overlap)),
+                strategy=str(active_cfg.get("strategy", base.strategy)),
+                min_chunk_size=int(active_cfg.get("min_chunk_size", base.min_chunk_size)),
+                embedding_model=str(active_cfg.get("embedding_model", base.embedding_model)),
+            )
+        )
+        chunks.extend(doc_chunker._chunk_document(doc, cfg_map, structured))
+    return chunks
+
+
+def _time(fn: Any, repeat: int) -> tuple[list[dict], float]:
+    timings = []
+    result: list[dict] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+
+def _load_corpus() -> list[dict]:
+    from src.ingestion.steps.load_markdown import get_markdown_documents
+    from src.ingestion.steps.load_pdfs import get_documents
+
+    return get_documents() + get_markdown_documents()
+
+
+def run_benchmark(documents: list[dict], workers: list[int], repeat: int) -> dict[str, Any]:
+    configs = config.get_source_chunk_configs()
+    baseline, baseline_seconds = _time(lambda: _legacy_chunk_documents(documents), repeat)
+    report: dict[str, Any] = {
+        "documents": len(documents),
+        "chunks": len(baseline),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "legacy_seconds": round(baseline_seconds, 4),
+        "runs": [],
+    }
+    for worker_count in workers:
+        chunks, seconds = _time(
+            lambda worker_count=worker_count: chunk_documents(
+                documents, source_chunk_configs=configs, max_workers=worker_count
+            ),
+            repeat,
+        )
+        report["runs"].append(
+            {
+                "workers": worker_count,
+                "seconds": round(seconds, 4),
+                "speedup": round(baseline_seconds / max(seconds, 1e-9), 2),
+                "documents_per_second": round(len(documents) / max(seconds, 1e-9), 1),
+                "identical_output": chunks == baseline,
+            }
+        )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark corpus chunking throughput")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, os.cpu_count() or 1],
+        help="Worker counts to benchmark (default: 1 and the CPU count)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per configuration (median)")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    print("Loading corpus...")
+    documents = _load_corpus()
+    report = run_benchmark(documents, args.workers, args.repeat)
+
+    print(f"Documents: {report['documents']}  chunks: {report['chunks']}")
+    print(f"Legacy serial path: {report['legacy_seconds']:.3f}s")
+    for run in report["runs"]:
+        print(
+            f"workers={run['workers']:<3} {run['seconds']:.3f}s  "
+            f"speedup={run['speedup']}x  docs/s={run['documents_per_second']}  "
+            f"identical={run['identical_output']}"
+        )
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report written to {output}")
+
+
+if __name__ == "__main__":
+    main()
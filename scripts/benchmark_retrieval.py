@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Benchmark retrieval latency and throughput offline, with regression gates.
+
+Drives the golden dataset through ``retrieve_context_with_trace`` against a
+throwaway local Chroma index, with stubbed embedding and LLM services (see
+``src.evals.retrieval_benchmark``). Reports p50/p95/p99 per stage and overall,
+throughput and peak memory, then checks the results against
+``DEFAULT_BENCHMARK_THRESHOLDS`` in ``src/evals/assessment/thresholds.py`` and
+exits with status 1 when any gate fails.
+
+Latency, throughput and memory gates are ratios against a baseline recorded on
+the same machine with the same flags (``--update-baseline``, which replaces
+only the baseline runs for the configs it measured). A run without a matching
+baseline fails, because its ratio gates cannot be checked; pass
+``--allow-missing-baseline`` to only check it for errors, with a warning.
+
+Usage:
+    python scripts/benchmark_retrieval.py --update-baseline
+    python scripts/benchmark_retrieval.py
+    python scripts/benchmark_retrieval.py --concurrency 1 4 8 --repeat 5
+    python scripts/benchmark_retrieval.py --search-mode semantic_only --embedding-latency-ms 20
+    python scripts/benchmark_retrieval.py --output data/evals/benchmark_retrieval.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from src.evals.assessment.thresholds import (
+    DEFAULT_BENCHMARK_THRESHOLDS,
+    evaluate_benchmark_thresholds,
+)
+from src.evals.retrieval_benchmark import (
+    BENCHMARK_STAGES,
+    DEFAULT_BENCHMARK_BASELINE,
+    DEFAULT_BENCHMARK_DATASET,
+    find_baseline_run,
+    load_benchmark_queries,
+    merge_baseline_runs,
+    run_retrieval_benchmark,
+)
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    config = report["config"]
+    print(
+        f"\nconcurrency={config['concurrency']}  queries={config['queries']}x{config['repeat']}  "
+        f"corpus={config['corpus_documents']} chunks"
+    )
+    print(f"{'stage':<20} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    latency = report["latency_ms"]
+    for stage in (*BENCHMARK_STAGES, "total"):
+        summary = latency["total"] if stage == "total" else latency["stages"][stage]
+        print(
+            f"{stage:<20} {summary['p50_ms']:>9.2f} {summary['p95_ms']:>9.2f} "
+            f"{summary['p99_ms']:>9.2f} {summary['max_ms']:>9.2f}"
+        )
+    print(
+        f"throughput={report['throughput_qps']} q/s  "
+        f"peak_memory={report['peak_memory_mb']} MB  peak_rss={report['peak_rss_mb']} MB  "
+        f"errors={report['error_rate']:.1%}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline retrieval latency benchmark")
+    parser.add_argument(
+        "--queries",
+        default=str(DEFAULT_BENCHMARK_DATASET),
+        help="Golden fixture or cached dataset JSON",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[4],
+        help="Concurrent query threads; one run per value (default: 4)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the dataset")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed warm-up queries")
+    parser.add_argument("--top-k", type=int, default=5, help="Documents retrieved per query")
+    parser.add_argument(
+        "--search-mode",
+        default=None,
+        choices=["rrf_hybrid", "semantic_only", "bm25_only"],
+        help="Retrieval search mode (default: from settings)",
+    )
+    parser.add_argument("--documents-per-query", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic corpus seed")
+    parser.add_argument(
+        "--embedding-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated service time per stub embedding call",
+    )
+    parser.add_argument(
+        "--llm-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated service time per stub chat completion",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc memory pass")
+    parser.add_argument(
+        "--thresholds",
+        default=None,
+        help="JSON file of threshold overrides merged over the defaults",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BENCHMARK_BASELINE),
+        help="Baseline report the ratio gates compare against",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record the measured configs as the baseline for later runs",
+    )
+    parser.add_argument(
+        "--allow-missing-baseline",
+        action="store_true",
+        help="Warn instead of failing when a config has no baseline to compare against",
+    )
+    parser.add_argument(
+        "--no-gate", action="store_true", help="Report only; never fail on thresholds"
+    )
+    parser.add_argument("--output", default=None, help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    thresholds = dict(DEFAULT_BENCHMARK_THRESHOLDS)
+    if args.thresholds:
+        thresholds.update(json.loads(Path(args.thresholds).read_text(encoding="utf-8")))
+    retrieval_options = {"search_mode": args.search_mode} if args.search_mode else None
+    baseline_path = Path(args.baseline)
+    baseline_runs: list[dict[str, Any]] = []
+    if baseline_path.exists():
+        baseline_runs = json.loads(baseline_path.read_text(encoding="utf-8")).get("runs", [])
+
+    queries = load_benchmark_queries(Path(args.queries))
+    print(f"Loaded {len(queries)} queries from {args.queries}")
+    runs = []
+    missing_baseline = False
+    for concurrency in args.concurrency:
+        report = run_retrieval_benchmark(
+            queries,
+            concurrency=concurrency,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            top_k=args.top_k,
+            retrieval_options=retrieval_options,
+            documents_per_query=args.documents_per_query,
+            seed=args.seed,
+            embedding_latency_ms=args.embedding_latency_ms,
+            llm_latency_ms=args.llm_latency_ms,
+            measure_memory=not args.no_memory,
+        )
+        baseline = None if args.update_baseline else find_baseline_run(report, baseline_runs)
+        report["baseline_found"] = baseline is not None
+        report["failed_thresholds"] = evaluate_benchmark_thresholds(
+            report, thresholds, baseline=baseline
+        )
+        _print_report(report)
+        if baseline is None and not args.update_baseline:
+            missing_baseline = True
+            level = "WARNING" if args.allow_missing_baseline else "ERROR"
+            print(
+                f"  {level}: no matching baseline in {baseline_path}; latency, throughput "
+                "and memory gates NOT checked (record one with --update-baseline)"
+            )
+        for failure in report["failed_thresholds"]:
+            ratio = f" ratio={failure['ratio']}" if "ratio" in failure else ""
+            print(
+                f"  REGRESSION {failure['metric']}={failure['value']}{ratio} "
+                f"({failure['threshold_op']} {failure['threshold_value']})"
+            )
+        runs.append(report)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"thresholds": thresholds, "runs": runs}
+        output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"Report written to {output}")
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        merged = merge_baseline_runs(baseline_runs, runs)
+        baseline_path.write_text(json.dumps({"runs": merged}, indent=2), encoding="utf-8")
+        print(f"Baseline for {len(runs)} config(s) written to {baseline_path}")
+
+    if args.no_gate:
+        return 0
+    if any(run["failed_thresholds"] for run in runs):
+        print("Retrieval benchmark regressed past thresholds")
+        return 1
+    if missing_baseline and not args.allow_missing_baseline:
+        print(
+            "Retrieval benchmark has no baseline to gate against; run with --update-baseline "
+            "first or pass --allow-missing-baseline"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,6 +37,12 @@ def main() -> None:
         action="store_true",
         help="Run retrieval-only studies without the answer-eval reruns for winners",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Concurrent read-only assessment runs (default: up to 4; 1 = serial)",
+    )
     parser.add_argument(
         "--summary-dir",
         default="data/evals_feature_ablation_summary",
@@ -50,6 +56,7 @@ def main() -> None:
         dataset_path=args.dataset_path,
         dataset_split=args.dataset_split,
         include_answer_eval_for_winner=not args.skip_winner_answer_eval,
+        max_workers=args.max_workers,
     )
     markdown_path, json_path = write_feature_ablation_outputs(summary, Path(args.summary_dir))
     print(f"Wrote feature ablation summary: {markdown_path}")
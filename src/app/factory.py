@@ -48,6 +48,7 @@ from src.app.routes import (
 from src.app.security import validate_security_configuration
 from src.config import settings
 from src.infra.di import get_container, reset_container
+from src.infra.llm.client_registry import aclose_pooled_clients, close_pooled_clients
 from src.infra.storage import FileChatHistoryStore
 from src.rag import initialize_runtime_index_async
 
@@ -77,6 +78,7 @@ async def lifespan(app: FastAPI):
         - Load vector index into memory for fast retrieval
 
     Shutdown tasks:
+        - Close pooled LLM/embedding HTTP clients
         - Reset container for clean shutdown
     """
     # Startup
@@ -106,6 +108,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutting down")
+    await aclose_pooled_clients()
+    close_pooled_clients()
     reset_container()
 
 
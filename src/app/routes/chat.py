@@ -15,7 +15,6 @@ Example request:
       }'
 """
 
-import json
 import logging
 
 from fastapi import APIRouter, Query, Request
@@ -24,6 +23,7 @@ from fastapi.responses import Response, StreamingResponse
 from src.app.logging import log_event
 from src.app.schemas import ChatRequest
 from src.app.session import ensure_chat_session, get_chat_session_id
+from src.app.streaming import coalesce_token_stream, encode_sse_event
 from src.config import settings
 from src.usecases.chat import stream_chat_message
 
@@ -32,67 +32,91 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _dump_sources(sources_data: list) -> list:
+    if sources_data and hasattr(sources_data[0], "model_dump"):
+        return [s.model_dump() if hasattr(s, "model_dump") else s for s in sources_data]
+    return sources_data
+
+
+def _terminal_event(request: Request, **fields) -> bytes:
+    return encode_sse_event(
+        {
+            "content": "",
+            "done": True,
+            **fields,
+            "request_id": getattr(request.state, "request_id", None),
+        }
+    )
+
+
 async def chat_stream_generator(
     request: Request,
     payload: ChatRequest,
     include_pipeline: bool,
+    coalesce_ms: int | None = None,
+    coalesce_max_chars: int | None = None,
 ):
     sent_terminal_event = False
+    window_ms = settings.api.chat_stream_coalesce_ms if coalesce_ms is None else coalesce_ms
+    max_chars = (
+        settings.api.chat_stream_coalesce_max_chars
+        if coalesce_max_chars is None
+        else coalesce_max_chars
+    )
     try:
         session_id = request.state.chat_session_id or get_chat_session_id(request) or "default"
         llm_client = getattr(request.app.state, "llm_client", None)
         history_store = request.app.state.chat_history_store
 
-        async for content, metadata in stream_chat_message(
+        events = stream_chat_message(
             llm_client=llm_client,
             history_store=history_store,
             message=payload.message,
             session_id=session_id,
             include_pipeline=include_pipeline,
             top_k=5,
+        )
+        async for content, metadata in coalesce_token_stream(
+            events, window_ms=window_ms, max_chars=max_chars
         ):
             if content:
-                event = json.dumps({"content": content, "done": False})
-                yield f"data: {event}\n\n"
+                yield encode_sse_event({"content": content, "done": False})
+
+            if not metadata.get("done") and "sources" in metadata:
+                yield encode_sse_event(
+                    {
+                        "content": "",
+                        "done": False,
+                        "sources": _dump_sources(metadata["sources"]),
+                    },
+                    event="sources",
+                )
 
             if metadata.get("done"):
-                sources_data = metadata.get("sources", [])
-                if sources_data and hasattr(sources_data[0], "model_dump"):
-                    sources_data = [
-                        s.model_dump() if hasattr(s, "model_dump") else s for s in sources_data
-                    ]
+                sources_data = _dump_sources(metadata.get("sources", []))
                 pipeline_data = metadata.get("pipeline")
                 if pipeline_data is not None and hasattr(pipeline_data, "model_dump"):
                     pipeline_data = pipeline_data.model_dump()
                 try:
-                    event = json.dumps(
-                        {
-                            "content": "",
-                            "done": True,
-                            "sources": sources_data,
-                            "pipeline": pipeline_data,
-                            "error": metadata.get("error"),
-                            "error_code": metadata.get("error_code"),
-                            "request_id": getattr(request.state, "request_id", None),
-                        }
+                    event = _terminal_event(
+                        request,
+                        sources=sources_data,
+                        pipeline=pipeline_data,
+                        error=metadata.get("error"),
+                        error_code=metadata.get("error_code"),
                     )
                     sent_terminal_event = True
-                    yield f"data: {event}\n\n"
+                    yield event
                 except GeneratorExit:
                     raise
                 except Exception:
                     logger.exception("Failed to serialize SSE event")
-                    error_event = json.dumps(
-                        {
-                            "content": "",
-                            "done": True,
-                            "error": "Serialization error",
-                            "error_code": "sse_serialization_failed",
-                            "request_id": getattr(request.state, "request_id", None),
-                        }
-                    )
                     sent_terminal_event = True
-                    yield f"data: {error_event}\n\n"
+                    yield _terminal_event(
+                        request,
+                        error="Serialization error",
+                        error_code="sse_serialization_failed",
+                    )
 
     except GeneratorExit:
         raise
@@ -109,16 +133,7 @@ async def chat_stream_generator(
             auth_key_id=getattr(getattr(request.state, "auth", None), "key_id", None),
         )
         if not sent_terminal_event:
-            error_event = json.dumps(
-                {
-                    "content": "",
-                    "done": True,
-                    "error": "An error occurred",
-                    "error_code": "chat_failed",
-                    "request_id": getattr(request.state, "request_id", None),
-                }
-            )
-            yield f"data: {error_event}\n\n"
+            yield _terminal_event(request, error="An error occurred", error_code="chat_failed")
 
 
 @router.post(
@@ -133,13 +148,25 @@ async def chat(
         False,
         description="Include detailed pipeline trace with timing information for debugging",
     ),
+    coalesce_ms: int | None = Query(
+        None,
+        ge=0,
+        le=1000,
+        description="Token coalescing window in milliseconds (0 = one frame per token)",
+    ),
+    coalesce_max_chars: int | None = Query(
+        None,
+        ge=1,
+        le=16384,
+        description="Flush a coalesced frame once it holds this many characters",
+    ),
 ):
     response = Response()
     ensure_chat_session(request, response)
     headers = {k: v for k, v in dict(response.headers).items() if k.lower() != "content-length"}
 
     return StreamingResponse(
-        chat_stream_generator(request, payload, include_pipeline),
+        chat_stream_generator(request, payload, include_pipeline, coalesce_ms, coalesce_max_chars),
         media_type="text/event-stream",
         headers=headers,
     )
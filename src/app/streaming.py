@@ -0,0 +1,144 @@
+"""Server-Sent Events framing and token coalescing for streamed chat responses.
+
+LLM streams arrive one token at a time. Emitting one SSE frame per token means
+one JSON encode, one allocation and one socket write per token. This module
+provides:
+
+    - ``encode_sse_event``: frames a payload as ``data: ...\\n\\n`` bytes using
+      orjson when installed (falls back to compact ``json.dumps``)
+    - ``coalesce_token_stream``: buffers tokens from ``stream_chat_message``
+      and flushes them as one frame per time window or size limit
+
+Example:
+    async for content, metadata in coalesce_token_stream(stream, window_ms=30):
+        yield encode_sse_event({"content": content, "done": False})
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+StreamEvent = tuple[str, dict[str, Any]]
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_sse_event(payload: dict[str, Any], event: str | None = None) -> bytes:
+    """Frame ``payload`` as a single SSE ``data:`` event, optionally named."""
+    if orjson is not None:
+        body = orjson.dumps(payload, default=_json_default)
+    else:
+        body = json.dumps(payload, separators=(",", ":"), default=_json_default).encode()
+    if event:
+        return b"event: " + event.encode() + b"\ndata: " + body + b"\n\n"
+    return b"data: " + body + b"\n\n"
+
+
+def _is_plain_token(metadata: dict[str, Any]) -> bool:
+    return metadata.keys() <= {"done"} and not metadata.get("done")
+
+
+async def coalesce_token_stream(
+    events: AsyncIterator[StreamEvent],
+    *,
+    window_ms: int,
+    max_chars: int,
+) -> AsyncIterator[StreamEvent]:
+    """Merge consecutive token events into larger ones.
+
+    Buffered text is flushed when ``window_ms`` has elapsed since the first
+    buffered token, when the buffer reaches ``max_chars``, before any event
+    that carries metadata (sources, done, errors), and when the stream ends.
+    A ``window_ms`` of 0 passes events through unchanged.
+
+    Args:
+        events: ``(content, metadata)`` events as produced by ``stream_chat_message``
+        window_ms: Maximum time a token may wait in the buffer
+        max_chars: Flush as soon as the buffer holds this many characters
+
+    Yields:
+        ``(content, metadata)`` events with token runs merged
+    """
+    if window_ms <= 0:
+        async for event in events:
+            yield event
+        return
+
+    loop = asyncio.get_running_loop()
+    window = window_ms / 1000.0
+    iterator = aiter(events)
+    buffer: list[str] = []
+    buffered_chars = 0
+    deadline: float | None = None
+    pending: asyncio.Future[StreamEvent] | None = None
+    # Every step of ``events`` runs in this one copy of the caller's context,
+    # as it would when iterated inline, so request context (trace, stage
+    # timings) reaches it and variables it sets persist across its yields.
+    step_context = contextvars.copy_context()
+
+    def flush() -> StreamEvent:
+        nonlocal buffered_chars, deadline
+        content = "".join(buffer)
+        buffer.clear()
+        buffered_chars = 0
+        deadline = None
+        return content, {"done": False}
+
+    try:
+        while True:
+            if pending is None:
+                pending = loop.create_task(anext(iterator), context=step_context)
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield flush()
+                continue
+
+            finished, pending = pending, None
+            try:
+                content, metadata = finished.result()
+            except StopAsyncIteration:
+                if buffer:
+                    yield flush()
+                return
+            except BaseException:
+                if buffer:
+                    yield flush()
+                raise
+
+            if not _is_plain_token(metadata):
+                if buffer:
+                    yield flush()
+                yield content, metadata
+                continue
+
+            if not content:
+                continue
+            buffer.append(content)
+            buffered_chars += len(content)
+            if deadline is None:
+                deadline = loop.time() + window
+            if buffered_chars >= max_chars:
+                yield flush()
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pending
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -200,6 +200,12 @@ def main() -> None:
         default=None,
         help="Max parallel workers (default: number of variants)",
     )
+    parser.add_argument(
+        "--stage-workers",
+        type=int,
+        default=None,
+        help="Workers for the concurrent L0-L5 step checks (default: CPU count; 1 = serial)",
+    )
     args = parser.parse_args()
     provided_flags = _provided_flags(sys.argv[1:])
 
@@ -408,6 +414,7 @@ def main() -> None:
         run_reranking_ablations=args.run_reranking_ablations,
         run_diversity_sweep=args.run_diversity_sweep,
         diversity_sweep=diversity_sweep,
+        stage_workers=args.stage_workers,
     )
     _print_assessment_result(result)
     raise SystemExit(1 if result.status == "failed" else 0)
@@ -13,47 +13,67 @@ def run_pipeline(
     skip_download: bool = False,
     force_rebuild: bool = False,
     force_html_convert: bool = False,
+    incremental_html_convert: bool = False,
     enable_hype: bool = False,
     enable_keyword_extraction: bool = False,
     enable_chunk_summaries: bool = False,
     parallel_cores: int = 1,
+    dry_run: bool = False,
+    use_cache: bool = True,
 ) -> None:
-    """Run the full offline corpus refresh pipeline."""
+    """Run the full offline corpus refresh pipeline.
+
+    Stage outputs (parsed PDFs, chunks, HyPE/enrichment results, embeddings)
+    are cached by content hash and config, so only changed sources are
+    recomputed. With ``dry_run`` nothing is downloaded, computed or written;
+    the per-stage reuse/recompute counts are printed instead. With
+    ``incremental_html_convert``, HTML whose conversion inputs changed since
+    the last run is re-converted even when its markdown already exists.
+    """
     print("=" * 70)
-    print("RAG DATA PIPELINE")
+    print("RAG DATA PIPELINE" + (" (dry run)" if dry_run else ""))
     print("=" * 70)
     print()
 
     total_start = time.time()
 
     from src.config import settings
+    from src.ingestion.stage_cache import (
+        StageCache,
+        chunk_documents_cached,
+        enrich_chunks_cached,
+        generate_hype_questions_cached,
+        plan_embeddings,
+    )
     from src.rag import initialize_runtime_index
 
+    cache = StageCache(enabled=use_cache, dry_run=dry_run)
+
     print("[1/5] Downloading content...")
-    if not skip_download:
+    if dry_run:
+        print("  Dry run - skipping downloads and HTML conversion")
+    elif not skip_download:
         from src.ingestion.steps.convert_html import main as html_to_md_main
         from src.ingestion.steps.download_pdfs import main as download_pdfs_main
         from src.ingestion.steps.download_web import main as download_web_main
 
         asyncio.run(download_web_main())
         asyncio.run(download_pdfs_main())
-        html_to_md_main(force=force_html_convert)
+        html_to_md_main(force=force_html_convert, incremental=incremental_html_convert)
     print()
 
     print("[2/5] Loading documents...")
     from src.ingestion.steps.load_markdown import get_markdown_documents
-    from src.ingestion.steps.load_pdfs import get_documents
+    from src.ingestion.steps.load_pdfs import PDFLoader
 
-    pdf_docs = get_documents()
+    pdf_docs = PDFLoader().load_all_pdfs(cache=cache)
     markdown_docs = get_markdown_documents()
     print(f"  Loaded {len(pdf_docs)} PDF documents, {len(markdown_docs)} Markdown docs")
     print()
 
     print("[3/5] Chunking documents...")
-    from src.ingestion.steps.chunk_text import chunk_documents
-
-    chunks = chunk_documents(pdf_docs)
-    markdown_chunks = chunk_documents(markdown_docs)
+    chunks = chunk_documents_cached(pdf_docs, cache)
+    markdown_chunks = chunk_documents_cached(markdown_docs, cache)
     chunks.extend(markdown_chunks)
     print(f"  Created {len(chunks)} chunks")
     print()
@@ -61,13 +81,13 @@ def run_pipeline(
     if enable_hype:
         print("[4/5] Generating HyPE questions...")
         from src.infra.llm.qwen_client import get_client
-        from src.ingestion.steps.hype import generate_hype_questions_for_chunks
 
         hype_client = get_client()
         hype_questions = asyncio.run(
-            generate_hype_questions_for_chunks(
-                chunks=chunks,
-                client=hype_client,
+            generate_hype_questions_cached(
+                chunks,
+                hype_client,
+                cache,
                 sample_rate=settings.hyde.hype_sample_rate,
                 max_chunks=settings.hyde.hype_max_chunks,
                 questions_per_chunk=settings.hyde.hype_questions_per_chunk,
@@ -82,13 +102,14 @@ def run_pipeline(
     if enable_keyword_extraction or enable_chunk_summaries:
         print("[4/5] Enriching chunks...")
         from src.infra.llm.qwen_client import get_client
-        from src.ingestion.steps.enrich_chunks import apply_enrichment_to_chunks, enrich_chunks
+        from src.ingestion.steps.enrich_chunks import apply_enrichment_to_chunks
 
         enrich_client = get_client()
         enrichment_results = asyncio.run(
-            enrich_chunks(
-                chunks=chunks,
-                client=enrich_client,
+            enrich_chunks_cached(
+                chunks,
+                enrich_client,
+                cache,
                 enable_keywords=enable_keyword_extraction,
                 enable_summaries=enable_chunk_summaries,
                 sample_rate=settings.enrichment.keyword_extraction_sample_rate,
@@ -118,16 +139,32 @@ def run_pipeline(
     all_docs = chunks + ref_docs
     print(f"  Total documents to embed: {len(all_docs)}")
     vector_store = get_vector_store()
+    if dry_run:
+        plan_embeddings(
+            all_docs,
+            cache,
+            embedding_model=vector_store.embedding_model,
+            existing_hashes=set() if force_rebuild else set(vector_store.content_hashes),
+        )
+        print()
+        print("Dry run - stage cache plan:")
+        print(cache.format_summary())
+        return
     if force_rebuild:
         print("  Force rebuild - clearing vector store...")
         vector_store.clear()
-    add_stats = vector_store.add_documents(all_docs)
+    add_stats = vector_store.add_documents(all_docs, embedding_cache=cache)
     print(
         f"  Vector store: attempted={add_stats['attempted']} "
         f"inserted={add_stats['inserted']} "
-        f"skipped_duplicate_id={add_stats['skipped_duplicate_id']}"
+        f"skipped_duplicate_id={add_stats['skipped_duplicate_id']} "
+        f"embedded={add_stats['embedded']} "
+        f"embedding_cache_hits={add_stats['embedding_cache_hits']}"
     )
     print()
+    print("  Stage cache:")
+    print(cache.format_summary())
+    print()
 
     initialize_runtime_index(rebuild=False)
 
@@ -147,8 +184,13 @@ def run_hamilton_pipeline(
     enable_keyword_extraction: bool = False,
     enable_chunk_summaries: bool = False,
     parallel_cores: int = 1,
+    use_cache: bool = True,
 ) -> None:
-    """Run using Hamilton DAG for parallel execution."""
+    """Run using Hamilton DAG for parallel execution.
+
+    Parse, chunk, enrich and embed nodes share the same content-addressed
+    stage cache as ``run_pipeline`` unless ``use_cache`` is False.
+    """
     print("=" * 70)
     print("RAG DATA PIPELINE (Hamilton DAG)")
     print("=" * 70)
@@ -167,6 +209,7 @@ def run_hamilton_pipeline(
         enable_chunk_summaries=enable_chunk_summaries,
         force_rebuild=force_rebuild,
         parallel_cores=parallel_cores,
+        use_stage_cache=use_cache,
     )
 
     if not skip_download:
@@ -212,6 +255,11 @@ def main() -> None:
         action="store_true",
         help="Force re-convert HTML to Markdown (overwrite existing)",
     )
+    parser.add_argument(
+        "--incremental-html",
+        action="store_true",
+        help="Re-convert only HTML whose content, config or extractor changed since the last run",
+    )
     parser.add_argument(
         "--enable-hype",
         action="store_true",
@@ -233,6 +281,16 @@ def main() -> None:
         default=1,
         help="Number of cores for parallel execution (default: 1)",
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report which sources each stage would recompute without running it",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the ingestion stage cache and recompute every stage",
+    )
     parser.add_argument(
         "--visualize",
         action="store_true",
@@ -249,7 +307,7 @@ def main() -> None:
         print("DAG visualization saved to dag.png")
         return
 
-    if args.parallel > 1:
+    if args.parallel > 1 and not args.dry_run:
         run_hamilton_pipeline(
             skip_download=args.skip_download,
             force_rebuild=args.force,
@@ -257,6 +315,7 @@ def main() -> None:
             enable_keyword_extraction=args.enable_keyword_extraction,
             enable_chunk_summaries=args.enable_chunk_summaries,
             parallel_cores=args.parallel,
+            use_cache=not args.no_cache,
         )
         return
 
@@ -264,10 +323,13 @@ def main() -> None:
         skip_download=args.skip_download,
         force_rebuild=args.force,
         force_html_convert=args.force_html,
+        incremental_html_convert=args.incremental_html,
         enable_hype=args.enable_hype,
         enable_keyword_extraction=args.enable_keyword_extraction,
         enable_chunk_summaries=args.enable_chunk_summaries,
         parallel_cores=args.parallel,
+        dry_run=args.dry_run,
+        use_cache=not args.no_cache,
     )
 
 
@@ -6,8 +6,11 @@ from src.config.paths import (
     DATA_DIR,
     DATA_PROCESSED_DIR,
     DATA_RAW_DIR,
+    INGESTION_CACHE_DIR,
+    L3_CHUNKING_CACHE_DIR,
     PROJECT_ROOT,
     RATE_LIMIT_DB,
+    SYNTHETIC_QUESTIONS_CHECKPOINT_PATH,
 )
 from src.config.settings import (
     ApiConfig,
@@ -32,8 +35,11 @@ __all__ = [
     "DATA_DIR",
     "DATA_PROCESSED_DIR",
     "DATA_RAW_DIR",
+    "INGESTION_CACHE_DIR",
+    "L3_CHUNKING_CACHE_DIR",
     "PROJECT_ROOT",
     "RATE_LIMIT_DB",
+    "SYNTHETIC_QUESTIONS_CHECKPOINT_PATH",
     "VECTOR_DIR",
     "ApiConfig",
     "AppConfig",
@@ -8,6 +8,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
 DATA_RAW_DIR = PROJECT_ROOT / settings.storage.data_dir
 DATA_PROCESSED_DIR = DATA_DIR / "processed"
+INGESTION_CACHE_DIR = DATA_DIR / "cache" / "ingestion"
+SYNTHETIC_QUESTIONS_CHECKPOINT_PATH = DATA_DIR / "cache" / "evals" / "synthetic_questions.json"
+L3_CHUNKING_CACHE_DIR = DATA_DIR / "cache" / "evals" / "l3_chunking"
 CHROMA_PERSIST_DIRECTORY = PROJECT_ROOT / settings.storage.chroma_persist_directory
 CHAT_HISTORY_FILE = DATA_DIR / "chat_history.json"
 RATE_LIMIT_DB = DATA_DIR / "rate_limits.db"
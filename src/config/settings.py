@@ -42,6 +42,11 @@ class ApiConfig(BaseModel):
     chat_session_cookie_max_age_seconds: int = 2592000
     chat_history_ttl_seconds: int = 2592000
     chat_history_max_messages_per_session: int = 100
+    chat_stream_coalesce_ms: int = 30
+    chat_stream_coalesce_max_chars: int = 512
+    chat_context_max_tokens: int = 6000
+    chat_history_max_tokens: int = 1500
+    chat_context_min_chunk_tokens: int = 64
     trust_proxy_headers: bool = False
 
 
@@ -61,6 +66,10 @@ class LLMConfig(BaseModel):
     judge_model_heavy_litellm: str = "google/gemma-4-31b-it"
     judge_temperature: float = 0.0
     judge_max_tokens: int = 1024
+    http_max_connections: int = 64
+    http_max_keepalive_connections: int = 16
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True
 
 
 class StorageConfig(BaseModel):
@@ -95,6 +104,9 @@ class HyDEConfig(BaseModel):
     hype_sample_rate: float = 0.1
     hype_max_chunks: int = 500
     hype_questions_per_chunk: int = 2
+    hype_concurrency: int = 8
+    hype_timeout_seconds: float = 30.0
+    hype_max_retries: int = 2
 
 
 class EnrichmentConfig(BaseModel):
@@ -107,6 +119,10 @@ class EnrichmentConfig(BaseModel):
 class RetryConfig(BaseModel):
     max_retries: int = 3
     retry_delay: float = 1.0
+    max_delay: float = 20.0
+    jitter: bool = True
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_reset_seconds: float = 30.0
 
 
 class DeepEvalConfig(BaseModel):
@@ -122,6 +138,9 @@ class DeepEvalConfig(BaseModel):
     deepeval_cache_dir: str = "data/evals/cache"
     deepeval_cache_schema_version: int = 2
     deepeval_faithfulness_truths_limit: int = 8
+    retrieval_eval_concurrency: int = 4
+    synthetic_generation_concurrency: int = 8
+    synthetic_generation_timeout_seconds: float = 60.0
 
 
 class WandbConfig(BaseModel):
@@ -155,6 +174,11 @@ class Settings(BaseSettings):
         "chat_session_cookie_max_age_seconds": ("api", "chat_session_cookie_max_age_seconds"),
         "chat_history_ttl_seconds": ("api", "chat_history_ttl_seconds"),
         "chat_history_max_messages_per_session": ("api", "chat_history_max_messages_per_session"),
+        "chat_stream_coalesce_ms": ("api", "chat_stream_coalesce_ms"),
+        "chat_stream_coalesce_max_chars": ("api", "chat_stream_coalesce_max_chars"),
+        "chat_context_max_tokens": ("api", "chat_context_max_tokens"),
+        "chat_history_max_tokens": ("api", "chat_history_max_tokens"),
+        "chat_context_min_chunk_tokens": ("api", "chat_context_min_chunk_tokens"),
         "trust_proxy_headers": ("api", "trust_proxy_headers"),
         "llm_provider": ("llm", "provider"),
         "model_name": ("llm", "model_name"),
@@ -171,6 +195,10 @@ class Settings(BaseSettings):
         "judge_model_heavy_litellm": ("llm", "judge_model_heavy_litellm"),
         "judge_temperature": ("llm", "judge_temperature"),
         "judge_max_tokens": ("llm", "judge_max_tokens"),
+        "http_max_connections": ("llm", "http_max_connections"),
+        "http_max_keepalive_connections": ("llm", "http_max_keepalive_connections"),
+        "http_keepalive_expiry_seconds": ("llm", "http_keepalive_expiry_seconds"),
+        "http2_enabled": ("llm", "http2_enabled"),
         "collection_name": ("storage", "collection_name"),
         "data_dir": ("storage", "data_dir"),
         "chroma_persist_directory": ("storage", "chroma_persist_directory"),
@@ -196,14 +224,27 @@ class Settings(BaseSettings):
         "hype_sample_rate": ("hyde", "hype_sample_rate"),
         "hype_max_chunks": ("hyde", "hype_max_chunks"),
         "hype_questions_per_chunk": ("hyde", "hype_questions_per_chunk"),
+        "hype_concurrency": ("hyde", "hype_concurrency"),
+        "hype_timeout_seconds": ("hyde", "hype_timeout_seconds"),
+        "hype_max_retries": ("hyde", "hype_max_retries"),
         "enable_keyword_extraction": ("enrichment", "enable_keyword_extraction"),
         "enable_chunk_summaries": ("enrichment", "enable_chunk_summaries"),
         "keyword_extraction_sample_rate": ("enrichment", "keyword_extraction_sample_rate"),
         "keyword_extraction_max_chunks": ("enrichment", "keyword_extraction_max_chunks"),
         "max_retries": ("retry", "max_retries"),
         "retry_delay": ("retry", "retry_delay"),
+        "retry_max_delay": ("retry", "max_delay"),
+        "retry_jitter": ("retry", "jitter"),
+        "circuit_breaker_failure_threshold": ("retry", "circuit_breaker_failure_threshold"),
+        "circuit_breaker_reset_seconds": ("retry", "circuit_breaker_reset_seconds"),
         "deepeval_query_concurrency": ("deepeval", "deepeval_query_concurrency"),
         "deepeval_metric_concurrency": ("deepeval", "deepeval_metric_concurrency"),
+        "retrieval_eval_concurrency": ("deepeval", "retrieval_eval_concurrency"),
+        "synthetic_generation_concurrency": ("deepeval", "synthetic_generation_concurrency"),
+        "synthetic_generation_timeout_seconds": (
+            "deepeval",
+            "synthetic_generation_timeout_seconds",
+        ),
         "deepeval_metric_timeout_seconds": ("deepeval", "deepeval_metric_timeout_seconds"),
         "deepeval_answer_cache_enabled": ("deepeval", "deepeval_answer_cache_enabled"),
         "deepeval_metric_cache_enabled": ("deepeval", "deepeval_metric_cache_enabled"),
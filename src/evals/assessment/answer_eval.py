@@ -17,6 +17,7 @@ from deepeval.test_case import LLMTestCase
 
 from src.config import settings
 from src.evals.artifacts import to_serializable
+from src.evals.cache_store import CacheTable, EvalCacheStore, open_eval_cache_store
 from src.evals.metrics import mean
 from src.evals.metrics import medical as medical_metrics
 from src.ingestion.indexing.vector_store import get_vector_store_runtime_config
@@ -69,46 +70,6 @@ def _cache_key(payload: dict[str, Any]) -> str:
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
 
-def _load_cache_entries(cache_path: Path | None) -> dict[str, Any]:
-    if cache_path is None or not cache_path.exists():
-        return {}
-    try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
-    except Exception as e:
-        logger.debug("Failed to load cache entries from %s: %s", cache_path, e)
-        return {}
-    if not isinstance(payload, dict):
-        return {}
-    version = int(getattr(settings.deepeval, "deepeval_cache_schema_version", 1))
-    if int(payload.get("schema_version", version)) != version:
-        return {}
-    entries = payload.get("entries", {})
-    return entries if isinstance(entries, dict) else {}
-
-
-def _write_cache_entries(cache_path: Path | None, cache_data: dict[str, Any]) -> None:
-    if cache_path is None:
-        return
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "schema_version": int(getattr(settings.deepeval, "deepeval_cache_schema_version", 1)),
-        "entries": to_serializable(cache_data),
-    }
-    cache_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
-
-
-def _resolve_cache_paths(
-    cache_dir: Path | None,
-) -> tuple[Path | None, Path | None, Path | None]:
-    if cache_dir is None:
-        return None, None, None
-    return (
-        cache_dir / "retrieval_cache.json",
-        cache_dir / "generation_cache.json",
-        cache_dir / "metric_cache.json",
-    )
-
-
 def _trace_to_dict(trace: Any) -> dict[str, Any]:
     if hasattr(trace, "model_dump"):
         payload = trace.model_dump()
@@ -124,8 +85,8 @@ async def _prepare_answer_case(
     top_k: int,
     retrieval_options: dict[str, Any] | None,
     runtime_signature: dict[str, Any],
-    retrieval_cache: dict[str, Any],
-    generation_cache: dict[str, Any],
+    retrieval_cache: CacheTable | dict[str, Any],
+    generation_cache: CacheTable | dict[str, Any],
     cache_enabled: bool,
     semaphore: asyncio.Semaphore,
 ) -> AnswerQualityCase:
@@ -297,7 +258,7 @@ async def _evaluate_case_metrics(
     case: AnswerQualityCase,
     *,
     runtime_signature: dict[str, Any],
-    metric_cache: dict[str, Any],
+    metric_cache: CacheTable | dict[str, Any],
     metric_cache_enabled: bool,
     metric_concurrency: int,
 ) -> tuple[dict[str, dict[str, Any]], dict[str, float | None], bool]:
@@ -397,15 +358,20 @@ async def evaluate_answer_quality_async(
     cache_enabled = bool(settings.deepeval.deepeval_answer_cache_enabled)
     metric_cache_enabled = bool(settings.deepeval.deepeval_metric_cache_enabled)
     resolved_cache_dir = cache_dir or Path(settings.deepeval.deepeval_cache_dir)
-    retrieval_cache_path, generation_cache_path, _ = _resolve_cache_paths(
-        resolved_cache_dir if cache_enabled else None
-    )
-    _, _, metric_cache_path = _resolve_cache_paths(
-        resolved_cache_dir if metric_cache_enabled else None
-    )
-    retrieval_cache = _load_cache_entries(retrieval_cache_path) if cache_enabled else {}
-    generation_cache = _load_cache_entries(generation_cache_path) if cache_enabled else {}
-    metric_cache = _load_cache_entries(metric_cache_path) if metric_cache_enabled else {}
+    cache_store: EvalCacheStore | None = None
+    if cache_enabled or metric_cache_enabled:
+        cache_store = open_eval_cache_store(
+            resolved_cache_dir,
+            schema_version=int(getattr(settings.deepeval, "deepeval_cache_schema_version", 1)),
+        )
+    retrieval_cache: CacheTable | dict[str, Any] = {}
+    generation_cache: CacheTable | dict[str, Any] = {}
+    metric_cache: CacheTable | dict[str, Any] = {}
+    if cache_store is not None and cache_enabled:
+        retrieval_cache = cache_store.table("retrieval")
+        generation_cache = cache_store.table("generation")
+    if cache_store is not None and metric_cache_enabled:
+        metric_cache = cache_store.table("metric")
     runtime_signature = _runtime_signature(
         top_k,
         retrieval_options=retrieval_options,
@@ -453,7 +419,12 @@ async def evaluate_answer_quality_async(
         }
 
     results: list[dict[str, Any]] = []
-    for result in await asyncio.gather(*[_evaluate_item(item) for item in dataset]):
+    try:
+        evaluated = await asyncio.gather(*[_evaluate_item(item) for item in dataset])
+    finally:
+        if cache_store is not None:
+            cache_store.close()
+    for result in evaluated:
         score_updates = result.pop("_score_updates", {})
         scored_this_query = False
         for metric_key, score in score_updates.items():
@@ -467,12 +438,6 @@ async def evaluate_answer_quality_async(
             query_count_scored += 1
         results.append(result)
 
-    if cache_enabled:
-        _write_cache_entries(retrieval_cache_path, retrieval_cache)
-        _write_cache_entries(generation_cache_path, generation_cache)
-    if metric_cache_enabled:
-        _write_cache_entries(metric_cache_path, metric_cache)
-
     aggregate = _aggregate_metric_results(
         score_buckets, error_buckets, len(results), query_count_scored
     )
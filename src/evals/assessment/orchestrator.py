@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 import json
 import logging
 import os
@@ -35,6 +36,7 @@ from .l6_contract import (  # noqa: E402
     SUMMARY_L6_METRICS_KEY,
     SUMMARY_L6_STATUS_KEY,
 )
+from .provenance_index import PROVENANCE_INDEX_FILENAME, ProvenanceIndex  # noqa: E402
 from .reporting import git_head, render_summary, sha256_file  # noqa: E402
 from .retrieval_eval import (  # noqa: E402
     evaluate_retrieval,
@@ -46,6 +48,7 @@ from .retrieval_eval import (  # noqa: E402
     run_reranking_ablations,
     run_retrieval_ablations,
 )
+from .stage_scheduler import Stage, run_stages  # noqa: E402
 from .thresholds import DEFAULT_THRESHOLDS, evaluate_thresholds  # noqa: E402
 
 __all__ = ["evaluate_answer_quality", "run_assessment"]
@@ -62,6 +65,20 @@ def _load_json_if_exists(path: Path) -> Any:
     return payload
 
 
+def _accepts_kwarg(fn: Callable[..., Any], name: str) -> bool:
+    """Whether ``fn`` can be called with keyword ``name`` (injected stage checks
+    may predate newer optional arguments)."""
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.kind is inspect.Parameter.VAR_KEYWORD
+        or (p.name == name and p.kind is not inspect.Parameter.POSITIONAL_ONLY)
+        for p in parameters
+    )
+
+
 def _load_failed_thresholds_for_run(run_dir: Path) -> list[dict[str, Any]]:
     summary = _load_json_if_exists(run_dir / "summary.json")
     failed = summary.get("failed_thresholds") if isinstance(summary, dict) else None
@@ -102,13 +119,21 @@ def _build_input_provenance(
     dataset_path: Path | None,
     raw_data_dir: Path,
     sha256_file_fn: Callable[[str | Path | None], str | None],
+    provenance_index: ProvenanceIndex | None = None,
 ) -> dict[str, Any]:
-    snapshot = _directory_snapshot(raw_data_dir)
+    if provenance_index is None:
+        snapshot = _directory_snapshot(raw_data_dir)
+        snapshot_sha256 = build_run_identity(config=snapshot, git_head=None)
+    else:
+        snapshot, snapshot_sha256 = provenance_index.directory_snapshot(raw_data_dir)
+        # Cached digests are only valid for the real hasher, not injected ones.
+        if sha256_file_fn is sha256_file:
+            sha256_file_fn = provenance_index.file_sha256
     return {
         "dataset_file_sha256": sha256_file_fn(dataset_path),
         "download_manifest_sha256": sha256_file_fn(raw_data_dir / "download_manifest.json"),
         "raw_data_snapshot": snapshot,
-        "raw_data_snapshot_sha256": build_run_identity(config=snapshot, git_head=None),
+        "raw_data_snapshot_sha256": snapshot_sha256,
     }
 
 
@@ -146,6 +171,8 @@ def run_assessment(
     diversity_sweep: dict[str, Any] | None = None,
     skip_ingestion: bool = False,
     experiment_config: dict[str, Any] | None = None,
+    stage_workers: int | None = None,
+    provenance_index: ProvenanceIndex | None = None,
     audit_l0_download_fn: Callable[[], dict[str, Any]] | None = None,
     assess_l1_html_markdown_quality_fn: Callable[[], dict[str, Any]] | None = None,
     assess_l2_pdf_quality_fn: Callable[[], dict[str, Any]] | None = None,
@@ -181,7 +208,10 @@ def run_assessment(
     sha256_file_fn: Callable[[str | Path | None], str | None] = sha256_file,
 ) -> AssessmentResult:
     start = time.time()
-    from src.ingestion.indexing.vector_store import set_vector_store_runtime_config
+    from src.ingestion.indexing.vector_store import (
+        read_collection_state,
+        set_vector_store_runtime_config,
+    )
     from src.ingestion.steps.chunk_text import (
         set_source_chunk_configs,
         set_structured_chunking_enabled,
@@ -242,11 +272,15 @@ def run_assessment(
     )
     config_payload = asdict(config)
     git_revision = git_head_fn()
+    if provenance_index is None:
+        provenance_index = ProvenanceIndex(config.artifact_dir / PROVENANCE_INDEX_FILENAME)
     input_provenance = _build_input_provenance(
         dataset_path=config.dataset_path,
         raw_data_dir=DATA_RAW_DIR,
         sha256_file_fn=sha256_file_fn,
+        provenance_index=provenance_index,
     )
+    provenance_index.save()
     run_identity = build_run_identity(
         config={"assessment": config_payload, "input_provenance": input_provenance},
         git_head=git_revision,
@@ -285,23 +319,20 @@ def run_assessment(
     else:
         embedding_index = config.experiment_config.get("embedding_index", {})
         vector_config = experiment_runtime.get("vector_store", {})
-        vector_path = Path("data/vectors") / (
-            f"{vector_config.get('collection_name', settings.storage.collection_name)}.json"
+        # Collection-level metadata only; the index itself is not loaded.
+        index_state = read_collection_state(
+            vector_config.get("collection_name", settings.storage.collection_name)
+        )
+        index_exists = bool(index_state and index_state["count"])
+        existing_index_hash = (
+            index_state["index_metadata"].get("index_config_hash")
+            if index_state and index_exists
+            else None
         )
-        existing_index_hash = None
-        if vector_path.exists():
-            try:
-                payload = json.loads(vector_path.read_text(encoding="utf-8"))
-                existing_index_hash = (payload.get("index_metadata", {}) or {}).get(
-                    "index_config_hash"
-                )
-            except Exception as e:
-                logger.debug("Failed to load vector index hash from %s: %s", vector_path, e)
-                existing_index_hash = None
         rebuild_policy = str(embedding_index.get("rebuild_policy", "if_missing_or_stale")).lower()
         should_rebuild = rebuild_policy == "always"
         if rebuild_policy in {"if_missing_or_stale", "auto"}:
-            should_rebuild = (not vector_path.exists()) or (
+            should_rebuild = (not index_exists) or (
                 existing_index_hash != config.experiment_config.get("index_config_hash")
             )
         if rebuild_policy == "never" and existing_index_hash not in {
@@ -343,26 +374,49 @@ def run_assessment(
         or assess_l5_index_quality_fn is None
     ):
         raise ValueError("Assessment stage functions must be provided")
-    audit_l0 = audit_l0_download_fn
-    assess_l1 = assess_l1_html_markdown_quality_fn
-    assess_l2 = assess_l2_pdf_quality_fn
-    assess_l3 = assess_l3_chunking_quality_fn
-    assess_l4 = assess_l4_reference_quality_fn
-    assess_l5 = assess_l5_index_quality_fn
-    step_metrics = {
-        "l0": audit_l0(),
-        "l1": assess_l1(),
-        "l2": assess_l2(),
-        "l3": assess_l3(),
-        "l4": assess_l4(),
-        "l5": assess_l5(collection_name=l5_collection_name) if l5_collection_name else assess_l5(),
+    # The checks read independent artifacts, so none depends on another.
+    step_metrics, step_timings = run_stages(
+        [
+            Stage("l0", audit_l0_download_fn),
+            Stage("l1", assess_l1_html_markdown_quality_fn),
+            Stage("l2", assess_l2_pdf_quality_fn),
+            Stage("l3", assess_l3_chunking_quality_fn),
+            Stage("l4", assess_l4_reference_quality_fn),
+            Stage(
+                "l5",
+                assess_l5_index_quality_fn,
+                kwargs={
+                    **({"collection_name": l5_collection_name} if l5_collection_name else {}),
+                    # Per-record index summaries stream to disk instead of memory.
+                    **(
+                        {"records_path": store.path("index_records.jsonl")}
+                        if _accepts_kwarg(assess_l5_index_quality_fn, "records_path")
+                        else {}
+                    ),
+                },
+            ),
+        ],
+        max_workers=stage_workers,
+    )
+    stage_timings = {
+        name: {
+            "wall_s": round(timing.wall_seconds, 3),
+            "cpu_s": round(timing.cpu_seconds, 3),
+            "executor": timing.executor,
+            "started_offset_s": round(timing.started_offset_seconds, 3),
+        }
+        for name, timing in step_timings.items()
     }
     step_findings: list[dict[str, Any]] = []
     for stage in step_metrics.values():
         step_findings.extend(stage.get("findings", []))
     l5_agg = step_metrics.get("l5", {}).get("aggregate", {})
     vector_path = l5_agg.get("vector_path")
-    vector_file_sha256 = sha256_file_fn(vector_path)
+    # The L5 check reports the store's incrementally maintained digest; hashing
+    # the legacy JSON snapshot is only a fallback for stores that lack one.
+    index_digest = l5_agg.get("index_digest")
+    vector_file_sha256 = None if index_digest else sha256_file_fn(vector_path)
+    index_fingerprint = index_digest or vector_file_sha256
 
     dataset_bundle = build_retrieval_dataset_fn(
         dataset_path=config.dataset_path,
@@ -377,7 +431,7 @@ def run_assessment(
             "experiment_index_config_hash": (
                 (config.experiment_config or {}).get("index_config_hash")
             ),
-            "vector_file_sha256": vector_file_sha256,
+            "index_fingerprint": index_fingerprint,
         },
         artifact_dir=config.artifact_dir,
         dataset_split=config.dataset_split,
@@ -487,7 +541,7 @@ def run_assessment(
                     (config.experiment_config or {}).get("index_config_hash")
                 ),
                 "experiment_variant": ((config.experiment_config or {}).get("variant_name")),
-                "vector_file_sha256": vector_file_sha256,
+                "index_fingerprint": index_fingerprint,
             },
         )
     elif config.disable_llm_judging:
@@ -526,14 +580,7 @@ def run_assessment(
             (config.experiment_config or {}).get("ingestion", {}).get("html_extractor_mode")
         ),
     }
-    index_metadata: dict[str, Any] = {}
-    if vector_path and Path(vector_path).exists():
-        try:
-            index_payload = json.loads(Path(vector_path).read_text(encoding="utf-8"))
-            index_metadata = index_payload.get("index_metadata", {}) or {}
-        except Exception as e:
-            logger.debug("Failed to load index metadata from %s: %s", vector_path, e)
-            index_metadata = {}
+    index_metadata: dict[str, Any] = dict(l5_agg.get("index_metadata") or {})
     manifest["index_provenance"] = {
         "collection_name": index_metadata.get("collection_name", settings.storage.collection_name),
         "vector_path": vector_path,
@@ -558,15 +605,18 @@ def run_assessment(
             )
         ),
         "observed_embedding_dim": l5_agg.get("embedding_dim"),
+        "index_digest": index_digest,
         "indexing_stats": index_preparation.get("indexing_stats", {}),
     }
     manifest["checksums"] = {
+        "index_digest": index_digest,
         "vector_file_sha256": vector_file_sha256,
         "dataset_file_sha256": sha256_file_fn(dataset_file),
     }
     store.write_json("manifest.json", manifest)
 
     store.write_json("step_metrics.json", step_metrics)
+    store.write_json("stage_timings.json", stage_timings)
     store.write_json("step_findings.json", step_findings)
     store.write_jsonl("html_metrics.jsonl", step_metrics["l1"].get("records", []))
     store.write_jsonl("pdf_metrics.jsonl", step_metrics["l2"].get("records", []))
@@ -594,6 +644,7 @@ def run_assessment(
     summary = {
         "run_dir": str(store.run_dir),
         "duration_s": round(time.time() - start, 3),
+        "stage_timings": stage_timings,
         "retrieval_metrics": retrieval_metrics,
         "retrieval_ablations": retrieval_ablations,
         "hype_ablations": hype_ablations,
@@ -0,0 +1,183 @@
+"""Persisted index that makes input-provenance snapshots incremental.
+
+``run_assessment`` fingerprints the raw data directory (path, size and mtime
+of every file) and hashes the download manifest and dataset on every run.
+``ProvenanceIndex`` remembers, per directory, its mtime and child listing
+from the previous run: directories whose mtime is unchanged reuse the cached
+listing instead of being re-listed, files are stat'ed once each (downloads
+overwrite files in place, which does not touch the directory mtime), and when
+no file or directory moved the previous snapshot digest is reused instead of
+re-serializing and hashing the whole snapshot. File hashes are reused while a
+file's size and mtime are unchanged.
+
+The resulting records are byte-identical to a full ``rglob`` walk: same entry
+order, same fields, symlinked files included and symlinked directories not
+followed.
+
+The index lives next to the runs it serves, as
+``<artifact_dir>/input_provenance_index.json``.
+
+Example:
+    index = ProvenanceIndex(artifact_dir / PROVENANCE_INDEX_FILENAME)
+    snapshot, snapshot_sha256 = index.directory_snapshot(DATA_RAW_DIR)
+    manifest_sha256 = index.file_sha256(DATA_RAW_DIR / "download_manifest.json")
+    index.save()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from src.evals.artifacts import build_run_identity
+from src.infra.json_store import read_json, write_json_atomic
+
+from .reporting import sha256_file
+
+logger = logging.getLogger(__name__)
+
+PROVENANCE_INDEX_VERSION = 1
+PROVENANCE_INDEX_FILENAME = "input_provenance_index.json"
+# Directories modified this recently may still change within the same mtime
+# tick, so their listings are not trusted on the next run.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class ProvenanceIndex:
+    """Directory listings, file stats and digests from the previous snapshot."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        payload = read_json(self.path, {})
+        if payload.get("version") != PROVENANCE_INDEX_VERSION:
+            payload = {}
+        self.roots: dict[str, Any] = dict(payload.get("roots", {}))
+        self.files: dict[str, Any] = dict(payload.get("files", {}))
+        self.stats = {"dirs_listed": 0, "dirs_reused": 0, "snapshot_digest_reused": False}
+
+    def directory_snapshot(self, dir_path: Path) -> tuple[dict[str, Any], str]:
+        """Return ``({"exists", "entries"}, snapshot_sha256)`` for ``dir_path``."""
+        dir_path = Path(dir_path)
+        if not dir_path.exists():
+            snapshot: dict[str, Any] = {"exists": False, "entries": []}
+            return snapshot, build_run_identity(config=snapshot, git_head=None)
+
+        cached = self.roots.get(str(dir_path), {})
+        cached_dirs: dict[str, Any] = cached.get("dirs", {})
+        dirs: dict[str, Any] = {}
+        entries: list[dict[str, Any]] = []
+        # A racy directory is left out of ``dirs``; it could still be racy (and
+        # changed) next run while ``dirs`` compares equal, so never reuse then.
+        skipped_racy = False
+        now_ns = time.time_ns()
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            abs_dir = os.path.join(dir_path, rel_dir) if rel_dir else str(dir_path)
+            try:
+                dir_mtime_ns = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                continue
+            previous = cached_dirs.get(rel_dir)
+            if previous is not None and previous["mtime_ns"] == dir_mtime_ns:
+                file_names = list(previous["files"])
+                subdirs = list(previous["subdirs"])
+                self.stats["dirs_reused"] += 1
+            else:
+                file_names, subdirs = _list_directory(abs_dir)
+                self.stats["dirs_listed"] += 1
+            file_stats: dict[str, list[int]] = {}
+            for name in file_names:
+                try:
+                    stat = os.stat(os.path.join(abs_dir, name))
+                except OSError:
+                    continue
+                file_stats[name] = [stat.st_size, stat.st_mtime_ns]
+                entries.append(
+                    {
+                        "path": os.path.join(rel_dir, name),
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                    }
+                )
+            if now_ns - dir_mtime_ns > _RACY_WINDOW_NS:
+                dirs[rel_dir] = {
+                    "mtime_ns": dir_mtime_ns,
+                    "files": file_stats,
+                    "subdirs": subdirs,
+                }
+            else:
+                skipped_racy = True
+            pending.extend(os.path.join(rel_dir, name) for name in subdirs)
+
+        entries.sort(key=lambda entry: entry["path"])
+        snapshot = {"exists": True, "entries": entries}
+        if cached.get("snapshot_sha256") and not skipped_racy and dirs == cached_dirs:
+            snapshot_sha256 = str(cached["snapshot_sha256"])
+            self.stats["snapshot_digest_reused"] = True
+        else:
+            snapshot_sha256 = build_run_identity(config=snapshot, git_head=None)
+        self.roots[str(dir_path)] = {"dirs": dirs, "snapshot_sha256": snapshot_sha256}
+        logger.debug(
+            "Provenance snapshot of %s: %d files, %d dirs listed, %d reused, digest reused=%s",
+            dir_path,
+            len(entries),
+            self.stats["dirs_listed"],
+            self.stats["dirs_reused"],
+            self.stats["snapshot_digest_reused"],
+        )
+        return snapshot, snapshot_sha256
+
+    def file_sha256(self, path: str | Path | None) -> str | None:
+        """``sha256_file`` with the digest reused while size and mtime are unchanged."""
+        if not path:
+            return None
+        file_path = Path(path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return sha256_file(file_path)
+        key = str(file_path.resolve())
+        cached = self.files.get(key)
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached["sha256"]
+        digest = sha256_file(file_path)
+        if digest is not None and time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            self.files[key] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+            }
+        return digest
+
+    def save(self) -> None:
+        try:
+            write_json_atomic(
+                self.path,
+                {"version": PROVENANCE_INDEX_VERSION, "roots": self.roots, "files": self.files},
+            )
+        except OSError as e:
+            logger.warning("Failed to persist provenance index %s: %s", self.path, e)
+
+
+def _list_directory(abs_dir: str) -> tuple[list[str], list[str]]:
+    files: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                # Matches ``Path.rglob``: symlinked directories are not followed,
+                # symlinks to files count as files.
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+    except OSError:
+        pass
+    return sorted(files), sorted(subdirs)
+
+
+__all__ = ["PROVENANCE_INDEX_FILENAME", "PROVENANCE_INDEX_VERSION", "ProvenanceIndex"]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.evals.metrics import (
@@ -88,12 +90,87 @@ def binary_unique_by_key(
     return out
 
 
+def _log_candidate_replay(
+    label: str, candidate_pools: dict[tuple, Any] | None, variants: int, queries: int
+) -> None:
+    if candidate_pools is not None:
+        logger.info(
+            "%s: %d candidate pools captured for %d variants x %d queries",
+            label,
+            len(candidate_pools),
+            variants,
+            queries,
+        )
+
+
+def _retrieve_all(
+    dataset: list[dict[str, Any]],
+    top_k: int,
+    retrieval_options: dict[str, Any] | None,
+    max_concurrency: int,
+    candidate_pools: dict[tuple, Any] | None = None,
+) -> list[tuple[str, list[Any], Any]]:
+    """Run retrieval for every query, in dataset order, on up to ``max_concurrency`` threads.
+
+    The first query runs alone so lazy index/model initialisation happens once
+    before the pool starts.
+    """
+    from src.rag.runtime import retrieve_context_with_trace
+
+    def retrieve(item: dict[str, Any]) -> tuple[str, list[Any], Any]:
+        if candidate_pools is not None:
+            return retrieve_context_with_trace(
+                item["query"],
+                top_k=top_k,
+                retrieval_options=retrieval_options,
+                candidate_pools=candidate_pools,
+            )
+        if retrieval_options:
+            return retrieve_context_with_trace(
+                item["query"], top_k=top_k, retrieval_options=retrieval_options
+            )
+        return retrieve_context_with_trace(item["query"], top_k=top_k)
+
+    if not dataset:
+        return []
+    results = [retrieve(dataset[0])]
+    if max_concurrency <= 1 or len(dataset) == 1:
+        results.extend(retrieve(item) for item in dataset[1:])
+        return results
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(dataset) - 1),
+        thread_name_prefix="retrieval-eval",
+    ) as pool:
+        results.extend(pool.map(retrieve, dataset[1:]))
+    return results
+
+
 def evaluate_retrieval(
     dataset: list[dict[str, Any]],
     top_k: int,
     retrieval_options: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
+    candidate_pools: dict[tuple, Any] | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    from src.rag.runtime import retrieve_context_with_trace
+    """Score retrieval over ``dataset``; queries run concurrently, rows keep dataset order.
+
+    ``max_concurrency`` defaults to ``settings.deepeval.retrieval_eval_concurrency``;
+    pass 1 for the serial path. Per-query metrics do not depend on it.
+    ``candidate_pools`` is shared across calls by sweeps to replay captured
+    pre-rerank candidates (see ``retrieve_context_with_trace``).
+    """
+    from src.config import settings
+
+    concurrency = max(
+        1,
+        int(
+            max_concurrency
+            if max_concurrency is not None
+            else settings.deepeval.retrieval_eval_concurrency
+        ),
+    )
+    wall_start = time.perf_counter()
+    retrievals = _retrieve_all(dataset, top_k, retrieval_options, concurrency, candidate_pools)
 
     rows: list[dict[str, Any]] = []
     hit_values: list[float] = []
@@ -140,14 +217,8 @@ def evaluate_retrieval(
     rerank_output_values: list[float] = []
     rerank_filtered_values: list[float] = []
 
-    for item in dataset:
+    for item, (context, sources, trace) in zip(dataset, retrievals, strict=True):
         query = item["query"]
-        if retrieval_options:
-            context, sources, trace = retrieve_context_with_trace(
-                query, top_k=top_k, retrieval_options=retrieval_options
-            )
-        else:
-            context, sources, trace = retrieve_context_with_trace(query, top_k=top_k)
         retrieved_docs = [
             doc.model_dump() if hasattr(doc, "model_dump") else doc
             for doc in trace.retrieval.documents
@@ -344,6 +415,14 @@ def evaluate_retrieval(
             "duplicate_source_ratio_mean": mean([r["duplicate_source_ratio"] for r in items]),
         }
 
+    wall_time_seconds = time.perf_counter() - wall_start
+    logger.info(
+        "Retrieval eval: %d queries in %.2fs (%.2f q/s, concurrency=%d)",
+        len(rows),
+        wall_time_seconds,
+        len(rows) / wall_time_seconds if rows else 0.0,
+        concurrency,
+    )
     aggregate = {
         "query_count": len(rows),
         "hit_rate_at_k": mean(hit_values),
@@ -399,6 +478,9 @@ def evaluate_retrieval(
         "by_difficulty": {k: _slice_aggregate(v) for k, v in sorted(by_difficulty.items())},
         "by_semantic_case": {k: _slice_aggregate(v) for k, v in sorted(by_semantic_case.items())},
         "contribution_analysis": retrieval_contribution,
+        "retrieval_concurrency": concurrency,
+        "wall_time_seconds": round(wall_time_seconds, 3),
+        "queries_per_second": round(len(rows) / wall_time_seconds, 2) if rows else 0.0,
     }
     return rows, aggregate
 
@@ -683,12 +765,21 @@ def run_reranking_ablations(
     top_k: int,
     *,
     base_options: dict[str, Any] | None = None,
+    replay_candidates: bool = True,
 ) -> dict[str, Any]:
-    """Run cross-encoder reranking ablation study."""
+    """Run cross-encoder reranking ablation study.
+
+    Variants differ only downstream of candidate retrieval, so by default each
+    query's candidate pool is captured once and replayed for every variant.
+    """
     outputs: dict[str, Any] = {}
+    candidate_pools: dict[tuple, Any] | None = {} if replay_candidates else None
     for name, options in reranking_ablation_configs(base_options):
-        _, metrics = evaluate_retrieval(dataset, top_k, retrieval_options=options)
+        _, metrics = evaluate_retrieval(
+            dataset, top_k, retrieval_options=options, candidate_pools=candidate_pools
+        )
         outputs[name] = metrics
+    _log_candidate_replay("Reranking ablations", candidate_pools, len(outputs), len(dataset))
     if "no_reranking" in outputs:
         baseline = outputs["no_reranking"]
         for name in outputs:
@@ -719,13 +810,21 @@ def run_diversity_sweep(
     overfetch_multipliers: list[int] | None = None,
     max_chunks_per_source_page_values: list[int] | None = None,
     max_chunks_per_source_values: list[int] | None = None,
+    replay_candidates: bool = True,
 ) -> list[dict[str, Any]]:
+    """Grid-search MMR/diversification caps, ranked by a hit-rate vs duplication tradeoff.
+
+    Only ``overfetch_multiplier`` changes the candidate pool, so by default the
+    pool is captured once per query and overfetch value and replayed for the
+    other sweep dimensions.
+    """
     lambdas = mmr_lambda_values or [0.5, 0.75, 0.9]
     overfetches = overfetch_multipliers or [2, 4]
     per_page_caps = max_chunks_per_source_page_values or [1, 2]
     per_source_caps = max_chunks_per_source_values or [2, 3]
     rows: list[dict[str, Any]] = []
     base = dict(base_options or {})
+    candidate_pools: dict[tuple, Any] | None = {} if replay_candidates else None
     for mmr_lambda in lambdas:
         for overfetch in overfetches:
             for per_page in per_page_caps:
@@ -739,7 +838,9 @@ def run_diversity_sweep(
                         "max_chunks_per_source_page": per_page,
                         "max_chunks_per_source": per_source,
                     }
-                    _, metrics = evaluate_retrieval(dataset, top_k, retrieval_options=opts)
+                    _, metrics = evaluate_retrieval(
+                        dataset, top_k, retrieval_options=opts, candidate_pools=candidate_pools
+                    )
                     rows.append(
                         {
                             "retrieval_options": opts,
@@ -757,6 +858,7 @@ def run_diversity_sweep(
                             ),
                         }
                     )
+    _log_candidate_replay("Diversity sweep", candidate_pools, len(rows), len(dataset))
     rows.sort(
         key=lambda r: (r["tradeoff_score"], r["exact_chunk_hit_rate"], r["evidence_hit_rate"]),
         reverse=True,
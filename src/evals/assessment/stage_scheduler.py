@@ -0,0 +1,239 @@
+"""Dependency-aware scheduler for the L0-L5 assessment stage checks.
+
+The step checks read independent artifacts (raw downloads, HTML/PDF
+artifacts, chunks, reference CSVs, the vector index), so ``run_assessment``
+runs them concurrently instead of one after another. Each stage declares the
+stages it depends on; a stage is submitted as soon as its dependencies have
+finished. Stage functions that can be pickled (the module-level checks) run
+in a process pool, so CPU-bound checks such as L2 PDF parsing and L3 chunking
+use separate cores; anything else (e.g. test lambdas) runs on a thread.
+Worker processes are spawned, never forked: by the time the stages run the
+parent has usually opened Chroma, and a forked child that touches the
+inherited client deadlocks. Workers receive the parent's runtime state and
+vector-store config explicitly, so checks see the same experiment
+configuration.
+
+Each stage's wall and CPU time are recorded in ``StageTiming``; stage outputs
+are identical to calling the functions serially. Inline and process-pool
+stages run alone in their process, so their CPU time is the process's
+``getrusage`` user+system time including child processes they waited for
+(e.g. a chunking pool). Thread stages share the parent process, so only their
+own thread's CPU time is available and subprocesses are not counted.
+
+Example:
+    results, timings = run_stages(
+        [
+            Stage("l0", audit_l0_download),
+            Stage("l3", assess_l3_chunking_quality),
+            Stage("l5", assess_l5_index_quality, kwargs={"collection_name": name}),
+        ],
+        max_workers=4,
+    )
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Chroma (and its sqlite/Rust internals) is not fork-safe once a client is open.
+_PROCESS_START_METHOD = "spawn"
+
+# Runtime-state keys that are not configuration and must not leak into workers.
+_NON_CONFIG_STATE_KEYS = {"vector_store_initialized", "vector_store_initialized_signature"}
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    fn: Callable[..., dict[str, Any]]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class StageTiming:
+    wall_seconds: float
+    cpu_seconds: float
+    executor: str
+    started_offset_seconds: float = 0.0
+
+
+def _runtime_config_snapshot() -> dict[str, Any]:
+    from src.config.context import RuntimeState, get_runtime_state
+    from src.ingestion.indexing.vector_store import get_vector_store_runtime_config
+
+    state = get_runtime_state().snapshot()
+    return {
+        "runtime_state": {
+            key: value
+            for key, value in state.items()
+            if key in RuntimeState._DEFAULTS and key not in _NON_CONFIG_STATE_KEYS
+        },
+        "vector_store_runtime_config": get_vector_store_runtime_config(),
+    }
+
+
+def _init_stage_worker(snapshot: dict[str, Any]) -> None:
+    from src.config.context import get_runtime_state
+    from src.ingestion.indexing.vector_store import set_vector_store_runtime_config
+
+    state = get_runtime_state()
+    for key, value in snapshot["runtime_state"].items():
+        setattr(state, key, value)
+    set_vector_store_runtime_config(snapshot["vector_store_runtime_config"] or None)
+
+
+def _process_cpu_seconds() -> float:
+    """User+system CPU time of this process and its terminated, waited-for children."""
+    if resource is None:  # pragma: no cover - Windows
+        return time.process_time()
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _run_stage(
+    fn: Callable[..., dict[str, Any]], kwargs: dict[str, Any], whole_process: bool = True
+) -> tuple[dict[str, Any], float, float]:
+    cpu_clock = _process_cpu_seconds if whole_process else time.thread_time
+    wall_start = time.perf_counter()
+    cpu_start = cpu_clock()
+    result = fn(**kwargs)
+    return result, time.perf_counter() - wall_start, cpu_clock() - cpu_start
+
+
+def _is_picklable(stage: Stage) -> bool:
+    try:
+        pickle.dumps((stage.fn, stage.kwargs))
+    except Exception:
+        return False
+    return True
+
+
+def _validate(stages: list[Stage]) -> None:
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names: {names}")
+    known = set(names)
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in known]
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} depends on unknown stages {missing}")
+    # Kahn's algorithm: every stage must become ready eventually.
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Stage dependency cycle among {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def run_stages(
+    stages: list[Stage],
+    *,
+    max_workers: int | None = None,
+) -> tuple[dict[str, dict[str, Any]], dict[str, StageTiming]]:
+    """Run ``stages`` respecting ``depends_on``; return results and timings by stage name.
+
+    ``max_workers`` defaults to ``min(len(stages), os.cpu_count())``; 1 runs every
+    stage inline in declaration order. The first stage failure is re-raised
+    after in-flight stages finish.
+    """
+    _validate(stages)
+    workers = max(1, int(max_workers or min(len(stages), os.cpu_count() or 1)))
+    run_start = time.perf_counter()
+    results: dict[str, dict[str, Any]] = {}
+    timings: dict[str, StageTiming] = {}
+
+    if workers <= 1:
+        done: set[str] = set()
+        pending = list(stages)
+        while pending:
+            stage = next(s for s in pending if set(s.depends_on) <= done)
+            pending.remove(stage)
+            offset = time.perf_counter() - run_start
+            results[stage.name], wall, cpu = _run_stage(stage.fn, stage.kwargs)
+            timings[stage.name] = StageTiming(wall, cpu, "inline", offset)
+            done.add(stage.name)
+        return {stage.name: results[stage.name] for stage in stages}, timings
+
+    process_stages = {stage.name for stage in stages if _is_picklable(stage)}
+    executors: dict[str, Executor] = {
+        "thread": ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(stages) - len(process_stages))),
+            thread_name_prefix="assessment-stage",
+        )
+    }
+    if process_stages:
+        executors["process"] = ProcessPoolExecutor(
+            max_workers=min(workers, len(process_stages)),
+            mp_context=multiprocessing.get_context(_PROCESS_START_METHOD),
+            initializer=_init_stage_worker,
+            initargs=(_runtime_config_snapshot(),),
+        )
+    in_flight: dict[Future, tuple[Stage, float]] = {}
+    waiting = list(stages)
+    first_error: BaseException | None = None
+    try:
+        while waiting or in_flight:
+            if first_error is None:
+                ready = [s for s in waiting if set(s.depends_on) <= results.keys()]
+                for stage in ready:
+                    waiting.remove(stage)
+                    kind = "process" if stage.name in process_stages else "thread"
+                    future = executors[kind].submit(
+                        _run_stage, stage.fn, stage.kwargs, kind == "process"
+                    )
+                    in_flight[future] = (stage, time.perf_counter() - run_start)
+            elif not in_flight:
+                break
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, offset = in_flight.pop(future)
+                try:
+                    results[stage.name], wall, cpu = future.result()
+                except BaseException as exc:
+                    logger.error("Assessment stage %s failed: %s", stage.name, exc)
+                    first_error = first_error or exc
+                    continue
+                executor = "process" if stage.name in process_stages else "thread"
+                timings[stage.name] = StageTiming(wall, cpu, executor, offset)
+    finally:
+        for pool in executors.values():
+            pool.shutdown(wait=True)
+    if first_error is not None:
+        raise first_error
+
+    total = time.perf_counter() - run_start
+    logger.info(
+        "Assessment stages finished in %.2fs (serial sum %.2fs, %d workers)",
+        total,
+        sum(timing.wall_seconds for timing in timings.values()),
+        workers,
+    )
+    return {stage.name: results[stage.name] for stage in stages}, timings
@@ -28,6 +28,22 @@ DEFAULT_THRESHOLDS: dict[str, dict[str, Any]] = {
     "l6.metric_error_rate": {"op": "max", "value": 0.10},
 }
 
+# Regression gates for scripts/benchmark_retrieval.py (offline retrieval latency).
+# Timing and memory gates are ratios of the run to a baseline report recorded
+# on the same machine with the same settings, so they hold on any hardware;
+# without a baseline they are skipped. The error rate is gated absolutely.
+DEFAULT_BENCHMARK_THRESHOLDS: dict[str, dict[str, Any]] = {
+    "retrieval_benchmark.total_p50_ms": {"op": "max_ratio", "value": 1.25},
+    "retrieval_benchmark.total_p95_ms": {"op": "max_ratio", "value": 1.5},
+    "retrieval_benchmark.total_p99_ms": {"op": "max_ratio", "value": 2.0},
+    "retrieval_benchmark.candidate_retrieval_p95_ms": {"op": "max_ratio", "value": 1.5},
+    "retrieval_benchmark.rerank_diversify_p95_ms": {"op": "max_ratio", "value": 1.5},
+    "retrieval_benchmark.throughput_qps": {"op": "min_ratio", "value": 0.8},
+    "retrieval_benchmark.peak_memory_mb": {"op": "max_ratio", "value": 1.25},
+    "retrieval_benchmark.error_rate": {"op": "max", "value": 0.0},
+}
+_RATIO_OPS = {"max_ratio": "max", "min_ratio": "min"}
+
 
 def flatten_stage_aggregates(step_metrics: dict[str, Any]) -> dict[str, Any]:
     flattened: dict[str, Any] = {}
@@ -63,7 +79,6 @@ def evaluate_thresholds(
     l6_answer_quality_metrics: dict[str, Any],
     thresholds: dict[str, Any],
 ) -> list[dict[str, Any]]:
-    failed: list[dict[str, Any]] = []
     lookup = flatten_stage_aggregates(step_metrics)
     for key, value in retrieval_metrics.items():
         if not isinstance(value, dict):
@@ -75,6 +90,67 @@ def evaluate_thresholds(
                 lookup[f"l6.{key}_error_rate"] = value.get("error_rate")
         elif not isinstance(value, dict):
             lookup[f"l6.{key}"] = value
+    return _failed_thresholds(lookup, thresholds)
+
+
+def flatten_benchmark_metrics(report: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a retrieval benchmark report into ``retrieval_benchmark.*`` metrics."""
+    prefix = "retrieval_benchmark"
+    latency = report.get("latency_ms", {})
+    flattened: dict[str, Any] = {}
+    for stage, summary in {"total": latency.get("total", {}), **latency.get("stages", {})}.items():
+        for key, value in summary.items():
+            if key.endswith("_ms") and summary.get("count"):
+                flattened[f"{prefix}.{stage}_{key}"] = value
+    for key in ("throughput_qps", "peak_memory_mb", "peak_rss_mb", "error_rate"):
+        if report.get(key) is not None:
+            flattened[f"{prefix}.{key}"] = report[key]
+    return flattened
+
+
+def evaluate_benchmark_thresholds(
+    report: dict[str, Any],
+    thresholds: dict[str, Any] | None = None,
+    baseline: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the benchmark metrics that regressed past ``thresholds``.
+
+    ``max_ratio``/``min_ratio`` gates compare the metric with the same metric
+    of ``baseline`` (an earlier report from the same machine and settings) and
+    are skipped when there is no baseline value; ``max``/``min`` gates are
+    absolute.
+    """
+    thresholds = DEFAULT_BENCHMARK_THRESHOLDS if thresholds is None else thresholds
+    current = flatten_benchmark_metrics(report)
+    reference = flatten_benchmark_metrics(baseline) if baseline else {}
+    failed: list[dict[str, Any]] = []
+    for key, threshold in thresholds.items():
+        op = threshold.get("op") if isinstance(threshold, dict) else None
+        if op not in _RATIO_OPS:
+            failed.extend(_failed_thresholds(current, {key: threshold}))
+            continue
+        if key not in current or not reference.get(key):
+            continue
+        ratio = float(current[key]) / float(reference[key])
+        passed, _, threshold_value = is_threshold_pass(
+            ratio, {"op": _RATIO_OPS[op], "value": threshold["value"]}
+        )
+        if not passed:
+            failed.append(
+                {
+                    "metric": key,
+                    "value": current[key],
+                    "baseline_value": reference[key],
+                    "ratio": round(ratio, 3),
+                    "threshold_op": op,
+                    "threshold_value": threshold_value,
+                }
+            )
+    return failed
+
+
+def _failed_thresholds(lookup: dict[str, Any], thresholds: dict[str, Any]) -> list[dict[str, Any]]:
+    failed: list[dict[str, Any]] = []
     for key, threshold in thresholds.items():
         if key not in lookup:
             continue
@@ -0,0 +1,236 @@
+"""SQLite key/value store for answer-evaluation caches.
+
+``answer_eval`` used to keep its retrieval, generation and metric caches as
+whole JSON files that were loaded up front and rewritten at the end of every
+run. ``EvalCacheStore`` keeps all three in one SQLite database instead: each
+lookup is a primary-key read and each write its own small transaction, so
+lookup cost stays flat as the caches grow and concurrent evaluation workers
+(threads or processes) can share the file safely. WAL mode lets readers
+proceed while a writer commits.
+
+Entries are namespaced ("retrieval", "generation", "metric") and tagged with
+the cache schema version; entries from another schema version read as misses.
+Existing JSON caches are imported with ``import_json``/``import_legacy_json_caches``.
+
+Example:
+    store = EvalCacheStore(cache_dir / "answer_eval_cache.sqlite3", schema_version=2)
+    store.import_legacy_json_caches(cache_dir)
+    metrics = store.table("metric")
+    cached = metrics.get(key)
+    metrics[key] = {"metrics": ..., "score_updates": ...}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.evals.artifacts import to_serializable
+
+logger = logging.getLogger(__name__)
+
+CACHE_DB_FILENAME = "answer_eval_cache.sqlite3"
+CACHE_NAMESPACES = ("retrieval", "generation", "metric")
+LEGACY_JSON_FILENAMES = {
+    "retrieval": "retrieval_cache.json",
+    "generation": "generation_cache.json",
+    "metric": "metric_cache.json",
+}
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class CacheTable:
+    """Dict-like view of one namespace (``get``, ``[key] = value``, ``len``)."""
+
+    def __init__(self, store: EvalCacheStore, namespace: str):
+        self.store = store
+        self.namespace = namespace
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.store.get(self.namespace, key)
+        return default if value is None else value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.store.put(self.namespace, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.store.get(self.namespace, key) is not None
+
+    def __len__(self) -> int:
+        return self.store.count(self.namespace)
+
+
+class EvalCacheStore:
+    """Transactional, content-hash keyed cache shared by answer-eval workers."""
+
+    def __init__(self, path: Path, *, schema_version: int):
+        self.path = Path(path)
+        self.schema_version = int(schema_version)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    schema_version INTEGER NOT NULL,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_imports (
+                    source_path TEXT PRIMARY KEY,
+                    source_mtime_ns INTEGER NOT NULL,
+                    entries INTEGER NOT NULL
+                )
+                """
+            )
+
+    def table(self, namespace: str) -> CacheTable:
+        return CacheTable(self, namespace)
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache_entries "
+                "WHERE namespace = ? AND key = ? AND schema_version = ?",
+                (namespace, key, self.schema_version),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError as e:
+            logger.debug("Corrupt %s cache entry %s: %s", namespace, key, e)
+            return None
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        self.put_many(namespace, {key: value})
+
+    def put_many(self, namespace: str, entries: dict[str, Any]) -> int:
+        """Write ``entries`` in a single transaction."""
+        now = time.time()
+        rows = [
+            (
+                namespace,
+                str(key),
+                self.schema_version,
+                json.dumps(to_serializable(value), ensure_ascii=False),
+                now,
+            )
+            for key, value in entries.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(namespace, key, schema_version, value, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def count(self, namespace: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ? AND schema_version = ?",
+                (namespace, self.schema_version),
+            ).fetchone()
+        return int(row[0])
+
+    def import_json(self, namespace: str, json_path: Path) -> int:
+        """Import a legacy ``{"schema_version", "entries"}`` JSON cache file.
+
+        Each file is imported once per modification time; entries whose schema
+        version differs from the store's are skipped, as the JSON loader did.
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return 0
+        mtime_ns = json_path.stat().st_mtime_ns
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source_mtime_ns FROM cache_imports WHERE source_path = ?",
+                (str(json_path.resolve()),),
+            ).fetchone()
+        if row is not None and int(row[0]) == mtime_ns:
+            return 0
+        try:
+            payload = json.loads(json_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning("Skipping unreadable cache file %s: %s", json_path, e)
+            return 0
+        entries: dict[str, Any] = {}
+        if isinstance(payload, dict) and (
+            int(payload.get("schema_version", self.schema_version)) == self.schema_version
+        ):
+            raw_entries = payload.get("entries", {})
+            entries = raw_entries if isinstance(raw_entries, dict) else {}
+        imported = self.put_many(namespace, entries) if entries else 0
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_imports (source_path, source_mtime_ns, entries) "
+                "VALUES (?, ?, ?)",
+                (str(json_path.resolve()), mtime_ns, imported),
+            )
+        if imported:
+            logger.info("Imported %d %s cache entries from %s", imported, namespace, json_path)
+        return imported
+
+    def import_legacy_json_caches(self, cache_dir: Path) -> dict[str, int]:
+        """Import ``retrieval_cache.json``/``generation_cache.json``/``metric_cache.json``."""
+        return {
+            namespace: self.import_json(namespace, Path(cache_dir) / filename)
+            for namespace, filename in LEGACY_JSON_FILENAMES.items()
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> EvalCacheStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def open_eval_cache_store(cache_dir: Path, *, schema_version: int) -> EvalCacheStore:
+    """Open the store in ``cache_dir``, importing any legacy JSON caches found there."""
+    store = EvalCacheStore(Path(cache_dir) / CACHE_DB_FILENAME, schema_version=schema_version)
+    store.import_legacy_json_caches(cache_dir)
+    return store
+
+
+__all__ = [
+    "CACHE_DB_FILENAME",
+    "CACHE_NAMESPACES",
+    "CacheTable",
+    "EvalCacheStore",
+    "open_eval_cache_store",
+]
@@ -1,4 +1,16 @@
-"""L1 HTML/Markdown quality checks."""
+"""L1 HTML/Markdown quality checks.
+
+The visible-text length of each page comes from the quality stats ingestion
+recorded in its artifact; the HTML is re-parsed (with the ingestion parser)
+only when the artifact is missing, was built from different bytes or with a
+different parser.
+
+``html_visible_chars`` (and the retention ratios derived from it) used to be
+measured with ``html.parser``; it is now measured with the ingestion parser,
+which can count slightly differently on malformed markup. Reports carry
+``html_visible_chars_version`` and ``html_visible_text_parser`` so runs
+measured before and after the switch are not compared as like for like.
+"""
 
 from __future__ import annotations
 
@@ -7,11 +19,14 @@ from collections import Counter
 from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
-
 from src.config import DATA_RAW_DIR
 from src.evals.checks.shared import count_false, safe_mean, safe_median
-from src.ingestion.artifacts import load_source_artifact
+from src.ingestion.artifacts import load_run_summary, load_source_artifact
+from src.ingestion.quality_stats import cached_quality_stats, source_content_hash
+from src.ingestion.steps.convert_html import HTML_PARSER, visible_text_chars
+
+# Version 2: visible text measured with the ingestion parser (was html.parser).
+HTML_VISIBLE_CHARS_VERSION = 2
 
 
 def _float_metric(value: Any, default: float = 0.0) -> float:
@@ -30,14 +45,18 @@ def assess_l1_html_markdown_quality(data_raw_dir: Path | None = None) -> dict[st
     empty_md = 0
     boilerplate_terms = ["cookie", "privacy", "menu", "navigation", "subscribe", "footer"]
 
+    stats_hits = 0
     for html_path in html_files:
         md_path = html_path.with_suffix(".md")
-        html_raw = html_path.read_text(encoding="utf-8", errors="ignore")
-        soup = BeautifulSoup(html_raw, "html.parser")
-        html_visible = soup.get_text("\n", strip=True)
-        html_chars = len(html_visible)
-        md_text = md_path.read_text(encoding="utf-8", errors="ignore") if md_path.exists() else ""
         artifact = load_source_artifact("html", html_path.stem) or {}
+        quality_stats = cached_quality_stats(artifact, source_content_hash(html_path))
+        if quality_stats is not None and quality_stats.get("html_parser") == HTML_PARSER:
+            html_chars = int(quality_stats["html_visible_chars"])
+            stats_hits += 1
+        else:
+            html_raw = html_path.read_text(encoding="utf-8", errors="ignore")
+            html_chars = visible_text_chars(html_raw)
+        md_text = md_path.read_text(encoding="utf-8", errors="ignore") if md_path.exists() else ""
         artifact_meta = artifact.get("metadata", {})
         structured_blocks = artifact.get("structured_blocks", [])
         md_chars = len(md_text.strip())
@@ -84,10 +103,16 @@ def assess_l1_html_markdown_quality(data_raw_dir: Path | None = None) -> dict[st
                 ),
                 "selected_extractor": artifact_meta.get("selected_extractor", "trafilatura"),
                 "cascade_depth": artifact_meta.get("cascade_depth", 1),
+                "timings_ms": artifact_meta.get("timings_ms") or {},
             }
         )
 
     cascade_depths = [int(r.get("cascade_depth", 1)) for r in records]
+    timing_values: dict[str, list[float]] = {}
+    for record in records:
+        for key, value in record["timings_ms"].items():
+            timing_values.setdefault(key, []).append(_float_metric(value))
+    run_summary = load_run_summary("html") or {}
     aggregate = {
         "pairs_evaluated": len(records),
         "markdown_missing_rate": (count_false(records, "md_exists") / len(records))
@@ -122,6 +147,14 @@ def assess_l1_html_markdown_quality(data_raw_dir: Path | None = None) -> dict[st
         ),
         "cascade_depth_mean": safe_mean([float(d) for d in cascade_depths]),
         "cascade_depth_distribution": dict(Counter(cascade_depths)),
+        "extractor_time_ms_mean": {
+            key: safe_mean(values) for key, values in sorted(timing_values.items())
+        },
+        "conversion_files_per_second": _float_metric(run_summary.get("files_per_second")),
+        "conversion_workers": int(run_summary.get("workers") or 0),
+        "quality_stats_hit_rate": (stats_hits / len(records)) if records else 0.0,
+        "html_visible_chars_version": HTML_VISIBLE_CHARS_VERSION,
+        "html_visible_text_parser": HTML_PARSER,
     }
     findings = []
     if _float_metric(aggregate.get("markdown_empty_rate")) > 0.1:
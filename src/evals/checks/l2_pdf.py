@@ -1,4 +1,10 @@
-"""L2 PDF quality checks."""
+"""L2 PDF quality checks.
+
+Per-page character counts come from the quality stats ingestion recorded
+while extracting each PDF with pypdf; a PDF is reopened with ``PdfReader``
+only when its artifact is missing, stale, or was extracted with another
+primary extractor.
+"""
 
 from __future__ import annotations
 
@@ -8,8 +14,9 @@ from typing import Any
 from pypdf import PdfReader
 
 from src.config import DATA_RAW_DIR
-from src.evals.checks.shared import safe_median
-from src.ingestion.artifacts import load_source_artifact
+from src.evals.checks.shared import safe_mean, safe_median
+from src.ingestion.artifacts import load_run_summary, load_source_artifact
+from src.ingestion.quality_stats import cached_quality_stats, source_content_hash
 
 
 def _float_metric(value: Any, default: float = 0.0) -> float:
@@ -20,6 +27,17 @@ def _float_metric(value: Any, default: float = 0.0) -> float:
     return default
 
 
+def _pypdf_page_stats(pdf_path: Path) -> tuple[list[int], int]:
+    reader = PdfReader(str(pdf_path))
+    per_page_chars: list[int] = []
+    replacement_chars = 0
+    for page in reader.pages:
+        text = page.extract_text() or ""
+        replacement_chars += text.count("\ufffd")
+        per_page_chars.append(len(text.strip()))
+    return per_page_chars, replacement_chars
+
+
 def assess_l2_pdf_quality(data_raw_dir: Path | None = None) -> dict[str, Any]:
     data_dir = Path(data_raw_dir or DATA_RAW_DIR)
     pdf_files = sorted(data_dir.glob("*.pdf"))
@@ -29,29 +47,30 @@ def assess_l2_pdf_quality(data_raw_dir: Path | None = None) -> dict[str, Any]:
     empty_pages = 0
     findings = []
 
+    stats_hits = 0
     for pdf_path in pdf_files:
-        try:
-            reader = PdfReader(str(pdf_path))
-        except Exception as exc:
-            findings.append(
-                {"severity": "error", "stage": "L2", "file": pdf_path.name, "message": str(exc)}
-            )
-            continue
         artifact = load_source_artifact("pdf", pdf_path.stem) or {}
         artifact_meta = artifact.get("metadata", {})
+        quality_stats = cached_quality_stats(artifact, source_content_hash(pdf_path))
+        if quality_stats is not None and quality_stats.get("text_extractor") == "pypdf":
+            per_page_chars = [int(c) for c in quality_stats["page_chars"]]
+            replacement_chars = int(quality_stats["replacement_chars"])
+            stats_hits += 1
+        else:
+            try:
+                per_page_chars, replacement_chars = _pypdf_page_stats(pdf_path)
+            except Exception as exc:
+                findings.append(
+                    {"severity": "error", "stage": "L2", "file": pdf_path.name, "message": str(exc)}
+                )
+                continue
 
-        per_page_chars: list[int] = []
-        replacement_chars = 0
         fallback_pages = 0
         low_conf_pages = 0
         ocr_required_pages = 0
         suspected_tables = 0
-        for page in reader.pages:
+        for chars in per_page_chars:
             total_pages += 1
-            text = page.extract_text() or ""
-            replacement_chars += text.count("\ufffd")
-            chars = len(text.strip())
-            per_page_chars.append(chars)
             if chars > 0:
                 extracted_pages += 1
             else:
@@ -68,7 +87,7 @@ def assess_l2_pdf_quality(data_raw_dir: Path | None = None) -> dict[str, Any]:
         records.append(
             {
                 "file": pdf_path.name,
-                "page_count": len(reader.pages),
+                "page_count": len(per_page_chars),
                 "extracted_page_count": sum(1 for c in per_page_chars if c > 0),
                 "empty_page_count": sum(1 for c in per_page_chars if c == 0),
                 "chars_per_page_median": safe_median([float(c) for c in per_page_chars]),
@@ -89,9 +108,16 @@ def assess_l2_pdf_quality(data_raw_dir: Path | None = None) -> dict[str, Any]:
                 "pdf_table_extractor": artifact_meta.get("pdf_table_extractor", "heuristic"),
                 "camelot_table_pages": artifact_meta.get("camelot_table_pages", 0),
                 "camelot_total_rows": artifact_meta.get("camelot_total_rows", 0),
+                "timings_ms": artifact_meta.get("timings_ms") or {},
             }
         )
 
+    timing_values: dict[str, list[float]] = {}
+    for record in records:
+        for key, value in record["timings_ms"].items():
+            timing_values.setdefault(key, []).append(_float_metric(value))
+    run_summary = load_run_summary("pdf") or {}
+
     aggregate = {
         "pdf_file_count": len(pdf_files),
         "total_pages": total_pages,
@@ -124,6 +150,12 @@ def assess_l2_pdf_quality(data_raw_dir: Path | None = None) -> dict[str, Any]:
         "pdf_table_extractor": list({r.get("pdf_table_extractor", "heuristic") for r in records}),
         "camelot_total_table_pages": sum(int(r.get("camelot_table_pages", 0)) for r in records),
         "camelot_total_rows": sum(int(r.get("camelot_total_rows", 0)) for r in records),
+        "extractor_time_ms_mean": {
+            key: safe_mean(values) for key, values in sorted(timing_values.items())
+        },
+        "extraction_files_per_second": _float_metric(run_summary.get("files_per_second")),
+        "extraction_workers": int(run_summary.get("workers") or 0),
+        "quality_stats_hit_rate": (stats_hits / len(records)) if records else 0.0,
     }
     if _float_metric(aggregate.get("empty_page_rate")) > 0.2:
         findings.append(
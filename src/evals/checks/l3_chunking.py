@@ -1,16 +1,33 @@
-"""L3 chunking quality checks."""
+"""L3 chunking quality checks.
+
+PDF documents come from the persisted L2 artifacts when their bytes and
+processor config are unchanged, so the corpus is only re-extracted on a miss.
+The report is cached under ``L3_CHUNKING_CACHE_DIR``, keyed by a fingerprint of
+the documents, the chunker parameters and the chunking flags, so the corpus is
+only re-chunked when one of them changes. The check never writes chunking
+results back into the artifacts.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import itertools
 from collections import Counter, defaultdict
+from pathlib import Path
 from typing import Any
 
+from src.config import L3_CHUNKING_CACHE_DIR
+from src.config.context import get_runtime_state
 from src.evals.checks.shared import longest_suffix_prefix_overlap, safe_mean, safe_median
+from src.infra.json_store import read_json, write_json_atomic
+from src.ingestion.stage_cache import fingerprint
 from src.ingestion.steps.chunk_text import TextChunker
+from src.ingestion.steps.chunking import config as chunking_config
 from src.ingestion.steps.load_pdfs import get_documents
 
+# Bump when the report below changes shape or meaning.
+L3_CACHE_VERSION = 1
+
 
 def _float_metric(value: Any, default: float = 0.0) -> float:
     if isinstance(value, bool):
@@ -20,77 +37,96 @@ def _float_metric(value: Any, default: float = 0.0) -> float:
     return default
 
 
+def _corpus_fingerprint(docs: list[dict[str, Any]], chunker: TextChunker) -> str:
+    """Key of one L3 report: the documents plus everything that changes their chunks."""
+    return fingerprint(
+        "l3_chunking",
+        L3_CACHE_VERSION,
+        chunker.params,
+        chunking_config.DEFAULT_SOURCE_CHUNK_CONFIGS,
+        chunking_config.is_structured_chunking_enabled(),
+        bool(get_runtime_state().auto_select_strategy),
+        [fingerprint(doc) for doc in docs],
+    )
+
+
 def assess_l3_chunking_quality(
     chunk_size: int = 800,
     chunk_overlap: int = 150,
+    cache_dir: Path | None = None,
 ) -> dict[str, Any]:
-    docs = get_documents()
+    docs = get_documents(reuse_artifacts=True)
     chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    chunks = chunker.chunk_documents(docs)
+    cache_path = Path(cache_dir or L3_CHUNKING_CACHE_DIR) / (
+        f"{_corpus_fingerprint(docs, chunker)}.json"
+    )
+    cached = read_json(cache_path)
+    if isinstance(cached, dict) and "aggregate" in cached:
+        return cached
+
     records: list[dict[str, Any]] = []
     duplicate_hashes: Counter[str] = Counter()
-    boundary_cut_count = 0
     overlap_values: list[int] = []
-    groups: dict[tuple[str, int | None], list[dict[str, Any]]] = defaultdict(list)
+    quality_scores: list[float] = []
+    boundary_cut_count = 0
+    section_path_count = 0
+    table_row_split_violations = 0
 
-    for chunk in chunks:
-        content = chunk.get("content", "")
-        chunk_hash = hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()
-        duplicate_hashes[chunk_hash] += 1
-        if content and content[-1].isalnum():
-            boundary_cut_count += 1
-        key = (str(chunk.get("source", "")), chunk.get("page"))
-        groups[key].append(chunk)
-        records.append(
-            {
-                "id": chunk.get("id"),
-                "source": chunk.get("source"),
-                "page": chunk.get("page"),
-                "length_chars": len(content),
-                "has_page": "page" in chunk,
-                "content_hash": chunk_hash[:16],
-                "ends_mid_token": bool(content and content[-1].isalnum()),
-            }
+    for doc_chunks in chunker.chunk_each_document(docs):
+        pages: dict[tuple[str, int | None], list[str]] = defaultdict(list)
+        for chunk in doc_chunks:
+            content = chunk.get("content", "")
+            pages[(str(chunk.get("source", "")), chunk.get("page"))].append(content)
+            chunk_hash = hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()
+            duplicate_hashes[chunk_hash] += 1
+            ends_mid_token = bool(content and content[-1].isalnum())
+            if ends_mid_token:
+                boundary_cut_count += 1
+            if chunk.get("section_path"):
+                section_path_count += 1
+            if chunk.get("content_type") == "table" and len(str(content).splitlines()) == 1:
+                table_row_split_violations += 1
+            quality_scores.append(_float_metric(chunk.get("quality_score", 1.0), 1.0))
+            records.append(
+                {
+                    "id": chunk.get("id"),
+                    "source": chunk.get("source"),
+                    "page": chunk.get("page"),
+                    "length_chars": len(content),
+                    "has_page": "page" in chunk,
+                    "content_hash": chunk_hash[:16],
+                    "ends_mid_token": ends_mid_token,
+                }
+            )
+        overlap_values.extend(
+            longest_suffix_prefix_overlap(a, b, chunk_overlap)
+            for group in pages.values()
+            for a, b in itertools.pairwise(group)
         )
 
-    for _, group in groups.items():
-        for first, second in itertools.pairwise(group):
-            a = first.get("content", "")
-            b = second.get("content", "")
-            overlap_values.append(longest_suffix_prefix_overlap(a, b, chunk_overlap))
-
+    chunk_count = len(records)
     lengths = [r["length_chars"] for r in records]
     duplicate_chunks = sum(count - 1 for count in duplicate_hashes.values() if count > 1)
     low_quality_excluded = 0
     aggregate = {
         "document_count": len(docs),
-        "chunk_count": len(chunks),
+        "chunk_count": chunk_count,
         "chunk_size_config": chunk_size,
         "chunk_overlap_config": chunk_overlap,
         "chunk_length_median": safe_median([float(x) for x in lengths]),
         "chunk_length_mean": safe_mean([float(x) for x in lengths]),
-        "duplicate_chunk_rate": (duplicate_chunks / len(chunks)) if chunks else 0.0,
-        "boundary_cut_rate": (boundary_cut_count / len(chunks)) if chunks else 0.0,
+        "duplicate_chunk_rate": (duplicate_chunks / chunk_count) if chunk_count else 0.0,
+        "boundary_cut_rate": (boundary_cut_count / chunk_count) if chunk_count else 0.0,
         "observed_overlap_mean": safe_mean([float(x) for x in overlap_values]),
-        "section_integrity_rate": (sum(1 for c in chunks if c.get("section_path")) / len(chunks))
-        if chunks
-        else 0.0,
-        "table_row_split_violations": sum(
-            1
-            for c in chunks
-            if c.get("content_type") == "table" and len(str(c.get("content", "")).splitlines()) == 1
-        ),
+        "section_integrity_rate": (section_path_count / chunk_count) if chunk_count else 0.0,
+        "table_row_split_violations": table_row_split_violations,
         "low_quality_chunk_exclusion_rate": (
-            low_quality_excluded / max(1, len(chunks) + low_quality_excluded)
+            low_quality_excluded / max(1, chunk_count + low_quality_excluded)
         ),
         "chunk_quality_histogram": {
-            "high": sum(
-                1 for c in chunks if _float_metric(c.get("quality_score", 1.0), 1.0) >= 0.8
-            ),
-            "medium": sum(
-                1 for c in chunks if 0.55 <= _float_metric(c.get("quality_score", 1.0), 1.0) < 0.8
-            ),
-            "low": sum(1 for c in chunks if _float_metric(c.get("quality_score", 1.0), 1.0) < 0.55),
+            "high": sum(1 for score in quality_scores if score >= 0.8),
+            "medium": sum(1 for score in quality_scores if 0.55 <= score < 0.8),
+            "low": sum(1 for score in quality_scores if score < 0.55),
         },
     }
     findings = []
@@ -98,4 +134,6 @@ def assess_l3_chunking_quality(
         findings.append(
             {"severity": "warning", "message": "Duplicate chunk rate exceeds 5%", "stage": "L3"}
         )
-    return {"aggregate": aggregate, "records": records, "findings": findings}
+    report = {"aggregate": aggregate, "records": records, "findings": findings}
+    write_json_atomic(cache_path, report)
+    return report
@@ -1,92 +1,188 @@
-"""L5 index quality checks."""
+"""L5 index quality checks.
+
+The check opens the Chroma collection read-only (it never creates one) and
+streams it page by page instead of loading the legacy
+``data/vectors/<collection>.json`` snapshot. Aggregates are folded in per
+page, so only one page of raw documents is in memory at a time; with
+``records_path`` the per-record summaries are appended to a JSONL file as
+well instead of being returned. Embeddings are fetched only for the
+embedding-dimension checks (``check_embeddings=True``), and only their
+lengths are kept. The index digest and content-hash count come from the
+collection metadata persisted at write time; indexes written before that are
+digested while they are streamed.
+
+Example:
+    report = assess_l5_index_quality(collection_name="medical_docs")
+    report["aggregate"]["index_digest"]
+"""
 
 from __future__ import annotations
 
 import json
 from collections import Counter
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
-from src.config import VECTOR_DIR, settings
+from src.config import VECTOR_DIR
+from src.ingestion.indexing.chroma_store import (
+    INDEX_PAGE_SIZE,
+    ChromaVectorStore,
+    extend_index_digest,
+    get_vector_store_runtime_config,
+    iter_collection_pages,
+    open_collection,
+    read_collection_state,
+)
+
+
+def _empty_index_report(coll: str, vector_path: Path) -> dict[str, Any]:
+    return {
+        "aggregate": {
+            "index_exists": False,
+            "collection_name": coll,
+            "vector_path": str(vector_path),
+        },
+        "records": [],
+        "findings": [
+            {
+                "severity": "warning",
+                "message": "Vector index collection is empty",
+                "stage": "L5",
+            }
+        ],
+    }
 
 
 def assess_l5_index_quality(
     vector_dir: Path | None = None,
     collection_name: str | None = None,
+    *,
+    vector_store: ChromaVectorStore | None = None,
+    check_embeddings: bool = True,
+    page_size: int = INDEX_PAGE_SIZE,
+    records_path: Path | None = None,
 ) -> dict[str, Any]:
     vdir = Path(vector_dir or VECTOR_DIR)
-    coll = collection_name or settings.storage.collection_name
+    coll = (
+        collection_name
+        or (vector_store.collection_name if vector_store is not None else None)
+        or get_vector_store_runtime_config()["collection_name"]
+    )
     vector_path = vdir / f"{coll}.json"
-    if not vector_path.exists():
-        return {
-            "aggregate": {"index_exists": False, "vector_path": str(vector_path)},
-            "records": [],
-            "findings": [
-                {"severity": "warning", "message": "Vector index file missing", "stage": "L5"}
-            ],
-        }
+    include = ("documents", "metadatas") + (("embeddings",) if check_embeddings else ())
+    if vector_store is not None:
+        if vector_store.count() == 0:
+            return _empty_index_report(coll, vector_path)
+        index_metadata = vector_store.index_metadata
+        stored_digest: str | None = vector_store.index_digest
+        stored_hashes_count: int | None = len(vector_store.content_hashes)
+        pages = vector_store.iter_index_pages(include=include, page_size=page_size)
+    else:
+        state = read_collection_state(coll)
+        collection = open_collection(coll) if state and state["count"] else None
+        if state is None or collection is None:
+            return _empty_index_report(coll, vector_path)
+        index_metadata = state["index_metadata"]
+        stored_digest = state["index_digest"]
+        stored_hashes_count = state["content_hashes_count"]
+        pages = iter_collection_pages(collection, include=include, page_size=page_size)
+
+    counts: Counter[str] = Counter()
+    dims: set[int] = set()
+    short_contents = 0
+    source_counter: Counter[str] = Counter()
+    source_type_counter: Counter[str] = Counter()
+    source_class_counter: Counter[str] = Counter()
+    streamed_digest = ""
+    streamed_hashes: set[str] = set()
+    records: list[dict[str, Any]] = []
+    with ExitStack() as stack:
+        records_file = None
+        if records_path is not None:
+            records_path = Path(records_path)
+            records_path.parent.mkdir(parents=True, exist_ok=True)
+            records_file = stack.enter_context(records_path.open("w", encoding="utf-8"))
+        for page in pages:
+            ids = page["ids"]
+            contents = page["documents"]
+            metadatas = page["metadatas"]
+            embeddings = page.get("embeddings", [])
+            counts["ids"] += len(ids)
+            counts["contents"] += len(contents)
+            counts["metadatas"] += len(metadatas)
+            counts["embeddings"] += len(embeddings)
+            lengths = [len(e) for e in embeddings if e is not None and len(e)]
+            dims.update(lengths)
+            short_contents += sum(1 for c in contents if isinstance(c, str) and len(c.strip()) < 20)
+            for meta in metadatas:
+                meta = meta or {}
+                source_counter[meta.get("source", "unknown")] += 1
+                source_type_counter[meta.get("source_type", "unknown")] += 1
+                source_class_counter[meta.get("source_class", "unknown")] += 1
+            if stored_digest is None or stored_hashes_count is None:
+                page_hashes = [str((meta or {}).get("content_hash", "")) for meta in metadatas]
+                streamed_digest = extend_index_digest(
+                    streamed_digest, zip(ids, page_hashes, strict=False)
+                )
+                streamed_hashes.update(h for h in page_hashes if h)
+            page_rows = min(len(ids), len(contents), len(metadatas))
+            for i in range(page_rows):
+                record = {
+                    "id": ids[i],
+                    "source": (metadatas[i] or {}).get("source", "unknown"),
+                    "content_chars": len(contents[i]) if isinstance(contents[i], str) else 0,
+                    "embedding_dim": len(embeddings[i])
+                    if i < len(embeddings) and embeddings[i] is not None
+                    else 0,
+                }
+                if records_file is not None:
+                    records_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                else:
+                    records.append(record)
 
-    data = json.loads(vector_path.read_text(encoding="utf-8"))
-    ids = data.get("ids", [])
-    contents = data.get("contents", [])
-    embeddings = data.get("embeddings", [])
-    metadatas = data.get("metadatas", [])
-    content_hashes = data.get("content_hashes", [])
-    lengths = [len(e) for e in embeddings if isinstance(e, list)]
-    source_counter = Counter((m or {}).get("source", "unknown") for m in metadatas)
-    source_type_counter = Counter((m or {}).get("source_type", "unknown") for m in metadatas)
-    source_class_counter = Counter((m or {}).get("source_class", "unknown") for m in metadatas)
-    records = [
-        {
-            "id": ids[i] if i < len(ids) else None,
-            "source": (metadatas[i] or {}).get("source", "unknown")
-            if i < len(metadatas)
-            else "unknown",
-            "content_chars": len(contents[i])
-            if i < len(contents) and isinstance(contents[i], str)
-            else 0,
-            "embedding_dim": len(embeddings[i])
-            if i < len(embeddings) and isinstance(embeddings[i], list)
-            else 0,
-        }
-        for i in range(min(len(ids), len(contents), len(embeddings), len(metadatas)))
-    ]
     findings = []
-    lengths_equal = len(ids) == len(contents) == len(embeddings) == len(metadatas)
+    lengths_equal = counts["ids"] == counts["contents"] == counts["metadatas"] and (
+        not check_embeddings or counts["embeddings"] == counts["ids"]
+    )
     if not lengths_equal:
         findings.append(
             {"severity": "error", "message": "Vector arrays have mismatched lengths", "stage": "L5"}
         )
-    unique_dims = sorted(set(lengths))
-    index_metadata = data.get("index_metadata", {})
+    unique_dims = sorted(dims)
     if len(unique_dims) > 1:
         findings.append(
             {"severity": "error", "message": "Embedding dimensions are inconsistent", "stage": "L5"}
         )
 
+    if stored_digest is None or stored_hashes_count is None:
+        stored_digest = extend_index_digest(streamed_digest, ())
+        stored_hashes_count = len(streamed_hashes)
+    content_hashes_count = stored_hashes_count
     aggregate = {
         "index_exists": True,
+        "collection_name": coll,
         "vector_path": str(vector_path),
-        "ids_count": len(ids),
-        "contents_count": len(contents),
-        "embeddings_count": len(embeddings),
-        "metadatas_count": len(metadatas),
-        "content_hashes_count": len(content_hashes),
+        "index_digest": stored_digest,
+        "ids_count": counts["ids"],
+        "contents_count": counts["contents"],
+        "embeddings_count": counts["embeddings"] if check_embeddings else None,
+        "metadatas_count": counts["metadatas"],
+        "content_hashes_count": content_hashes_count,
         "lengths_consistent": lengths_equal,
         "embedding_dim_consistent": len(unique_dims) <= 1,
         "embedding_dim": unique_dims[0] if len(unique_dims) == 1 else None,
         "embedding_model": index_metadata.get("embedding_model"),
         "embedding_batch_size": index_metadata.get("embedding_batch_size"),
         "index_config_hash": index_metadata.get("index_config_hash"),
-        "short_content_rate": (
-            sum(1 for c in contents if isinstance(c, str) and len(c.strip()) < 20) / len(contents)
-        )
-        if contents
-        else 0.0,
+        "index_metadata": index_metadata,
+        "short_content_rate": short_contents / counts["contents"] if counts["contents"] else 0.0,
         "source_distribution": dict(source_counter),
         "source_type_distribution": dict(source_type_counter),
         "source_class_distribution": dict(source_class_counter),
-        "dedupe_effect_estimate": max(0, len(content_hashes) - len(contents)),
-        "index_file_size_bytes": vector_path.stat().st_size,
+        "dedupe_effect_estimate": max(0, content_hashes_count - counts["contents"]),
+        "index_file_size_bytes": vector_path.stat().st_size if vector_path.exists() else None,
     }
+    if records_path is not None:
+        aggregate["records_path"] = str(records_path)
     return {"aggregate": aggregate, "records": records, "findings": findings}
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import hashlib
 import json
 import logging
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -358,12 +361,100 @@ def _extract_json_object(text: str) -> dict[str, Any]:
     return parsed
 
 
-def _try_generate_synthetic_questions(
+# Synthetic questions whose token sets overlap at least this much are duplicates.
+NEAR_DUPLICATE_JACCARD = 0.85
+
+
+def _question_tokens(question: str) -> frozenset[str]:
+    return frozenset(re.findall(r"[a-z0-9]+", question.lower()))
+
+
+def _is_near_duplicate(tokens: frozenset[str], seen: list[frozenset[str]]) -> bool:
+    if not tokens:
+        return False
+    for other in seen:
+        union = len(tokens | other)
+        if union and len(tokens & other) / union >= NEAR_DUPLICATE_JACCARD:
+            return True
+    return False
+
+
+def _synthetic_prompt(doc: dict[str, Any], context_text: str) -> str:
+    return (
+        "Generate ONE medically relevant retrieval test item as strict JSON with keys: "
+        "question, hard_paraphrase, distractor_question, evidence_span, answer_summary, expected_keywords. "
+        "Use only the provided context. evidence_span must be exact.\n\n"
+        f"Metadata: source={doc.get('source')} page={doc.get('page')} "
+        f"section={doc.get('section_path', [])} content_type={doc.get('content_type')}\n\n"
+        f"Context:\n{context_text}"
+    )
+
+
+def _text_field(parsed: dict[str, Any], key: str) -> str:
+    value = parsed.get(key)
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise ValueError(f"Synthetic item field {key!r} must be a string")
+    return value.strip()
+
+
+def _synthetic_candidate(parsed: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a parsed LLM item; raises ``ValueError`` on wrongly typed fields."""
+    keywords = parsed.get("expected_keywords", [])
+    if not isinstance(keywords, list) or not all(
+        isinstance(k, (str, int, float)) and not isinstance(k, bool) for k in keywords
+    ):
+        raise ValueError("Synthetic item field 'expected_keywords' must be a list of strings")
+    evidence_span = _text_field(parsed, "evidence_span")
+    return {
+        "query": _text_field(parsed, "question"),
+        "negative_query": _text_field(parsed, "distractor_question") or None,
+        "paraphrase_query": _text_field(parsed, "hard_paraphrase") or None,
+        "evidence_span": evidence_span,
+        "evidence_phrase": evidence_span,
+        "answer_summary": _text_field(parsed, "answer_summary"),
+        "expected_keywords": [str(k).strip() for k in keywords if str(k).strip()],
+    }
+
+
+def _synthetic_record(idx: int, doc: dict[str, Any], candidate: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "query_id": f"synthetic_{idx}",
+        "query": candidate["query"],
+        "expected_keywords": candidate["expected_keywords"],
+        "expected_sources": [str(doc.get("source", ""))],
+        "expected_chunk_id": doc.get("id"),
+        "expected_page": doc.get("page"),
+        "reference_answer": candidate["answer_summary"],
+        "evidence_phrase": candidate["evidence_phrase"],
+        "evidence_span": candidate["evidence_span"],
+        "expected_source_types": [_source_type(str(doc.get("source", "")))],
+        "query_category": "synthetic",
+        "task_type": f"{_source_type(str(doc.get('source', '')))}_{doc.get('content_type', 'paragraph')}",
+        "label_confidence": "high" if doc.get("content_type") != "mixed" else "medium",
+        "dataset_origin": "synthetic_qwen",
+        "dataset_split": _assign_split(str(doc.get("source", ""))),
+        "difficulty": _difficulty_for_chunk(doc),
+        "negative_query": candidate["negative_query"],
+        "paraphrase_query": candidate["paraphrase_query"],
+        "source_family": _source_family(str(doc.get("source", ""))),
+    }
+
+
+async def _try_generate_synthetic_questions_async(
     *,
     max_synthetic_questions: int,
     sample_docs_per_source_type: int,
     seed: int,
+    checkpoint_path: Path | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Generate synthetic test items for sampled chunks.
+
+    Completions are requested concurrently (see ``src.evals.synthetic_questions``)
+    and checkpointed, then parsed, validated and deduplicated in candidate
+    order, so the accepted set does not depend on which request finished first.
+    """
     attempts: list[dict[str, Any]] = []
     accepted: list[dict[str, Any]] = []
 
@@ -371,7 +462,11 @@ def _try_generate_synthetic_questions(
         return accepted, [{"status": "skipped", "reason": "missing_dashscope_api_key"}]
 
     try:
-        from openai import OpenAI
+        from src.evals.synthetic_questions import (
+            SyntheticQuestionCheckpoint,
+            SyntheticQuestionJob,
+            generate_synthetic_responses,
+        )
     except Exception as exc:  # pragma: no cover
         return accepted, [{"status": "skipped", "reason": f"openai_import_error: {exc}"}]
 
@@ -379,79 +474,59 @@ def _try_generate_synthetic_questions(
     if not candidates:
         return accepted, [{"status": "skipped", "reason": "no_candidate_docs"}]
 
-    client = OpenAI(api_key=settings.llm.dashscope_api_key, base_url=settings.llm.qwen_base_url)
     chunk_map = {str(item.get("id")): item for item in candidates}
-    for idx, doc in enumerate(candidates[:max_synthetic_questions], start=1):
-        seed_context = _build_seed_context(doc, chunk_map)
-        prompt = (
-            "Generate ONE medically relevant retrieval test item as strict JSON with keys: "
-            "question, hard_paraphrase, distractor_question, evidence_span, answer_summary, expected_keywords. "
-            "Use only the provided context. evidence_span must be exact.\n\n"
-            f"Metadata: source={doc.get('source')} page={doc.get('page')} "
-            f"section={doc.get('section_path', [])} content_type={doc.get('content_type')}\n\n"
-            f"Context:\n{seed_context['context_text']}"
+    selected = candidates[:max_synthetic_questions]
+    contexts = [_build_seed_context(doc, chunk_map)["context_text"] for doc in selected]
+    jobs = [
+        SyntheticQuestionJob(
+            attempt_id=idx,
+            doc_id=doc.get("id"),
+            prompt=_synthetic_prompt(doc, context_text),
         )
+        for idx, (doc, context_text) in enumerate(zip(selected, contexts, strict=True), start=1)
+    ]
+    responses = await generate_synthetic_responses(
+        jobs, checkpoint=SyntheticQuestionCheckpoint(checkpoint_path)
+    )
+
+    seen_questions: list[frozenset[str]] = []
+    for doc, context_text, response in zip(selected, contexts, responses, strict=True):
+        idx = response.attempt_id
         attempt: dict[str, Any] = {
             "attempt_id": idx,
             "doc_id": doc.get("id"),
             "source": doc.get("source"),
             "status": "error",
         }
+        if response.cached:
+            attempt["from_checkpoint"] = True
+        if response.text is None:
+            attempt["error"] = response.error
+            attempts.append(attempt)
+            continue
+        attempt["raw_response"] = response.text
         try:
-            response = client.chat.completions.create(
-                model=settings.llm.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
-            text = (response.choices[0].message.content or "").strip()
-            attempt["raw_response"] = text
-            parsed = _extract_json_object(text)
-            candidate = {
-                "query": str(parsed.get("question", "")).strip(),
-                "negative_query": str(parsed.get("distractor_question", "")).strip() or None,
-                "paraphrase_query": str(parsed.get("hard_paraphrase", "")).strip() or None,
-                "evidence_span": str(parsed.get("evidence_span", "")).strip(),
-                "evidence_phrase": str(parsed.get("evidence_span", "")).strip(),
-                "answer_summary": str(parsed.get("answer_summary", "")).strip(),
-                "expected_keywords": [
-                    str(k).strip() for k in parsed.get("expected_keywords", []) if str(k).strip()
-                ],
-            }
-            valid, reason = _validate_synthetic_record(candidate, doc, seed_context["context_text"])
-            if not valid:
-                attempt["error"] = reason
-                attempt["status"] = "rejected"
-                attempts.append(attempt)
-                continue
-
-            accepted.append(
-                {
-                    "query_id": f"synthetic_{idx}",
-                    "query": candidate["query"],
-                    "expected_keywords": candidate["expected_keywords"],
-                    "expected_sources": [str(doc.get("source", ""))],
-                    "expected_chunk_id": doc.get("id"),
-                    "expected_page": doc.get("page"),
-                    "reference_answer": candidate["answer_summary"],
-                    "evidence_phrase": candidate["evidence_phrase"],
-                    "evidence_span": candidate["evidence_span"],
-                    "expected_source_types": [_source_type(str(doc.get("source", "")))],
-                    "query_category": "synthetic",
-                    "task_type": f"{_source_type(str(doc.get('source', '')))}_{doc.get('content_type', 'paragraph')}",
-                    "label_confidence": "high" if doc.get("content_type") != "mixed" else "medium",
-                    "dataset_origin": "synthetic_qwen",
-                    "dataset_split": _assign_split(str(doc.get("source", ""))),
-                    "difficulty": _difficulty_for_chunk(doc),
-                    "negative_query": candidate["negative_query"],
-                    "paraphrase_query": candidate["paraphrase_query"],
-                    "source_family": _source_family(str(doc.get("source", ""))),
-                }
-            )
-            attempt["status"] = "accepted"
-            attempt["parsed"] = accepted[-1]
-        except Exception as exc:
+            candidate = _synthetic_candidate(_extract_json_object(response.text))
+        except (ValueError, json.JSONDecodeError) as exc:
             attempt["error"] = str(exc)
             logger.warning("Synthetic dataset generation failed for doc %s: %s", doc.get("id"), exc)
+            attempts.append(attempt)
+            continue
+
+        valid, reason = _validate_synthetic_record(candidate, doc, context_text)
+        tokens = _question_tokens(candidate["query"])
+        if valid and _is_near_duplicate(tokens, seen_questions):
+            valid, reason = False, "near_duplicate_question"
+        if not valid:
+            attempt["error"] = reason
+            attempt["status"] = "rejected"
+            attempts.append(attempt)
+            continue
+
+        seen_questions.append(tokens)
+        accepted.append(_synthetic_record(idx, doc, candidate))
+        attempt["status"] = "accepted"
+        attempt["parsed"] = accepted[-1]
         attempts.append(attempt)
 
     return accepted, attempts
@@ -543,7 +618,7 @@ def _filter_records(
     return filtered
 
 
-def build_retrieval_dataset(
+async def build_retrieval_dataset_async(
     *,
     dataset_path: str | Path | None = None,
     enable_llm_generation: bool = True,
@@ -603,7 +678,7 @@ def build_retrieval_dataset(
             }
         ]
     elif enable_llm_generation:
-        synthetic_records, attempts = _try_generate_synthetic_questions(
+        synthetic_records, attempts = await _try_generate_synthetic_questions_async(
             max_synthetic_questions=max_synthetic_questions,
             sample_docs_per_source_type=sample_docs_per_source_type,
             seed=seed,
@@ -657,3 +732,47 @@ def build_retrieval_dataset(
             "min_label_confidence": min_label_confidence,
         },
     }
+
+
+def build_retrieval_dataset(
+    *,
+    dataset_path: str | Path | None = None,
+    enable_llm_generation: bool = True,
+    max_synthetic_questions: int = 40,
+    sample_docs_per_source_type: int = 10,
+    seed: int = 42,
+    max_queries: int | None = None,
+    sample_seed: int = 42,
+    dataset_split: str | None = None,
+    min_label_confidence: str = "low",
+    reuse_cached_dataset: bool = False,
+    reuse_requirements: dict[str, Any] | None = None,
+    artifact_dir: str | Path = "data/evals",
+) -> dict[str, Any]:
+    """Synchronous wrapper around ``build_retrieval_dataset_async``.
+
+    Called from inside a running event loop (async runners, notebooks), the
+    build runs on its own loop in a worker thread and blocks the caller, as
+    the synchronous builder always did. Async callers should prefer awaiting
+    ``build_retrieval_dataset_async``.
+    """
+    coro = build_retrieval_dataset_async(
+        dataset_path=dataset_path,
+        enable_llm_generation=enable_llm_generation,
+        max_synthetic_questions=max_synthetic_questions,
+        sample_docs_per_source_type=sample_docs_per_source_type,
+        seed=seed,
+        max_queries=max_queries,
+        sample_seed=sample_seed,
+        dataset_split=dataset_split,
+        min_label_confidence=min_label_confidence,
+        reuse_cached_dataset=reuse_cached_dataset,
+        reuse_requirements=reuse_requirements,
+        artifact_dir=artifact_dir,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(contextvars.copy_context().run, asyncio.run, coro).result()
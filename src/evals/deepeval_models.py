@@ -8,9 +8,10 @@ import os
 from typing import Any
 
 from deepeval.models import DeepEvalBaseLLM
-from openai import AsyncOpenAI, OpenAI
+from openai import AsyncOpenAI
 
 from src.config.settings import settings
+from src.infra.llm.client_registry import get_async_openai_client, get_openai_client
 
 
 class QwenModel(DeepEvalBaseLLM):
@@ -21,7 +22,7 @@ class QwenModel(DeepEvalBaseLLM):
 
     Attributes:
         model: Model identifier (e.g., "qwen3.5-flash", "qwen3.5-35b-a3b")
-        client: OpenAI-compatible client pointing to Dashscope API
+        client: Shared pooled OpenAI-compatible client pointing to Dashscope API
     """
 
     model: str
@@ -29,15 +30,14 @@ class QwenModel(DeepEvalBaseLLM):
     def __init__(self, model: str):
         self.model = model
         self.model_name = model
-        self.client = OpenAI(
-            api_key=settings.llm.dashscope_api_key,
-            base_url=settings.llm.qwen_base_url,
+        self.client = get_openai_client(
             timeout=settings.deepeval.deepeval_metric_timeout_seconds,
             max_retries=2,
         )
-        self.async_client = AsyncOpenAI(
-            api_key=settings.llm.dashscope_api_key,
-            base_url=settings.llm.qwen_base_url,
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        return get_async_openai_client(
             timeout=settings.deepeval.deepeval_metric_timeout_seconds,
             max_retries=2,
         )
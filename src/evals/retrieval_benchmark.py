@@ -0,0 +1,509 @@
+"""Offline latency and throughput benchmark for ``retrieve_context_with_trace``.
+
+Answer-quality benchmarks (``scripts/benchmark_deepeval_multi.py``) depend on
+live LLM calls and say nothing about retrieval speed. This module drives the
+golden dataset through the real retrieval runtime against a local, throwaway
+Chroma index, with every outbound service replaced by a deterministic stub:
+
+    - embeddings come from ``StubOpenAIClient``, which hashes tokens into a
+      fixed-size unit vector, so the index and query vectors are identical
+      on every machine and no network is touched
+    - chat completions (HyDE, enrichment, query-understanding fallbacks)
+      return a canned answer derived from the prompt
+    - both stubs can add a fixed simulated service time per call
+
+The index is built from a seeded synthetic corpus derived from the dataset
+queries, so the benchmark needs nothing from ``data/`` and runs on a CPU-only
+box. Queries are issued from ``concurrency`` threads; the report has
+p50/p95/p99 latency per retrieval stage and overall, throughput, peak traced
+Python memory and peak RSS, plus a digest of the retrieved document ids that
+must not change between runs. Stage latencies come from the ``stage_timer``
+hooks in the retrieval runtime (see ``src.ingestion.timing``).
+
+Absolute latencies depend on the machine, so regressions are gated against a
+baseline report recorded on the same machine with the same settings.
+
+Example:
+    queries = load_benchmark_queries(Path("tests/fixtures/golden_queries.json"))
+    report = run_retrieval_benchmark(queries, concurrency=4, repeat=3)
+    baseline = find_baseline_run(report, previous_runs)
+    failed = evaluate_benchmark_thresholds(report, baseline=baseline)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import platform
+import random
+import re
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from src.config import settings
+from src.evals.dataset_builder import normalize_golden_queries
+from src.ingestion.timing import collect_stage_timings
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_COLLECTION_NAME = "retrieval_benchmark"
+DEFAULT_BENCHMARK_DATASET = Path("tests/fixtures/golden_queries.json")
+# Machine-local: record it with ``scripts/benchmark_retrieval.py --update-baseline``.
+DEFAULT_BENCHMARK_BASELINE = Path("data/evals/retrieval_benchmark_baseline.json")
+# Timed retrieval stages, in pipeline order; "total" covers the whole call.
+BENCHMARK_STAGES = (
+    "prepare",
+    "candidate_retrieval",
+    "query_embedding",
+    "rerank_diversify",
+    "trace_build",
+)
+PERCENTILES = (50, 95, 99)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_FILLER_WORDS = (
+    "patients adults clinical guideline recommendation assessment monitoring review "
+    "therapy treatment dose risk follow-up primary care referral screening management "
+    "evidence outcome target threshold diagnosis symptoms education lifestyle diet "
+    "exercise medication adherence laboratory measurement interval annual baseline"
+).split()
+
+
+def _hashed_embedding(text: str, dim: int) -> list[float]:
+    vector = [0.0] * dim
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        index = int.from_bytes(digest[:4], "big") % dim
+        vector[index] += 1.0 if digest[4] & 1 else -1.0
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0.0:
+        vector[0] = 1.0
+        return vector
+    return [value / norm for value in vector]
+
+
+def _sleep_ms(latency_ms: float) -> None:
+    if latency_ms > 0:
+        time.sleep(latency_ms / 1000)
+
+
+class StubOpenAIClient:
+    """Deterministic, offline stand-in for the pooled Dashscope client.
+
+    ``embeddings.create`` returns hashed bag-of-words vectors and
+    ``chat.completions.create`` echoes the last user message as the answer.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedding_dim: int = 64,
+        embedding_latency_ms: float = 0.0,
+        llm_latency_ms: float = 0.0,
+    ):
+        self.embedding_dim = embedding_dim
+        self.embedding_latency_ms = embedding_latency_ms
+        self.llm_latency_ms = llm_latency_ms
+        self.calls = {"embeddings": 0, "chat": 0}
+        self._lock = threading.Lock()
+        self.embeddings = SimpleNamespace(create=self._create_embeddings)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create_completion))
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.calls[kind] += 1
+
+    def _create_embeddings(self, *, model: str, input: list[str] | str, **kwargs: Any):
+        self._count("embeddings")
+        _sleep_ms(self.embedding_latency_ms)
+        texts = [input] if isinstance(input, str) else list(input)
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=i, embedding=_hashed_embedding(text, self.embedding_dim))
+                for i, text in enumerate(texts)
+            ],
+            model=model,
+        )
+
+    def _create_completion(self, *, model: str, messages: list[dict[str, Any]], **kwargs: Any):
+        self._count("chat")
+        _sleep_ms(self.llm_latency_ms)
+        prompt = str(messages[-1].get("content", "")) if messages else ""
+        content = f"Stub answer: {' '.join(prompt.split()[:40])}"
+        return SimpleNamespace(
+            model=model,
+            choices=[
+                SimpleNamespace(
+                    index=0,
+                    message=SimpleNamespace(role="assistant", content=content),
+                    finish_reason="stop",
+                )
+            ],
+        )
+
+
+class AsyncStubOpenAIClient:
+    """Async facade over ``StubOpenAIClient`` for code paths using the async pool."""
+
+    def __init__(self, client: StubOpenAIClient):
+        self._client = client
+
+        async def create_embeddings(**kwargs: Any):
+            return client._create_embeddings(**kwargs)
+
+        async def create_completion(**kwargs: Any):
+            return client._create_completion(**kwargs)
+
+        self.embeddings = SimpleNamespace(create=create_embeddings)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create_completion))
+
+    async def close(self) -> None:
+        return None
+
+
+def load_benchmark_queries(path: Path = DEFAULT_BENCHMARK_DATASET) -> list[dict[str, Any]]:
+    """Load golden-fixture or cached-dataset records that carry a query."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict) and "golden_queries" in data:
+        return normalize_golden_queries(Path(path))
+    if isinstance(data, list):
+        return [
+            item for item in data if isinstance(item, dict) and str(item.get("query", "")).strip()
+        ]
+    raise ValueError(f"Unsupported dataset format in {path}")
+
+
+def build_benchmark_corpus(
+    queries: list[dict[str, Any]],
+    *,
+    documents_per_query: int = 8,
+    seed: int = 42,
+) -> list[dict[str, Any]]:
+    """Seeded synthetic corpus with on-topic and distractor chunks per query."""
+    rng = random.Random(seed)
+    vocabulary = sorted(
+        {token for record in queries for token in _TOKEN_RE.findall(record["query"].lower())}
+        | set(_FILLER_WORDS)
+    )
+    documents: list[dict[str, Any]] = []
+    for query_index, record in enumerate(queries):
+        keywords = [str(k) for k in record.get("expected_keywords") or []]
+        keywords = keywords or record["query"].split()
+        source = (record.get("expected_sources") or [f"source_{query_index}"])[0]
+        family = record.get("source_family") or "general"
+        for doc_index in range(documents_per_query):
+            on_topic = doc_index == 0
+            words = rng.choices(vocabulary, k=rng.randint(40, 120))
+            sampled = keywords if on_topic else rng.sample(keywords, k=min(2, len(keywords)))
+            for keyword in sampled:
+                words.insert(rng.randrange(len(words) + 1), keyword)
+            lead = (record.get("evidence_span") or record["query"]) if on_topic else ""
+            documents.append(
+                {
+                    "id": f"bench_{query_index}_{doc_index}",
+                    "content": " ".join([lead, *words]).strip(),
+                    "source": f"{source}.pdf" if on_topic else f"{family}_{doc_index % 3}.pdf",
+                    "page": doc_index % 4 + 1,
+                    "content_type": "paragraph",
+                }
+            )
+    return documents
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Linearly interpolated percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (k - lower) * (ordered[upper] - ordered[lower])
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    summary = {f"p{p}_ms": round(percentile(values, p), 3) for p in PERCENTILES}
+    summary["mean_ms"] = round(statistics.fmean(values), 3) if values else 0.0
+    summary["max_ms"] = round(max(values), 3) if values else 0.0
+    summary["count"] = len(values)
+    return summary
+
+
+def _swap(stack: ExitStack, target: Any, name: str, value: Any) -> None:
+    original = getattr(target, name)
+    setattr(target, name, value)
+    stack.callback(setattr, target, name, original)
+
+
+@contextmanager
+def offline_services(client: StubOpenAIClient) -> Iterator[StubOpenAIClient]:
+    """Route embedding and LLM client lookups to ``client`` and clear embedding caches."""
+    from src.infra.llm import client_registry, qwen_client
+    from src.ingestion.indexing import embedding
+
+    async_client = AsyncStubOpenAIClient(client)
+    with ExitStack() as stack:
+        for module in (client_registry, qwen_client, embedding):
+            if hasattr(module, "get_openai_client"):
+                _swap(stack, module, "get_openai_client", lambda **kwargs: client)
+            if hasattr(module, "get_async_openai_client"):
+                _swap(stack, module, "get_async_openai_client", lambda **kwargs: async_client)
+        clear_embedding_caches()
+        stack.callback(clear_embedding_caches)
+        yield client
+
+
+def clear_embedding_caches() -> None:
+    """Drop cached text and query embeddings so the next queries embed cold."""
+    from src.ingestion.indexing import chroma_store, embedding
+
+    embedding._embedding_cache.clear()
+    chroma_store._embed_cache.clear()
+
+
+@contextmanager
+def benchmark_index(documents: list[dict[str, Any]], persist_dir: Path) -> Iterator[Any]:
+    """Build a Chroma collection in ``persist_dir`` and serve it to the runtime."""
+    from src.ingestion.indexing.chroma_store import ChromaVectorStore
+    from src.rag import runtime
+
+    with ExitStack() as stack:
+        _swap(stack, settings.storage, "chroma_server_host", "")
+        _swap(stack, settings.storage, "chroma_persist_directory", str(persist_dir))
+        store = ChromaVectorStore(collection_name=BENCHMARK_COLLECTION_NAME)
+        store.add_documents(documents)
+        _swap(stack, runtime, "initialize_runtime_index", lambda: None)
+        _swap(stack, runtime, "get_vector_store", lambda: store)
+        yield store
+
+
+def _run_queries(
+    queries: list[str],
+    *,
+    top_k: int,
+    retrieval_options: dict[str, Any] | None,
+    concurrency: int,
+) -> tuple[list[dict[str, Any]], float]:
+    from src.rag.runtime import retrieve_context_with_trace
+
+    def run_one(query: str) -> dict[str, Any]:
+        with collect_stage_timings() as stages:
+            start = time.perf_counter()
+            try:
+                _, _, trace = retrieve_context_with_trace(
+                    query, top_k=top_k, retrieval_options=retrieval_options
+                )
+            except Exception as exc:
+                logger.warning("Benchmark query failed: %s", exc)
+                return {"query": query, "error": str(exc) or type(exc).__name__}
+            total_ms = (time.perf_counter() - start) * 1000
+        return {
+            "query": query,
+            "total_ms": total_ms,
+            "stages": dict(stages),
+            "doc_ids": [doc.id for doc in trace.retrieval.documents],
+        }
+
+    start = time.perf_counter()
+    if concurrency <= 1:
+        samples = [run_one(query) for query in queries]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(run_one, queries))
+    return samples, time.perf_counter() - start
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    return round(peak / (1024 * 1024 if platform.system() == "Darwin" else 1024), 2)
+
+
+def run_retrieval_benchmark(
+    queries: list[dict[str, Any]],
+    *,
+    concurrency: int = 4,
+    repeat: int = 3,
+    warmup: int = 5,
+    top_k: int = 5,
+    retrieval_options: dict[str, Any] | None = None,
+    documents_per_query: int = 8,
+    seed: int = 42,
+    embedding_dim: int = 64,
+    embedding_latency_ms: float = 0.0,
+    llm_latency_ms: float = 0.0,
+    measure_memory: bool = True,
+) -> dict[str, Any]:
+    """Benchmark retrieval over ``queries`` against an offline local index.
+
+    Args:
+        queries: Dataset records with a ``query`` field (see ``load_benchmark_queries``)
+        concurrency: Threads issuing queries at once
+        repeat: Passes over the dataset in the timed run
+        warmup: Untimed queries issued first to load the in-memory indexes
+        top_k: Documents retrieved per query
+        retrieval_options: Overrides passed to ``retrieve_context_with_trace``
+        documents_per_query: Synthetic corpus chunks generated per dataset query
+        seed: Seed for the synthetic corpus
+        embedding_dim: Dimension of the stub embeddings
+        embedding_latency_ms: Simulated service time per stub embedding call
+        llm_latency_ms: Simulated service time per stub chat completion
+        measure_memory: Run one extra serial pass under ``tracemalloc``
+
+    Returns:
+        Report with ``config``, ``latency_ms`` (``total`` and per ``stages``),
+        ``throughput_qps``, ``peak_memory_mb``, ``peak_rss_mb``, ``error_rate``
+        and ``retrieval_digest``
+    """
+    query_texts = [str(record["query"]).strip() for record in queries]
+    query_texts = [query for query in query_texts if query]
+    if not query_texts:
+        raise ValueError("Retrieval benchmark needs at least one query")
+    concurrency = max(1, int(concurrency))
+    documents = build_benchmark_corpus(queries, documents_per_query=documents_per_query, seed=seed)
+    client = StubOpenAIClient(
+        embedding_dim=embedding_dim,
+        embedding_latency_ms=embedding_latency_ms,
+        llm_latency_ms=llm_latency_ms,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="retrieval_benchmark_") as persist_dir:
+        with offline_services(client), benchmark_index(documents, Path(persist_dir)):
+            warmup_start = time.perf_counter()
+            _run_queries(
+                query_texts[: max(0, warmup)] or query_texts[:1],
+                top_k=top_k,
+                retrieval_options=retrieval_options,
+                concurrency=1,
+            )
+            warmup_seconds = time.perf_counter() - warmup_start
+            # The first timed pass embeds every query, later passes hit the cache.
+            clear_embedding_caches()
+            samples, wall_seconds = _run_queries(
+                query_texts * max(1, repeat),
+                top_k=top_k,
+                retrieval_options=retrieval_options,
+                concurrency=concurrency,
+            )
+            peak_memory_mb = None
+            if measure_memory:
+                clear_embedding_caches()
+                was_tracing = tracemalloc.is_tracing()
+                if was_tracing:
+                    tracemalloc.reset_peak()
+                else:
+                    tracemalloc.start()
+                try:
+                    _run_queries(
+                        query_texts,
+                        top_k=top_k,
+                        retrieval_options=retrieval_options,
+                        concurrency=1,
+                    )
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    if not was_tracing:
+                        tracemalloc.stop()
+                peak_memory_mb = round(peak / (1024 * 1024), 3)
+
+    succeeded = [sample for sample in samples if "error" not in sample]
+    stage_latencies = {
+        stage: latency_summary(
+            [sample["stages"][stage] for sample in succeeded if stage in sample["stages"]]
+        )
+        for stage in BENCHMARK_STAGES
+    }
+    retrieved = sorted({(sample["query"], tuple(sample["doc_ids"])) for sample in succeeded})
+    return {
+        "config": {
+            "queries": len(query_texts),
+            "repeat": max(1, repeat),
+            "concurrency": concurrency,
+            "top_k": top_k,
+            "retrieval_options": dict(retrieval_options or {}),
+            "corpus_documents": len(documents),
+            "documents_per_query": documents_per_query,
+            "seed": seed,
+            "embedding_dim": embedding_dim,
+            "embedding_latency_ms": embedding_latency_ms,
+            "llm_latency_ms": llm_latency_ms,
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "latency_ms": {
+            "total": latency_summary([sample["total_ms"] for sample in succeeded]),
+            "stages": stage_latencies,
+        },
+        "throughput_qps": round(len(succeeded) / max(wall_seconds, 1e-9), 2),
+        "wall_seconds": round(wall_seconds, 4),
+        "warmup_seconds": round(warmup_seconds, 4),
+        "peak_memory_mb": peak_memory_mb,
+        "peak_rss_mb": _peak_rss_mb(),
+        "error_rate": round(1 - len(succeeded) / len(samples), 4),
+        "stub_calls": dict(client.calls),
+        "retrieval_digest": hashlib.sha256(
+            json.dumps(retrieved, ensure_ascii=False).encode("utf-8")
+        ).hexdigest(),
+    }
+
+
+def find_baseline_run(
+    report: dict[str, Any], baseline_runs: list[dict[str, Any]]
+) -> dict[str, Any] | None:
+    """The baseline run recorded with exactly the same ``config`` as ``report``.
+
+    The config includes the CPU count and Python version, so runs from another
+    machine or with other settings never serve as a baseline.
+    """
+    for run in baseline_runs:
+        if run.get("config") == report.get("config"):
+            return run
+    return None
+
+
+def merge_baseline_runs(
+    baseline_runs: list[dict[str, Any]], measured_runs: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """``baseline_runs`` with the runs of the same ``config`` replaced by ``measured_runs``.
+
+    Baselines recorded for other configs (concurrency levels, search modes,
+    machines) are kept, so updating one config never drops the others.
+    """
+    measured_configs = [run.get("config") for run in measured_runs]
+    kept = [run for run in baseline_runs if run.get("config") not in measured_configs]
+    return [*kept, *measured_runs]
+
+
+__all__ = [
+    "BENCHMARK_STAGES",
+    "DEFAULT_BENCHMARK_BASELINE",
+    "DEFAULT_BENCHMARK_DATASET",
+    "AsyncStubOpenAIClient",
+    "StubOpenAIClient",
+    "benchmark_index",
+    "build_benchmark_corpus",
+    "clear_embedding_caches",
+    "find_baseline_run",
+    "latency_summary",
+    "load_benchmark_queries",
+    "merge_baseline_runs",
+    "offline_services",
+    "percentile",
+    "run_retrieval_benchmark",
+]
@@ -0,0 +1,211 @@
+"""Concurrent LLM generation for synthetic retrieval test items.
+
+``build_retrieval_dataset`` asks the LLM for one test item per sampled chunk.
+Doing that one round trip at a time made a 1,000-question golden set take
+about an hour, so the completions are generated here instead:
+
+    - one pooled async client (``get_async_openai_client``) shared by all
+      requests, with SDK retries disabled so retries are not doubled
+    - at most ``concurrency`` requests in flight, each attempt bounded by
+      ``timeout``
+    - retries with jittered backoff under the shared ``RetryPolicy``
+    - raw completions checkpointed to disk, keyed by prompt version, model,
+      temperature and prompt text; an interrupted or repeated build only
+      calls the LLM for prompts that have no completion yet
+
+Parsing, validation and deduplication of the completions stay in the dataset
+builder, which consumes results in job order so the dataset does not depend on
+completion order.
+
+Example:
+    jobs = [SyntheticQuestionJob(attempt_id=1, doc_id="chunk_1", prompt=prompt)]
+    results = asyncio.run(generate_synthetic_responses(jobs, concurrency=8))
+    results[0].text
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.config import SYNTHETIC_QUESTIONS_CHECKPOINT_PATH, settings
+from src.infra.json_store import JsonEntryStore
+from src.infra.llm.client_registry import get_async_openai_client
+from src.infra.llm.retry import RetryPolicy, get_retry_policy
+
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_PROMPT_VERSION = 1
+# Persist the checkpoint and log progress every this many completed requests.
+SYNTHETIC_CHECKPOINT_EVERY = 25
+
+
+@dataclass(frozen=True)
+class SyntheticQuestionJob:
+    attempt_id: int
+    doc_id: str | None
+    prompt: str
+
+
+@dataclass
+class SyntheticResponse:
+    attempt_id: int
+    text: str | None = None
+    error: str | None = None
+    cached: bool = False
+
+
+class SyntheticQuestionCheckpoint(JsonEntryStore):
+    """Raw completions keyed by prompt version, model, temperature and prompt."""
+
+    def __init__(self, path: Path | None = None):
+        super().__init__(path or SYNTHETIC_QUESTIONS_CHECKPOINT_PATH)
+
+    @staticmethod
+    def key(prompt: str, *, model: str, temperature: float) -> str:
+        payload = f"v{SYNTHETIC_PROMPT_VERSION}\n{model}\n{temperature}\n{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, key: str) -> str | None:
+        return super().get(key)
+
+    def save(self) -> None:
+        try:
+            super().save()
+        except OSError as e:
+            logger.warning("Failed to persist synthetic question checkpoint %s: %s", self.path, e)
+
+
+async def _complete(
+    client: Any,
+    prompt: str,
+    *,
+    model: str,
+    temperature: float,
+    timeout: float,
+    retry_policy: RetryPolicy,
+) -> str:
+    async def attempt() -> str:
+        async with asyncio.timeout(timeout):
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+            )
+        text = (response.choices[0].message.content or "").strip()
+        if not text:
+            raise ValueError("Empty completion")
+        return text
+
+    return await retry_policy.acall(attempt, label="Synthetic question generation")
+
+
+async def generate_synthetic_responses(
+    jobs: list[SyntheticQuestionJob],
+    *,
+    client: Any | None = None,
+    model: str | None = None,
+    temperature: float = 0.7,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    retry_policy: RetryPolicy | None = None,
+    checkpoint: SyntheticQuestionCheckpoint | None = None,
+    on_progress: Callable[[int, int], Any] | None = None,
+) -> list[SyntheticResponse]:
+    """Generate one completion per job, returned in job order.
+
+    Args:
+        jobs: Prompts to complete
+        client: Async OpenAI-compatible client (default: the pooled Dashscope client)
+        model: Model name (default: settings.llm.model_name)
+        temperature: Sampling temperature
+        concurrency: Requests in flight (default: settings.deepeval.synthetic_generation_concurrency)
+        timeout: Seconds per attempt (default: settings.deepeval.synthetic_generation_timeout_seconds)
+        retry_policy: Retry/backoff policy (default: the shared Dashscope policy)
+        checkpoint: Completion checkpoint (default: the persistent one under data/cache)
+        on_progress: Called with ``(completed, total)`` after every finished request
+
+    Returns:
+        One ``SyntheticResponse`` per job; failed jobs carry ``error`` instead of ``text``
+    """
+    model = model or settings.llm.model_name
+    concurrency = max(1, concurrency or settings.deepeval.synthetic_generation_concurrency)
+    timeout = timeout or settings.deepeval.synthetic_generation_timeout_seconds
+    retry_policy = retry_policy or get_retry_policy()
+    checkpoint = checkpoint if checkpoint is not None else SyntheticQuestionCheckpoint()
+
+    results: list[SyntheticResponse] = []
+    pending: list[tuple[SyntheticResponse, str, str]] = []
+    for job in jobs:
+        result = SyntheticResponse(attempt_id=job.attempt_id)
+        key = SyntheticQuestionCheckpoint.key(job.prompt, model=model, temperature=temperature)
+        cached = checkpoint.get(key)
+        if cached is not None:
+            result.text = cached
+            result.cached = True
+        else:
+            pending.append((result, key, job.prompt))
+        results.append(result)
+    if not pending:
+        return results
+
+    if client is None:
+        client = get_async_openai_client(max_retries=0)
+    semaphore = asyncio.Semaphore(concurrency)
+    completed = 0
+    start = time.perf_counter()
+
+    async def run(result: SyntheticResponse, key: str, prompt: str) -> None:
+        nonlocal completed
+        async with semaphore:
+            try:
+                result.text = await _complete(
+                    client,
+                    prompt,
+                    model=model,
+                    temperature=temperature,
+                    timeout=timeout,
+                    retry_policy=retry_policy,
+                )
+            except Exception as exc:
+                result.error = str(exc) or type(exc).__name__
+                logger.warning(
+                    "Synthetic question generation failed for attempt %s: %s",
+                    result.attempt_id,
+                    result.error,
+                )
+            else:
+                checkpoint.put(key, result.text)
+        completed += 1
+        if on_progress is not None:
+            on_progress(completed, len(pending))
+        if completed == len(pending) or completed % SYNTHETIC_CHECKPOINT_EVERY == 0:
+            checkpoint.save()
+            logger.info(
+                "Synthetic generation progress: %d/%d requests (%.2f/s), %d from checkpoint",
+                completed,
+                len(pending),
+                completed / max(time.perf_counter() - start, 1e-9),
+                len(jobs) - len(pending),
+            )
+
+    try:
+        await asyncio.gather(*(run(result, key, prompt) for result, key, prompt in pending))
+    finally:
+        checkpoint.save()
+    return results
+
+
+__all__ = [
+    "SYNTHETIC_PROMPT_VERSION",
+    "SyntheticQuestionCheckpoint",
+    "SyntheticQuestionJob",
+    "SyntheticResponse",
+    "generate_synthetic_responses",
+]
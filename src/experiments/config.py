@@ -373,6 +373,19 @@ def _normalize_experiment_dict(data: dict[str, Any], *, file_path: Path) -> dict
     return normalized
 
 
+_INDEX_EMBEDDING_KEYS = frozenset(
+    {
+        "collection_name",
+        "embedding_model",
+        "embedding_batch_size",
+        "semantic_weight",
+        "keyword_weight",
+        "boost_weight",
+        "materialize_html",
+    }
+)
+
+
 def _index_config_subset(experiment: dict[str, Any]) -> dict[str, Any]:
     return {
         "schema_version": experiment["schema_version"],
@@ -380,20 +393,31 @@ def _index_config_subset(experiment: dict[str, Any]) -> dict[str, Any]:
         "embedding_index": {
             key: value
             for key, value in experiment["embedding_index"].items()
-            if key
-            in {
-                "collection_name",
-                "embedding_model",
-                "embedding_batch_size",
-                "semantic_weight",
-                "keyword_weight",
-                "boost_weight",
-                "materialize_html",
-            }
+            if key in _INDEX_EMBEDDING_KEYS
         },
     }
 
 
+def index_group_key(experiment: dict[str, Any]) -> str:
+    """Hash of the index-affecting config, ignoring the collection name.
+
+    Experiments with the same key build identical indexes, so one collection can
+    serve all of them; they differ at most in retrieval-time settings.
+    """
+    embedding_index = experiment.get("embedding_index") or {}
+    return _config_hash(
+        {
+            "schema_version": experiment.get("schema_version"),
+            "ingestion": experiment.get("ingestion") or {},
+            "embedding_index": {
+                key: value
+                for key, value in embedding_index.items()
+                if key in _INDEX_EMBEDDING_KEYS and key != "collection_name"
+            },
+        }
+    )
+
+
 def load_experiment_file(path: str | Path) -> dict[str, Any]:
     file_path = Path(path)
     raw_text = file_path.read_text(encoding="utf-8")
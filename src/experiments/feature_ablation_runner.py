@@ -1,4 +1,16 @@
-"""Helpers to run feature-focused ablation studies from a reference variant."""
+"""Helpers to run feature-focused ablation studies from a reference variant.
+
+Index-building assessments (the keyword and HyPE ablations re-ingest per
+variant) run one at a time, because ingestion rewrites the shared processed
+artifacts. Everything else only reads an existing collection and runs
+concurrently: retrieval-only families such as reranking, and the winners'
+answer-eval runs, which reuse the collection the ablation already built for
+the winning variant instead of re-ingesting it.
+
+Example:
+    summary = run_feature_ablation_studies(include_answer_eval_for_winner=True, max_workers=3)
+    write_feature_ablation_outputs(summary, "data/evals_feature_ablation_summary")
+"""
 
 from __future__ import annotations
 
@@ -15,10 +27,13 @@ from src.evals.assessment.retrieval_eval import (
     keyword_ablation_configs,
     reranking_ablation_configs,
 )
+from src.evals.assessment.stage_scheduler import Stage, run_stages
 from src.experiments.config import build_run_assessment_kwargs, resolve_experiment_runs
 
 REFERENCE_CONFIG = "experiments/v1/comprehensive_ablation.yaml"
 REFERENCE_VARIANT = "pymupdf_semantic_hybrid"
+# Read-only assessments run concurrently by default, up to this many at once.
+DEFAULT_ASSESSMENT_WORKERS = 4
 
 
 @dataclass(frozen=True)
@@ -112,9 +127,14 @@ def _config_options_by_variant(
 
 
 def _winner_experiment(
-    experiment: dict[str, Any], family: FeatureFamily, winner_name: str
+    experiment: dict[str, Any],
+    family: FeatureFamily,
+    winner_name: str,
+    winner_metrics: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     winner_experiment = copy.deepcopy(experiment)
+    # Collection the ablation built for the winner (re-ingesting families only).
+    built_collection = (winner_metrics or {}).get("collection_name")
     options = _config_options_by_variant(family, experiment)[winner_name]
     winner_experiment["metadata"]["name"] = _run_name(
         experiment.get("variant_name") or experiment.get("metadata", {}).get("name", "reference"),
@@ -133,20 +153,12 @@ def _winner_experiment(
     if family.name == "keyword":
         ingestion["enable_keyword_extraction"] = bool(options.get("enable_keyword_extraction"))
         ingestion["enable_chunk_summaries"] = bool(options.get("enable_chunk_summaries"))
-        embedding_index["collection_name"] = (
-            f"{embedding_index['collection_name']}_{winner_name}_answer"
-        )
-        embedding_index["rebuild_policy"] = "always"
     elif family.name == "hype":
         ingestion["enable_hype"] = bool(options.get("enable_hype"))
         if "hype_sample_rate" in options:
             ingestion["hype_sample_rate"] = options["hype_sample_rate"]
         retrieval["enable_hype"] = bool(options.get("enable_hype"))
         retrieval["enable_hyde"] = bool(options.get("enable_hyde"))
-        embedding_index["collection_name"] = (
-            f"{embedding_index['collection_name']}_{winner_name}_answer"
-        )
-        embedding_index["rebuild_policy"] = "always"
     else:
         retrieval.update(
             {
@@ -156,84 +168,166 @@ def _winner_experiment(
             }
         )
 
+    if not family.reingest_required:
+        winner_experiment["skip_ingestion"] = True
+    elif built_collection:
+        embedding_index["collection_name"] = str(built_collection)
+        winner_experiment["skip_ingestion"] = True
+    else:
+        embedding_index["collection_name"] = (
+            f"{embedding_index['collection_name']}_{winner_name}_answer"
+        )
+        embedding_index["rebuild_policy"] = "always"
+
     winner_experiment["retrieval"] = retrieval
     winner_experiment["ingestion"] = ingestion
     winner_experiment["embedding_index"] = embedding_index
     return winner_experiment
 
 
-def run_feature_family(
-    experiment: dict[str, Any],
-    family_name: str,
-    *,
-    include_answer_eval_for_winner: bool = True,
-    run_assessment_fn=run_assessment,
-) -> dict[str, Any]:
-    family = _family_map()[family_name]
+_SINGLE_RUN_OVERRIDES: dict[str, Any] = {
+    "export_failed_generations": False,
+    "force_rerun": True,
+    "run_retrieval_ablations": False,
+    "run_hype_ablations": False,
+    "run_keyword_ablations": False,
+    "run_reranking_ablations": False,
+}
+
+
+def _reference_variant(experiment: dict[str, Any]) -> str:
+    return experiment.get("variant_name") or experiment.get("metadata", {}).get("name", "reference")
+
+
+def _family_retrieval_kwargs(experiment: dict[str, Any], family: FeatureFamily) -> dict[str, Any]:
     kwargs = build_run_assessment_kwargs(experiment)
-    reference_variant = experiment.get("variant_name") or experiment.get("metadata", {}).get(
-        "name", "reference"
-    )
     kwargs.update(
         {
+            **_SINGLE_RUN_OVERRIDES,
             "artifact_dir": family.artifact_dir,
-            "name": _run_name(reference_variant, family, "retrieval"),
+            "name": _run_name(_reference_variant(experiment), family, "retrieval"),
             "include_answer_eval": False,
             "disable_llm_judging": True,
-            "export_failed_generations": False,
-            "force_rerun": True,
-            "run_retrieval_ablations": False,
-            "run_hype_ablations": False,
-            "run_keyword_ablations": False,
-            "run_reranking_ablations": False,
         }
     )
     kwargs[family.ablation_flag] = True
-    retrieval_result = run_assessment_fn(**kwargs)
-    family_metrics = dict(retrieval_result.summary.get(family.summary_key, {}) or {})
-    winner_name, winner_metrics = select_best_variant(family_metrics)
+    return kwargs
 
-    winner_run_dir: str | None = None
-    winner_answer_metrics: dict[str, Any] | None = None
-    if include_answer_eval_for_winner:
-        winner_experiment = _winner_experiment(experiment, family, winner_name)
-        winner_kwargs = build_run_assessment_kwargs(winner_experiment)
-        winner_kwargs.update(
-            {
-                "artifact_dir": family.artifact_dir,
-                "name": winner_experiment["metadata"]["name"],
-                "include_answer_eval": True,
-                "disable_llm_judging": False,
-                "export_failed_generations": False,
-                "force_rerun": True,
-                "run_retrieval_ablations": False,
-                "run_hype_ablations": False,
-                "run_keyword_ablations": False,
-                "run_reranking_ablations": False,
-            }
+
+def _winner_kwargs(winner_experiment: dict[str, Any], family: FeatureFamily) -> dict[str, Any]:
+    kwargs = build_run_assessment_kwargs(winner_experiment)
+    kwargs.update(
+        {
+            **_SINGLE_RUN_OVERRIDES,
+            "artifact_dir": family.artifact_dir,
+            "name": winner_experiment["metadata"]["name"],
+            "include_answer_eval": True,
+            "disable_llm_judging": False,
+        }
+    )
+    return kwargs
+
+
+def _assessment_stage(*, run_assessment_fn=run_assessment, **kwargs: Any) -> dict[str, Any]:
+    result = run_assessment_fn(**kwargs)
+    return {"run_dir": str(result.run_dir), "summary": dict(result.summary or {})}
+
+
+def _run_assessments(
+    runs: list[tuple[str, dict[str, Any], bool]],
+    *,
+    run_assessment_fn,
+    max_workers: int | None,
+) -> dict[str, dict[str, Any]]:
+    """Run ``(name, kwargs, builds_index)`` assessments, index builders first.
+
+    Builders run one at a time in order. The remaining runs skip ingestion and
+    run concurrently against the collections that are already built.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    stages: list[Stage] = []
+    for name, kwargs, builds_index in runs:
+        if builds_index:
+            results[name] = _assessment_stage(run_assessment_fn=run_assessment_fn, **kwargs)
+        else:
+            stages.append(
+                Stage(
+                    name,
+                    _assessment_stage,
+                    kwargs={
+                        **kwargs,
+                        "skip_ingestion": True,
+                        # Runs already execute in parallel; nested stage pools
+                        # would multiply the worker processes.
+                        "stage_workers": 1,
+                        "run_assessment_fn": run_assessment_fn,
+                    },
+                )
+            )
+    if stages:
+        outputs, _ = run_stages(
+            stages, max_workers=max_workers or min(len(stages), DEFAULT_ASSESSMENT_WORKERS)
         )
-        winner_result = run_assessment_fn(**winner_kwargs)
-        winner_run_dir = str(winner_result.run_dir)
+        results.update(outputs)
+    return {name: results[name] for name, _, _ in runs}
+
+
+def _family_study(
+    family: FeatureFamily,
+    retrieval: dict[str, Any],
+    winner_run: dict[str, Any] | None,
+) -> dict[str, Any]:
+    family_metrics = dict(retrieval["summary"].get(family.summary_key, {}) or {})
+    winner_name, winner_metrics = select_best_variant(family_metrics)
+    winner_answer_metrics: dict[str, Any] | None = None
+    if winner_run is not None:
         winner_answer_metrics = dict(
-            winner_result.summary.get("l6_answer_quality_metrics", {}) or {}
+            winner_run["summary"].get("l6_answer_quality_metrics", {}) or {}
         )
-
     baseline_metrics = family_metrics.get(family.baseline_variant, {})
     return {
         "family": family.name,
         "artifact_dir": family.artifact_dir,
-        "retrieval_run_dir": str(retrieval_result.run_dir),
+        "retrieval_run_dir": retrieval["run_dir"],
         "retrieval_metrics_by_variant": family_metrics,
         "winner_variant": winner_name,
         "winner_metrics": winner_metrics,
         "baseline_variant": family.baseline_variant,
         "baseline_metrics": baseline_metrics,
-        "winner_answer_eval_run_dir": winner_run_dir,
+        "winner_answer_eval_run_dir": winner_run["run_dir"] if winner_run else None,
         "winner_answer_eval_metrics": winner_answer_metrics,
         "answer_eval_re_ranked": False,
     }
 
 
+def _winner_run(
+    experiment: dict[str, Any], family: FeatureFamily, retrieval: dict[str, Any]
+) -> tuple[dict[str, Any], bool]:
+    """Winner answer-eval kwargs and whether the run has to build its own index."""
+    family_metrics = dict(retrieval["summary"].get(family.summary_key, {}) or {})
+    winner_name, winner_metrics = select_best_variant(family_metrics)
+    winner_experiment = _winner_experiment(experiment, family, winner_name, winner_metrics)
+    return _winner_kwargs(winner_experiment, family), not winner_experiment.get("skip_ingestion")
+
+
+def run_feature_family(
+    experiment: dict[str, Any],
+    family_name: str,
+    *,
+    include_answer_eval_for_winner: bool = True,
+    run_assessment_fn=run_assessment,
+) -> dict[str, Any]:
+    family = _family_map()[family_name]
+    retrieval = _assessment_stage(
+        run_assessment_fn=run_assessment_fn, **_family_retrieval_kwargs(experiment, family)
+    )
+    winner_run: dict[str, Any] | None = None
+    if include_answer_eval_for_winner:
+        winner_kwargs, _ = _winner_run(experiment, family, retrieval)
+        winner_run = _assessment_stage(run_assessment_fn=run_assessment_fn, **winner_kwargs)
+    return _family_study(family, retrieval, winner_run)
+
+
 def run_feature_ablation_studies(
     *,
     config_path: str = REFERENCE_CONFIG,
@@ -242,6 +336,7 @@ def run_feature_ablation_studies(
     dataset_split: str | None = None,
     include_answer_eval_for_winner: bool = True,
     run_assessment_fn=run_assessment,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
     experiment = load_reference_experiment(config_path, variant_name)
     experiment.setdefault("dataset", {})
@@ -249,16 +344,33 @@ def run_feature_ablation_studies(
         experiment["dataset"]["path"] = dataset_path
     if dataset_split is not None:
         experiment["dataset"]["split"] = dataset_split
-    studies: list[dict[str, Any]] = []
-    for family in FEATURE_FAMILIES:
-        studies.append(
-            run_feature_family(
-                experiment,
+    retrievals = _run_assessments(
+        [
+            (
                 family.name,
-                include_answer_eval_for_winner=include_answer_eval_for_winner,
-                run_assessment_fn=run_assessment_fn,
+                _family_retrieval_kwargs(experiment, family),
+                # The first run also builds the reference collection the others read.
+                family.reingest_required or index == 0,
             )
+            for index, family in enumerate(FEATURE_FAMILIES)
+        ],
+        run_assessment_fn=run_assessment_fn,
+        max_workers=max_workers,
+    )
+    winner_runs: dict[str, dict[str, Any]] = {}
+    if include_answer_eval_for_winner:
+        winner_runs = _run_assessments(
+            [
+                (family.name, *_winner_run(experiment, family, retrievals[family.name]))
+                for family in FEATURE_FAMILIES
+            ],
+            run_assessment_fn=run_assessment_fn,
+            max_workers=max_workers,
         )
+    studies = [
+        _family_study(family, retrievals[family.name], winner_runs.get(family.name))
+        for family in FEATURE_FAMILIES
+    ]
     summary = {
         "config_path": config_path,
         "reference_variant": variant_name,
@@ -1,7 +1,15 @@
 """Feature addition experiment runner.
 
 Extends the ablation framework to test feature additions
-by comparing variants against a baseline.
+by comparing variants against a baseline. Variants that share an
+index-affecting configuration share one collection: it is built once, and the
+variants that only change retrieval-time settings run concurrently against it,
+in spawned worker processes (see ``run_stages``) that open their own Chroma
+clients.
+
+Example:
+    summary = load_and_run_experiment("experiments/medical_semantic_exp.yaml", max_workers=4)
+    winner_name, winner = summary.get_winner()
 """
 
 from __future__ import annotations
@@ -14,12 +22,20 @@ from pathlib import Path
 from typing import Any
 
 from src.evals import run_assessment
-from src.experiments.config import build_run_assessment_kwargs, resolve_experiment_runs
+from src.evals.assessment.stage_scheduler import Stage, run_stages
+from src.experiments.config import (
+    build_run_assessment_kwargs,
+    index_group_key,
+    resolve_experiment_runs,
+)
 from src.experiments.experiment_config import ExperimentConfig, ExperimentVariant
 from src.experiments.metric_utils import resolve_metric_key
 
 logger = logging.getLogger(__name__)
 
+# Retrieval-only variants run concurrently by default, up to this many at once.
+DEFAULT_VARIANT_WORKERS = 4
+
 
 @dataclass
 class VariantResult:
@@ -176,6 +192,7 @@ def run_variant(
     run_assessment_fn=run_assessment,
     skip_ingestion: bool = False,
     collection_name_override: str | None = None,
+    stage_workers: int | None = None,
 ) -> VariantResult:
     """Run a single variant experiment.
 
@@ -184,6 +201,8 @@ def run_variant(
         variant: Variant configuration
         artifact_dir: Directory for artifacts
         run_assessment_fn: Assessment function to run
+        stage_workers: Passed to ``run_assessment``; 1 keeps the L0-L5 stages
+            in the variant's own process (used when variants run concurrently)
 
     Returns:
         VariantResult with run results
@@ -214,6 +233,8 @@ def run_variant(
             "run_reranking_ablations": False,
         }
     )
+    if stage_workers is not None:
+        kwargs["stage_workers"] = stage_workers
 
     # Run assessment
     result = run_assessment_fn(**kwargs)
@@ -239,11 +260,14 @@ def run_variant(
     )
 
 
-def _chunking_key(experiment: dict[str, Any]) -> str:
-    """Extract a hashable key from the chunking config."""
-    configs = experiment.get("ingestion", {}).get("source_chunk_configs", {})
-    strategies = tuple(sorted((k, v.get("strategy", "")) for k, v in (configs or {}).items()))
-    return str(strategies)
+def _run_variant_stage(**kwargs: Any) -> dict[str, Any]:
+    """``run_variant`` for the stage scheduler: failures are returned, not raised."""
+    variant = kwargs["variant"]
+    try:
+        return {"result": run_variant(**kwargs), "error": None}
+    except Exception as e:
+        logger.exception(f"Variant {variant.name} failed: {e}")
+        return {"result": None, "error": str(e)}
 
 
 def run_feature_addition_experiment(
@@ -251,14 +275,23 @@ def run_feature_addition_experiment(
     base_experiment_path: str | None = None,
     base_experiment: dict[str, Any] | None = None,
     run_assessment_fn=run_assessment,
+    max_workers: int | None = None,
 ) -> ExperimentSummary:
     """Run a feature addition experiment.
 
+    Variants are grouped by their index-affecting configuration
+    (``index_group_key``). The first variant of each group ingests and builds
+    the group's collection; builds run one after another because ingestion
+    rewrites the shared processed artifacts. Once every collection is built,
+    the remaining variants only differ in retrieval-time settings and run
+    concurrently against their group's collection without re-ingesting.
+
     Args:
         config: Experiment configuration
         base_experiment_path: Path to base experiment YAML
         base_experiment: Base experiment config dict (overrides path)
         run_assessment_fn: Assessment function to run
+        max_workers: Concurrent retrieval-only variants (default: min(variants, 4); 1 = serial)
 
     Returns:
         ExperimentSummary with all results
@@ -285,19 +318,10 @@ def run_feature_addition_experiment(
     base_artifact_dir = Path(f"data/evals_{config.name}")
     base_artifact_dir.mkdir(parents=True, exist_ok=True)
 
-    # Group variants by chunking strategy to avoid redundant ingestion
-    baseline_exp = _build_experiment_for_variant(
-        base_experiment,
-        config.baseline,
-        str(base_artifact_dir / "baseline"),
-    )
-    baseline_key = _chunking_key(baseline_exp)
-
-    # Build ordered list: (variant, needs_ingestion, group_key)
-    all_variants: list[tuple[ExperimentVariant, bool, str]] = [
-        (config.baseline, True, baseline_key),
-    ]
-    for variant in config.variants or []:
+    # Group variants by index-affecting config: (variant, group_key, builds_index)
+    all_variants: list[tuple[ExperimentVariant, str, bool]] = []
+    group_collections: dict[str, str | None] = {}
+    for variant in [config.baseline, *(config.variants or [])]:
         if variant is None:
             continue
         v_exp = _build_experiment_for_variant(
@@ -305,47 +329,67 @@ def run_feature_addition_experiment(
             variant,
             str(base_artifact_dir / variant.name),
         )
-        v_key = _chunking_key(v_exp)
-        needs_ingestion = v_key not in {key for _, _, key in all_variants}
-        all_variants.append((variant, needs_ingestion, v_key))
+        group_key = index_group_key(v_exp)
+        builds_index = group_key not in group_collections
+        if builds_index:
+            group_collections[group_key] = v_exp["embedding_index"].get("collection_name")
+        all_variants.append((variant, group_key, builds_index))
+    logger.info(
+        f"{len(all_variants)} variants share {len(group_collections)} distinct index configurations"
+    )
 
-    # Run variants: first per chunking group ingests, others reuse collection
-    collection_map: dict[str, str] = {}
     results_map: dict[str, VariantResult] = {}
+    built_groups: set[str] = set()
+    for variant, group_key, builds_index in all_variants:
+        if not builds_index:
+            continue
+        logger.info(f"Running variant {variant.name}: full ingestion + retrieval")
+        outcome = _run_variant_stage(
+            experiment_config=base_experiment,
+            variant=variant,
+            artifact_dir=str(base_artifact_dir / variant.name),
+            run_assessment_fn=run_assessment_fn,
+            skip_ingestion=False,
+        )
+        if outcome["result"] is not None:
+            results_map[variant.name] = outcome["result"]
+            built_groups.add(group_key)
 
-    for variant, needs_ingestion, group_key in all_variants:
-        try:
-            if needs_ingestion:
-                logger.info(f"Running variant {variant.name}: full ingestion + retrieval")
-                result = run_variant(
-                    base_experiment,
-                    variant,
-                    str(base_artifact_dir / variant.name),
-                    run_assessment_fn,
-                    skip_ingestion=False,
-                )
-                # Record collection name for group reuse
-                v_exp = _build_experiment_for_variant(
-                    base_experiment,
-                    variant,
-                    str(base_artifact_dir / variant.name),
-                )
-                collection_map[group_key] = v_exp["embedding_index"]["collection_name"]
-            else:
-                logger.info(
-                    f"Running variant {variant.name}: skipping ingestion, reusing collection {collection_map[group_key]}"
-                )
-                result = run_variant(
-                    base_experiment,
-                    variant,
-                    str(base_artifact_dir / variant.name),
-                    run_assessment_fn,
-                    skip_ingestion=True,
-                    collection_name_override=collection_map[group_key],
-                )
-            results_map[variant.name] = result
-        except Exception as e:
-            logger.exception(f"Variant {variant.name} failed: {e}")
+    stages: list[Stage] = []
+    for variant, group_key, builds_index in all_variants:
+        if builds_index:
+            continue
+        if group_key not in built_groups:
+            logger.error(f"Variant {variant.name} skipped: its index group failed to build")
+            continue
+        logger.info(
+            f"Running variant {variant.name}: skipping ingestion, "
+            f"reusing collection {group_collections[group_key]}"
+        )
+        stages.append(
+            Stage(
+                variant.name,
+                _run_variant_stage,
+                kwargs={
+                    "experiment_config": base_experiment,
+                    "variant": variant,
+                    "artifact_dir": str(base_artifact_dir / variant.name),
+                    "run_assessment_fn": run_assessment_fn,
+                    "skip_ingestion": True,
+                    "collection_name_override": group_collections[group_key],
+                    # Variants already run in parallel; nested stage pools would
+                    # multiply the worker processes.
+                    "stage_workers": 1,
+                },
+            )
+        )
+    if stages:
+        outcomes, _ = run_stages(
+            stages, max_workers=max_workers or min(len(stages), DEFAULT_VARIANT_WORKERS)
+        )
+        for name, outcome in outcomes.items():
+            if outcome["result"] is not None:
+                results_map[name] = outcome["result"]
 
     baseline_result = results_map.get(config.baseline.name)
     if baseline_result is None:
@@ -371,6 +415,7 @@ def load_and_run_experiment(
     base_experiment_path: str | None = None,
     base_experiment: dict[str, Any] | None = None,
     run_assessment_fn=run_assessment,
+    max_workers: int | None = None,
 ) -> ExperimentSummary:
     """Load experiment config from YAML and run.
 
@@ -379,11 +424,12 @@ def load_and_run_experiment(
         base_experiment_path: Path to base experiment YAML
         base_experiment: Base experiment config dict (overrides path)
         run_assessment_fn: Assessment function to run
+        max_workers: Concurrent retrieval-only variants (see run_feature_addition_experiment)
 
     Returns:
         ExperimentSummary with all results
     """
     config = ExperimentConfig.from_yaml(experiment_yaml)
     return run_feature_addition_experiment(
-        config, base_experiment_path, base_experiment, run_assessment_fn
+        config, base_experiment_path, base_experiment, run_assessment_fn, max_workers=max_workers
     )
@@ -60,6 +60,12 @@ def main() -> int:
         default=None,
         help="Override dataset split",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Concurrent retrieval-only variants (default: up to 4; 1 = serial)",
+    )
 
     args = parser.parse_args()
 
@@ -75,6 +81,7 @@ def main() -> int:
         summary = load_and_run_experiment(
             experiment_yaml=experiment_path,
             base_experiment_path=args.base_experiment,
+            max_workers=args.max_workers,
         )
 
         # Write comparison reports
@@ -0,0 +1,97 @@
+"""Atomic JSON files for local caches, checkpoints and indexes.
+
+``read_json`` treats a missing or corrupt file as empty so a cache can always
+be rebuilt, and ``write_json_atomic`` replaces the file in one rename so an
+interrupted run never leaves a half-written cache behind. ``JsonEntryStore``
+is the shared shape of the persistent key/value caches (HyPE questions,
+synthetic question checkpoint): entries are loaded once, mutated in memory and
+written back by ``save`` only when something changed. ``save`` holds an
+exclusive lock on a sibling ``.lock`` file and merges its new entries into
+what is on disk, so concurrent runs sharing one cache file (e.g. parallel
+experiment variants) do not drop each other's entries.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """Load JSON from ``path``; return ``default`` when it is missing or unreadable."""
+    if not path.exists():
+        return default
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to load %s: %s", path, e)
+        return default
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write ``payload`` to ``path`` atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def locked_path(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path``'s sibling ``.lock`` file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(f"{path.name}.lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_entries(path: Path) -> dict[str, Any]:
+    payload = read_json(path, {})
+    entries = payload.get("entries") if isinstance(payload, dict) else None
+    return dict(entries or {})
+
+
+class JsonEntryStore:
+    """Key/value entries persisted as ``{"entries": {...}}`` in one JSON file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: dict[str, Any] = _load_entries(self.path)
+        self._dirty_keys: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        return self._entries.get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._dirty_keys.add(key)
+
+    def save(self) -> None:
+        if not self._dirty_keys:
+            return
+        with locked_path(self.path):
+            entries = _load_entries(self.path)
+            entries.update({key: self._entries[key] for key in self._dirty_keys})
+            write_json_atomic(self.path, {"entries": entries})
+        self._entries = entries
+        self._dirty_keys.clear()
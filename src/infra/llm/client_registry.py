@@ -0,0 +1,191 @@
+"""Process-wide registry of pooled OpenAI-compatible clients for Dashscope.
+
+Every embedding, generation, HyDE/HyPE, enrichment and DeepEval judge call
+goes to the same Dashscope endpoint. Building a fresh ``OpenAI`` client per
+call throws away the connection pool and pays a new TCP/TLS handshake each
+time, so this module hands out long-lived clients backed by tuned httpx
+pools (keep-alive, optional HTTP/2, bounded connections).
+
+Sync clients are shared across the whole process. Async clients are shared
+per event loop, because httpx async connections are bound to the loop that
+opened them and CLI code paths call ``asyncio.run`` more than once. Async
+clients requested outside a running loop are never shared: such a client
+binds to whichever loop first drives it, and reusing it from a later
+``asyncio.run`` would fail with "Event loop is closed".
+
+Example:
+    from src.infra.llm.client_registry import get_openai_client
+    client = get_openai_client()
+    client.embeddings.create(model="text-embedding-v4", input=["hello"])
+
+    # On shutdown (see src.app.factory.lifespan)
+    await aclose_pooled_clients()
+    close_pooled_clients()
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+_ClientKey = tuple[str, str, float | None, int | None]
+
+_registry_lock = threading.Lock()
+_sync_clients: dict[_ClientKey, OpenAI] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_ClientKey, AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+
+
+def http2_available() -> bool:
+    """Return True when HTTP/2 is enabled in settings and ``h2`` is installed."""
+    return bool(settings.llm.http2_enabled) and importlib.util.find_spec("h2") is not None
+
+
+def _build_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.llm.http_max_connections,
+        max_keepalive_connections=settings.llm.http_max_keepalive_connections,
+        keepalive_expiry=settings.llm.http_keepalive_expiry_seconds,
+    )
+
+
+def _client_key(
+    api_key: str | None,
+    base_url: str | None,
+    timeout: float | None,
+    max_retries: int | None,
+) -> _ClientKey:
+    return (
+        base_url or settings.llm.qwen_base_url,
+        api_key if api_key is not None else settings.llm.dashscope_api_key,
+        timeout,
+        max_retries,
+    )
+
+
+def _client_kwargs(key: _ClientKey) -> dict[str, Any]:
+    base_url, api_key, timeout, max_retries = key
+    kwargs: dict[str, Any] = {"api_key": api_key, "base_url": base_url}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    if max_retries is not None:
+        kwargs["max_retries"] = max_retries
+    return kwargs
+
+
+def get_openai_client(
+    *,
+    api_key: str | None = None,
+    base_url: str | None = None,
+    timeout: float | None = None,
+    max_retries: int | None = None,
+) -> OpenAI:
+    """Return the shared sync client for the given endpoint and call options.
+
+    Args:
+        api_key: API key override (defaults to ``settings.llm.dashscope_api_key``)
+        base_url: Endpoint override (defaults to ``settings.llm.qwen_base_url``)
+        timeout: Request timeout in seconds; None keeps the SDK default
+        max_retries: SDK-level retries; None keeps the SDK default
+
+    Returns:
+        OpenAI client backed by a pooled ``httpx.Client``
+    """
+    key = _client_key(api_key, base_url, timeout, max_retries)
+    with _registry_lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            http_client = DefaultHttpxClient(limits=_build_limits(), http2=http2_available())
+            client = OpenAI(http_client=http_client, **_client_kwargs(key))
+            _sync_clients[key] = client
+        return client
+
+
+def get_async_openai_client(
+    *,
+    api_key: str | None = None,
+    base_url: str | None = None,
+    timeout: float | None = None,
+    max_retries: int | None = None,
+) -> AsyncOpenAI:
+    """Return the shared async client for the current event loop.
+
+    Called outside a running loop, a new unshared client is returned; it is
+    safe to use from whichever single loop first drives it.
+
+    Args:
+        api_key: API key override (defaults to ``settings.llm.dashscope_api_key``)
+        base_url: Endpoint override (defaults to ``settings.llm.qwen_base_url``)
+        timeout: Request timeout in seconds; None keeps the SDK default
+        max_retries: SDK-level retries; None keeps the SDK default
+
+    Returns:
+        AsyncOpenAI client backed by a pooled ``httpx.AsyncClient``
+    """
+    key = _client_key(api_key, base_url, timeout, max_retries)
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is None:
+        return _new_async_client(key)
+    with _registry_lock:
+        bucket = _async_clients.setdefault(loop, {})
+        client = bucket.get(key)
+        if client is None:
+            client = _new_async_client(key)
+            bucket[key] = client
+        return client
+
+
+def _new_async_client(key: _ClientKey) -> AsyncOpenAI:
+    http_client = DefaultAsyncHttpxClient(limits=_build_limits(), http2=http2_available())
+    return AsyncOpenAI(http_client=http_client, **_client_kwargs(key))
+
+
+def pooled_client_stats() -> dict[str, int]:
+    """Return counts of live pooled clients (for health/debug output)."""
+    with _registry_lock:
+        return {
+            "sync_clients": len(_sync_clients),
+            "async_clients": sum(len(bucket) for bucket in _async_clients.values()),
+            "async_event_loops": len(_async_clients),
+        }
+
+
+async def aclose_pooled_clients() -> None:
+    """Close async clients owned by the running loop."""
+    loop = asyncio.get_running_loop()
+    with _registry_lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as exc:
+            logger.warning("Failed to close pooled async client: %s", exc)
+
+
+def close_pooled_clients() -> None:
+    """Close all sync clients and drop every registered async client.
+
+    Async clients belonging to other loops cannot be awaited from here; they
+    are released and their transports are reclaimed with the loop.
+    """
+    with _registry_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as exc:
+            logger.warning("Failed to close pooled client: %s", exc)
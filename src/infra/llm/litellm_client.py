@@ -6,30 +6,13 @@ import time
 import litellm
 
 from src.config import settings
+from src.infra.llm.prompts import build_chat_messages
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 INITIAL_DELAY = 1.0
 
-SYSTEM_PROMPT = "You are a medical information assistant that provides educational information about lab tests and health screening results."
-
-USER_PROMPT_TEMPLATE = """You are a helpful medical information assistant.
-Based on the following reference information, answer the user's question.
-
-Reference Information:
-{context}
-
-User Question: {prompt}
-
-Instructions:
-- Provide evidence-based information
-- Always recommend consulting with a healthcare provider
-- Include relevant reference ranges when applicable
-- Mention potential controversies or limitations of tests
-- Do not provide medical diagnoses
-"""
-
 
 def _resolve_model() -> str:
     if settings.llm.litellm_model:
@@ -42,13 +25,6 @@ def _ensure_api_key() -> None:
         os.environ["OPENROUTER_API_KEY"] = settings.llm.openrouter_api_key
 
 
-def _build_messages(prompt: str, context: str = "") -> list[dict[str, str]]:
-    return [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user", "content": USER_PROMPT_TEMPLATE.format(context=context, prompt=prompt)},
-    ]
-
-
 class LiteLLMClient:
     def __init__(self, model: str | None = None):
         self.model = model or _resolve_model()
@@ -60,7 +36,7 @@ class LiteLLMClient:
             try:
                 response = litellm.completion(
                     model=self.model,
-                    messages=_build_messages(prompt, context),
+                    messages=build_chat_messages(prompt, context),
                     temperature=0.7,
                     max_tokens=2048,
                 )
@@ -82,20 +58,24 @@ class LiteLLMClient:
             raise last_exception
         raise RuntimeError("Unexpected error in retry logic")
 
+    async def a_generate_once(self, prompt: str, context: str = "") -> str:
+        """Single ``a_generate`` attempt, for callers that apply their own retries."""
+        response = await litellm.acompletion(
+            model=self.model,
+            messages=build_chat_messages(prompt, context),
+            temperature=0.7,
+            max_tokens=2048,
+        )
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError("Empty response from LiteLLM")
+        return str(content)
+
     async def a_generate(self, prompt: str, context: str = "") -> str:
         last_exception: Exception | None = None
         for attempt in range(MAX_RETRIES):
             try:
-                response = await litellm.acompletion(
-                    model=self.model,
-                    messages=_build_messages(prompt, context),
-                    temperature=0.7,
-                    max_tokens=2048,
-                )
-                content = response.choices[0].message.content
-                if content is None:
-                    raise ValueError("Empty response from LiteLLM")
-                return str(content)
+                return await self.a_generate_once(prompt, context)
             except Exception as e:
                 last_exception = e
                 if attempt < MAX_RETRIES - 1:
@@ -116,7 +96,7 @@ class LiteLLMClient:
             try:
                 stream = await litellm.acompletion(
                     model=self.model,
-                    messages=_build_messages(prompt, context),
+                    messages=build_chat_messages(prompt, context),
                     temperature=0.7,
                     max_tokens=2048,
                     stream=True,
@@ -5,7 +5,8 @@ endpoint) with automatic retry logic for handling transient failures. It constru
 prompts with system instructions optimized for medical information queries.
 
 Key features:
-    - Exponential backoff retry strategy for API resilience
+    - Shared retry policy (jittered backoff, status classification, circuit breaker)
+    - Pooled keep-alive HTTP clients shared process-wide (see client_registry)
     - Medical-domain prompt engineering with safety constraints
     - Configurable model selection (qwen3.5-flash, qwen3.5-plus, qwen-plus, etc.)
     - Temperature and token configuration for consistent responses
@@ -22,64 +23,16 @@ Example:
 
 import asyncio
 import logging
-import time
-from typing import Any
 
-from openai import AsyncOpenAI, OpenAI
+from openai import AsyncOpenAI
 
 from src.config import settings
+from src.infra.llm.client_registry import get_async_openai_client, get_openai_client
+from src.infra.llm.prompts import build_chat_messages
+from src.infra.llm.retry import get_retry_policy
 
 logger = logging.getLogger(__name__)
 
-# Retry configuration
-# Maximum attempts before giving up
-MAX_RETRIES = 3
-# Initial delay in seconds (doubles each retry: 1s, 2s, 4s)
-INITIAL_DELAY = 1.0
-
-
-def retry_with_backoff(func):
-    """Decorator that adds exponential backoff retry logic to a function.
-
-    Retries the wrapped function up to MAX_RETRIES times with exponentially
-    increasing delays between attempts. Logs warnings for retries and errors
-    for final failures.
-
-    Args:
-        func: The function to wrap with retry logic
-
-    Returns:
-        The wrapped function with retry capability
-
-    Raises:
-        Exception: The last exception encountered if all retries fail
-
-    Example:
-        @retry_with_backoff
-        def unstable_api_call():
-            # Might fail transiently
-            return requests.get("https://api.example.com")
-    """
-
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        last_exception: Exception | None = None
-        for attempt in range(MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                if attempt < MAX_RETRIES - 1:
-                    delay = INITIAL_DELAY * (2**attempt)
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
-                    time.sleep(delay)
-                else:
-                    logger.error(f"All {MAX_RETRIES} attempts failed: {e}")
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected error in retry logic")
-
-    return wrapper
-
 
 class QwenClient:
     """Alibaba Qwen LLM client with medical-domain prompt engineering.
@@ -89,7 +42,8 @@ class QwenClient:
     automatic retry logic and configurable model selection.
 
     Attributes:
-        client: Underlying OpenAI client instance (pointing to Dashscope)
+        client: Shared pooled OpenAI client instance (pointing to Dashscope)
+        async_client: Shared pooled AsyncOpenAI client for the running event loop
         model: Qwen model identifier (e.g., "qwen3.5-flash")
 
     Example:
@@ -108,15 +62,15 @@ class QwenClient:
             model: Model identifier (e.g., "qwen3.5-flash", "qwen3.5-plus")
                    If None, uses the model from settings.llm.model_name
         """
-        self.client = OpenAI(
-            api_key=settings.llm.dashscope_api_key, base_url=settings.llm.qwen_base_url
-        )
-        self.async_client = AsyncOpenAI(
-            api_key=settings.llm.dashscope_api_key, base_url=settings.llm.qwen_base_url
-        )
+        # Retries are owned by the shared RetryPolicy, not the SDK.
+        self.client = get_openai_client(max_retries=0)
         self.model = model or settings.llm.model_name
 
-    @retry_with_backoff
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Pooled async client resolved per event loop at call time."""
+        return get_async_openai_client(max_retries=0)
+
     def generate(self, prompt: str, context: str = "") -> str:
         """Generate a response using Qwen with medical context.
 
@@ -142,101 +96,51 @@ class QwenClient:
             - User question
             - Safety instructions (no diagnosis, consult provider)
         """
-        response = self.client.chat.completions.create(
+
+        def _call() -> str:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=build_chat_messages(prompt, context),
+                temperature=0.7,
+                max_tokens=2048,
+            )
+            content = response.choices[0].message.content
+            if content is None:
+                raise ValueError("Empty response from Qwen API")
+            return str(content)
+
+        return get_retry_policy().call(_call, label="Qwen generate")
+
+    async def a_generate_once(self, prompt: str, context: str = "") -> str:
+        """Single ``a_generate`` attempt, for callers that apply their own retry policy."""
+        response = await self.async_client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a medical information assistant that provides educational information about lab tests and health screening results.",
-                },
-                {
-                    "role": "user",
-                    "content": f"""You are a helpful medical information assistant.
-Based on the following reference information, answer the user's question.
-
-Reference Information:
-{context}
-
-User Question: {prompt}
-
-Instructions:
-- Provide evidence-based information
-- Always recommend consulting with a healthcare provider
-- Include relevant reference ranges when applicable
-- Mention potential controversies or limitations of tests
-- Do not provide medical diagnoses
-""",
-                },
-            ],
+            messages=build_chat_messages(prompt, context),
             temperature=0.7,
             max_tokens=2048,
         )
-
         content = response.choices[0].message.content
         if content is None:
             raise ValueError("Empty response from Qwen API")
         return str(content)
 
     async def a_generate(self, prompt: str, context: str = "") -> str:
-        """Generate a response asynchronously using Qwen with medical context."""
-        last_exception: Exception | None = None
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = await self.async_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a medical information assistant that provides educational information about lab tests and health screening results.",
-                        },
-                        {
-                            "role": "user",
-                            "content": f"""You are a helpful medical information assistant.
-Based on the following reference information, answer the user's question.
-
-Reference Information:
-{context}
-
-User Question: {prompt}
-
-Instructions:
-- Provide evidence-based information
-- Always recommend consulting with a healthcare provider
-- Include relevant reference ranges when applicable
-- Mention potential controversies or limitations of tests
-- Do not provide medical diagnoses
-""",
-                        },
-                    ],
-                    temperature=0.7,
-                    max_tokens=2048,
-                )
+        """Generate a response asynchronously using Qwen with medical context.
 
-                content = response.choices[0].message.content
-                if content is None:
-                    raise ValueError("Empty response from Qwen API")
-                return str(content)
-            except Exception as e:
-                last_exception = e
-                if attempt < MAX_RETRIES - 1:
-                    delay = INITIAL_DELAY * (2**attempt)
-                    logger.warning(
-                        "Async attempt %s failed: %s. Retrying in %ss...",
-                        attempt + 1,
-                        e,
-                        delay,
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error("All %s async attempts failed: %s", MAX_RETRIES, e)
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected error in async retry logic")
+        Retries follow the shared policy and back off with ``asyncio.sleep``,
+        so a transient failure never blocks the event loop.
+        """
+        return await get_retry_policy().acall(
+            lambda: self.a_generate_once(prompt, context), label="Qwen async generate"
+        )
 
     async def a_generate_stream(self, prompt: str, context: str = ""):
         """Stream response tokens from Qwen using async generator.
 
-        Yields each token as it arrives from the model.
+        Yields each token as it arrives from the model. Failures are retried
+        under the shared policy only until the first token has been yielded;
+        after that, retrying would duplicate output, so the error is counted
+        against the circuit breaker and propagates.
 
         Args:
             prompt: User's question
@@ -245,35 +149,15 @@ Instructions:
         Yields:
             str: Individual tokens from the model response
         """
-        last_exception: Exception | None = None
-        for attempt in range(MAX_RETRIES):
+        policy = get_retry_policy()
+        attempt = 0
+        while True:
+            policy.before_attempt()
+            yielded = False
             try:
                 stream = await self.async_client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a medical information assistant that provides educational information about lab tests and health screening results.",
-                        },
-                        {
-                            "role": "user",
-                            "content": f"""You are a helpful medical information assistant.
-Based on the following reference information, answer the user's question.
-
-Reference Information:
-{context}
-
-User Question: {prompt}
-
-Instructions:
-- Provide evidence-based information
-- Always recommend consulting with a healthcare provider
-- Include relevant reference ranges when applicable
-- Mention potential controversies or limitations of tests
-- Do not provide medical diagnoses
-""",
-                        },
-                    ],
+                    messages=build_chat_messages(prompt, context),
                     temperature=0.7,
                     max_tokens=2048,
                     stream=True,
@@ -281,24 +165,23 @@ Instructions:
 
                 async for chunk in stream:
                     if chunk.choices and chunk.choices[0].delta.content:
+                        yielded = True
                         yield chunk.choices[0].delta.content
-                return
-            except Exception as e:
-                last_exception = e
-                if attempt < MAX_RETRIES - 1:
-                    delay = INITIAL_DELAY * (2**attempt)
-                    logger.warning(
-                        "Stream attempt %s failed: %s. Retrying in %ss...",
-                        attempt + 1,
-                        e,
-                        delay,
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error("All %s stream attempts failed: %s", MAX_RETRIES, e)
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected error in stream retry logic")
+            except Exception as exc:
+                if yielded:
+                    policy.record_failure(exc)
+                    raise
+                delay = policy.on_failure(exc, attempt, "Qwen stream")
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                policy.on_abort()
+                raise
+            policy.on_success()
+            return
 
 
 def get_client() -> QwenClient:
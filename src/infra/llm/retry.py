@@ -0,0 +1,351 @@
+"""Shared retry policy and circuit breaker for upstream LLM calls.
+
+A single ``RetryPolicy`` drives both the sync and async call paths so they
+agree on what is retryable, how long to wait and when to stop calling a
+degraded upstream altogether:
+
+    - Jittered exponential backoff ("full jitter": a random delay between 0
+      and ``initial_delay * 2**attempt``, capped at ``max_delay``)
+    - Status classification: 408/409/429/5xx and connection/timeout errors are
+      retried; other 4xx responses fail immediately
+    - ``Retry-After`` / ``retry-after-ms`` headers override the computed delay
+    - A circuit breaker that opens after consecutive upstream failures and
+      fails fast with ``CircuitOpenError`` until the reset window elapses
+
+The async path sleeps with ``asyncio.sleep`` so a retry never blocks the
+event loop.
+
+Example:
+    from src.infra.llm.retry import get_retry_policy
+    policy = get_retry_policy()
+    text = policy.call(lambda: client.chat.completions.create(...))
+    text = await policy.acall(lambda: async_client.chat.completions.create(...))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+import httpx
+import openai
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Classify an exception as transient (retry) or permanent (fail now).
+
+    Connection errors, timeouts, 408/409/429 and 5xx responses are transient.
+    Any other HTTP status (auth, validation, not found) is permanent. Errors
+    without a status (e.g. an empty completion) are treated as transient.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, openai.APIConnectionError | httpx.TransportError | TimeoutError):
+        return True
+    status = _status_code(exc)
+    if status is None:
+        return True
+    return status in _RETRYABLE_STATUS_CODES or status >= 500
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Return the server-requested delay from ``Retry-After`` headers, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open).
+
+    While half-open a single trial call is let through. A trial that ends
+    without an outcome (cancelled, or interrupted by a ``BaseException``) is
+    released with ``release_trial``; one that is never released expires after
+    ``reset_timeout`` so the breaker cannot stay open forever.
+
+    Attributes:
+        name: Label used in logs and ``CircuitOpenError``
+        failure_threshold: Consecutive upstream failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a trial call
+    """
+
+    name: str = "llm"
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    _failures: int = field(default=0, init=False, repr=False)
+    _opened_at: float | None = field(default=None, init=False, repr=False)
+    _trial_started_at: float | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked(time.monotonic())
+
+    def _state_locked(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` if the call must not reach upstream."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            state = self._state_locked(now)
+            if state == "closed":
+                return
+            trial_expired = (
+                self._trial_started_at is not None
+                and now - self._trial_started_at >= self.reset_timeout
+            )
+            if state == "half_open" and (self._trial_started_at is None or trial_expired):
+                self._trial_started_at = now
+                return
+            opened_at = self._opened_at or now
+            raise CircuitOpenError(self.name, max(0.0, self.reset_timeout - (now - opened_at)))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started_at = None
+
+    def release_trial(self) -> None:
+        """Let another trial through after one ended without success or failure."""
+        with self._lock:
+            self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            half_open = self._trial_started_at is not None
+            self._trial_started_at = None
+            if half_open or self._failures >= self.failure_threshold:
+                if self._opened_at is None or half_open:
+                    logger.warning(
+                        "Circuit '%s' opened after %s consecutive failures",
+                        self.name,
+                        self._failures,
+                    )
+                self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+@dataclass
+class RetryPolicy:
+    """Retry/backoff policy shared by sync and async upstream calls.
+
+    Attributes:
+        max_attempts: Total attempts including the first call
+        initial_delay: Base delay in seconds (doubles each attempt)
+        max_delay: Upper bound for any single wait, including ``Retry-After``
+        jitter: Use full jitter instead of the deterministic backoff delay
+        breaker: Optional circuit breaker guarding the upstream
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 1.0
+    max_delay: float = 20.0
+    jitter: bool = True
+    breaker: CircuitBreaker | None = None
+
+    def backoff_delay(self, attempt: int, exc: BaseException | None = None) -> float:
+        """Delay before retry number ``attempt + 1`` (``attempt`` is 0-based)."""
+        if exc is not None:
+            server_delay = retry_after_seconds(exc)
+            if server_delay is not None:
+                return min(server_delay, self.max_delay)
+        ceiling = min(self.max_delay, self.initial_delay * (2**attempt))
+        if self.jitter:
+            return random.uniform(0.0, ceiling)
+        return ceiling
+
+    def record_failure(self, exc: BaseException) -> bool:
+        """Count ``exc`` against the breaker without retrying; return whether it is transient."""
+        retryable = is_retryable_error(exc)
+        if self.breaker is not None:
+            # A permanent 4xx still proves the upstream is answering.
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        return retryable
+
+    def on_failure(self, exc: Exception, attempt: int, label: str = "LLM call") -> float | None:
+        """Record a failed attempt; return the delay to wait or None to give up."""
+        retryable = self.record_failure(exc)
+        if not retryable:
+            logger.error("%s failed with non-retryable error: %s", label, exc)
+            return None
+        if attempt >= self.max_attempts - 1:
+            logger.error("All %s %s attempts failed: %s", self.max_attempts, label, exc)
+            return None
+        delay = self.backoff_delay(attempt, exc)
+        logger.warning(
+            "%s attempt %s failed: %s. Retrying in %.2fs...", label, attempt + 1, exc, delay
+        )
+        return delay
+
+    def before_attempt(self) -> None:
+        """Fail fast with ``CircuitOpenError`` while the breaker is open."""
+        if self.breaker is not None:
+            self.breaker.before_call()
+
+    def on_success(self) -> None:
+        """Record a successful attempt (closes the breaker)."""
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def on_abort(self) -> None:
+        """Record an attempt cancelled before it had an outcome."""
+        if self.breaker is not None:
+            self.breaker.release_trial()
+
+    def call(self, func: Callable[[], T], *, label: str = "LLM call") -> T:
+        """Run ``func`` with retries, sleeping between attempts."""
+        attempt = 0
+        while True:
+            self.before_attempt()
+            try:
+                result = func()
+            except Exception as exc:
+                delay = self.on_failure(exc, attempt, label)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self.on_abort()
+                raise
+            self.on_success()
+            return result
+
+    async def acall(self, func: Callable[[], Awaitable[T]], *, label: str = "LLM call") -> T:
+        """Await ``func()`` with retries, yielding to the event loop between attempts."""
+        attempt = 0
+        while True:
+            self.before_attempt()
+            try:
+                result = await func()
+            except Exception as exc:
+                delay = self.on_failure(exc, attempt, label)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self.on_abort()
+                raise
+            self.on_success()
+            return result
+
+    def decorate(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Decorator form of ``call`` for sync functions."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return self.call(lambda: func(*args, **kwargs), label=func.__name__)
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+
+_policy_lock = threading.Lock()
+_default_policy: RetryPolicy | None = None
+
+
+def build_retry_policy(name: str = "dashscope") -> RetryPolicy:
+    """Build a policy (with its own breaker) from ``settings.retry``."""
+    retry = settings.retry
+    return RetryPolicy(
+        max_attempts=max(1, retry.max_retries),
+        initial_delay=retry.retry_delay,
+        max_delay=retry.max_delay,
+        jitter=retry.jitter,
+        breaker=CircuitBreaker(
+            name=name,
+            failure_threshold=retry.circuit_breaker_failure_threshold,
+            reset_timeout=retry.circuit_breaker_reset_seconds,
+        ),
+    )
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the process-wide policy guarding the Dashscope endpoint."""
+    global _default_policy
+    with _policy_lock:
+        if _default_policy is None:
+            _default_policy = build_retry_policy()
+        return _default_policy
+
+
+def reset_retry_policy() -> None:
+    """Drop the process-wide policy so it is rebuilt from settings (tests)."""
+    global _default_policy
+    with _policy_lock:
+        _default_policy = None
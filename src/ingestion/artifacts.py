@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from src.config import DATA_PROCESSED_DIR
+from src.infra.json_store import write_json_atomic
 
 
 @dataclass
@@ -65,12 +66,40 @@ def artifact_dir_for(source_type: str, source_id: str) -> Path:
 
 def persist_source_artifact(artifact: SourceArtifact) -> Path:
     target = artifact_dir_for(artifact.source_type, artifact.source_id) / "artifact.json"
-    target.write_text(json.dumps(asdict(artifact), ensure_ascii=False, indent=2), encoding="utf-8")
+    # Atomic, so quality checks reading artifacts concurrently never see a partial file.
+    write_json_atomic(target, asdict(artifact))
     return target
 
 
+def source_artifact_exists(source_type: str, source_id: str) -> bool:
+    return (DATA_PROCESSED_DIR / source_type / source_id / "artifact.json").exists()
+
+
 def load_source_artifact(source_type: str, source_id: str) -> dict[str, Any] | None:
     target = artifact_dir_for(source_type, source_id) / "artifact.json"
     if not target.exists():
         return None
     return json.loads(target.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+
+
+def processed_dir_for(source_type: str) -> Path:
+    return DATA_PROCESSED_DIR / source_type
+
+
+def run_summary_path(source_type: str) -> Path:
+    return processed_dir_for(source_type) / "_run_summary.json"
+
+
+def persist_run_summary(source_type: str, summary: dict[str, Any]) -> Path:
+    """Persist throughput/timing stats of the latest conversion run for ``source_type``."""
+    target = run_summary_path(source_type)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    return target
+
+
+def load_run_summary(source_type: str) -> dict[str, Any] | None:
+    target = run_summary_path(source_type)
+    if not target.exists():
+        return None
+    return json.loads(target.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
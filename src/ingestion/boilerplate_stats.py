@@ -0,0 +1,163 @@
+"""Persistent per-file block-hash statistics for HTML boilerplate removal.
+
+L1 conversion drops blocks whose text repeats across a large share of the
+corpus. Counting those repeats used to mean parsing every HTML file on every
+run. ``BoilerplateStatsStore`` keeps, across runs:
+
+    - block-hash counts (and structured block text hashes) per file content
+      hash, so a file is only parsed again when its bytes change
+    - a filename -> content hash map validated by size and mtime, so
+      unchanged files are not even re-read
+    - the corpus-wide block-hash counter, updated by subtracting a file's old
+      counts and adding its new ones instead of being rebuilt
+    - a fingerprint of the inputs behind each file's last conversion, so a
+      forced run can skip files whose output would be identical
+
+The store is invalidated wholesale when its ``version`` (parser and hashing
+rules) changes.
+
+Example:
+    store = BoilerplateStatsStore(path, version="lxml:1")
+    digest = store.file_hash(html_path)
+    if store.get(digest) is None:
+        store.put(digest, block_hash_counts, block_text_hashes)
+    store.assign(html_path, digest)
+    store.prune({p.name for p in html_files})
+    repeated = store.repeated_hashes(len(html_files))
+    store.save()
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from src.infra.json_store import read_json, write_json_atomic
+from src.ingestion.manifest import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+def repeated_hashes_from_counts(counts: Counter[str] | dict[str, int], file_count: int) -> set[str]:
+    """Block hashes that occur often enough across the corpus to count as boilerplate."""
+    threshold = max(2, file_count // 3) if file_count else 2
+    return {key for key, count in counts.items() if count >= threshold}
+
+
+class BoilerplateStatsStore:
+    """Block-hash statistics cache keyed by file content hash."""
+
+    def __init__(self, path: Path, *, version: str):
+        self.path = path
+        self.version = version
+        data = read_json(path, {})
+        if data.get("version") != version:
+            data = {}
+        self._entries: dict[str, dict[str, Any]] = dict(data.get("entries") or {})
+        self._files: dict[str, dict[str, Any]] = dict(data.get("files") or {})
+        self._global: Counter[str] = Counter(data.get("global_counts") or {})
+        self._dirty = False
+
+    @property
+    def global_counts(self) -> Counter[str]:
+        return self._global
+
+    def file_hash(self, path: Path) -> str:
+        """Content hash of ``path``; unchanged files (same size/mtime) are not re-read."""
+        stat = path.stat()
+        cached = self._files.get(path.name)
+        if (
+            cached
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("content_hash")
+        ):
+            return str(cached["content_hash"])
+        return content_hash(path.read_bytes())
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        return self._entries.get(digest)
+
+    def put(
+        self,
+        digest: str,
+        block_hash_counts: dict[str, int],
+        block_text_hashes: list[str],
+    ) -> None:
+        self._entries[digest] = {
+            "block_hash_counts": dict(block_hash_counts),
+            "block_text_hashes": list(block_text_hashes),
+        }
+        self._dirty = True
+
+    def _apply(self, digest: str | None, sign: int) -> None:
+        entry = self._entries.get(digest or "")
+        if entry is None:
+            return
+        for key, count in entry["block_hash_counts"].items():
+            updated = self._global[key] + sign * int(count)
+            if updated > 0:
+                self._global[key] = updated
+            else:
+                del self._global[key]
+
+    def assign(self, path: Path, digest: str) -> None:
+        """Point ``path`` at the stats for ``digest``, updating the global counter."""
+        stat = path.stat()
+        previous = self._files.get(path.name)
+        previous_digest = previous.get("content_hash") if previous else None
+        if previous_digest != digest:
+            self._apply(previous_digest, -1)
+            self._apply(digest, +1)
+            self._dirty = True
+        record = {
+            **(previous or {}),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_hash": digest,
+        }
+        if previous != record:
+            self._files[path.name] = record
+            self._dirty = True
+
+    def converted_fingerprint(self, filename: str) -> str | None:
+        """Fingerprint of the inputs behind the last conversion written for ``filename``."""
+        record = self._files.get(filename) or {}
+        value = record.get("converted_fingerprint")
+        return str(value) if value else None
+
+    def mark_converted(self, filename: str, fingerprint: str) -> None:
+        record = self._files.get(filename)
+        if record is not None and record.get("converted_fingerprint") != fingerprint:
+            record["converted_fingerprint"] = fingerprint
+            self._dirty = True
+
+    def prune(self, live_filenames: set[str]) -> None:
+        """Forget files that no longer exist and entries no file refers to."""
+        for name in sorted(set(self._files) - live_filenames):
+            self._apply(self._files.pop(name).get("content_hash"), -1)
+            self._dirty = True
+        referenced = {record.get("content_hash") for record in self._files.values()}
+        for digest in set(self._entries) - referenced:
+            del self._entries[digest]
+            self._dirty = True
+
+    def repeated_hashes(self, file_count: int) -> set[str]:
+        return repeated_hashes_from_counts(self._global, file_count)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        write_json_atomic(
+            self.path,
+            {
+                "version": self.version,
+                "files": self._files,
+                "entries": self._entries,
+                "global_counts": dict(self._global),
+            },
+        )
+        self._dirty = False
+        logger.debug("Saved boilerplate stats for %d files to %s", len(self._files), self.path)
@@ -6,12 +6,19 @@ Bronze→Silver: parsing raw documents into structured format.
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+from src.ingestion.stage_cache import StageCache, file_digest, fingerprint
+
 logger = logging.getLogger(__name__)
 
 
+def ingestion_stage_cache(use_stage_cache: bool) -> StageCache:
+    return StageCache(enabled=use_stage_cache)
+
+
 def silver_data_path(project_root: Path) -> str:
     return str(project_root / "data" / "02_silver")
 
@@ -49,11 +56,21 @@ def parse_markdown_document(md_path: str) -> dict[str, Any]:
 
 def all_pdf_documents(
     all_pdf_downloads: list[str],
+    ingestion_stage_cache: StageCache,
 ) -> list[dict[str, Any]]:
+    from src.ingestion.steps.load_pdfs import PDF_PARSE_CACHE_VERSION, get_pdf_processor_config
+
+    config = asdict(get_pdf_processor_config())
     results = []
     for pdf_path in all_pdf_downloads:
         try:
-            result = parse_pdf_document(pdf_path)
+            key = fingerprint(
+                "parse_text", file_digest(Path(pdf_path)), config, PDF_PARSE_CACHE_VERSION
+            )
+            result = ingestion_stage_cache.lookup("parse", key, Path(pdf_path).name)
+            if result is None:
+                result = parse_pdf_document(pdf_path)
+                ingestion_stage_cache.store("parse", key, result)
             results.append(result)
         except Exception as e:
             logger.warning("Failed to parse PDF %s: %s", pdf_path, e)
@@ -11,6 +11,8 @@ from typing import Any
 
 import polars as pl
 
+from src.ingestion.stage_cache import StageCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,9 +26,10 @@ def gold_chunks_dir(gold_data_path: str) -> str:
 
 def chunk_silver_documents(
     silver_documents_dir: str,
+    ingestion_stage_cache: StageCache,
     source_type: str = "pdf",
 ) -> list[dict[str, Any]]:
-    from src.ingestion.steps.chunk_text import chunk_documents
+    from src.ingestion.stage_cache import chunk_documents_cached
 
     if source_type == "pdf":
         path = Path(silver_documents_dir) / "pdf_documents.parquet"
@@ -38,8 +41,7 @@ def chunk_silver_documents(
 
     df = pl.read_parquet(path)
     docs = df.to_dicts()
-    chunks = chunk_documents(docs)
-    return chunks
+    return chunk_documents_cached(docs, ingestion_stage_cache)
 
 
 def all_chunks(
@@ -10,6 +10,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from src.ingestion.stage_cache import StageCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,18 +30,20 @@ def summaries_path(gold_data_path: str) -> str:
 def generate_hype_for_chunks(
     all_chunks: list[dict[str, Any]],
     hype_config: dict[str, Any],
+    ingestion_stage_cache: StageCache,
 ) -> dict[str, Any]:
     from src.infra.llm.qwen_client import get_client
-    from src.ingestion.steps.hype import generate_hype_questions_for_chunks
+    from src.ingestion.stage_cache import generate_hype_questions_cached
 
     if not all_chunks:
         return {}
 
     client = get_client()
     hype_questions = asyncio.run(
-        generate_hype_questions_for_chunks(
-            chunks=all_chunks,
-            client=client,
+        generate_hype_questions_cached(
+            all_chunks,
+            client,
+            ingestion_stage_cache,
             sample_rate=hype_config.get("sample_rate", 0.1),
             max_chunks=hype_config.get("max_chunks", 500),
             questions_per_chunk=hype_config.get("questions_per_chunk", 2),
@@ -65,18 +69,20 @@ def apply_hype_questions(
 def extract_keywords_for_chunks(
     all_chunks: list[dict[str, Any]],
     enrichment_config: dict[str, Any],
+    ingestion_stage_cache: StageCache,
 ) -> dict[str, Any]:
     from src.infra.llm.qwen_client import get_client
-    from src.ingestion.steps.enrich_chunks import enrich_chunks
+    from src.ingestion.stage_cache import enrich_chunks_cached
 
     if not all_chunks:
         return {}
 
     client = get_client()
     results = asyncio.run(
-        enrich_chunks(
-            chunks=all_chunks,
-            client=client,
+        enrich_chunks_cached(
+            all_chunks,
+            client,
+            ingestion_stage_cache,
             enable_keywords=True,
             enable_summaries=False,
             sample_rate=enrichment_config.get("sample_rate", 1.0),
@@ -104,18 +110,20 @@ def apply_keyword_extractions(
 def generate_summaries_for_chunks(
     all_chunks: list[dict[str, Any]],
     enrichment_config: dict[str, Any],
+    ingestion_stage_cache: StageCache,
 ) -> dict[str, Any]:
     from src.infra.llm.qwen_client import get_client
-    from src.ingestion.steps.enrich_chunks import enrich_chunks
+    from src.ingestion.stage_cache import enrich_chunks_cached
 
     if not all_chunks:
         return {}
 
     client = get_client()
     results = asyncio.run(
-        enrich_chunks(
-            chunks=all_chunks,
-            client=client,
+        enrich_chunks_cached(
+            all_chunks,
+            client,
+            ingestion_stage_cache,
             enable_keywords=False,
             enable_summaries=True,
             sample_rate=enrichment_config.get("sample_rate", 1.0),
@@ -9,6 +9,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from src.ingestion.stage_cache import StageCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +26,7 @@ def embed_chunks(
     all_chunks: list[dict[str, Any]],
     reference_chunks: list[dict[str, Any]],
     embedding_config: dict[str, Any],
+    ingestion_stage_cache: StageCache,
 ) -> list[dict[str, Any]]:
     from src.ingestion.indexing.chroma_store import get_vector_store
 
@@ -32,7 +35,7 @@ def embed_chunks(
 
     all_docs = all_chunks + reference_chunks
     vector_store = get_vector_store()
-    add_stats = vector_store.add_documents(all_docs)
+    add_stats = vector_store.add_documents(all_docs, embedding_cache=ingestion_stage_cache)
 
     return [
         {
@@ -0,0 +1,270 @@
+"""Concurrent HTTP crawler used by the L0 download steps.
+
+One pooled ``httpx.AsyncClient`` is shared by every request of a crawl, so
+connections to the same host are reused instead of paying a TCP/TLS handshake
+per page. Requests are bounded by a global concurrency limit plus a per-host
+concurrency limit and a per-host request rate, which keeps a full refresh
+polite towards each source website while different hosts proceed in parallel.
+
+``fetch`` supports conditional requests: pass the ``etag``/``last_modified``
+validators stored in the download manifest and an unchanged page comes back
+as ``304 Not Modified`` without a body.
+
+Example:
+    async with Crawler(CrawlConfig(per_host_concurrency=2)) as crawler:
+        result = await crawler.fetch(url, etag=record.get("etag"))
+        if result.not_modified:
+            ...
+    print(crawler.stats.format_summary())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+@dataclass(frozen=True)
+class CrawlConfig:
+    """Limits applied to a crawl.
+
+    Attributes:
+        max_concurrency: Maximum requests in flight across all hosts
+        per_host_concurrency: Maximum requests in flight to a single host
+        per_host_requests_per_second: Request start rate per host; 0 disables
+        timeout: Default request timeout in seconds
+        user_agent: User-Agent header sent with every request
+    """
+
+    max_concurrency: int = 16
+    per_host_concurrency: int = 4
+    per_host_requests_per_second: float = 4.0
+    timeout: float = 30.0
+    user_agent: str = DEFAULT_USER_AGENT
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single fetch."""
+
+    url: str
+    status_code: int | None
+    content: bytes = b""
+    encoding: str | None = None
+    content_type: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    elapsed_ms: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 300
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+@dataclass
+class CrawlStats:
+    """Throughput and latency counters for one crawl."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    latencies_ms: list[float] = field(default_factory=list)
+    status_counts: Counter[str] = field(default_factory=Counter)
+    host_counts: Counter[str] = field(default_factory=Counter)
+    bytes_downloaded: int = 0
+
+    def record(self, host: str, result: FetchResult) -> None:
+        self.latencies_ms.append(result.elapsed_ms)
+        self.host_counts[host] += 1
+        status = "error" if result.status_code is None else str(result.status_code)
+        self.status_counts[status] += 1
+        self.bytes_downloaded += len(result.content)
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        latencies = sorted(self.latencies_ms)
+        requests = len(latencies)
+        not_modified = self.status_counts.get("304", 0)
+        failed = sum(
+            count
+            for status, count in self.status_counts.items()
+            if status == "error" or (status.isdigit() and int(status) >= 400)
+        )
+        return {
+            "requests": requests,
+            "ok": requests - failed - not_modified,
+            "not_modified": not_modified,
+            "failed": failed,
+            "hosts": len(self.host_counts),
+            "bytes_downloaded": self.bytes_downloaded,
+            "elapsed_seconds": round(elapsed, 3),
+            "requests_per_second": round(requests / elapsed, 2),
+            "latency_p50_ms": round(_percentile(latencies, 50), 1),
+            "latency_p95_ms": round(_percentile(latencies, 95), 1),
+            "latency_max_ms": round(latencies[-1], 1) if latencies else 0.0,
+            "status_counts": dict(self.status_counts),
+        }
+
+    def format_summary(self) -> str:
+        s = self.summary()
+        return (
+            f"{s['requests']} requests to {s['hosts']} hosts in {s['elapsed_seconds']:.2f}s "
+            f"({s['requests_per_second']:.2f} req/s): {s['ok']} ok, "
+            f"{s['not_modified']} not modified, {s['failed']} failed, "
+            f"{s['bytes_downloaded'] / 1024:.1f} KiB; latency p50 {s['latency_p50_ms']:.0f}ms "
+            f"p95 {s['latency_p95_ms']:.0f}ms max {s['latency_max_ms']:.0f}ms"
+        )
+
+
+class _HostThrottle:
+    """Per-host concurrency limit plus evenly spaced request starts."""
+
+    def __init__(self, concurrency: int, requests_per_second: float):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Crawler:
+    """Shared-client crawler with per-host politeness limits.
+
+    Use as an async context manager; the pooled client is closed on exit
+    unless it was passed in by the caller.
+    """
+
+    def __init__(
+        self,
+        config: CrawlConfig | None = None,
+        *,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.config = config or CrawlConfig()
+        self.stats = CrawlStats()
+        self._client = client
+        self._owns_client = client is None
+        self._global = asyncio.Semaphore(max(1, self.config.max_concurrency))
+        self._hosts: dict[str, _HostThrottle] = {}
+
+    async def __aenter__(self) -> Crawler:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.config.user_agent},
+                limits=httpx.Limits(
+                    max_connections=self.config.max_concurrency,
+                    max_keepalive_connections=self.config.max_concurrency,
+                ),
+            )
+        self.stats = CrawlStats()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _throttle(self, host: str) -> _HostThrottle:
+        throttle = self._hosts.get(host)
+        if throttle is None:
+            throttle = _HostThrottle(
+                self.config.per_host_concurrency, self.config.per_host_requests_per_second
+            )
+            self._hosts[host] = throttle
+        return throttle
+
+    async def fetch(
+        self,
+        url: str,
+        *,
+        timeout: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> FetchResult:
+        """GET ``url``, sending conditional headers when validators are given.
+
+        Never raises for HTTP or transport errors; they are reported on the
+        returned ``FetchResult`` and counted in ``stats``.
+        """
+        if self._client is None:
+            raise RuntimeError("Crawler must be used as an async context manager")
+
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        host = urlparse(url).netloc.lower()
+        throttle = self._throttle(host)
+        async with throttle.semaphore, self._global:
+            await throttle.wait_turn()
+            start = time.perf_counter()
+            try:
+                response = await self._client.get(
+                    url,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else self.config.timeout,
+                )
+                result = FetchResult(
+                    url=url,
+                    status_code=response.status_code,
+                    content=b"" if response.status_code == 304 else response.content,
+                    encoding=response.encoding,
+                    content_type=response.headers.get("content-type"),
+                    etag=response.headers.get("etag") or etag,
+                    last_modified=response.headers.get("last-modified") or last_modified,
+                )
+                if response.status_code >= 400:
+                    result.error = f"HTTP {response.status_code}"
+                    result.content = b""
+            except httpx.RequestError as exc:
+                result = FetchResult(
+                    url=url, status_code=None, error=str(exc) or type(exc).__name__
+                )
+            result.elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.stats.record(host, result)
+        if result.error is not None:
+            logger.warning("Error downloading %s: %s", url, result.error)
+        return result
@@ -7,11 +7,13 @@ are all unchanged — only the storage layer moves to ChromaDB.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -24,6 +26,10 @@ from src.ingestion.indexing.keyword_index import (
     keyword_score,
     keyword_score_with_extracted_keywords,
 )
+from src.ingestion.timing import stage_timer
+
+if TYPE_CHECKING:
+    from src.ingestion.stage_cache import StageCache
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +73,22 @@ from src.source_metadata import (  # noqa: E402
 
 _VALID_SEARCH_MODES = {"rrf_hybrid", "semantic_only", "bm25_only"}
 
+# Records fetched per ``collection.get`` call when scanning the whole index.
+INDEX_PAGE_SIZE = 500
+_DIGEST_MODULUS = 1 << 256
+# Collection metadata keys the store maintains on every write; they are kept
+# out of ``index_metadata`` so readers can fingerprint the index without a scan.
+_INDEX_DIGEST_KEY = "index_digest"
+_INDEX_RECORDS_KEY = "index_digest_records"
+_INDEX_CONTENT_HASHES_KEY = "index_content_hashes"
+_INDEX_STATE_KEYS = (_INDEX_DIGEST_KEY, _INDEX_RECORDS_KEY, _INDEX_CONTENT_HASHES_KEY)
+
+
+def _index_digest_term(doc_id: str, content_hash_value: str) -> int:
+    """Per-record term of the order-independent index digest."""
+    payload = f"{doc_id}\x00{content_hash_value}".encode()
+    return int.from_bytes(hashlib.sha256(payload).digest(), "big")
+
 
 def _source_type_for(source: str) -> str:
     return normalize_source_type(source)
@@ -83,6 +105,114 @@ def _source_class_for(source: str, metadata: dict | None = None) -> str:
     )
 
 
+def _create_chroma_client() -> Any:
+    chroma_host = settings.storage.chroma_server_host.strip()
+    if chroma_host:
+        logger.info(
+            "Connecting to ChromaDB server at %s:%d",
+            chroma_host,
+            settings.storage.chroma_server_port,
+        )
+        return chromadb.HttpClient(
+            host=chroma_host,
+            port=settings.storage.chroma_server_port,
+        )
+    persist_dir = str(settings.storage.chroma_persist_directory)
+    return chromadb.PersistentClient(
+        path=persist_dir,
+        settings=ChromaSettings(allow_reset=True),
+    )
+
+
+def _split_collection_metadata(metadata: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split collection metadata into ``(index_metadata, store-maintained index state)``."""
+    index_metadata = dict(metadata or {})
+    state = {key: index_metadata.pop(key) for key in _INDEX_STATE_KEYS if key in index_metadata}
+    return index_metadata, state
+
+
+def open_collection(collection_name: str) -> Any | None:
+    """Return the existing Chroma collection for read-only use, else ``None``.
+
+    Unlike ``ChromaVectorStore`` this never creates the collection and does
+    not scan it.
+    """
+    try:
+        return _create_chroma_client().get_collection(name=collection_name, embedding_function=None)
+    except Exception as e:
+        logger.debug("Collection %s not available: %s", collection_name, e)
+        return None
+
+
+def read_collection_state(collection_name: str) -> dict[str, Any] | None:
+    """Return the state of an existing collection, else ``None``.
+
+    Keys: ``count``, ``index_metadata`` and, when the store recorded them for
+    the current record count, ``index_digest`` and ``content_hashes_count``
+    (``None`` otherwise, e.g. for indexes written before they were persisted).
+    Reads only collection-level metadata, without creating the collection or
+    loading any documents.
+    """
+    collection = open_collection(collection_name)
+    if collection is None:
+        return None
+    count = int(collection.count())
+    index_metadata, state = _split_collection_metadata(collection.metadata)
+    current = state.get(_INDEX_RECORDS_KEY) == count
+    return {
+        "count": count,
+        "index_metadata": index_metadata,
+        "index_digest": state.get(_INDEX_DIGEST_KEY) if current else None,
+        "content_hashes_count": state.get(_INDEX_CONTENT_HASHES_KEY) if current else None,
+    }
+
+
+def iter_collection_pages(
+    collection: Any,
+    *,
+    include: tuple[str, ...] = ("documents", "metadatas"),
+    page_size: int = INDEX_PAGE_SIZE,
+) -> Iterator[dict[str, list[Any]]]:
+    """Yield ``collection`` in pages of at most ``page_size`` records.
+
+    Each page has ``ids`` plus one list per requested ``include`` field
+    (``documents``, ``metadatas``, ``embeddings``); only one page is held in
+    memory at a time, and embeddings are fetched only when requested.
+    """
+    offset = 0
+    while True:
+        page = cast(
+            dict[str, Any],
+            collection.get(limit=page_size, offset=offset, include=cast(Any, list(include))),
+        )
+        ids: list[Any] = list(page.get("ids") or [])
+        if not ids:
+            return
+        result: dict[str, list[Any]] = {"ids": ids}
+        for name in include:
+            values = page.get(name)
+            values = list(values) if values is not None else []
+            if name == "embeddings":
+                values = [v.tolist() if hasattr(v, "tolist") else v for v in values]
+            result[name] = values
+        yield result
+        if len(ids) < page_size:
+            return
+        offset += len(ids)
+
+
+def extend_index_digest(digest: str, pairs: Iterable[tuple[str, str]]) -> str:
+    """Add ``(id, content_hash)`` pairs to an ``index_digest`` (``""`` for none yet).
+
+    Lets readers compute ``ChromaVectorStore.index_digest`` page by page for
+    indexes that predate the persisted digest.
+    """
+    value = int(digest, 16) if digest else 0
+    for doc_id, content_hash_value in pairs:
+        value = (value + _index_digest_term(doc_id, content_hash_value)) % _DIGEST_MODULUS
+    return f"{value:064x}"
+
+
 class ChromaVectorStore:
     """Vector store backed by ChromaDB persistent storage.
 
@@ -120,30 +250,17 @@ class ChromaVectorStore:
 
         self._embeddings_file: Path | None = None
 
-        chroma_host = settings.storage.chroma_server_host.strip()
-        if chroma_host:
-            logger.info(
-                "Connecting to ChromaDB server at %s:%d",
-                chroma_host,
-                settings.storage.chroma_server_port,
-            )
-            self._client = chromadb.HttpClient(
-                host=chroma_host,
-                port=settings.storage.chroma_server_port,
-            )
-        else:
-            persist_dir = str(settings.storage.chroma_persist_directory)
-            self._client = chromadb.PersistentClient(
-                path=persist_dir,
-                settings=ChromaSettings(allow_reset=True),
-            )
+        self._client = _create_chroma_client()
         self._collection = self._client.get_or_create_collection(
             name=self.collection_name,
             embedding_function=None,
         )
-        self._index_metadata: dict[str, Any] = dict(index_metadata or {})
+        collection_metadata, index_state = _split_collection_metadata(self._collection.metadata)
+        self._index_metadata: dict[str, Any] = dict(index_metadata or collection_metadata)
         self.content_hashes: set[str] = set()
         self._id_set: set[str] = set()
+        self._content_hash_by_id: dict[str, str] = {}
+        self._index_digest_value = 0
         self._doc_ids: list[str] = []
         self._doc_contents: list[str] = []
         self._doc_metadatas: list[dict[str, Any]] = []
@@ -155,10 +272,13 @@ class ChromaVectorStore:
         self._index_dirty = True
         self.last_indexing_stats: dict[str, Any] = {}
 
+        # Documents and keyword indexes load lazily on first search; opening a
+        # store only scans metadata pages for content hashes and the digest.
         self._load_content_hashes()
-        self._rebuild_index_if_needed()
-        if self._index_metadata and self._index_metadata != dict(self._collection.metadata or {}):
-            self._apply_index_metadata()
+        if (
+            self._index_metadata and self._index_metadata != collection_metadata
+        ) or index_state.get(_INDEX_DIGEST_KEY) != self.index_digest:
+            self._persist_collection_metadata()
 
     @property
     def embeddings_file(self) -> Path | None:
@@ -221,8 +341,6 @@ class ChromaVectorStore:
         self.clear()
 
         self._index_metadata = dict(payload.get("index_metadata", {}) or {})
-        if self._index_metadata:
-            self._collection.modify(metadata=self._index_metadata)
 
         normalized_metadatas = metadatas or [{} for _ in ids]
         non_empty_embeddings = bool(embeddings) and all(bool(vector) for vector in embeddings)
@@ -237,28 +355,74 @@ class ChromaVectorStore:
             self._collection.upsert(**upsert_payload)
 
         self._id_set = set(ids)
+        for doc_id, meta in zip(ids, normalized_metadatas, strict=True):
+            self._track_index_digest(doc_id, str((meta or {}).get("content_hash", "")))
         self._doc_ids = []
         self._doc_contents = []
         self._doc_metadatas = []
         self._doc_embeddings = []
         self._doc_id_to_index = {}
         self.content_hashes = set(payload.get("content_hashes", []))
+        self._persist_collection_metadata()
         self._index_dirty = True
         self._rebuild_index_if_needed()
         self._persist_legacy_snapshot()
 
     def _load_content_hashes(self) -> None:
-        all_data = cast(dict[str, Any], self._collection.get(include=["metadatas"]))
-        ids: list[Any] = all_data.get("ids", []) or []
-        metas: list[Any] = all_data.get("metadatas", []) or []
-        for doc_id, meta in zip(ids, metas, strict=False):
-            self._id_set.add(doc_id)
-            if meta and "content_hash" in meta:
-                self.content_hashes.add(str(meta["content_hash"]))
+        for page in self.iter_index_pages(include=("metadatas",)):
+            for doc_id, meta in zip(page["ids"], page["metadatas"], strict=False):
+                self._id_set.add(doc_id)
+                hash_value = str((meta or {}).get("content_hash", ""))
+                if hash_value:
+                    self.content_hashes.add(hash_value)
+                self._track_index_digest(doc_id, hash_value)
+
+    def _track_index_digest(self, doc_id: str, content_hash_value: str) -> None:
+        previous = self._content_hash_by_id.get(doc_id)
+        if previous == content_hash_value:
+            return
+        if previous is not None:
+            self._index_digest_value -= _index_digest_term(doc_id, previous)
+        self._index_digest_value += _index_digest_term(doc_id, content_hash_value)
+        self._index_digest_value %= _DIGEST_MODULUS
+        self._content_hash_by_id[doc_id] = content_hash_value
+
+    @property
+    def index_digest(self) -> str:
+        """Order-independent digest of the indexed ``(id, content_hash)`` pairs.
+
+        Maintained incrementally as documents are added and persisted in the
+        collection metadata on every write (see ``read_collection_state``), so
+        fingerprinting the index never rereads the collection.
+        """
+        return f"{self._index_digest_value:064x}"
+
+    @property
+    def index_metadata(self) -> dict[str, Any]:
+        return dict(self._index_metadata)
+
+    def count(self) -> int:
+        return int(self._collection.count())
 
-    def _apply_index_metadata(self) -> None:
-        if self._index_metadata:
-            self._collection.modify(metadata=self._index_metadata)
+    def iter_index_pages(
+        self,
+        *,
+        include: tuple[str, ...] = ("documents", "metadatas"),
+        page_size: int = INDEX_PAGE_SIZE,
+    ) -> Iterator[dict[str, list[Any]]]:
+        """Yield the collection in pages (see ``iter_collection_pages``)."""
+        return iter_collection_pages(self._collection, include=include, page_size=page_size)
+
+    def _persist_collection_metadata(self) -> None:
+        """Write ``index_metadata`` plus the current digest and counts to the collection."""
+        self._collection.modify(
+            metadata={
+                **self._index_metadata,
+                _INDEX_DIGEST_KEY: self.index_digest,
+                _INDEX_RECORDS_KEY: len(self._content_hash_by_id),
+                _INDEX_CONTENT_HASHES_KEY: len(self.content_hashes),
+            }
+        )
 
     def _tokenize(self, text: str) -> list[str]:
         return tokenize_text(text)
@@ -354,10 +518,15 @@ class ChromaVectorStore:
 
     def set_index_metadata(self, metadata: dict[str, Any] | None = None) -> None:
         self._index_metadata = dict(metadata or {})
-        self._collection.modify(metadata=self._index_metadata)
+        self._persist_collection_metadata()
         self._persist_legacy_snapshot()
 
-    def add_documents(self, documents: list[dict], batch_size: int | None = None) -> dict:
+    def add_documents(
+        self,
+        documents: list[dict],
+        batch_size: int | None = None,
+        embedding_cache: StageCache | None = None,
+    ) -> dict:
         texts = [sanitize_text(doc["content"]) for doc in documents]
         ids = [doc["id"] for doc in documents]
         effective_batch_size = int(batch_size or self.embedding_batch_size)
@@ -423,13 +592,44 @@ class ChromaVectorStore:
                 meta["chunk_summary"] = doc_metadata["chunk_summary"]
             metadatas.append(meta)
 
-        embeddings, embedding_stats = self._embed_with_stats(texts, effective_batch_size)
+        # Content already in the collection is skipped below, so only new
+        # content is embedded; an embedding cache also survives clear().
+        hashes = [content_hash(text) for text in texts]
+        pending_hashes: set[str] = set()
+        new_indices: list[int] = []
+        for i, content_hash_value in enumerate(hashes):
+            if content_hash_value in self.content_hashes or content_hash_value in pending_hashes:
+                continue
+            pending_hashes.add(content_hash_value)
+            new_indices.append(i)
+        embeddings: dict[int, list[float]] = {}
+        if embedding_cache is not None:
+            for i in new_indices:
+                vector = embedding_cache.get_embedding(self.embedding_model, hashes[i])
+                if vector is not None:
+                    embeddings[i] = vector
+        to_embed = [i for i in new_indices if i not in embeddings]
+        if embedding_cache is not None:
+            pending = set(to_embed)
+            for i, doc in enumerate(documents):
+                embedding_cache.record("embed", doc["source"], reused=i not in pending)
+        embedding_stats: dict = {}
+        if to_embed:
+            new_embeddings, embedding_stats = self._embed_with_stats(
+                [texts[i] for i in to_embed], effective_batch_size
+            )
+            embeddings.update(zip(to_embed, new_embeddings, strict=True))
+            if embedding_cache is not None:
+                for i, vector in zip(to_embed, new_embeddings, strict=True):
+                    embedding_cache.put_embedding(self.embedding_model, hashes[i], vector)
 
         stats: dict[str, Any] = {
             "attempted": len(documents),
             "inserted": 0,
             "skipped_duplicate_id": 0,
             "skipped_duplicate_content": 0,
+            "embedded": len(to_embed),
+            "embedding_cache_hits": len(new_indices) - len(to_embed),
             "embedding_stats": embedding_stats,
         }
 
@@ -439,7 +639,7 @@ class ChromaVectorStore:
         to_upsert_metadatas: list[dict[str, Any]] = []
 
         for i, doc_id in enumerate(ids):
-            content_hash_value = content_hash(texts[i])
+            content_hash_value = hashes[i]
 
             if content_hash_value in self.content_hashes:
                 stats["skipped_duplicate_content"] += 1
@@ -458,6 +658,7 @@ class ChromaVectorStore:
 
             self._id_set.add(doc_id)
             self.content_hashes.add(content_hash_value)
+            self._track_index_digest(doc_id, content_hash_value)
             stats["inserted"] += 1
 
         if to_upsert_ids:
@@ -467,6 +668,7 @@ class ChromaVectorStore:
                 documents=to_upsert_documents,
                 metadatas=cast(Any, to_upsert_metadatas),
             )
+            self._persist_collection_metadata()
 
             # Incrementally update keyword index for new documents
             for doc_id, text, meta, embedding in zip(
@@ -569,7 +771,8 @@ class ChromaVectorStore:
         if use_semantic:
             try:
                 embedding_start = time.time()
-                query_embedding = _get_cached_query_embedding(query, self.embedding_model)
+                with stage_timer("query_embedding"):
+                    query_embedding = _get_cached_query_embedding(query, self.embedding_model)
                 trace_info["query_embedding_timing_ms"] = int(
                     (time.time() - embedding_start) * 1000
                 )
@@ -921,6 +1124,8 @@ class ChromaVectorStore:
             self._collection.delete(ids=all_ids)
         self.content_hashes = set()
         self._id_set = set()
+        self._content_hash_by_id = {}
+        self._index_digest_value = 0
         self._doc_ids = []
         self._doc_contents = []
         self._doc_metadatas = []
@@ -930,6 +1135,7 @@ class ChromaVectorStore:
         self._doc_term_freqs = {}
         self._extracted_keywords_list = []
         self._index_metadata = {}
+        self._persist_collection_metadata()
         self._index_dirty = False
         self.last_indexing_stats = {}
         self._remove_legacy_snapshot()
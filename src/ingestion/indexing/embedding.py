@@ -2,25 +2,29 @@
 
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 
 from openai import OpenAI
 
 from src.config import settings
+from src.infra.llm.client_registry import get_openai_client
 
 EMBEDDING_MODEL = settings.llm.embedding_model
+# Output dimensions requested from the embedding API for every call.
+EMBEDDING_DIMENSIONS = 768
 _EMBEDDING_CACHE_MAX_ENTRIES = 512
 _embedding_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
 _embedding_cache_lock = Lock()
 
 
 def get_embedding_client() -> OpenAI:
-    """Get a configured OpenAI client for Qwen embeddings.
+    """Get the shared pooled OpenAI client for Qwen embeddings.
 
     Returns:
         OpenAI client configured for Dashscope API
     """
-    return OpenAI(api_key=settings.llm.dashscope_api_key, base_url=settings.llm.qwen_base_url)
+    return get_openai_client()
 
 
 def _cache_get(model_name: str, text: str) -> list[float] | None:
@@ -43,13 +47,17 @@ def _cache_put(model_name: str, text: str, embedding: list[float]) -> None:
 
 
 def embed_texts_with_stats(
-    texts: list[str], batch_size: int = 10, model: str | None = None
+    texts: list[str],
+    batch_size: int = 10,
+    model: str | None = None,
+    max_concurrency: int = 1,
 ) -> tuple[list[list[float]], dict]:
     """Generate embeddings for a list of texts using Qwen.
 
     Args:
         texts: List of text strings to embed
         batch_size: Number of texts to process per API call
+        max_concurrency: Number of API calls in flight at once
 
     Returns:
         List of embedding vectors (each is a list of floats)
@@ -66,49 +74,57 @@ def embed_texts_with_stats(
 
     start_time = time.time()
     model_name = model or EMBEDDING_MODEL
-    all_embeddings: list[list[float] | None] = [None] * len(texts)
-    uncached_items: list[tuple[int, str]] = []
-    cache_hits = 0
+    resolved: dict[str, list[float]] = {}
+    uncached: list[str] = []
 
-    for idx, text in enumerate(texts):
+    # Duplicate texts within one call are embedded once.
+    for text in dict.fromkeys(texts):
         cached = _cache_get(model_name, text)
         if cached is not None:
-            all_embeddings[idx] = cached
-            cache_hits += 1
+            resolved[text] = cached
         else:
-            uncached_items.append((idx, text))
+            uncached.append(text)
+    cache_hits = sum(1 for text in texts if text in resolved)
 
-    if uncached_items:
+    batches = [uncached[i : i + batch_size] for i in range(0, len(uncached), batch_size)]
+    if batches:
         client = get_embedding_client()
-        for i in range(0, len(uncached_items), batch_size):
-            batch_items = uncached_items[i : i + batch_size]
-            batch = [text for _, text in batch_items]
-            response = client.embeddings.create(model=model_name, input=batch, dimensions=768)
-            for (idx, text), item in zip(batch_items, response.data, strict=True):
-                embedding = item.embedding
-                all_embeddings[idx] = embedding
+
+        def embed_batch(batch: list[str]) -> list[list[float]]:
+            response = client.embeddings.create(
+                model=model_name, input=batch, dimensions=EMBEDDING_DIMENSIONS
+            )
+            return [item.embedding for item in response.data]
+
+        if max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+                batch_results = list(executor.map(embed_batch, batches))
+        else:
+            batch_results = [embed_batch(batch) for batch in batches]
+        for batch, embeddings in zip(batches, batch_results, strict=True):
+            for text, embedding in zip(batch, embeddings, strict=True):
+                resolved[text] = embedding
                 _cache_put(model_name, text, embedding)
 
-    resolved_embeddings = [embedding for embedding in all_embeddings if embedding is not None]
-    if len(resolved_embeddings) != len(texts):
+    if any(text not in resolved for text in texts):
         raise RuntimeError("Embedding generation returned incomplete results")
 
-    return resolved_embeddings, {
+    return [list(resolved[text]) for text in texts], {
         "text_count": len(texts),
-        "batch_count": (len(uncached_items) + batch_size - 1) // batch_size
-        if uncached_items
-        else 0,
+        "batch_count": len(batches),
         "batch_size": batch_size,
         "embedding_model": model_name,
         "elapsed_ms": int((time.time() - start_time) * 1000),
         "failure_count": 0,
         "cache_hit_count": cache_hits,
-        "cache_miss_count": len(uncached_items),
+        "cache_miss_count": len(uncached),
     }
 
 
 def embed_texts(
-    texts: list[str], batch_size: int = 10, model: str | None = None
+    texts: list[str], batch_size: int = 10, model: str | None = None, max_concurrency: int = 1
 ) -> list[list[float]]:
-    embeddings, _ = embed_texts_with_stats(texts, batch_size=batch_size, model=model)
+    embeddings, _ = embed_texts_with_stats(
+        texts, batch_size=batch_size, model=model, max_concurrency=max_concurrency
+    )
     return embeddings
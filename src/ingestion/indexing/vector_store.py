@@ -5,6 +5,7 @@ from src.ingestion.indexing.chroma_store import (
     ChromaVectorStoreFactory,
     get_vector_store,
     get_vector_store_runtime_config,
+    read_collection_state,
     set_vector_store_runtime_config,
 )
 
@@ -18,5 +19,6 @@ __all__ = [
     "VectorStoreFactory",
     "get_vector_store",
     "get_vector_store_runtime_config",
+    "read_collection_state",
     "set_vector_store_runtime_config",
 ]
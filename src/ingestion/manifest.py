@@ -0,0 +1,241 @@
+"""In-memory download manifest with batched, atomic persistence.
+
+The L0 download steps record every URL in ``data/raw/download_manifest.json``.
+Reloading and rewriting that file for each URL, and re-hashing every raw HTML
+file to detect duplicate content, made downloads O(pages^2) in disk I/O.
+``ManifestStore`` loads the manifest once and keeps:
+
+    - url -> latest record, filename/logical name -> first record and
+      content hash -> records indexes
+    - a filename -> content hash cache, validated by file size and mtime and
+      persisted next to the manifest (``download_manifest.hashes.json``), so
+      duplicate detection only hashes files that are new or changed since the
+      last run
+
+Changes are written atomically (temp file + rename) every ``flush_every``
+updates, when the store is closed, and at interpreter exit. The hash cache is
+only rewritten when it changed, and never forces a manifest rewrite.
+
+Example:
+    with ManifestStore(MANIFEST_PATH, DATA_DIR) as manifest:
+        prior = manifest.get_by_url(normalized_url)
+        duplicate = manifest.find_file_by_content_hash(content_hash)
+        manifest.add_record({...})
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any
+
+from src.infra.json_store import read_json, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# Older manifests embedded the hash cache under this key; it is migrated out on load.
+FILE_HASH_CACHE_KEY = "file_hash_cache"
+
+
+def hash_cache_path_for(manifest_path: Path) -> Path:
+    """Location of the file hash cache kept alongside ``manifest_path``."""
+    return manifest_path.with_suffix(".hashes.json")
+
+
+def content_hash(data: bytes) -> str:
+    """Short SHA-256 digest used to identify raw file content."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def load_manifest_file(path: Path) -> dict[str, Any]:
+    manifest = read_json(path)
+    return dict(manifest) if isinstance(manifest, dict) else {"records": []}
+
+
+def write_manifest_file(path: Path, manifest: dict[str, Any]) -> None:
+    """Write ``manifest`` to ``path`` atomically."""
+    write_json_atomic(path, manifest)
+
+
+def _load_hash_cache(path: Path) -> dict[str, dict[str, Any]]:
+    hashes = read_json(path)
+    return dict(hashes) if isinstance(hashes, dict) else {}
+
+
+class ManifestStore:
+    """Download manifest kept in memory for the duration of a crawl."""
+
+    def __init__(
+        self,
+        path: Path,
+        data_dir: Path,
+        *,
+        flush_every: int = 25,
+        hash_cache_path: Path | None = None,
+    ):
+        self.path = path
+        self.data_dir = data_dir
+        self.flush_every = max(1, flush_every)
+        self.hash_cache_path = hash_cache_path or hash_cache_path_for(path)
+        self.manifest = load_manifest_file(path)
+        self.manifest.setdefault("records", [])
+        self._pending = 0
+        legacy_hashes = self.manifest.pop(FILE_HASH_CACHE_KEY, None)
+        self._file_hashes: dict[str, dict[str, Any]] = _load_hash_cache(self.hash_cache_path)
+        self._hashes_dirty = False
+        if legacy_hashes is not None:
+            self._file_hashes = {**dict(legacy_hashes), **self._file_hashes}
+            self._pending += 1
+            self._hashes_dirty = True
+        self._by_url: dict[str, dict] = {}
+        self._by_filename: dict[str, dict] = {}
+        self._by_logical_name: dict[str, dict] = {}
+        self._by_hash: dict[str, list[dict]] = {}
+        for record in self.manifest["records"]:
+            self._index(record)
+        self._hash_to_file: dict[str, str] | None = None
+        self._atexit_registered = False
+
+    def __enter__(self) -> ManifestStore:
+        atexit.register(self.flush)
+        self._atexit_registered = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.flush()
+        if self._atexit_registered:
+            atexit.unregister(self.flush)
+            self._atexit_registered = False
+
+    @property
+    def records(self) -> list[dict]:
+        return self.manifest["records"]
+
+    def _index(self, record: dict) -> None:
+        normalized_url = record.get("normalized_url")
+        if normalized_url:
+            self._by_url[str(normalized_url)] = record
+        filename = record.get("filename")
+        if filename:
+            self._by_filename.setdefault(str(filename), record)
+        logical_name = record.get("logical_name")
+        if logical_name:
+            self._by_logical_name.setdefault(str(logical_name), record)
+        digest = record.get("content_hash")
+        if digest:
+            self._by_hash.setdefault(str(digest), []).append(record)
+
+    def get_by_url(self, normalized_url: str) -> dict | None:
+        return self._by_url.get(normalized_url)
+
+    def get_by_filename(self, filename: str) -> dict | None:
+        return self._by_filename.get(filename)
+
+    def get_by_logical_name(self, logical_name: str) -> dict | None:
+        return self._by_logical_name.get(logical_name)
+
+    def records_by_hash(self, digest: str) -> list[dict]:
+        return self._by_hash.get(digest, [])
+
+    def add_record(self, record: dict) -> None:
+        self.records.append(record)
+        self._index(record)
+        self.mark_dirty()
+
+    def update_record(self, record: dict, **changes: Any) -> None:
+        """Update a record in place, keeping the hash index consistent."""
+        old_hash = record.get("content_hash")
+        record.update(changes)
+        if record.get("filename"):
+            self._by_filename.setdefault(str(record["filename"]), record)
+        new_hash = record.get("content_hash")
+        if old_hash != new_hash:
+            if old_hash and record in self._by_hash.get(str(old_hash), []):
+                self._by_hash[str(old_hash)].remove(record)
+            if new_hash:
+                self._by_hash.setdefault(str(new_hash), []).append(record)
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            write_manifest_file(self.path, self.manifest)
+            self._pending = 0
+        if self._hashes_dirty:
+            write_manifest_file(self.hash_cache_path, self._file_hashes)
+            self._hashes_dirty = False
+
+    def file_hash(self, path: Path) -> str | None:
+        """Content hash of ``path``, reusing the cached digest when size/mtime match."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        cached = self._file_hashes.get(path.name)
+        if (
+            cached
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return str(cached["hash"])
+        try:
+            digest = content_hash(path.read_bytes())
+        except OSError as e:
+            logger.debug("Failed to hash file %s: %s", path.name, e)
+            return None
+        self._file_hashes[path.name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": digest,
+        }
+        self._hashes_dirty = True
+        return digest
+
+    def remember_file(self, path: Path, digest: str) -> None:
+        """Record the hash of a file this process just wrote."""
+        stat = path.stat()
+        self._file_hashes[path.name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": digest,
+        }
+        self._hashes_dirty = True
+        if self._hash_to_file is not None:
+            self._hash_to_file.setdefault(digest, path.name)
+
+    def _build_hash_to_file(self, pattern: str) -> dict[str, str]:
+        index: dict[str, str] = {}
+        live = set()
+        for path in sorted(self.data_dir.glob(pattern)):
+            live.add(path.name)
+            digest = self.file_hash(path)
+            if digest is not None:
+                index.setdefault(digest, path.name)
+        for stale in set(self._file_hashes) - live:
+            if stale.endswith(pattern.lstrip("*")):
+                del self._file_hashes[stale]
+                self._hashes_dirty = True
+        return index
+
+    def find_file_by_content_hash(self, digest: str, pattern: str = "*.html") -> Path | None:
+        """Find a raw file with ``digest`` without re-hashing unchanged files."""
+        if self._hash_to_file is None:
+            self._hash_to_file = self._build_hash_to_file(pattern)
+        filename = self._hash_to_file.get(digest)
+        if filename is None:
+            return None
+        path = self.data_dir / filename
+        if self.file_hash(path) == digest:
+            return path
+        self._hash_to_file = self._build_hash_to_file(pattern)
+        filename = self._hash_to_file.get(digest)
+        return self.data_dir / filename if filename else None
@@ -26,6 +26,7 @@ def build_ingestion_pipeline(
     enable_chunk_summaries: bool = False,
     force_rebuild: bool = False,
     parallel_cores: int = 1,
+    use_stage_cache: bool = True,
 ) -> driver.Driver:
     """Build the ingestion pipeline Hamilton driver.
 
@@ -37,6 +38,8 @@ def build_ingestion_pipeline(
         enable_chunk_summaries: Enable chunk summarization.
         force_rebuild: Force rebuild of vector store.
         parallel_cores: Number of cores for parallel execution.
+        use_stage_cache: Reuse the content-addressed ingestion stage cache
+            (``src.ingestion.stage_cache``) for parse/chunk/enrich/embed.
     """
     modules = _modules
 
@@ -47,6 +50,7 @@ def build_ingestion_pipeline(
         "enable_keyword_extraction": enable_keyword_extraction,
         "enable_chunk_summaries": enable_chunk_summaries,
         "force_rebuild": force_rebuild,
+        "use_stage_cache": use_stage_cache,
         "hype_config": {
             "sample_rate": 0.1,
             "max_chunks": 500,
@@ -0,0 +1,82 @@
+"""Compact per-document quality statistics shared by ingestion and the L1-L3 checks.
+
+Ingestion already parses every HTML file, extracts every PDF page and chunks
+the corpus; the L1-L3 quality checks used to repeat all of that work. The
+HTML and PDF steps now record the few numbers the checks need in
+``artifact.metadata["quality_stats"]``:
+
+    - HTML: visible-text length of the raw page and the parser that produced it
+    - PDF: per-page character counts and replacement characters of the
+      pypdf page text, plus the processor-config fingerprint the artifact
+      was extracted with
+
+Every entry carries the content hash of the source file it was computed
+from; a check trusts the stats only when that hash still matches the file on
+disk and re-parses the source otherwise.
+
+Example:
+    source_hash = source_content_hash(html_path)
+    stats = cached_quality_stats(load_source_artifact("html", html_path.stem), source_hash)
+    if stats is not None:
+        html_chars = stats["html_visible_chars"]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from src.ingestion.manifest import content_hash
+
+QUALITY_STATS_VERSION = 1
+
+
+def source_content_hash(path: Path) -> str:
+    return content_hash(Path(path).read_bytes())
+
+
+def html_quality_stats(source_hash: str, visible_chars: int, *, parser: str) -> dict[str, Any]:
+    return {
+        "version": QUALITY_STATS_VERSION,
+        "source_hash": source_hash,
+        "html_parser": parser,
+        "html_visible_chars": visible_chars,
+    }
+
+
+def pdf_quality_stats(
+    source_hash: str,
+    page_texts: list[str],
+    *,
+    text_extractor: str,
+    config_fingerprint: str,
+) -> dict[str, Any]:
+    return {
+        "version": QUALITY_STATS_VERSION,
+        "source_hash": source_hash,
+        "config_fingerprint": config_fingerprint,
+        "text_extractor": text_extractor,
+        "page_chars": [len(text.strip()) for text in page_texts],
+        "replacement_chars": sum(text.count("\ufffd") for text in page_texts),
+    }
+
+
+def cached_quality_stats(
+    artifact: dict[str, Any] | None, source_hash: str
+) -> dict[str, Any] | None:
+    """Return the artifact's quality stats when they describe ``source_hash``."""
+    stats = ((artifact or {}).get("metadata") or {}).get("quality_stats")
+    if not isinstance(stats, dict):
+        return None
+    if stats.get("version") != QUALITY_STATS_VERSION or stats.get("source_hash") != source_hash:
+        return None
+    return stats
+
+
+__all__ = [
+    "QUALITY_STATS_VERSION",
+    "cached_quality_stats",
+    "html_quality_stats",
+    "pdf_quality_stats",
+    "source_content_hash",
+]
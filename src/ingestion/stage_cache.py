@@ -0,0 +1,362 @@
+"""Content-addressed cache for ingestion stage outputs.
+
+``src.cli.ingest`` used to re-parse every PDF, re-chunk the whole corpus and
+re-run HyPE/enrichment on every run. ``StageCache`` stores the output of each
+stage under a key derived from its inputs, so a re-ingest only recomputes the
+sources that changed:
+
+    - parse:  per PDF, keyed by file content hash + PDF processor config
+    - chunk:  per document, keyed by the parsed document + chunk configs
+    - enrich: per document, keyed by its sampled chunks + prompt version,
+              prompt text and model
+              (sampling runs over the whole corpus first, as without the cache)
+    - embed:  per chunk, keyed by embedding model + chunk content hash
+
+In dry-run mode lookups are counted but nothing is computed or written, which
+lets ``--dry-run`` report what a real run would recompute.
+
+Example:
+    cache = StageCache(INGESTION_CACHE_DIR)
+    docs = PDFLoader().load_all_pdfs(cache=cache)
+    chunks = chunk_documents_cached(docs, cache)
+    print(cache.format_summary())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from array import array
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.config import INGESTION_CACHE_DIR
+from src.infra.json_store import read_json, write_json_atomic
+
+STAGE_CACHE_VERSION = 1
+STAGES = ("parse", "chunk", "enrich", "embed")
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable digest of JSON-serializable ``parts``."""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:32]
+
+
+@dataclass
+class StageStats:
+    reused: int = 0
+    recomputed: int = 0
+    recomputed_sources: list[str] = field(default_factory=list)
+
+
+class StageCache:
+    """Per-stage, content-addressed store of ingestion outputs."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        enabled: bool = True,
+        dry_run: bool = False,
+    ):
+        self.root = Path(root or INGESTION_CACHE_DIR)
+        self.enabled = enabled
+        self.dry_run = dry_run
+        self.stats: dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / stage / key[:2] / f"{key}.json"
+
+    def record(self, stage: str, source: str, *, reused: bool) -> None:
+        stats = self.stats[stage]
+        if reused:
+            stats.reused += 1
+        else:
+            stats.recomputed += 1
+            if source not in stats.recomputed_sources:
+                stats.recomputed_sources.append(source)
+
+    def lookup(self, stage: str, key: str, source: str) -> Any | None:
+        """Return the cached output for ``key`` (or None) and count the hit/miss."""
+        value = None
+        if self.enabled:
+            payload = read_json(self._path(stage, key), {})
+            if payload.get("version") == STAGE_CACHE_VERSION:
+                value = payload.get("value")
+        self.record(stage, source, reused=value is not None)
+        return value
+
+    def store(self, stage: str, key: str, value: Any) -> None:
+        if not self.enabled or self.dry_run:
+            return
+        write_json_atomic(
+            self._path(stage, key),
+            {"version": STAGE_CACHE_VERSION, "stage": stage, "value": value},
+        )
+
+    def _embedding_path(self, model: str, digest: str) -> Path:
+        safe_model = re.sub(r"[^A-Za-z0-9_.-]", "_", model)
+        return self.root / "embed" / safe_model / digest[:2] / f"{digest}.f64"
+
+    def get_embedding(self, model: str, digest: str) -> list[float] | None:
+        if not self.enabled:
+            return None
+        path = self._embedding_path(model, digest)
+        if not path.exists():
+            return None
+        vector = array("d")
+        vector.frombytes(path.read_bytes())
+        return vector.tolist()
+
+    def put_embedding(self, model: str, digest: str, vector: list[float]) -> None:
+        if not self.enabled or self.dry_run:
+            return
+        path = self._embedding_path(model, digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(array("d", vector).tobytes())
+        tmp.replace(path)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per-stage counts. Sources recomputed upstream are recomputed downstream too."""
+        report: dict[str, dict[str, Any]] = {}
+        upstream: list[str] = []
+        for stage in STAGES:
+            stats = self.stats[stage]
+            sources = list(stats.recomputed_sources)
+            sources.extend(source for source in upstream if source not in sources)
+            report[stage] = {
+                "reused": stats.reused,
+                "recomputed": stats.recomputed,
+                "recomputed_sources": sources,
+            }
+            upstream = sources
+        return report
+
+    def format_summary(self) -> str:
+        lines = []
+        for stage, stats in self.summary().items():
+            sources = stats["recomputed_sources"]
+            preview = ", ".join(sources[:5]) + (" ..." if len(sources) > 5 else "")
+            lines.append(
+                f"  {stage:<7} reuse={stats['reused']:<5} recompute={stats['recomputed']:<5}"
+                + (f" sources: {preview}" if sources else "")
+            )
+        return "\n".join(lines)
+
+
+def _document_fingerprint(document: dict) -> str:
+    return fingerprint(
+        {
+            key: document.get(key)
+            for key in ("id", "source", "content", "page", "pages", "structured_blocks", "metadata")
+        }
+    )
+
+
+def chunk_documents_cached(
+    documents: list[dict],
+    cache: StageCache,
+    source_chunk_configs: dict | None = None,
+) -> list[dict]:
+    """Chunk ``documents``, reusing cached chunks for unchanged documents.
+
+    Chunk ids and indexes are assigned per document, so chunking only the
+    changed documents produces the same chunks as a full ``chunk_documents`` call.
+    """
+    from src.config.context import get_runtime_state
+    from src.ingestion.steps.chunking import TextChunker, config
+
+    effective_configs = (
+        source_chunk_configs
+        if source_chunk_configs is not None
+        else config.get_source_chunk_configs()
+    )
+    strategy_flags = {
+        "structured": config.is_structured_chunking_enabled(),
+        "auto_select": bool(get_runtime_state().auto_select_strategy),
+    }
+    cached_chunks: list[list[dict] | None] = []
+    pending: list[tuple[int, str, dict]] = []
+    for document in documents:
+        source = str(document.get("source", document.get("id", "unknown")))
+        key = fingerprint(
+            "chunk", _document_fingerprint(document), effective_configs, strategy_flags
+        )
+        cached = cache.lookup("chunk", key, source)
+        if cached is None and not cache.dry_run:
+            pending.append((len(cached_chunks), key, document))
+        cached_chunks.append(cached)
+
+    if pending:
+        fresh = TextChunker().chunk_each_document(
+            [document for _, _, document in pending], source_chunk_configs=effective_configs
+        )
+        for (index, key, _), doc_chunks in zip(pending, fresh, strict=True):
+            cache.store("chunk", key, doc_chunks)
+            cached_chunks[index] = doc_chunks
+    return [chunk for doc_chunks in cached_chunks if doc_chunks for chunk in doc_chunks]
+
+
+async def _per_source_cached(
+    chunks: list[dict],
+    cache: StageCache,
+    stage_config: dict[str, Any],
+    sample: Callable[[list[dict]], list[dict]],
+    compute: Callable[[list[dict]], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Run ``compute`` only on sampled chunks of sources whose sample or config changed.
+
+    Sampling runs over every chunk, exactly as an uncached run would, so the
+    cache never changes which chunks are enriched; each source's cache key
+    covers the chunks sampled from it. ``compute`` omits chunks whose LLM call
+    failed, so a source is only stored when every sampled chunk has a result;
+    otherwise the next run retries it.
+    """
+    from src.ingestion.indexing.text_utils import content_hash
+
+    by_source: dict[str, list[dict]] = defaultdict(list)
+    for chunk in sample(chunks):
+        by_source[str(chunk.get("source", "unknown"))].append(chunk)
+
+    results: dict[str, Any] = {}
+    pending: list[tuple[str, list[dict]]] = []
+    for source, source_chunks in by_source.items():
+        key = fingerprint(
+            "enrich",
+            stage_config,
+            [(chunk["id"], content_hash(chunk.get("content", ""))) for chunk in source_chunks],
+        )
+        cached = cache.lookup("enrich", key, source)
+        if cached is None:
+            pending.append((key, source_chunks))
+        else:
+            results.update(cached)
+
+    if pending and not cache.dry_run:
+        fresh = await compute([chunk for _, source_chunks in pending for chunk in source_chunks])
+        for key, source_chunks in pending:
+            ids = {chunk["id"] for chunk in source_chunks}
+            if ids <= fresh.keys():
+                cache.store("enrich", key, {cid: fresh[cid] for cid in ids})
+        results.update(fresh)
+    return results
+
+
+async def generate_hype_questions_cached(
+    chunks: list[dict],
+    client: Any,
+    cache: StageCache,
+    *,
+    sample_rate: float,
+    max_chunks: int,
+    questions_per_chunk: int,
+) -> dict[str, list[str]]:
+    """``generate_hype_questions_for_chunks`` recomputing only changed sources."""
+    from src.ingestion.steps.hype import (
+        _weighted_sample_chunks,
+        generate_hype_questions_for_chunks,
+    )
+    from src.rag.hyde import HYPE_PROMPT_VERSION, HYPE_QUESTION_PROMPT_TEMPLATE
+
+    stage_config = {
+        "kind": "hype",
+        "version": HYPE_PROMPT_VERSION,
+        "prompt": fingerprint(HYPE_QUESTION_PROMPT_TEMPLATE),
+        "model": getattr(client, "model", None),
+        "questions_per_chunk": questions_per_chunk,
+    }
+
+    async def compute(pending: list[dict]) -> dict[str, Any]:
+        return await generate_hype_questions_for_chunks(
+            chunks=pending,
+            client=client,
+            sample_rate=1.0,
+            max_chunks=len(pending),
+            questions_per_chunk=questions_per_chunk,
+        )
+
+    return await _per_source_cached(
+        chunks,
+        cache,
+        stage_config,
+        lambda all_chunks: _weighted_sample_chunks(all_chunks, sample_rate, max_chunks),
+        compute,
+    )
+
+
+async def enrich_chunks_cached(
+    chunks: list[dict],
+    client: Any,
+    cache: StageCache,
+    *,
+    enable_keywords: bool,
+    enable_summaries: bool,
+    sample_rate: float,
+    max_chunks: int,
+) -> dict[str, dict[str, Any]]:
+    """``enrich_chunks`` recomputing only changed sources."""
+    from src.ingestion.steps.enrich_chunks import (
+        ENRICH_PROMPT_TEMPLATE,
+        ENRICH_PROMPT_VERSION,
+        _weighted_sample_chunks,
+        enrich_chunks,
+    )
+
+    stage_config = {
+        "kind": "keywords_summaries",
+        "version": ENRICH_PROMPT_VERSION,
+        "prompt": fingerprint(ENRICH_PROMPT_TEMPLATE),
+        "model": getattr(client, "model", None),
+        "enable_keywords": enable_keywords,
+        "enable_summaries": enable_summaries,
+    }
+
+    async def compute(pending: list[dict]) -> dict[str, Any]:
+        return await enrich_chunks(
+            chunks=pending,
+            client=client,
+            enable_keywords=enable_keywords,
+            enable_summaries=enable_summaries,
+            sample_rate=1.0,
+            max_chunks=len(pending),
+        )
+
+    return await _per_source_cached(
+        chunks,
+        cache,
+        stage_config,
+        lambda all_chunks: _weighted_sample_chunks(all_chunks, sample_rate, max_chunks),
+        compute,
+    )
+
+
+def plan_embeddings(
+    documents: list[dict],
+    cache: StageCache,
+    *,
+    embedding_model: str,
+    existing_hashes: set[str],
+) -> None:
+    """Count (without embedding) which documents would need new embeddings."""
+    from src.ingestion.indexing.text_utils import content_hash, sanitize_text
+
+    for document in documents:
+        digest = content_hash(sanitize_text(document.get("content", "")))
+        reused = digest in existing_hashes or (
+            cache.get_embedding(embedding_model, digest) is not None
+        )
+        cache.record("embed", str(document.get("source", "unknown")), reused=reused)
@@ -61,6 +61,8 @@ class ChonkieChunkerAdapter:
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
         self.embedding_model = embedding_model or "text-embedding-v4"
+        self.embedder: QwenEmbeddings | None = None
+        self.last_batch_stats: dict[str, Any] = {}
 
         self._chunker = self._create_chunker()
 
@@ -82,6 +84,7 @@ class ChonkieChunkerAdapter:
     def _create_semantic_chunker(self) -> Any:
         """Create semantic/late chunker (overlap handled separately)."""
         embedder = QwenEmbeddings(model=self.embedding_model)
+        self.embedder = embedder
 
         if self.strategy == "chonkie_semantic":
             return SemanticChunker(
@@ -134,6 +137,12 @@ class ChonkieChunkerAdapter:
                 "token_count_estimate": (
                     chunk.token_count if hasattr(chunk, "token_count") else len(chunk.text.split())
                 ),
+                # Character offsets in ``text`` when the chunker reports them.
+                **(
+                    {"start_char": chunk.start_index, "end_char": chunk.end_index}
+                    if hasattr(chunk, "start_index") and hasattr(chunk, "end_index")
+                    else {}
+                ),
             }
             for idx, chunk in enumerate(chonkie_chunks)
         ]
@@ -146,6 +155,70 @@ class ChonkieChunkerAdapter:
 
         return chunks
 
+    def chunk_texts(self, items: list[tuple[str, str, str, int]]) -> list[list[dict[str, Any]]]:
+        """Chunk ``(text, source, doc_id, page)`` items with this adapter's chunker.
+
+        For embedding-based strategies the chunker first runs against a
+        recording embedder to collect every sentence window of the batch; the
+        unique windows are then embedded in a few concurrent API batches and
+        the real pass is served from those vectors. The recording pass sees
+        placeholder vectors, so a chunker whose requests depend on similarity
+        values may ask for texts that were not prefetched; those are embedded
+        on demand and reported as ``prefetch_misses``. Per-document embedding
+        counts are left in ``last_batch_stats`` (pages of one document are
+        summed under its id).
+
+        Returns one chunk list per item, in input order.
+        """
+        embedder = self.embedder
+        if embedder is None:
+            return [
+                self.chunk_text(text, source, doc_id, page) for text, source, doc_id, page in items
+            ]
+
+        texts_per_document: dict[str, int] = {}
+        with embedder.recording() as requested:
+            for text, source, doc_id, page in items:
+                before = len(requested)
+                self.chunk_text(text, source, doc_id, page)
+                texts_per_document[doc_id] = (
+                    texts_per_document.get(doc_id, 0) + len(requested) - before
+                )
+        prefetch_calls = embedder.prefetch(requested)
+
+        results: list[list[dict[str, Any]]] = []
+        fallback_calls: dict[str, int] = {}
+        misses: dict[str, int] = {}
+        try:
+            for text, source, doc_id, page in items:
+                calls_before = embedder.api_calls
+                misses_before = embedder.prefetch_misses
+                results.append(self.chunk_text(text, source, doc_id, page))
+                fallback_calls[doc_id] = (
+                    fallback_calls.get(doc_id, 0) + embedder.api_calls - calls_before
+                )
+                misses[doc_id] = misses.get(doc_id, 0) + embedder.prefetch_misses - misses_before
+        finally:
+            embedder.clear_prefetched()
+
+        self.last_batch_stats = {
+            "documents": len(items),
+            "embedding_texts": len(requested),
+            "unique_embedding_texts": len(set(requested)),
+            "prefetch_api_calls": prefetch_calls,
+            "embedding_api_calls": prefetch_calls + sum(fallback_calls.values()),
+            "prefetch_misses": sum(misses.values()),
+            "per_document": {
+                doc_id: {
+                    "embedding_texts": texts_per_document.get(doc_id, 0),
+                    "fallback_api_calls": fallback_calls.get(doc_id, 0),
+                    "prefetch_misses": misses.get(doc_id, 0),
+                }
+                for doc_id in texts_per_document
+            },
+        }
+        return results
+
     def _apply_overlap(
         self, chunks: list[dict[str, Any]], original_text: str
     ) -> list[dict[str, Any]]:
@@ -1,8 +1,29 @@
-"""Core chunking implementation."""
+"""Core chunking implementation.
+
+Documents are chunked independently (chunk ids and indexes depend only on the
+document), so ``chunk_documents`` fans them out over a process pool and
+returns chunks in document order. ``TextChunker`` instances for non-default
+source configs are cached per resolved config instead of rebuilt per document.
+Documents whose source config selects an embedding-based strategy are instead
+chunked in-process, one batch per chunker: a first pass over the documents
+collects the text segments (page text, markdown sections, paragraph blocks)
+the chunker would split, ``TextChunker.chunk_texts`` splits all of them so
+their sentence windows are embedded in a few batched API calls, and a second
+pass builds the chunks from those splits. Both passes walk the documents
+exactly like per-document chunking, so batched chunks carry the same
+metadata, offsets, quality scores and structured-block handling.
+
+Example:
+    chunks = chunk_documents(documents, max_workers=4)
+"""
 
 from __future__ import annotations
 
 import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from typing import TYPE_CHECKING, ClassVar
 
 from src.ingestion.steps.chunking import config
@@ -22,6 +43,19 @@ from src.ingestion.steps.chunking.strategies import find_recursive_split
 if TYPE_CHECKING:
     from src.ingestion.steps.chunking.chonkie_adapter import ChonkieChunkerAdapter
 
+# Below this many documents, process start-up costs more than it saves.
+PARALLEL_CHUNKING_MIN_DOCUMENTS = 8
+# Strategies that call the embedding API while splitting.
+EMBEDDING_STRATEGIES = frozenset({"chonkie_semantic", "chonkie_late", "medical_semantic"})
+# Embedding counters summed across batches into ``last_chunking_stats``.
+_EMBEDDING_STAT_KEYS = (
+    "embedding_texts",
+    "unique_embedding_texts",
+    "prefetch_api_calls",
+    "embedding_api_calls",
+    "prefetch_misses",
+)
+
 
 class TextChunker:
     """Text chunker with support for multiple chunking strategies.
@@ -74,6 +108,26 @@ class TextChunker:
         self.min_chunk_size = min_chunk_size
         self.embedding_model = embedding_model or "text-embedding-v4"
         self._chonkie_adapter: ChonkieChunkerAdapter | None = None
+        self.last_chunking_stats: dict = {}
+        # Batched embedding chunking: segments recorded by the first pass and
+        # the adapter's splits served to the second pass (see _split_text).
+        self._segment_sink: list[dict] | None = None
+        self._presplit: dict[str, list[dict]] | None = None
+
+    @property
+    def params(self) -> tuple[int, int, str, int, str]:
+        """Resolved constructor arguments; equal params produce identical chunks."""
+        return (
+            self.chunk_size,
+            self.chunk_overlap,
+            self.strategy,
+            self.min_chunk_size,
+            self.embedding_model,
+        )
+
+    @property
+    def uses_embeddings(self) -> bool:
+        return self.strategy in EMBEDDING_STRATEGIES
 
     @property
     def chonkie_adapter(self) -> ChonkieChunkerAdapter | None:
@@ -105,6 +159,29 @@ class TextChunker:
             text, source, doc_id, page=page, start_chunk_index=0
         )
 
+    def chunk_texts(self, documents: list[dict]) -> list[list[dict]]:
+        """``chunk_text`` for many documents, one chunk list per document.
+
+        Embedding-based strategies share one adapter (and embedder) across the
+        whole batch and embed its sentence windows in batched API calls; the
+        per-document embedding stats end up in ``last_chunking_stats``.
+        """
+        items = [
+            (
+                str(doc.get("content", "")),
+                str(doc.get("source", "unknown")),
+                str(doc.get("id", "doc")),
+                int(doc.get("page", 1)),
+            )
+            for doc in documents
+        ]
+        adapter = self.chonkie_adapter
+        if adapter is not None:
+            results = adapter.chunk_texts(items)
+            self.last_chunking_stats = dict(adapter.last_batch_stats)
+            return results
+        return [self.chunk_text(*item) for item in items]
+
     def _chunk_text_with_base_index(
         self,
         text: str,
@@ -122,6 +199,71 @@ class TextChunker:
         doc_metadata: dict | None = None,
     ) -> list[dict]:
         chunks: list[dict] = []
+        for chunk_text, start, end in self._split_text(text, source, doc_id, page):
+            chunk_index = start_chunk_index + len(chunks)
+            chunks.append(
+                {
+                    "id": f"{doc_id}_p{page}_chunk_{chunk_index}",
+                    "source": source,
+                    "page": page,
+                    "content": chunk_text,
+                    "content_type": content_type,
+                    "section_path": list(section_path or []),
+                    "chunk_index": chunk_index,
+                    "start_char": base_char_offset + start,
+                    "end_char": base_char_offset + end,
+                    "char_count": len(chunk_text),
+                    "token_count_estimate": len(chunk_text.split()),
+                    "quality_score": quality_score,
+                    "parent_block_ids": list(parent_block_ids or []),
+                    "extractor": extractor,
+                    "metadata": build_chunk_metadata(doc_metadata),
+                }
+            )
+        return chunks
+
+    def _split_text(
+        self, text: str, source: str, doc_id: str, page: int
+    ) -> list[tuple[str, int, int]]:
+        """Split ``text`` into ``(content, start, end)`` pieces; offsets are relative to ``text``.
+
+        Embedding-based strategies split with the chonkie adapter; while a
+        batch is being recorded the segment is collected and nothing is
+        returned, and during the batch's second pass the recorded split is used.
+        """
+        adapter = self.chonkie_adapter if self.uses_embeddings else None
+        if adapter is None:
+            return self._recursive_split(text)
+        if not text.strip():
+            # Blank pages never yield a chunk; keep them out of the embedding batch.
+            return []
+        if self._segment_sink is not None:
+            self._segment_sink.append(
+                {"content": text, "source": source, "id": doc_id, "page": page}
+            )
+            return []
+        pieces = self._presplit.get(text) if self._presplit is not None else None
+        if pieces is None:
+            pieces = adapter.chunk_text(text, source, doc_id, page)
+        spans: list[tuple[str, int, int]] = []
+        cursor = 0
+        for piece in pieces:
+            content = str(piece.get("content", "")).strip()
+            if not content:
+                continue
+            start = piece.get("start_char")
+            if start is None:
+                found = text.find(content, cursor)
+                start = found if found != -1 else cursor
+            end = piece.get("end_char")
+            if end is None:
+                end = min(len(text), start + len(content))
+            spans.append((content, start, end))
+            cursor = max(cursor, start)
+        return spans
+
+    def _recursive_split(self, text: str) -> list[tuple[str, int, int]]:
+        spans: list[tuple[str, int, int]] = []
         start = 0
         text_length = len(text)
 
@@ -141,37 +283,15 @@ class TextChunker:
                 end = min(start + self.chunk_size, text_length)
 
             raw_chunk = text[start:end]
-            left_trim = len(raw_chunk) - len(raw_chunk.lstrip())
-            right_trim = len(raw_chunk) - len(raw_chunk.rstrip())
-            trimmed_start = base_char_offset + start + left_trim
-            trimmed_end = base_char_offset + end - right_trim
             chunk_text = raw_chunk.strip()
             if chunk_text:
-                chunk_index = start_chunk_index + len(chunks)
-                chunk_metadata = build_chunk_metadata(doc_metadata)
-                chunks.append(
-                    {
-                        "id": f"{doc_id}_p{page}_chunk_{chunk_index}",
-                        "source": source,
-                        "page": page,
-                        "content": chunk_text,
-                        "content_type": content_type,
-                        "section_path": list(section_path or []),
-                        "chunk_index": chunk_index,
-                        "start_char": trimmed_start,
-                        "end_char": trimmed_end,
-                        "char_count": len(chunk_text),
-                        "token_count_estimate": len(chunk_text.split()),
-                        "quality_score": quality_score,
-                        "parent_block_ids": list(parent_block_ids or []),
-                        "extractor": extractor,
-                        "metadata": chunk_metadata,
-                    }
-                )
+                left_trim = len(raw_chunk) - len(raw_chunk.lstrip())
+                right_trim = len(raw_chunk) - len(raw_chunk.rstrip())
+                spans.append((chunk_text, start + left_trim, end - right_trim))
 
             start = end - self.chunk_overlap if end < text_length else text_length
 
-        return chunks
+        return spans
 
     def _chunk_markdown_document(
         self,
@@ -346,8 +466,110 @@ class TextChunker:
         self,
         documents: list[dict],
         source_chunk_configs: dict | None = None,
+        max_workers: int | None = None,
     ) -> list[dict]:
-        all_chunks = []
+        return [
+            chunk
+            for doc_chunks in self.chunk_each_document(
+                documents, source_chunk_configs=source_chunk_configs, max_workers=max_workers
+            )
+            for chunk in doc_chunks
+        ]
+
+    def chunk_each_document(
+        self,
+        documents: list[dict],
+        source_chunk_configs: dict | None = None,
+        max_workers: int | None = None,
+    ) -> list[list[dict]]:
+        """Chunk ``documents`` and return one chunk list per document, in input order.
+
+        Chunk ids and indexes depend only on the document, so documents are
+        chunked independently: in a process pool when there are enough of them
+        (``max_workers`` defaults to the CPU count), otherwise in-process.
+        Documents whose config selects an embedding-based strategy are batched
+        per chunker through ``chunk_texts``; the batch and embedding API counts
+        are left in ``last_chunking_stats``.
+        """
+        cfg_map = self._resolve_config_map(source_chunk_configs)
+        structured = config.is_structured_chunking_enabled()
+        results: list[list[dict] | None] = [None] * len(documents)
+        embedding_groups: dict[tuple, tuple[TextChunker, list[int]]] = {}
+        local: list[int] = []
+        for index, doc in enumerate(documents):
+            doc_chunker = self._document_chunker(doc, cfg_map)
+            if doc_chunker.uses_embeddings:
+                embedding_groups.setdefault(doc_chunker.params, (doc_chunker, []))[1].append(index)
+            else:
+                local.append(index)
+
+        stats: dict = {
+            "documents": len(documents),
+            "embedding_documents": len(documents) - len(local),
+            "embedding_batches": len(embedding_groups),
+            **dict.fromkeys(_EMBEDDING_STAT_KEYS, 0),
+        }
+        for doc_chunker, indexes in embedding_groups.values():
+            grouped = doc_chunker._chunk_embedding_documents(
+                [documents[i] for i in indexes], structured
+            )
+            for index, doc_chunks in zip(indexes, grouped, strict=True):
+                results[index] = doc_chunks
+            for key in _EMBEDDING_STAT_KEYS:
+                stats[key] += int(doc_chunker.last_chunking_stats.get(key, 0))
+
+        local_docs = [documents[i] for i in local]
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(local_docs)))
+        if workers <= 1 or len(local_docs) < PARALLEL_CHUNKING_MIN_DOCUMENTS:
+            local_chunks = [self._chunk_document(doc, cfg_map, structured) for doc in local_docs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                local_chunks = list(
+                    executor.map(
+                        _chunk_document_in_worker,
+                        repeat(self.params),
+                        local_docs,
+                        repeat(cfg_map),
+                        repeat(structured),
+                        chunksize=max(1, len(local_docs) // (workers * 4)),
+                    )
+                )
+        for index, doc_chunks in zip(local, local_chunks, strict=True):
+            results[index] = doc_chunks
+        self.last_chunking_stats = stats
+        return [doc_chunks or [] for doc_chunks in results]
+
+    def _chunk_embedding_documents(
+        self, documents: list[dict], structured: bool
+    ) -> list[list[dict]]:
+        """Chunk documents with this embedding-based chunker in one ``chunk_texts`` batch.
+
+        Produces the same chunks as ``_chunk_single_document`` on each document.
+        """
+        segments: list[dict] = []
+        self._segment_sink = segments
+        try:
+            for doc in documents:
+                self._chunk_single_document(doc, structured)
+        finally:
+            self._segment_sink = None
+        unique = list({segment["content"]: segment for segment in segments}.values())
+        if not unique:
+            # Every page was empty: no batch to embed, so skip the dispatch.
+            self.last_chunking_stats = {}
+            return [[] for _ in documents]
+        pieces = self.chunk_texts(unique)
+        self._presplit = {
+            segment["content"]: segment_pieces
+            for segment, segment_pieces in zip(unique, pieces, strict=True)
+        }
+        try:
+            return [self._chunk_single_document(doc, structured) for doc in documents]
+        finally:
+            self._presplit = None
+
+    @staticmethod
+    def _resolve_config_map(source_chunk_configs: dict | None) -> dict:
         cfg_map = copy.deepcopy(config.DEFAULT_SOURCE_CHUNK_CONFIGS)
         if source_chunk_configs:
             for key, value in source_chunk_configs.items():
@@ -355,94 +577,97 @@ class TextChunker:
                     cfg_map[key].update(value)
                 else:
                     cfg_map[key] = dict(value)
-        for doc in documents:
-            source = doc.get("source", "unknown")
-            doc_id = doc.get("id", "doc")
-            doc_metadata = doc.get("metadata", {})
-            doc_chunk_index = 0
-            source_key = self._source_kind(source)
-            active_cfg = cfg_map.get(source_key, cfg_map.get("default", {}))
-            doc_chunker = (
-                self
-                if self._matches_self_config(active_cfg)
-                else TextChunker(
-                    chunk_size=int(active_cfg.get("chunk_size", self.chunk_size)),  # type: ignore[call-overload]
-                    chunk_overlap=int(active_cfg.get("chunk_overlap", self.chunk_overlap)),  # type: ignore[call-overload]
-                    strategy=str(active_cfg.get("strategy", self.strategy)),
-                    min_chunk_size=int(active_cfg.get("min_chunk_size", self.min_chunk_size)),  # type: ignore[call-overload]
-                    embedding_model=str(active_cfg.get("embedding_model", self.embedding_model)),
-                )
-            )
+        return cfg_map
+
+    def _chunker_for(self, cfg: dict) -> TextChunker:
+        if self._matches_self_config(cfg):
+            return self
+        return chunker_for_config(
+            int(cfg.get("chunk_size", self.chunk_size)),
+            int(cfg.get("chunk_overlap", self.chunk_overlap)),
+            str(cfg.get("strategy", self.strategy)),
+            int(cfg.get("min_chunk_size", self.min_chunk_size)),
+            str(cfg.get("embedding_model", self.embedding_model)),
+        )
 
-            if "pages" in doc:
-                for page_data in doc["pages"]:
-                    page_num = page_data.get("page", 1)
-                    blocks = (
-                        (page_data.get("structured_blocks") or [])
-                        if config.is_structured_chunking_enabled()
-                        else []
-                    )
-                    text = page_data.get("content", "")
-                    if blocks:
-                        chunks = doc_chunker._chunk_structured_blocks(
-                            blocks,
-                            source,
-                            doc_id,
-                            default_page=page_num,
-                            start_chunk_index=doc_chunk_index,
-                            doc_metadata=doc_metadata,
-                        )
-                    elif text:
-                        chunks = doc_chunker._chunk_text_with_base_index(
-                            text,
-                            source,
-                            doc_id,
-                            page=page_num,
-                            start_chunk_index=doc_chunk_index,
-                            quality_score=0.8,
-                            extractor=str(page_data.get("extractor", "")) or None,
-                            doc_metadata=doc_metadata,
-                        )
-                    else:
-                        chunks = []
-                    if chunks:
-                        chunks = doc_chunker._filter_low_quality_chunks(chunks)
-                        all_chunks.extend(chunks)
-                        doc_chunk_index += len(chunks)
-            else:
-                content = doc.get("content", "")
-                page = doc.get("page", 1)
-                if config.is_structured_chunking_enabled() and doc.get("structured_blocks"):
-                    chunks = doc_chunker._chunk_structured_blocks(
-                        list(doc.get("structured_blocks", [])),
-                        source,
-                        doc_id,
-                        default_page=page,
-                        start_chunk_index=doc_chunk_index,
-                        doc_metadata=doc_metadata,
-                    )
-                elif str(source).lower().endswith(".md"):
-                    chunks = doc_chunker._chunk_markdown_document(
-                        content,
+    def _document_chunker(self, doc: dict, cfg_map: dict) -> TextChunker:
+        source_key = self._source_kind(doc.get("source", "unknown"))
+        return self._chunker_for(cfg_map.get(source_key, cfg_map.get("default", {})))
+
+    def _chunk_document(self, doc: dict, cfg_map: dict, structured: bool) -> list[dict]:
+        return self._document_chunker(doc, cfg_map)._chunk_single_document(doc, structured)
+
+    def _chunk_single_document(self, doc: dict, structured: bool) -> list[dict]:
+        all_chunks: list[dict] = []
+        source = doc.get("source", "unknown")
+        doc_id = doc.get("id", "doc")
+        doc_metadata = doc.get("metadata", {})
+        doc_chunk_index = 0
+        if "pages" in doc:
+            for page_data in doc["pages"]:
+                page_num = page_data.get("page", 1)
+                blocks = (page_data.get("structured_blocks") or []) if structured else []
+                text = page_data.get("content", "")
+                if blocks:
+                    chunks = self._chunk_structured_blocks(
+                        blocks,
                         source,
                         doc_id,
-                        page=page,
+                        default_page=page_num,
                         start_chunk_index=doc_chunk_index,
                         doc_metadata=doc_metadata,
                     )
-                else:
-                    chunks = doc_chunker._chunk_text_with_base_index(
-                        content,
+                elif text:
+                    chunks = self._chunk_text_with_base_index(
+                        text,
                         source,
                         doc_id,
-                        page=page,
+                        page=page_num,
                         start_chunk_index=doc_chunk_index,
                         quality_score=0.8,
+                        extractor=str(page_data.get("extractor", "")) or None,
                         doc_metadata=doc_metadata,
                     )
-                chunks = doc_chunker._filter_low_quality_chunks(chunks)
-                all_chunks.extend(chunks)
-                doc_chunk_index += len(chunks)
+                else:
+                    chunks = []
+                if chunks:
+                    chunks = self._filter_low_quality_chunks(chunks)
+                    all_chunks.extend(chunks)
+                    doc_chunk_index += len(chunks)
+        else:
+            content = doc.get("content", "")
+            page = doc.get("page", 1)
+            if structured and doc.get("structured_blocks"):
+                chunks = self._chunk_structured_blocks(
+                    list(doc.get("structured_blocks", [])),
+                    source,
+                    doc_id,
+                    default_page=page,
+                    start_chunk_index=doc_chunk_index,
+                    doc_metadata=doc_metadata,
+                )
+            elif str(source).lower().endswith(".md"):
+                chunks = self._chunk_markdown_document(
+                    content,
+                    source,
+                    doc_id,
+                    page=page,
+                    start_chunk_index=doc_chunk_index,
+                    doc_metadata=doc_metadata,
+                )
+            else:
+                chunks = self._chunk_text_with_base_index(
+                    content,
+                    source,
+                    doc_id,
+                    page=page,
+                    start_chunk_index=doc_chunk_index,
+                    quality_score=0.8,
+                    doc_metadata=doc_metadata,
+                )
+            chunks = self._filter_low_quality_chunks(chunks)
+            all_chunks.extend(chunks)
+            doc_chunk_index += len(chunks)
 
         return all_chunks
 
@@ -460,11 +685,41 @@ class TextChunker:
         return source_kind(source)
 
 
-def chunk_documents(documents: list[dict], source_chunk_configs: dict | None = None) -> list[dict]:
+@lru_cache(maxsize=32)
+def chunker_for_config(
+    chunk_size: int,
+    chunk_overlap: int,
+    strategy: str,
+    min_chunk_size: int,
+    embedding_model: str,
+) -> TextChunker:
+    """Process-wide ``TextChunker`` per resolved config (chonkie adapters load lazily once)."""
+    return TextChunker(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        strategy=strategy,
+        min_chunk_size=min_chunk_size,
+        embedding_model=embedding_model,
+    )
+
+
+def _chunk_document_in_worker(
+    params: tuple[int, int, str, int, str], doc: dict, cfg_map: dict, structured: bool
+) -> list[dict]:
+    return chunker_for_config(*params)._chunk_document(doc, cfg_map, structured)
+
+
+def chunk_documents(
+    documents: list[dict],
+    source_chunk_configs: dict | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
     chunker = TextChunker()
     effective_configs = source_chunk_configs
     if effective_configs is None:
         runtime_configs = config.get_source_chunk_configs()
         if runtime_configs != config.DEFAULT_SOURCE_CHUNK_CONFIGS:
             effective_configs = copy.deepcopy(runtime_configs)
-    return chunker.chunk_documents_with_configs(documents, source_chunk_configs=effective_configs)
+    return chunker.chunk_documents_with_configs(
+        documents, source_chunk_configs=effective_configs, max_workers=max_workers
+    )
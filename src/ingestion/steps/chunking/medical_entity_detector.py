@@ -2,13 +2,31 @@
 
 Uses spaCy with optional scispaCy models for detecting medical entities
 that should inform chunking boundaries (drugs, conditions, procedures).
+
+One detector (and one loaded spaCy model) is shared per model name in the
+process. Texts are analysed in batches with ``nlp.pipe`` and results are
+cached per text, so repeated passes over the same text are free.
+
+Example:
+    detector = get_medical_entity_detector()
+    per_text = detector.detect_entities_batch(texts)
+    hints = detector.get_boundary_hints(texts[0])  # served from the cache
 """
 
 from __future__ import annotations
 
+import copy
+import multiprocessing
+import os
 import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import cache
+from threading import Lock
 from typing import Any, ClassVar
 
+_DOSAGE_RE = re.compile(r"\d+\s*(?:mg|mcg|g|ml|units?)", re.IGNORECASE)
+
 
 class MedicalEntityDetector:
     """Detects medical entities that should inform chunking decisions.
@@ -42,15 +60,37 @@ class MedicalEntityDetector:
         r"\b(?:Type\s+[12]\s+diabetes)\b",
     ]
 
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    DRUG_REGEXES: ClassVar[tuple[re.Pattern[str], ...]] = tuple(
+        re.compile(pattern, re.IGNORECASE) for pattern in DRUG_PATTERNS
+    )
+    CONDITION_REGEXES: ClassVar[tuple[re.Pattern[str], ...]] = tuple(
+        re.compile(pattern, re.IGNORECASE) for pattern in CONDITION_PATTERNS
+    )
+
+    CACHE_MAX_ENTRIES: ClassVar[int] = 4096
+
+    def __init__(
+        self,
+        model_name: str = "en_core_web_sm",
+        batch_size: int = 64,
+        n_process: int | None = None,
+    ):
         """Initialize medical entity detector.
 
         Args:
             model_name: spaCy model name. Falls back to regex if unavailable.
+            batch_size: Texts per ``nlp.pipe`` batch
+            n_process: spaCy worker processes for large batches (defaults to
+                the CPU count, or 1 inside a worker process such as the
+                chunking pool, so pools do not nest)
         """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.n_process = n_process or _default_n_process()
         self._nlp = None
         self._use_fallback = False
+        self._cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._cache_lock = Lock()
 
     @property
     def nlp(self):
@@ -60,8 +100,8 @@ class MedicalEntityDetector:
                 import spacy
 
                 self._nlp = spacy.load(self.model_name, disable=["parser", "lemmatizer"])
-            except OSError:
-                # Model not installed, use fallback patterns
+            except (ImportError, OSError):
+                # spaCy or the model not installed, use fallback patterns
                 self._use_fallback = True
         return self._nlp
 
@@ -74,32 +114,58 @@ class MedicalEntityDetector:
         Returns:
             List of entity dicts with keys: text, label, start, end, confidence
         """
-        if self._use_fallback or self.nlp is None:
-            return self._detect_with_fallback(text)
+        return self.detect_entities_batch([text])[0]
 
-        doc = self.nlp(text)
-        entities = []
+    def detect_entities_batch(self, texts: list[str]) -> list[list[dict[str, Any]]]:
+        """Detect medical entities for many texts, one entity list per text.
 
-        for ent in doc.ents:
-            if ent.label_ in self.RELEVANT_ENTITY_LABELS:
-                entities.append(
-                    {
-                        "text": ent.text,
-                        "label": ent.label_,
-                        "start": ent.start_char,
-                        "end": ent.end_char,
-                        "confidence": 1.0,  # spaCy doesn't provide confidence by default
-                    }
-                )
-
-        return entities
+        Uncached texts are analysed together with ``nlp.pipe``; batches larger
+        than two ``batch_size`` runs are spread over ``n_process`` processes.
+        """
+        results: dict[str, list[dict[str, Any]]] = {}
+        with self._cache_lock:
+            for text in texts:
+                cached = self._cache.get(text)
+                if cached is not None:
+                    self._cache.move_to_end(text)
+                    results[text] = cached
+        pending = [text for text in dict.fromkeys(texts) if text not in results]
+
+        if pending:
+            if self._use_fallback or self.nlp is None:
+                detected = [self._detect_with_fallback(text) for text in pending]
+            else:
+                n_process = self.n_process if len(pending) >= 2 * self.batch_size else 1
+                docs = self.nlp.pipe(pending, batch_size=self.batch_size, n_process=n_process)
+                detected = [self._entities_from_doc(doc) for doc in docs]
+            with self._cache_lock:
+                for text, entities in zip(pending, detected, strict=True):
+                    results[text] = entities
+                    self._cache[text] = entities
+                while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+
+        return [copy.deepcopy(results[text]) for text in texts]
+
+    def _entities_from_doc(self, doc: Any) -> list[dict[str, Any]]:
+        return [
+            {
+                "text": ent.text,
+                "label": ent.label_,
+                "start": ent.start_char,
+                "end": ent.end_char,
+                "confidence": 1.0,  # spaCy doesn't provide confidence by default
+            }
+            for ent in doc.ents
+            if ent.label_ in self.RELEVANT_ENTITY_LABELS
+        ]
 
     def _detect_with_fallback(self, text: str) -> list[dict[str, Any]]:
         """Fallback regex-based detection for when spaCy unavailable."""
         entities = []
 
-        for pattern in self.DRUG_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for regex in self.DRUG_REGEXES:
+            for match in regex.finditer(text):
                 entities.append(
                     {
                         "text": match.group(),
@@ -110,8 +176,8 @@ class MedicalEntityDetector:
                     }
                 )
 
-        for pattern in self.CONDITION_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for regex in self.CONDITION_REGEXES:
+            for match in regex.finditer(text):
                 entities.append(
                     {
                         "text": match.group(),
@@ -161,26 +227,33 @@ class MedicalEntityDetector:
         Returns:
             True if segment contains medical entity relationships to preserve
         """
-        entities = self.detect_entities(text_segment)
+        return self.keeps_together(self.detect_entities(text_segment), text_segment)
+
+    @staticmethod
+    def keeps_together(entities: Iterable[dict[str, Any]], text_segment: str) -> bool:
+        """``should_keep_together`` for entities that were already detected.
+
+        Lets callers reuse batched ``detect_entities_batch`` results (e.g. of
+        two adjacent chunks) instead of parsing their concatenation again.
+        """
+        has_drug = any(ent["label"] == "DRUG" for ent in entities)
+        return has_drug and bool(_DOSAGE_RE.search(text_segment))
 
-        # Drug + dosage pattern
-        for ent in entities:
-            if ent["label"] == "DRUG":
-                # Check for dosage info nearby
-                dosage_pattern = r"\d+\s*(?:mg|mcg|g|ml|units?)"
-                if re.search(dosage_pattern, text_segment, re.IGNORECASE):
-                    return True
 
-        return False
+def _default_n_process() -> int:
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return os.cpu_count() or 1
 
 
+@cache
 def get_medical_entity_detector(model_name: str = "en_core_web_sm") -> MedicalEntityDetector:
-    """Factory function for medical entity detector.
+    """Process-wide medical entity detector per spaCy model.
 
     Args:
         model_name: spaCy model name
 
     Returns:
-        Configured MedicalEntityDetector instance
+        Shared MedicalEntityDetector instance
     """
     return MedicalEntityDetector(model_name=model_name)
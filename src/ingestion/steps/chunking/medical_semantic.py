@@ -74,6 +74,11 @@ class MedicalSemanticChunkerAdapter(ChonkieChunkerAdapter):
             self._structure_rules = get_medical_structure_rules(min_chunk_size=self.min_chunk_size)
         return self._structure_rules
 
+    def chunk_texts(self, items: list[tuple[str, str, str, int]]) -> list[list[dict[str, Any]]]:
+        """Batch variant of ``chunk_text``; entities for all texts are detected in one pipe."""
+        self.entity_detector.detect_entities_batch([text for text, *_ in items])
+        return super().chunk_texts(items)
+
     def _apply_medical_preprocessing(self, text: str) -> tuple[str, dict[str, Any]]:
         """Apply medical-aware preprocessing to text.
 
@@ -139,7 +144,11 @@ class MedicalSemanticChunkerAdapter(ChonkieChunkerAdapter):
         return text, metadata
 
     def _should_merge_chunks(
-        self, chunk1: dict[str, Any], chunk2: dict[str, Any], metadata: dict[str, Any]
+        self,
+        chunk1: dict[str, Any],
+        chunk2: dict[str, Any],
+        metadata: dict[str, Any],
+        entities: list[dict[str, Any]] | None = None,
     ) -> bool:
         """Check if two chunks should be merged based on medical structure.
 
@@ -147,15 +156,25 @@ class MedicalSemanticChunkerAdapter(ChonkieChunkerAdapter):
             chunk1: First chunk
             chunk2: Second chunk (follows chunk1)
             metadata: Medical preprocessing metadata
+            entities: Entities already detected in both chunks; detected
+                here when not given
 
         Returns:
             True if chunks should stay together
         """
         content1 = chunk1["content"]
         content2 = chunk2["content"]
+        if entities is None:
+            entities = [
+                ent
+                for chunk_entities in self.entity_detector.detect_entities_batch(
+                    [content1, content2]
+                )
+                for ent in chunk_entities
+            ]
 
         # Don't split mid-dosing section
-        if self.entity_detector.should_keep_together(content1 + " " + content2):
+        if self.entity_detector.keeps_together(entities, content1 + " " + content2):
             return True
 
         # Don't split lab tables
@@ -197,12 +216,21 @@ class MedicalSemanticChunkerAdapter(ChonkieChunkerAdapter):
 
         processed = []
         i = 0
+        # One spaCy pass over every chunk instead of one per adjacent pair.
+        chunk_entities = self.entity_detector.detect_entities_batch(
+            [chunk["content"] for chunk in chunks]
+        )
 
         while i < len(chunks):
             current = chunks[i]
 
             # Check if we should merge with next chunk
-            if i + 1 < len(chunks) and self._should_merge_chunks(current, chunks[i + 1], metadata):
+            if i + 1 < len(chunks) and self._should_merge_chunks(
+                current,
+                chunks[i + 1],
+                metadata,
+                chunk_entities[i] + chunk_entities[i + 1],
+            ):
                 # Merge current and next
                 merged = self._merge_two_chunks(current, chunks[i + 1], original_text)
                 processed.append(merged)
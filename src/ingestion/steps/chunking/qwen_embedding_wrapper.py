@@ -3,16 +3,28 @@
 Provides an embedding interface that uses the existing Qwen/Dashscope
 embedding pipeline, allowing chonkie semantic chunkers to use
 the same embeddings as the main retrieval pipeline.
+
+Semantic chunkers ask for one sentence window at a time. To avoid one API
+round trip per window, callers can ``prefetch`` every window of a batch of
+documents: unique texts are embedded in concurrent batches through the shared
+embedding cache and later ``embed`` calls are served from memory. In
+``recording`` mode the wrapper returns placeholder vectors and only collects
+the texts a chunker asks for, which is how those windows are discovered.
+Chunkers that choose what to embed from earlier similarities (rather than
+from the sentence split alone) can ask for different texts once real vectors
+come back; those are fetched on demand and counted in ``prefetch_misses``.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import numpy as np
 from chonkie.embeddings.base import BaseEmbeddings
 
-from src.ingestion.indexing.embedding import embed_texts
+from src.ingestion.indexing.embedding import EMBEDDING_DIMENSIONS, embed_texts_with_stats
 
 
 class QwenEmbeddings(BaseEmbeddings):
@@ -33,26 +45,77 @@ class QwenEmbeddings(BaseEmbeddings):
         model: str = "text-embedding-v4",
         batch_size: int = 10,
         dimensions: int | None = None,
+        max_concurrency: int = 4,
     ):
         """Initialize Qwen embeddings wrapper.
 
         Args:
             model: Qwen embedding model name
             batch_size: Number of texts to embed per API call
-            dimensions: Embedding dimensions (auto-detected if None)
+            dimensions: Embedding dimensions (defaults to the dimensions
+                requested from the embedding API)
+            max_concurrency: Embedding API calls in flight during prefetch
         """
         super().__init__()
         self.model = model
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
         self._dimensions: int | None = dimensions
+        self._prefetched: dict[str, np.ndarray] = {}
+        self._serving_prefetched = False
+        self._recorded: list[str] | None = None
+        self.api_calls = 0
+        self.prefetch_misses = 0
 
     @property
     def dimension(self) -> int:
-        """Get embedding dimensions, auto-detecting if not set."""
-        if self._dimensions is None:
-            dummy_emb = embed_texts(["test"], batch_size=1, model=self.model)
-            self._dimensions = len(dummy_emb[0])
-        return self._dimensions
+        """Embedding dimensions; known up front, so no probe call is made."""
+        return self._dimensions or EMBEDDING_DIMENSIONS
+
+    def _fetch(self, texts: list[str]) -> list[np.ndarray]:
+        if self._recorded is not None:
+            self._recorded.extend(texts)
+            placeholder = np.ones(self.dimension) / np.sqrt(self.dimension)
+            return [placeholder for _ in texts]
+        missing = list(dict.fromkeys(text for text in texts if text not in self._prefetched))
+        fetched: dict[str, np.ndarray] = {}
+        if missing:
+            if self._serving_prefetched:
+                self.prefetch_misses += len(missing)
+            embeddings, stats = embed_texts_with_stats(
+                missing,
+                batch_size=self.batch_size,
+                model=self.model,
+                max_concurrency=self.max_concurrency,
+            )
+            self.api_calls += int(stats.get("batch_count", 0))
+            fetched = {text: np.array(emb) for text, emb in zip(missing, embeddings, strict=True)}
+        return [
+            self._prefetched[text] if text in self._prefetched else fetched[text] for text in texts
+        ]
+
+    @contextmanager
+    def recording(self) -> Iterator[list[str]]:
+        """Collect requested texts (returning placeholder vectors) instead of embedding."""
+        self._recorded = []
+        try:
+            yield self._recorded
+        finally:
+            self._recorded = None
+
+    def prefetch(self, texts: Iterable[str]) -> int:
+        """Embed all unique ``texts`` in concurrent batches; returns API calls made."""
+        missing = list(dict.fromkeys(text for text in texts if text not in self._prefetched))
+        calls_before = self.api_calls
+        if missing:
+            for text, vector in zip(missing, self._fetch(missing), strict=True):
+                self._prefetched[text] = vector
+        self._serving_prefetched = True
+        return self.api_calls - calls_before
+
+    def clear_prefetched(self) -> None:
+        self._prefetched.clear()
+        self._serving_prefetched = False
 
     def embed(self, text: str) -> np.ndarray:
         """Embed a single text using Qwen API.
@@ -63,8 +126,7 @@ class QwenEmbeddings(BaseEmbeddings):
         Returns:
             Embedding vector as numpy array
         """
-        embeddings = embed_texts([text], batch_size=1, model=self.model)
-        return np.array(embeddings[0])
+        return self._fetch([text])[0]
 
     def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
         """Embed a batch of texts.
@@ -75,8 +137,7 @@ class QwenEmbeddings(BaseEmbeddings):
         Returns:
             List of embedding vectors as numpy arrays
         """
-        embeddings = embed_texts(texts, batch_size=self.batch_size, model=self.model)
-        return [np.array(emb) for emb in embeddings]
+        return self._fetch(list(texts))
 
     def get_tokenizer(self) -> Any:
         """Return a simple character tokenizer for Qwen API-based embeddings."""
@@ -8,17 +8,37 @@ Supports pluggable extractor strategies:
   - html2md_trafilatura_bs: html-to-markdown primary + trafilatura + BeautifulSoup cascade
   - readability_bs:        readability-lxml primary + BeautifulSoup fallback
   - full_cascade:          html-to-markdown → trafilatura → readability → BeautifulSoup
+
+Each document is parsed once (lxml via BeautifulSoup). The same tree is used
+for page classification, structured block extraction, the BeautifulSoup
+markdown fallback and the block hashes behind repeated-boilerplate removal.
+``main`` fans files out over a ``ProcessPoolExecutor``, merges the results in
+file order, and writes per-file timings plus a run summary (files/s and time
+per extractor) next to the L1 artifacts.
+
+Example:
+    from src.ingestion.steps.convert_html import main
+
+    summary = main(force=True, max_workers=4)
+    print(summary["files_per_second"], summary["timings_ms_total"])
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
+import os
 import re
+import time
 from collections import Counter
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlsplit, urlunsplit
@@ -27,8 +47,18 @@ from bs4 import BeautifulSoup
 
 from src.config import DATA_RAW_DIR
 from src.config.context import get_runtime_state
-from src.ingestion.artifacts import SourceArtifact, persist_source_artifact
+from src.ingestion.artifacts import (
+    SourceArtifact,
+    persist_run_summary,
+    persist_source_artifact,
+    processed_dir_for,
+    source_artifact_exists,
+)
+from src.ingestion.boilerplate_stats import BoilerplateStatsStore, repeated_hashes_from_counts
+from src.ingestion.manifest import content_hash
+from src.ingestion.quality_stats import html_quality_stats, source_content_hash
 from src.ingestion.steps.download_web import get_manifest_alias_filenames
+from src.ingestion.timing import rounded_timings, summarize_timings, timed
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +80,12 @@ except Exception:  # pragma: no cover - optional dependency
     readability = None
     logger.debug("readability-lxml not available")
 
+try:
+    importlib.import_module("lxml")
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml ships with readability-lxml
+    HTML_PARSER = "html.parser"
+
 
 @dataclass
 class HTMLProcessorConfig:
@@ -113,6 +149,7 @@ def get_html_processor_config() -> HTMLProcessorConfig:
 
 
 EXTRACTOR_CHAIN_DEPTH: int | None = None
+BOILERPLATE_STATS_VERSION = 1
 DATA_DIR = DATA_RAW_DIR
 
 _REMOVAL_SELECTORS = [
@@ -217,8 +254,8 @@ def _remove_noise(soup: BeautifulSoup) -> None:
             tag.decompose()
 
 
-def _classify_page(soup: BeautifulSoup, visible_text: str) -> str:
-    if not _page_classification_enabled():
+def _classify_page(soup: BeautifulSoup, visible_text: str, enabled: bool | None = None) -> str:
+    if not (_page_classification_enabled() if enabled is None else enabled):
         return "article"
     nav_links = len(soup.select("nav a, header a"))
     headings = len(soup.find_all(re.compile(r"^h[1-6]$")))
@@ -325,8 +362,8 @@ def _visible_text(soup: BeautifulSoup) -> str:
     return str(soup.get_text("\n", strip=True))
 
 
-def _density(text: str, html_content: str) -> float:
-    return len(_normalize_text(text)) / max(1, len(html_content))
+def _density(text: str, html_length: int) -> float:
+    return len(_normalize_text(text)) / max(1, html_length)
 
 
 def _boilerplate_ratio(text: str) -> float:
@@ -335,19 +372,74 @@ def _boilerplate_ratio(text: str) -> float:
     return hits / max(1, len(lowered))
 
 
+@dataclass
+class ParsedHTML:
+    """Everything derived from the single BeautifulSoup tree of one document."""
+
+    page_type: str
+    visible_text: str
+    structured_blocks: list[dict[str, Any]]
+    markdown: str
+    block_hash_counts: dict[str, int]
+    raw_visible_chars: int = 0
+
+
+def _block_hash_counts(soup: BeautifulSoup) -> dict[str, int]:
+    counts: Counter[str] = Counter()
+    for node in soup.find_all(["p", "li", "div", "span"]):
+        text = _normalize_text(node.get_text(" ", strip=True))
+        if len(text) < 20:
+            continue
+        counts[_hash_text(text)] += 1
+    return dict(counts)
+
+
+def _parse_html(
+    html_content: str,
+    *,
+    page_classification_enabled: bool | None = None,
+    timings: dict[str, float] | None = None,
+) -> ParsedHTML:
+    """Parse ``html_content`` once and derive every BeautifulSoup-based output.
+
+    The page is classified on the raw tree (navigation and headers intact);
+    blocks, visible text and boilerplate hashes use the tree after noise removal.
+    """
+    with timed(timings, "parse"):
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    with timed(timings, "classify"):
+        raw_visible_text = _visible_text(soup)
+        page_type = _classify_page(soup, raw_visible_text, page_classification_enabled)
+    with timed(timings, "beautifulsoup"):
+        _remove_noise(soup)
+        visible_text = _visible_text(soup)
+        blocks = _collect_structured_blocks(soup)
+        markdown = _markdown_from_blocks(blocks)
+    with timed(timings, "boilerplate_hash"):
+        hash_counts = _block_hash_counts(soup)
+    return ParsedHTML(
+        page_type=page_type,
+        visible_text=visible_text,
+        structured_blocks=blocks,
+        markdown=markdown,
+        block_hash_counts=hash_counts,
+        raw_visible_chars=len(raw_visible_text),
+    )
+
+
+def visible_text_chars(html_content: str) -> int:
+    """Visible-text length of the raw page, as recorded in the L1 quality stats."""
+    return len(_visible_text(BeautifulSoup(html_content, HTML_PARSER)))
+
+
 def _fallback_extract(html_content: str) -> dict[str, Any]:
-    soup = BeautifulSoup(html_content, "html.parser")
-    _remove_noise(soup)
-    visible_text = _visible_text(soup)
-    page_type = _classify_page(soup, visible_text)
-    blocks = _collect_structured_blocks(soup)
-    markdown = _markdown_from_blocks(blocks)
+    parsed = _parse_html(html_content)
     return {
         "extractor": "beautifulsoup",
-        "page_type": page_type,
-        "visible_text": visible_text,
-        "structured_blocks": blocks,
-        "markdown": markdown,
+        "page_type": parsed.page_type,
+        "visible_text": parsed.visible_text,
+        "structured_blocks": parsed.structured_blocks,
+        "markdown": parsed.markdown,
     }
 
 
@@ -356,7 +448,7 @@ def _should_use_fallback(primary_markdown: str, page_type: str, html_content: st
         return True
     if page_type in {"index/listing", "navigation-heavy"}:
         return True
-    if _density(primary_markdown, html_content) < 0.02:
+    if _density(primary_markdown, len(html_content)) < 0.02:
         return True
     if _boilerplate_ratio(primary_markdown) > 0.02:
         return True
@@ -368,19 +460,42 @@ def _should_use_fallback(primary_markdown: str, page_type: str, html_content: st
     return False
 
 
-def _compute_global_boilerplate_hashes(html_files: list[Path]) -> set[str]:
-    counts: Counter[str] = Counter()
+def _block_text_hashes(parsed: ParsedHTML) -> list[str]:
+    return [_hash_text(str(block.get("text", ""))) for block in parsed.structured_blocks]
+
+
+def _boilerplate_stats_store() -> BoilerplateStatsStore:
+    return BoilerplateStatsStore(
+        processed_dir_for("html") / "_boilerplate_stats.json",
+        version=f"{HTML_PARSER}:{BOILERPLATE_STATS_VERSION}",
+    )
+
+
+def _compute_global_boilerplate_hashes(
+    html_files: list[Path], stats: BoilerplateStatsStore | None = None
+) -> set[str]:
+    """Block hashes repeated across ``html_files``.
+
+    With a ``stats`` store only files whose content is not cached are parsed;
+    the store's global counter is updated incrementally and saved.
+    """
+    if stats is None:
+        counts: Counter[str] = Counter()
+        for html_path in html_files:
+            raw = html_path.read_text(encoding="utf-8", errors="ignore")
+            counts.update(_parse_html(raw, page_classification_enabled=False).block_hash_counts)
+        return repeated_hashes_from_counts(counts, len(html_files))
+
     for html_path in html_files:
-        raw = html_path.read_text(encoding="utf-8", errors="ignore")
-        soup = BeautifulSoup(raw, "html.parser")
-        _remove_noise(soup)
-        for node in soup.find_all(["p", "li", "div", "span"]):
-            text = _normalize_text(node.get_text(" ", strip=True))
-            if len(text) < 20:
-                continue
-            counts[_hash_text(text)] += 1
-    threshold = max(2, len(html_files) // 3) if html_files else 2
-    return {key for key, count in counts.items() if count >= threshold}
+        digest = stats.file_hash(html_path)
+        if stats.get(digest) is None:
+            raw = html_path.read_text(encoding="utf-8", errors="ignore")
+            parsed = _parse_html(raw, page_classification_enabled=False)
+            stats.put(digest, parsed.block_hash_counts, _block_text_hashes(parsed))
+        stats.assign(html_path, digest)
+    stats.prune({p.name for p in html_files})
+    stats.save()
+    return stats.repeated_hashes(len(html_files))
 
 
 def _drop_repeated_boilerplate(
@@ -395,42 +510,66 @@ def _drop_repeated_boilerplate(
     return filtered
 
 
-def convert_html_to_md(
-    html_path: Path, force: bool = False, repeated_hashes: set[str] | None = None
-) -> Path | None:
-    """Convert one HTML file to markdown and persist its artifact."""
-    md_path = html_path.with_suffix(".md")
-    if md_path.exists() and not force:
-        return None
-
-    html_content = html_path.read_text(encoding="utf-8", errors="ignore")
-    raw_soup = BeautifulSoup(html_content, "html.parser")
-    page_type = _classify_page(raw_soup, _visible_text(raw_soup))
-
-    cascade_markdown, cascade_meta, cascade_depth = _extract_markdown_cascade(html_content)
-
-    fallback = _fallback_extract(html_content)
-    blocks = list(fallback["structured_blocks"])
-    if repeated_hashes:
-        blocks = _drop_repeated_boilerplate(blocks, repeated_hashes)
-    fallback["structured_blocks"] = blocks
-    fallback["markdown"] = _markdown_from_blocks(blocks)
-
-    selected_extractor = cascade_meta.get("extractor_used", "beautifulsoup")
-
-    if _current_html_extractor_mode() == "primary_only":
-        markdown_content = cascade_markdown
-    elif _current_html_extractor_mode() == "fallback_only":
-        markdown_content = fallback["markdown"]
-    else:
-        markdown_content = (
-            fallback["markdown"]
-            if _should_use_fallback(cascade_markdown, page_type, html_content)
-            else cascade_markdown
+@dataclass
+class HTMLAnalysis:
+    """Per-file conversion inputs computed in a worker process.
+
+    Only picklable values are kept so results can cross the process pool;
+    the repeated-boilerplate filter and file writes happen afterwards in the
+    parent, once every file's block hashes are known.
+    """
+
+    html_path: Path
+    html_length: int
+    size_bytes: int
+    parsed: ParsedHTML
+    convert: bool
+    cascade_markdown: str = ""
+    cascade_meta: dict[str, Any] = field(default_factory=dict)
+    cascade_depth: int = 0
+    use_fallback: bool = True
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+
+def _analyze_html_file(
+    html_path: Path, config: HTMLProcessorConfig, convert: bool = True
+) -> HTMLAnalysis:
+    """Parse one file and, when ``convert`` is set, run the extractor cascade.
+
+    Runs in worker processes, so the processor config is passed explicitly
+    instead of being read from the (process-local) runtime state.
+    """
+    timings: dict[str, float] = {}
+    with timed(timings, "read"):
+        html_content = html_path.read_text(encoding="utf-8", errors="ignore")
+    parsed = _parse_html(
+        html_content,
+        page_classification_enabled=config.page_classification_enabled,
+        timings=timings,
+    )
+    analysis = HTMLAnalysis(
+        html_path=html_path,
+        html_length=len(html_content),
+        size_bytes=html_path.stat().st_size,
+        parsed=parsed,
+        convert=convert,
+    )
+    if convert:
+        markdown, meta, depth = _extract_markdown_cascade(
+            html_content,
+            strategy=config.extractor_strategy,
+            parsed=parsed,
+            timings=timings,
         )
-        if markdown_content == fallback["markdown"]:
-            selected_extractor = "beautifulsoup"
+        analysis.cascade_markdown = markdown
+        analysis.cascade_meta = meta
+        analysis.cascade_depth = depth
+        analysis.use_fallback = _should_use_fallback(markdown, parsed.page_type, html_content)
+    analysis.timings_ms = rounded_timings(timings)
+    return analysis
 
+
+def _clean_markdown_lines(markdown_content: str) -> str:
     lines = [line.rstrip() for line in markdown_content.splitlines()]
     cleaned_lines: list[str] = []
     prev_empty = False
@@ -445,33 +584,116 @@ def convert_html_to_md(
             continue
         cleaned_lines.append(line)
         prev_empty = is_empty
-    markdown_content = "\n".join(cleaned_lines).strip()
+    return "\n".join(cleaned_lines).strip()
+
+
+_EXTRACTOR_DISTRIBUTIONS = (
+    "beautifulsoup4",
+    "lxml",
+    "trafilatura",
+    "html-to-markdown",
+    "readability-lxml",
+)
+
+
+def _distribution_version(name: str) -> str | None:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+@functools.cache
+def _extractor_environment() -> dict[str, Any]:
+    """Extractor code and library versions; a change invalidates every fingerprint."""
+    return {
+        "html_parser": HTML_PARSER,
+        "extractor_code": content_hash(Path(__file__).read_bytes()),
+        "libraries": {name: _distribution_version(name) for name in _EXTRACTOR_DISTRIBUTIONS},
+    }
+
+
+def _conversion_fingerprint(
+    digest: str,
+    config: HTMLProcessorConfig,
+    block_text_hashes: list[str],
+    repeated_hashes: set[str],
+) -> str:
+    """Hash of every input that determines a file's converted output."""
+    payload = {
+        "version": BOILERPLATE_STATS_VERSION,
+        "content_hash": digest,
+        "config": asdict(config),
+        "environment": _extractor_environment(),
+        "dropped_blocks": sorted(set(block_text_hashes) & repeated_hashes),
+    }
+    return content_hash(json.dumps(payload, sort_keys=True).encode("utf-8"))
+
+
+def _write_conversion(
+    analysis: HTMLAnalysis,
+    config: HTMLProcessorConfig,
+    repeated_hashes: set[str] | None,
+    fingerprint: str | None = None,
+    source_hash: str | None = None,
+) -> Path:
+    """Apply the corpus-level boilerplate filter and persist markdown + artifact."""
+    html_path = analysis.html_path
+    source_hash = source_hash or source_content_hash(html_path)
+    md_path = html_path.with_suffix(".md")
+    parsed = analysis.parsed
+    page_type = parsed.page_type
+
+    blocks = list(parsed.structured_blocks)
+    if repeated_hashes:
+        blocks = _drop_repeated_boilerplate(blocks, repeated_hashes)
+    fallback_markdown = _markdown_from_blocks(blocks)
+
+    cascade_markdown = analysis.cascade_markdown
+    selected_extractor = analysis.cascade_meta.get("extractor_used", "beautifulsoup")
+
+    if config.extractor_mode == "primary_only":
+        markdown_content = cascade_markdown
+    elif config.extractor_mode == "fallback_only":
+        markdown_content = fallback_markdown
+    else:
+        markdown_content = fallback_markdown if analysis.use_fallback else cascade_markdown
+        if markdown_content == fallback_markdown:
+            selected_extractor = "beautifulsoup"
+
+    markdown_content = _clean_markdown_lines(markdown_content)
 
     artifact = SourceArtifact(
         source_id=html_path.stem,
         source_path=str(html_path),
         source_type="html",
-        raw_source={"page_type": page_type, "size_bytes": html_path.stat().st_size},
-        extracted_text=fallback["visible_text"],
+        raw_source={"page_type": page_type, "size_bytes": analysis.size_bytes},
+        extracted_text=parsed.visible_text,
         structured_blocks=blocks,
         markdown_text=markdown_content,
         best_output={
             "extractor": selected_extractor,
             "markdown": markdown_content,
-            "cascade_depth": cascade_depth,
+            "cascade_depth": analysis.cascade_depth,
         },
-        fallback_output={"extractor": fallback["extractor"], "markdown": fallback["markdown"]},
+        fallback_output={"extractor": "beautifulsoup", "markdown": fallback_markdown},
         metadata={
             "page_type": page_type,
             "selected_extractor": selected_extractor,
-            "html_extractor_strategy": _current_html_extractor_strategy(),
-            "cascade_depth": cascade_depth,
-            "html_extractor_mode": _current_html_extractor_mode(),
-            "text_density": _density(markdown_content, html_content),
+            "html_extractor_strategy": config.extractor_strategy,
+            "cascade_depth": analysis.cascade_depth,
+            "html_extractor_mode": config.extractor_mode,
+            "text_density": _density(markdown_content, analysis.html_length),
             "boilerplate_ratio": _boilerplate_ratio(markdown_content),
             "indexable": page_type in {"article", "faq"},
             "heading_count": len([b for b in blocks if b.get("block_type") == "heading"]),
             "table_count": len([b for b in blocks if b.get("block_type") == "table"]),
+            "html_parser": HTML_PARSER,
+            "timings_ms": analysis.timings_ms,
+            "conversion_fingerprint": fingerprint,
+            "quality_stats": html_quality_stats(
+                source_hash, parsed.raw_visible_chars, parser=HTML_PARSER
+            ),
         },
     )
     persist_source_artifact(artifact)
@@ -479,23 +701,25 @@ def convert_html_to_md(
     return md_path
 
 
+def convert_html_to_md(
+    html_path: Path, force: bool = False, repeated_hashes: set[str] | None = None
+) -> Path | None:
+    """Convert one HTML file to markdown and persist its artifact."""
+    md_path = html_path.with_suffix(".md")
+    if md_path.exists() and not force:
+        return None
+
+    config = get_html_processor_config()
+    analysis = _analyze_html_file(html_path, config)
+    return _write_conversion(analysis, config, repeated_hashes)
+
+
 def _bs_fallback_extract(html_content: str) -> dict[str, Any]:
-    soup = BeautifulSoup(html_content, "html.parser")
-    _remove_noise(soup)
-    visible_text = _visible_text(soup)
-    blocks = _collect_structured_blocks(soup)
-    markdown = _markdown_from_blocks(blocks)
-    return {
-        "extractor": "beautifulsoup",
-        "page_type": _classify_page(soup, visible_text),
-        "visible_text": visible_text,
-        "structured_blocks": blocks,
-        "markdown": markdown,
-    }
+    return _fallback_extract(html_content)
 
 
-def _build_extractor_chain() -> list[tuple[str, Callable]]:
-    strategy = _current_html_extractor_strategy()
+def _build_extractor_chain(strategy: str | None = None) -> list[tuple[str, Callable]]:
+    strategy = strategy or _current_html_extractor_strategy()
     if strategy == "trafilatura_bs":
         return [
             ("trafilatura", _trafilatura_extract),
@@ -522,22 +746,38 @@ def _build_extractor_chain() -> list[tuple[str, Callable]]:
     return [("trafilatura", _trafilatura_extract), ("beautifulsoup", _bs_fallback_extract)]
 
 
-def _extract_markdown_cascade(html_content: str) -> tuple[str, dict[str, Any], int]:
-    chain = _build_extractor_chain()
+def _extract_markdown_cascade(
+    html_content: str,
+    strategy: str | None = None,
+    parsed: ParsedHTML | None = None,
+    timings: dict[str, float] | None = None,
+) -> tuple[str, dict[str, Any], int]:
+    """Run the extractor chain until one yields usable markdown.
+
+    When ``parsed`` is given, the BeautifulSoup step reuses that tree's
+    markdown instead of parsing the document again.
+    """
+    chain = _build_extractor_chain(strategy)
     for depth, (name, extractor_fn) in enumerate(chain, 1):
-        result = extractor_fn(html_content)
-        if isinstance(result, tuple):
-            markdown, meta = result
+        if name == "beautifulsoup" and parsed is not None:
+            markdown, meta = parsed.markdown, {"extractor": "beautifulsoup"}
         else:
-            markdown = result.get("markdown", "") if isinstance(result, dict) else ""
-            meta = result if isinstance(result, dict) else {}
+            with timed(timings, name):
+                result = extractor_fn(html_content)
+            if isinstance(result, tuple):
+                markdown, meta = result
+            else:
+                markdown = result.get("markdown", "") if isinstance(result, dict) else ""
+                meta = result if isinstance(result, dict) else {}
         if len(markdown.strip()) > 50 or name == "beautifulsoup":
             meta["cascade_depth"] = depth
             meta["extractor_used"] = name
             return markdown, meta, depth
-    fallback = _bs_fallback_extract(html_content)
+    fallback = (
+        parsed.markdown if parsed is not None else _bs_fallback_extract(html_content)["markdown"]
+    )
     return (
-        fallback.get("markdown", ""),
+        fallback,
         {"extractor": "beautifulsoup", "cascade_depth": len(chain)},
         len(chain),
     )
@@ -549,8 +789,88 @@ def get_html_files() -> list[Path]:
     return [p for p in sorted(DATA_DIR.glob("*.html")) if p.name not in alias_names]
 
 
-def main(force: bool = False):
-    """Convert all HTML files to Markdown."""
+def _resolve_workers(max_workers: int | None, file_count: int) -> int:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(max_workers, file_count))
+
+
+def _analyze_html_files(
+    html_files: list[Path],
+    config: HTMLProcessorConfig,
+    convert_flags: list[bool],
+    workers: int,
+) -> list[HTMLAnalysis]:
+    """Analyze files in parallel; results come back in ``html_files`` order."""
+    if not html_files:
+        return []
+    if workers <= 1:
+        return [
+            _analyze_html_file(path, config, convert)
+            for path, convert in zip(html_files, convert_flags, strict=True)
+        ]
+    chunksize = max(1, len(html_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _analyze_html_file,
+                html_files,
+                repeat(config),
+                convert_flags,
+                chunksize=chunksize,
+            )
+        )
+
+
+def _summarize_run(
+    analyses: list[HTMLAnalysis],
+    *,
+    files: int,
+    converted: int,
+    skipped: int,
+    unchanged: int,
+    workers: int,
+    elapsed: float,
+    config: HTMLProcessorConfig,
+) -> dict[str, Any]:
+    return {
+        "files": files,
+        "parsed": len(analyses),
+        "converted": converted,
+        "skipped": skipped,
+        "unchanged": unchanged,
+        "workers": workers,
+        "html_parser": HTML_PARSER,
+        "html_extractor_strategy": config.extractor_strategy,
+        "html_extractor_mode": config.extractor_mode,
+        **summarize_timings(
+            (analysis.timings_ms for analysis in analyses), files=len(analyses), elapsed=elapsed
+        ),
+    }
+
+
+def main(
+    force: bool = False, max_workers: int | None = None, incremental: bool = False
+) -> dict[str, Any]:
+    """Convert all HTML files to Markdown.
+
+    Block-hash statistics are cached per file content hash, so only new or
+    changed files are parsed for the boilerplate pass. By default only files
+    without markdown are converted; ``force`` re-converts every file.
+
+    With ``incremental``, files are also re-converted when any input behind
+    their last conversion changed (content, processor config, dropped
+    boilerplate blocks, extractor code or library versions) or their L1
+    artifact is missing; the rest are left as they are.
+
+    Args:
+        force: Re-convert files whose markdown already exists
+        max_workers: Worker processes for parsing; defaults to the CPU count
+        incremental: Re-convert only files whose conversion inputs changed
+
+    Returns:
+        Run summary (also written to the L1 artifact directory)
+    """
     print("=" * 60)
     print("L1: HTML to Markdown Converter")
     print("=" * 60)
@@ -558,38 +878,111 @@ def main(force: bool = False):
     print()
 
     html_files = get_html_files()
-    repeated_hashes = _compute_global_boilerplate_hashes(html_files)
     print(f"Found {len(html_files)} HTML files")
 
+    config = get_html_processor_config()
+    workers = _resolve_workers(max_workers, len(html_files))
+    start = time.perf_counter()
+
+    stats = _boilerplate_stats_store()
+    digests = {path: stats.file_hash(path) for path in html_files}
+    md_missing = {path: not path.with_suffix(".md").exists() for path in html_files}
+
+    # New content always differs from its last conversion, so incremental runs convert it.
+    fresh = [path for path in html_files if stats.get(digests[path]) is None]
+    analyses = dict(
+        zip(
+            fresh,
+            _analyze_html_files(
+                fresh,
+                config,
+                [force or incremental or md_missing[path] for path in fresh],
+                workers,
+            ),
+            strict=True,
+        )
+    )
+    for path, analysis in analyses.items():
+        stats.put(
+            digests[path], analysis.parsed.block_hash_counts, _block_text_hashes(analysis.parsed)
+        )
+    for path in html_files:
+        stats.assign(path, digests[path])
+    stats.prune({path.name for path in html_files})
+    repeated_hashes = stats.repeated_hashes(len(html_files))
+
+    fingerprints = {
+        path: _conversion_fingerprint(
+            digests[path],
+            config,
+            (stats.get(digests[path]) or {}).get("block_text_hashes", []),
+            repeated_hashes,
+        )
+        for path in html_files
+    }
+    unchanged = 0
+    pending: list[Path] = []
+    for path in html_files:
+        if path in analyses:
+            continue
+        if force or md_missing[path]:
+            pending.append(path)
+        elif incremental:
+            if stats.converted_fingerprint(path.name) == fingerprints[
+                path
+            ] and source_artifact_exists("html", path.stem):
+                unchanged += 1
+            else:
+                pending.append(path)
+    analyses.update(
+        zip(
+            pending,
+            _analyze_html_files(pending, config, [True] * len(pending), workers),
+            strict=True,
+        )
+    )
+
     converted = 0
     skipped = 0
-
-    for html_path in html_files:
-        md_path = html_path.with_suffix(".md")
-
-        if md_path.exists() and not force:
-            print(f"Skipping (MD exists): {html_path.name}")
+    for path in html_files:
+        analysis = analyses.get(path)
+        if analysis is None or not analysis.convert:
+            print(f"Skipping (MD exists): {path.name}")
             skipped += 1
             continue
-
-        print(f"Converting: {html_path.name}")
-        result = convert_html_to_md(html_path, force=force, repeated_hashes=repeated_hashes)
-        if result:
-            print(f"  -> Saved: {result.name}")
-            converted += 1
-        else:
-            skipped += 1
+        result = _write_conversion(
+            analysis, config, repeated_hashes, fingerprints[path], source_hash=digests[path]
+        )
+        stats.mark_converted(path.name, fingerprints[path])
+        print(f"Converted: {path.name} -> {result.name}")
+        converted += 1
+    stats.save()
+
+    summary = _summarize_run(
+        [analyses[path] for path in html_files if path in analyses],
+        files=len(html_files),
+        converted=converted,
+        skipped=skipped,
+        unchanged=unchanged,
+        workers=workers,
+        elapsed=time.perf_counter() - start,
+        config=config,
+    )
+    persist_run_summary("html", summary)
 
     print()
     print("=" * 60)
     print(f"Converted: {converted} files")
-    print(f"Skipped:   {skipped} files")
+    print(f"Skipped:   {skipped} files ({unchanged} unchanged since last conversion)")
+    print(f"Parsed:    {summary['parsed']} files")
     print(f"Total MD:  {len(list(DATA_DIR.glob('*.md')))} files")
+    print(f"Throughput: {summary['files_per_second']:.2f} files/s ({workers} workers)")
     print("=" * 60)
+    return summary
 
 
 if __name__ == "__main__":
     import sys
 
     force_mode = "--force" in sys.argv or "-f" in sys.argv
-    main(force=force_mode)
+    main(force=force_mode, incremental="--incremental" in sys.argv)
@@ -3,6 +3,10 @@
 L0b: Download PDF documents from Singapore government health websites.
 Saves PDFs to data/raw directory.
 Uses existing manifest from download_web.py for tracking.
+
+PDFs are fetched over the same pooled crawler as the HTML pages. With
+--refresh, already-downloaded PDFs are revalidated with conditional requests
+(ETag/Last-Modified) and only rewritten when their content changed.
 """
 
 import asyncio
@@ -12,9 +16,10 @@ import re
 from datetime import UTC, datetime
 from pathlib import Path
 
-import httpx
-
 from src.config import DATA_RAW_DIR
+from src.ingestion.crawler import CrawlConfig, FetchResult
+from src.ingestion.manifest import ManifestStore, content_hash
+from src.ingestion.steps import download_web
 from src.ingestion.steps.download_web import _load_manifest as _load_web_manifest
 from src.ingestion.steps.download_web import _manifest_indexes as _manifest_indexes_web
 from src.ingestion.steps.download_web import _save_manifest as _save_web_manifest
@@ -53,63 +58,118 @@ def _manifest_indexes(manifest: dict) -> tuple[dict[str, dict], dict[str, list[d
 
 def _register_manifest_record(
     *,
-    manifest: dict,
+    manifest: ManifestStore,
     url: str,
     normalized_url: str,
     logical_name: str,
     file_path: Path | None,
     content_hash: str | None,
     status: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
 ) -> None:
-    records = manifest.setdefault("records", [])
-    records.append(
-        {
-            "url": url,
-            "normalized_url": normalized_url,
-            "logical_name": logical_name,
-            "filename": file_path.name if file_path else None,
-            "content_hash": content_hash,
-            "status": status,
-            "record_type": "pdf_download",
-            "timestamp_utc": datetime.now(UTC).isoformat(),
-        }
-    )
+    record = {
+        "url": url,
+        "normalized_url": normalized_url,
+        "logical_name": logical_name,
+        "filename": file_path.name if file_path else None,
+        "content_hash": content_hash,
+        "status": status,
+        "record_type": "pdf_download",
+        "timestamp_utc": datetime.now(UTC).isoformat(),
+    }
+    if etag:
+        record["etag"] = etag
+    if last_modified:
+        record["last_modified"] = last_modified
+    manifest.add_record(record)
+
+
+async def fetch_pdf(
+    url: str,
+    timeout: int = 60,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> FetchResult:
+    """Fetch a PDF through the active crawl session, rejecting non-PDF payloads."""
+    result = await download_web.fetch_url(url, timeout, etag=etag, last_modified=last_modified)
+    if result.ok:
+        content_type = result.content_type or ""
+        if "pdf" not in content_type.lower() and not result.content.startswith(b"%PDF"):
+            logger.warning("Expected PDF but got %s for %s", content_type, url)
+            result.error = f"unexpected content type {content_type!r}"
+            result.content = b""
+    return result
 
 
 async def download_pdf(url: str, timeout: int = 60) -> bytes | None:
     """Download PDF content from URL."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, headers=headers) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            content_type = response.headers.get("content-type", "")
-            looks_like_pdf = response.content.startswith(b"%PDF")
-            if "pdf" not in content_type.lower() and not looks_like_pdf:
-                logger.warning("Expected PDF but got %s for %s", content_type, url)
-                return None
-            return bytes(response.content)
-        except httpx.HTTPStatusError as e:
-            logger.warning("HTTP error downloading %s: %s", url, e)
-            return None
-        except httpx.RequestError as e:
-            logger.warning("Request error downloading %s: %s", url, e)
-            return None
+    result = await fetch_pdf(url, timeout)
+    return result.content if result.ok else None
+
+
+def _refresh_existing_pdf(
+    manifest: ManifestStore,
+    prior: dict,
+    prior_path: Path,
+    result: FetchResult,
+    logical_name: str,
+) -> Path | None:
+    """Apply a revalidation response to a PDF that is already on disk."""
+    if result.not_modified:
+        print(f"Not modified: {logical_name}")
+        manifest.update_record(prior, **download_web._validator_changes(result))
+        return None
+    if not result.ok or not result.content:
+        print(f"Refresh failed, keeping existing file: {logical_name}")
+        return None
+
+    digest = content_hash(result.content)
+    if digest == prior.get("content_hash"):
+        print(f"Unchanged: {logical_name}")
+        manifest.update_record(prior, **download_web._validator_changes(result))
+        return None
+
+    prior_path.write_bytes(result.content)
+    manifest.update_record(
+        prior,
+        content_hash=digest,
+        status="updated",
+        timestamp_utc=datetime.now(UTC).isoformat(),
+        **download_web._validator_changes(result),
+    )
+    print(f"  Updated: {prior_path.name}")
+    return prior_path
 
 
 async def download_pdf_if_not_exists(url: str, logical_name: str) -> Path | None:
-    """Download PDF if it doesn't already exist."""
+    """Download PDF if it doesn't already exist (or revalidate it when refreshing)."""
+    session = download_web._crawl_session.get()
+    if session is not None:
+        return await _download_pdf_into_manifest(
+            session.manifest, url, logical_name, refresh=session.refresh
+        )
+    with ManifestStore(download_web.MANIFEST_PATH, DATA_RAW_DIR) as manifest:
+        return await _download_pdf_into_manifest(manifest, url, logical_name, refresh=False)
+
+
+async def _download_pdf_into_manifest(
+    manifest: ManifestStore, url: str, logical_name: str, *, refresh: bool
+) -> Path | None:
     normalized_url = normalize_url(url)
-    manifest = _load_manifest()
-    by_url, _ = _manifest_indexes(manifest)
-    prior = by_url.get(normalized_url)
+    prior = manifest.get_by_url(normalized_url)
     if prior and prior.get("filename"):
         prior_path = DATA_RAW_DIR / str(prior["filename"])
         if prior_path.exists():
-            print(f"Skipping (manifest exists): {logical_name}")
-            return None
+            if not refresh:
+                print(f"Skipping (manifest exists): {logical_name}")
+                return None
+            print(f"Revalidating: {logical_name}")
+            result = await fetch_pdf(
+                url, etag=prior.get("etag"), last_modified=prior.get("last_modified")
+            )
+            return _refresh_existing_pdf(manifest, prior, prior_path, result, logical_name)
 
     file_path = get_file_path(url, "pdf")
     if file_path.exists():
@@ -123,12 +183,11 @@ async def download_pdf_if_not_exists(url: str, logical_name: str) -> Path | None
             content_hash=None,
             status="file_exists",
         )
-        _save_manifest(manifest)
         return None
 
     print(f"Downloading: {logical_name}")
-    content = await download_pdf(url)
-    if not content:
+    result = await fetch_pdf(url)
+    if not result.ok or not result.content:
         _register_manifest_record(
             manifest=manifest,
             url=url,
@@ -138,22 +197,20 @@ async def download_pdf_if_not_exists(url: str, logical_name: str) -> Path | None
             content_hash=None,
             status="download_failed",
         )
-        _save_manifest(manifest)
         return None
 
-    content_hash = hashlib.sha256(content).hexdigest()[:16]
-    file_path.write_bytes(content)
-
+    file_path.write_bytes(result.content)
     _register_manifest_record(
         manifest=manifest,
         url=url,
         normalized_url=normalized_url,
         logical_name=logical_name,
         file_path=file_path,
-        content_hash=content_hash,
+        content_hash=content_hash(result.content),
         status="downloaded",
+        etag=result.etag,
+        last_modified=result.last_modified,
     )
-    _save_manifest(manifest)
     print(f"  Saved: {file_path.name}")
     return file_path
 
@@ -243,7 +300,13 @@ def list_downloaded_pdfs() -> list[str]:
     return [str(f) for f in DATA_RAW_DIR.iterdir() if f.is_file() and f.suffix.lower() == ".pdf"]
 
 
-async def main():
+PDF_EXTRACTORS: tuple[download_web.SourceExtractor, ...] = (
+    ("ACE-HTA Clinical Guidelines PDFs", extract_ace_guidelines_pdfs),
+    ("HealthHub PDFs", extract_healthhub_pdfs),
+)
+
+
+async def main(*, refresh: bool = False, config: CrawlConfig | None = None):
     """Main function to download all PDFs."""
     print("=" * 60)
     print("L0b: PDF Downloader - SG Health Websites")
@@ -252,18 +315,27 @@ async def main():
     print(f"Existing PDFs: {len(list_downloaded_pdfs())}")
     print()
 
-    all_downloaded = []
-
-    print("\n[1/2] Downloading ACE-HTA Clinical Guidelines PDFs...")
-    all_downloaded.extend(await extract_ace_guidelines_pdfs())
-
-    print("\n[2/2] Downloading HealthHub PDFs...")
-    all_downloaded.extend(await extract_healthhub_pdfs())
+    _, crawl_summary = await download_web.crawl_sources(
+        PDF_EXTRACTORS, config=config, refresh=refresh
+    )
 
     print("\n" + "=" * 60)
     print(f"Download complete! Total PDFs in data/raw: {len(list_downloaded_pdfs())}")
+    print(f"Crawl: {crawl_summary['summary']}")
+    if crawl_summary["failed_sources"]:
+        print(f"Failed sources: {', '.join(crawl_summary['failed_sources'])}")
     print("=" * 60)
+    return crawl_summary
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Download source PDF documents")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Revalidate already-downloaded PDFs with conditional requests",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(refresh=args.refresh))
@@ -2,15 +2,22 @@
 """
 L0: Download medical content from Singapore government health websites.
 Saves content to data/raw directory.
-Skips download if target file already exists.
+Skips download if target file already exists, unless refreshing, in which case
+pages are revalidated with conditional requests (ETag/Last-Modified).
+
+All source extractors run concurrently over one pooled crawler client with
+per-host concurrency and rate limits (see src.ingestion.crawler).
 """
 
 import asyncio
+import contextvars
 import hashlib
 import json
 import logging
 import re
 import shutil
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -20,6 +27,13 @@ import httpx
 from bs4 import BeautifulSoup
 
 from src.config import DATA_RAW_DIR
+from src.ingestion.crawler import CrawlConfig, Crawler, FetchResult
+from src.ingestion.manifest import (
+    ManifestStore,
+    content_hash,
+    load_manifest_file,
+    write_manifest_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +41,18 @@ DATA_DIR = DATA_RAW_DIR
 MANIFEST_PATH = DATA_DIR / "download_manifest.json"
 
 
+@dataclass(frozen=True)
+class _CrawlSession:
+    crawler: Crawler
+    manifest: ManifestStore
+    refresh: bool = False
+
+
+_crawl_session: contextvars.ContextVar[_CrawlSession | None] = contextvars.ContextVar(
+    "download_web_crawl_session", default=None
+)
+
+
 def get_file_path(url: str, extension: str = "html") -> Path:
     """Generate a filename from URL."""
     url_hash = hashlib.md5(url.encode()).hexdigest()[:8]  # nosec B324
@@ -49,17 +75,11 @@ def normalize_url(url: str) -> str:
 
 
 def _load_manifest() -> dict[str, Any]:
-    if MANIFEST_PATH.exists():
-        try:
-            return dict(json.loads(MANIFEST_PATH.read_text(encoding="utf-8")))
-        except Exception as e:
-            logger.debug("Failed to load manifest: %s", e)
-            return {"records": []}
-    return {"records": []}
+    return load_manifest_file(MANIFEST_PATH)
 
 
 def _save_manifest(manifest: dict) -> None:
-    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_manifest_file(MANIFEST_PATH, manifest)
 
 
 def _manifest_indexes(manifest: dict) -> tuple[dict[str, dict], dict[str, list[dict]]]:
@@ -74,8 +94,32 @@ def _manifest_indexes(manifest: dict) -> tuple[dict[str, dict], dict[str, list[d
     return by_url, by_hash
 
 
+_manifest_snapshot: tuple[tuple[Path, int, int], ManifestStore] | None = None
+
+
+def _current_manifest() -> ManifestStore:
+    """In-memory manifest for lookups.
+
+    Inside a crawl this is the session's store; otherwise the file is loaded
+    once and reused until it changes on disk, so per-file lookups from the
+    loaders do not re-read the manifest.
+    """
+    global _manifest_snapshot
+    session = _crawl_session.get()
+    if session is not None:
+        return session.manifest
+    try:
+        stat = MANIFEST_PATH.stat()
+        key = (MANIFEST_PATH, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = (MANIFEST_PATH, 0, 0)
+    if _manifest_snapshot is None or _manifest_snapshot[0] != key:
+        _manifest_snapshot = (key, ManifestStore(MANIFEST_PATH, DATA_DIR))
+    return _manifest_snapshot[1]
+
+
 def get_manifest_alias_filenames(manifest: dict | None = None) -> set[str]:
-    manifest = manifest or _load_manifest()
+    manifest = manifest or _current_manifest().manifest
     aliases: set[str] = set()
     for record in manifest.get("records", []):
         status = str(record.get("status", ""))
@@ -110,11 +154,14 @@ def migrate_existing_html_duplicates(
     if archive_aliases and delete_aliases:
         raise ValueError("Choose either archive_aliases or delete_aliases, not both")
 
-    manifest = _load_manifest()
+    store = ManifestStore(MANIFEST_PATH, DATA_DIR)
+    manifest = store.manifest
     html_files = sorted(DATA_DIR.glob("*.html"))
     grouped: dict[str, list[Path]] = {}
     for path in html_files:
-        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+        digest = store.file_hash(path)
+        if digest is None:
+            continue
         grouped.setdefault(digest, []).append(path)
 
     archive_dir = DATA_DIR / archive_dir_name
@@ -179,7 +226,8 @@ def migrate_existing_html_duplicates(
     ]
     manifest["records"].extend(inventory_records)
     if not dry_run:
-        _save_manifest(manifest)
+        store.mark_dirty()
+        store.flush()
 
     return {
         "dry_run": dry_run,
@@ -195,7 +243,7 @@ def migrate_existing_html_duplicates(
 
 def _register_manifest_record(
     *,
-    manifest: dict,
+    manifest: ManifestStore,
     url: str,
     normalized_url: str,
     logical_name: str,
@@ -203,108 +251,168 @@ def _register_manifest_record(
     content_hash: str | None,
     status: str,
     duplicate_of: str | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
 ) -> None:
-    records = manifest.setdefault("records", [])
-    records.append(
-        {
-            "url": url,
-            "normalized_url": normalized_url,
-            "logical_name": logical_name,
-            "filename": file_path.name if file_path else None,
-            "content_hash": content_hash,
-            "status": status,
-            "duplicate_of": duplicate_of,
-            "timestamp_utc": datetime.now(UTC).isoformat(),
-        }
-    )
+    record = {
+        "url": url,
+        "normalized_url": normalized_url,
+        "logical_name": logical_name,
+        "filename": file_path.name if file_path else None,
+        "content_hash": content_hash,
+        "status": status,
+        "duplicate_of": duplicate_of,
+        "timestamp_utc": datetime.now(UTC).isoformat(),
+    }
+    if etag:
+        record["etag"] = etag
+    if last_modified:
+        record["last_modified"] = last_modified
+    manifest.add_record(record)
 
 
-def _find_existing_file_by_content_hash(content_hash_value: str) -> Path | None:
-    for html_file in DATA_DIR.glob("*.html"):
-        try:
-            digest = hashlib.sha256(html_file.read_bytes()).hexdigest()[:16]
-            if digest == content_hash_value:
-                return html_file
-        except Exception as e:
-            logger.debug("Failed to hash file %s: %s", html_file.name, e)
-            continue
-    return None
+def _validator_changes(result: FetchResult) -> dict[str, str]:
+    changes = {"checked_utc": datetime.now(UTC).isoformat()}
+    if result.etag:
+        changes["etag"] = result.etag
+    if result.last_modified:
+        changes["last_modified"] = result.last_modified
+    return changes
 
 
 def get_manifest_record_by_filename(filename: str) -> dict[str, Any] | None:
     """Look up manifest record by filename."""
-    manifest = _load_manifest()
-    for record in manifest.get("records", []):
-        if record.get("filename") == filename:
-            return dict(record)
-    return None
+    record = _current_manifest().get_by_filename(filename)
+    return dict(record) if record is not None else None
 
 
 def get_manifest_record_by_logical_name(logical_name: str) -> dict[str, Any] | None:
     """Look up manifest record by logical_name."""
-    manifest = _load_manifest()
-    for record in manifest.get("records", []):
-        if record.get("logical_name") == logical_name:
-            return dict(record)
-    return None
+    record = _current_manifest().get_by_logical_name(logical_name)
+    return dict(record) if record is not None else None
 
 
 def file_exists(url: str, extension: str = "html") -> bool:
     """Check if file already exists for this URL."""
-    normalized = normalize_url(url)
-    manifest = _load_manifest()
-    by_url, _ = _manifest_indexes(manifest)
-    if normalized in by_url and by_url[normalized].get("filename"):
-        existing = DATA_DIR / str(by_url[normalized]["filename"])
+    record = _current_manifest().get_by_url(normalize_url(url))
+    if record is not None and record.get("filename"):
+        existing = DATA_DIR / str(record["filename"])
         if existing.exists():
             return True
     file_path = get_file_path(url, extension)
     return file_path.exists()
 
 
+async def fetch_url(
+    url: str,
+    timeout: float = 30,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> FetchResult:
+    """Fetch ``url`` through the active crawl session's pooled client.
+
+    Outside a crawl session (e.g. one-off calls) a short-lived crawler is used.
+    """
+    session = _crawl_session.get()
+    if session is not None:
+        return await session.crawler.fetch(
+            url, timeout=timeout, etag=etag, last_modified=last_modified
+        )
+    async with Crawler(CrawlConfig(timeout=timeout)) as crawler:
+        return await crawler.fetch(url, etag=etag, last_modified=last_modified)
+
+
 async def download_url(url: str, timeout: int = 30) -> str | None:
     """Download content from URL."""
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            return str(response.text)
-        except httpx.HTTPStatusError as e:
-            logger.warning("HTTP error downloading %s: %s", url, e)
-            return None
-        except httpx.RequestError as e:
-            logger.warning("Request error downloading %s: %s", url, e)
-            return None
+    result = await fetch_url(url, timeout)
+    return result.text if result.ok else None
 
 
 async def download_binary(url: str, timeout: int = 60) -> bytes | None:
     """Download binary content (PDF) from URL."""
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            return bytes(response.content)
-        except httpx.HTTPStatusError as e:
-            logger.warning("HTTP error downloading %s: %s", url, e)
-            return None
-        except httpx.RequestError as e:
-            logger.warning("Request error downloading %s: %s", url, e)
-            return None
+    result = await fetch_url(url, timeout)
+    return result.content if result.ok else None
+
+
+def _prior_download_path(prior: dict | None) -> Path | None:
+    if not prior or not prior.get("filename"):
+        return None
+    file_path = DATA_DIR / str(prior["filename"])
+    return file_path if file_path.exists() else None
+
+
+def _refresh_existing_html(
+    manifest: ManifestStore,
+    prior: dict,
+    prior_path: Path,
+    result: FetchResult,
+    logical_name: str,
+) -> str | None:
+    """Apply a revalidation response to a page that is already on disk."""
+    if result.not_modified:
+        print(f"Not modified: {logical_name}")
+        manifest.update_record(prior, **_validator_changes(result))
+        return None
+    if not result.ok or not result.content:
+        print(f"Refresh failed, keeping existing file: {logical_name}")
+        return None
+
+    content = result.text
+    content_hash_value = content_hash(content.encode("utf-8", errors="ignore"))
+    if content_hash_value == prior.get("content_hash"):
+        print(f"Unchanged: {logical_name}")
+        manifest.update_record(prior, **_validator_changes(result))
+        return None
+
+    prior_path.write_text(content, encoding="utf-8")
+    manifest.remember_file(prior_path, content_hash_value)
+    manifest.update_record(
+        prior,
+        content_hash=content_hash_value,
+        status="updated",
+        timestamp_utc=datetime.now(UTC).isoformat(),
+        **_validator_changes(result),
+    )
+    print(f"  Updated: {prior_path.name}")
+    return str(prior_path)
 
 
 async def _download_and_save_html(url: str, logical_name: str, timeout: int = 30) -> str | None:
+    session = _crawl_session.get()
+    if session is not None:
+        return await _download_into_manifest(
+            session.manifest, url, logical_name, timeout, refresh=session.refresh
+        )
+    with ManifestStore(MANIFEST_PATH, DATA_DIR) as manifest:
+        return await _download_into_manifest(manifest, url, logical_name, timeout, refresh=False)
+
+
+async def _download_into_manifest(
+    manifest: ManifestStore,
+    url: str,
+    logical_name: str,
+    timeout: int,
+    *,
+    refresh: bool,
+) -> str | None:
     normalized_url = normalize_url(url)
-    manifest = _load_manifest()
-    by_url, by_hash = _manifest_indexes(manifest)
-    prior = by_url.get(normalized_url)
-    if prior and prior.get("filename"):
-        file_path = DATA_DIR / str(prior["filename"])
-        if file_path.exists():
+    prior = manifest.get_by_url(normalized_url)
+    prior_path = _prior_download_path(prior)
+    if prior is not None and prior_path is not None:
+        if not refresh:
             print(f"Skipping (manifest exists): {logical_name}")
             return None
+        print(f"Revalidating: {logical_name}")
+        result = await fetch_url(
+            url, timeout, etag=prior.get("etag"), last_modified=prior.get("last_modified")
+        )
+        return _refresh_existing_html(manifest, prior, prior_path, result, logical_name)
 
     print(f"Downloading: {logical_name}")
-    content = await download_url(url, timeout)
+    result = await fetch_url(url, timeout)
+
+    content = result.text if result.ok else None
     if not content:
         _register_manifest_record(
             manifest=manifest,
@@ -315,11 +423,10 @@ async def _download_and_save_html(url: str, logical_name: str, timeout: int = 30
             content_hash=None,
             status="download_failed",
         )
-        _save_manifest(manifest)
         return None
 
-    content_hash_value = hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()[:16]
-    duplicate_record = next(iter(by_hash.get(content_hash_value, [])), None)
+    content_hash_value = content_hash(content.encode("utf-8", errors="ignore"))
+    duplicate_record = next(iter(manifest.records_by_hash(content_hash_value)), None)
     if duplicate_record and duplicate_record.get("filename"):
         duplicate_file = DATA_DIR / str(duplicate_record["filename"])
         if duplicate_file.exists():
@@ -334,10 +441,9 @@ async def _download_and_save_html(url: str, logical_name: str, timeout: int = 30
                 status="duplicate_content_alias",
                 duplicate_of=duplicate_file.name,
             )
-            _save_manifest(manifest)
             return None
 
-    existing_file = _find_existing_file_by_content_hash(content_hash_value)
+    existing_file = manifest.find_file_by_content_hash(content_hash_value)
     if existing_file is not None:
         print(
             f"Skipping duplicate content (filesystem): {logical_name} (same as {existing_file.name})"
@@ -352,11 +458,11 @@ async def _download_and_save_html(url: str, logical_name: str, timeout: int = 30
             status="duplicate_content_alias",
             duplicate_of=existing_file.name,
         )
-        _save_manifest(manifest)
         return None
 
     file_path = get_file_path(url, "html")
     file_path.write_text(content, encoding="utf-8")
+    manifest.remember_file(file_path, content_hash_value)
     _register_manifest_record(
         manifest=manifest,
         url=url,
@@ -365,12 +471,30 @@ async def _download_and_save_html(url: str, logical_name: str, timeout: int = 30
         file_path=file_path,
         content_hash=content_hash_value,
         status="downloaded",
+        etag=result.etag,
+        last_modified=result.last_modified,
     )
-    _save_manifest(manifest)
     print(f"  Saved: {file_path.name}")
     return str(file_path)
 
 
+async def _download_pages(pages: Sequence[tuple[str, str]], timeout: int = 30) -> list[str]:
+    """Download ``(url, logical_name)`` pages concurrently; one failing page never sinks the rest."""
+    results = await asyncio.gather(
+        *[_download_and_save_html(url, name, timeout) for url, name in pages],
+        return_exceptions=True,
+    )
+    saved: list[str] = []
+    for (url, name), result in zip(pages, results, strict=True):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            logger.error("Failed to download %s (%s): %s", name, url, result, exc_info=result)
+        elif result:
+            saved.append(result)
+    return saved
+
+
 def clean_html_to_text(html: str) -> str:
     """Extract clean text from HTML."""
     soup = BeautifulSoup(html, "html.parser")
@@ -481,10 +605,7 @@ async def extract_ace_clinical_guidelines() -> list[str]:
         ),
     ]
 
-    results = await asyncio.gather(
-        *[_download_and_save_html(url, name) for url, name in guidelines]
-    )
-    return [r for r in results if r]
+    return await _download_pages(guidelines)
 
 
 async def extract_ace_cues() -> list[str]:
@@ -504,8 +625,7 @@ async def extract_ace_cues() -> list[str]:
         ),
     ]
 
-    results = await asyncio.gather(*[_download_and_save_html(url, name) for url, name in pages])
-    return [r for r in results if r]
+    return await _download_pages(pages)
 
 
 async def extract_ace_drug_guidances() -> list[str]:
@@ -553,8 +673,7 @@ async def extract_ace_drug_guidances() -> list[str]:
         ),
     ]
 
-    results = await asyncio.gather(*[_download_and_save_html(url, name) for url, name in guidances])
-    return [r for r in results if r]
+    return await _download_pages(guidances)
 
 
 async def extract_healthhub_content() -> list[str]:
@@ -593,8 +712,7 @@ async def extract_healthhub_content() -> list[str]:
         ),
     ]
 
-    results = await asyncio.gather(*[_download_and_save_html(url, name) for url, name in pages])
-    return [r for r in results if r]
+    return await _download_pages(pages)
 
 
 async def extract_hpp_guidelines() -> list[str]:
@@ -627,8 +745,7 @@ async def extract_hpp_guidelines() -> list[str]:
         ),
     ]
 
-    results = await asyncio.gather(*[_download_and_save_html(url, name) for url, name in pages])
-    return [r for r in results if r]
+    return await _download_pages(pages)
 
 
 async def extract_moh_content() -> list[str]:
@@ -637,8 +754,7 @@ async def extract_moh_content() -> list[str]:
         ("https://www.moh.gov.sg/", "moh_singapore"),
     ]
 
-    results = await asyncio.gather(*[_download_and_save_html(url, name) for url, name in pages])
-    return [r for r in results if r]
+    return await _download_pages(pages)
 
 
 async def extract_international_guidelines() -> list[str]:
@@ -650,10 +766,7 @@ async def extract_international_guidelines() -> list[str]:
         ("https://www.nice.org.uk/guidance/ng236", "nice_heart_failure"),
     ]
 
-    results = await asyncio.gather(
-        *[_download_and_save_html(url, name, timeout=60) for url, name in pages]
-    )
-    return [r for r in results if r]
+    return await _download_pages(pages, timeout=60)
 
 
 def list_downloaded_files() -> list[str]:
@@ -663,7 +776,71 @@ def list_downloaded_files() -> list[str]:
     return [str(f) for f in DATA_DIR.iterdir() if f.is_file()]
 
 
-async def main():
+SourceExtractor = tuple[str, Callable[[], Awaitable[Sequence[str | Path]]]]
+
+SOURCE_EXTRACTORS: tuple[SourceExtractor, ...] = (
+    ("ACE Clinical Guidelines", extract_ace_clinical_guidelines),
+    ("ACE CUES resources", extract_ace_cues),
+    ("ACE Drug Guidances", extract_ace_drug_guidances),
+    ("HealthHub content", extract_healthhub_content),
+    ("HPP Guidelines", extract_hpp_guidelines),
+    ("International Guidelines (NHS/NICE)", extract_international_guidelines),
+)
+
+
+async def crawl_sources(
+    extractors: Sequence[SourceExtractor] = SOURCE_EXTRACTORS,
+    *,
+    config: CrawlConfig | None = None,
+    refresh: bool = False,
+    client: httpx.AsyncClient | None = None,
+) -> tuple[list[str | Path], dict[str, Any]]:
+    """Run source extractors concurrently over one pooled crawler.
+
+    A source whose extractor raises is logged and reported under
+    ``failed_sources`` in the summary; the other sources still complete.
+
+    Args:
+        extractors: ``(label, coroutine function)`` pairs to run
+        config: Crawl concurrency/rate limits (defaults to ``CrawlConfig()``)
+        refresh: Revalidate already-downloaded files with conditional requests
+        client: Optional pre-built httpx client (used by tests)
+
+    Returns:
+        Tuple of (saved file paths, crawl throughput/latency summary)
+    """
+    failed_sources: list[str] = []
+    with ManifestStore(MANIFEST_PATH, DATA_DIR) as manifest:
+        async with Crawler(config, client=client) as crawler:
+            token = _crawl_session.set(
+                _CrawlSession(crawler=crawler, manifest=manifest, refresh=refresh)
+            )
+            try:
+                total = len(extractors)
+
+                async def run(index: int, source: SourceExtractor) -> Sequence[str | Path]:
+                    label, extractor = source
+                    try:
+                        saved = await extractor()
+                    except Exception:
+                        logger.exception("Source %s failed", label)
+                        print(f"\n[{index}/{total}] {label}: FAILED (see log)")
+                        failed_sources.append(label)
+                        return []
+                    print(f"\n[{index}/{total}] {label}: {len(saved)} file(s) saved")
+                    return saved
+
+                results = await asyncio.gather(
+                    *(run(i, source) for i, source in enumerate(extractors, start=1))
+                )
+            finally:
+                _crawl_session.reset(token)
+    saved_paths = [path for saved in results for path in saved]
+    summary = crawler.stats.summary() | {"failed_sources": failed_sources}
+    return saved_paths, summary | {"summary": crawler.stats.format_summary()}
+
+
+async def main(*, refresh: bool = False, config: CrawlConfig | None = None):
     """Main function to download all content."""
     print("=" * 60)
     print("L0: Medical Content Downloader")
@@ -672,29 +849,15 @@ async def main():
     print(f"Existing files: {len(list_downloaded_files())}")
     print()
 
-    all_downloaded = []
-
-    print("\n[1/6] Downloading ACE Clinical Guidelines...")
-    all_downloaded.extend(await extract_ace_clinical_guidelines())
-
-    print("\n[2/6] Downloading ACE CUES resources...")
-    all_downloaded.extend(await extract_ace_cues())
-
-    print("\n[3/6] Downloading ACE Drug Guidances...")
-    all_downloaded.extend(await extract_ace_drug_guidances())
-
-    print("\n[4/6] Downloading HealthHub content...")
-    all_downloaded.extend(await extract_healthhub_content())
-
-    print("\n[5/6] Downloading HPP Guidelines...")
-    all_downloaded.extend(await extract_hpp_guidelines())
-
-    print("\n[6/6] Downloading International Guidelines (NHS/NICE)...")
-    all_downloaded.extend(await extract_international_guidelines())
+    _, crawl_summary = await crawl_sources(config=config, refresh=refresh)
 
     print("\n" + "=" * 60)
     print(f"Download complete! Total files in data/raw: {len(list_downloaded_files())}")
+    print(f"Crawl: {crawl_summary['summary']}")
+    if crawl_summary["failed_sources"]:
+        print(f"Failed sources: {', '.join(crawl_summary['failed_sources'])}")
     print("=" * 60)
+    return crawl_summary
 
 
 if __name__ == "__main__":
@@ -719,6 +882,21 @@ if __name__ == "__main__":
         help="Delete duplicate alias HTML files (used with --cleanup-duplicates)",
     )
     parser.add_argument("--apply", action="store_true", help="Write changes (default is dry-run)")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Revalidate already-downloaded pages with conditional requests",
+    )
+    parser.add_argument("--concurrency", type=int, default=CrawlConfig.max_concurrency)
+    parser.add_argument(
+        "--per-host-concurrency", type=int, default=CrawlConfig.per_host_concurrency
+    )
+    parser.add_argument(
+        "--per-host-rps",
+        type=float,
+        default=CrawlConfig.per_host_requests_per_second,
+        help="Maximum request starts per second per host (0 disables rate limiting)",
+    )
     args = parser.parse_args()
 
     if args.cleanup_duplicates:
@@ -729,4 +907,13 @@ if __name__ == "__main__":
         )
         print(json.dumps(summary, indent=2))
     else:
-        asyncio.run(main())
+        asyncio.run(
+            main(
+                refresh=args.refresh,
+                config=CrawlConfig(
+                    max_concurrency=args.concurrency,
+                    per_host_concurrency=args.per_host_concurrency,
+                    per_host_requests_per_second=args.per_host_rps,
+                ),
+            )
+        )
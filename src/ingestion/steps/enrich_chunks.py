@@ -37,6 +37,10 @@ logger = logging.getLogger(__name__)
 
 ENRICH_BATCH_SIZE = 10
 
+# Bump whenever ENRICH_PROMPT_TEMPLATE or _parse_enrich_result changes; the
+# ingestion stage cache keys enrichment results by it.
+ENRICH_PROMPT_VERSION = 1
+
 ENRICH_PROMPT_TEMPLATE = """Given this medical document chunk, do TWO things:
 
 1. EXTRACT KEYWORDS: List 5-10 key medical entities found in the text. Include:
@@ -3,25 +3,54 @@
 This module generates hypothetical questions for document chunks at ingestion time,
 storing them in chunk metadata for zero-LLM-cost query expansion at retrieval time.
 
+Questions are generated with the async LLM client under a concurrency limit;
+each chunk is retried under the shared retry policy with a timeout per
+attempt. Chunks that produced questions are persisted in
+``HypeQuestionCache`` keyed by chunk content hash, prompt version, model and
+question count (failures are retried on the next run), and sampling is
+deterministic per chunk content, so re-ingesting only calls the LLM for new,
+changed or previously failed chunks.
+
 Reference:
     HyPE shifts HyDE-style computation from query time to index time, generating
     "what questions does this chunk answer?" at ingestion rather than "what answer
     would this query get?" at retrieval.
+
+Example:
+    questions = await generate_hype_questions_for_chunks(
+        chunks, client, sample_rate=0.1, max_chunks=500, questions_per_chunk=2,
+        concurrency=8,
+    )
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import random
-from typing import cast
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.config import INGESTION_CACHE_DIR
+from src.infra.json_store import JsonEntryStore
+from src.infra.llm.retry import RetryPolicy, get_retry_policy
 
-if False:
+if TYPE_CHECKING:
     from src.infra.llm.qwen_client import QwenClient
 
 logger = logging.getLogger(__name__)
 
-HYPE_BATCH_SIZE = 10
+HYPE_CACHE_PATH = INGESTION_CACHE_DIR / "hype_questions.json"
+# Log progress every this many completed chunks.
+HYPE_PROGRESS_EVERY = 25
+
+
+def _content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
 
 
 def _weighted_sample_chunks(
@@ -29,7 +58,11 @@ def _weighted_sample_chunks(
     sample_rate: float,
     max_chunks: int,
 ) -> list[dict]:
-    """Select chunks using weighted random sampling by quality_score.
+    """Select chunks by weighted sampling without replacement on quality_score.
+
+    Each chunk's random draw is seeded by its content, so the same corpus
+    always yields the same sample and unchanged chunks stay selected when
+    other chunks change.
 
     Args:
         chunks: List of chunk dicts with 'id' and 'quality_score'
@@ -43,25 +76,99 @@ def _weighted_sample_chunks(
         return []
 
     target_count = min(max_chunks, max(1, int(len(chunks) * sample_rate)))
-    population = list(chunks)
-    sampled: list[dict] = []
 
-    while population and len(sampled) < target_count:
-        weights = [max(0.01, float(c.get("quality_score", 0.5)) ** 2) for c in population]
-        selected = random.choices(population, weights=weights, k=1)[0]  # nosec B311
-        sampled.append(selected)
-        population = [chunk for chunk in population if chunk["id"] != selected["id"]]
+    def priority(chunk: dict) -> float:
+        weight = max(0.01, float(chunk.get("quality_score", 0.5)) ** 2)
+        seed = _content_digest(f"{chunk['id']}\n{chunk.get('content', '')}")
+        draw = random.Random(seed).random()  # nosec B311
+        return draw ** (1.0 / weight)
 
+    sampled = sorted(chunks, key=priority, reverse=True)[:target_count]
     logger.info(f"HyPE sampling: selected {len(sampled)} chunks from {len(chunks)} total")
     return sampled
 
 
+class HypeQuestionCache(JsonEntryStore):
+    """Persistent HyPE questions keyed by chunk content, prompt version and model."""
+
+    def __init__(self, path: Path | None = None):
+        super().__init__(path or HYPE_CACHE_PATH)
+
+    @staticmethod
+    def key(content: str, *, model: str | None, count: int) -> str:
+        from src.rag.hyde import HYPE_PROMPT_VERSION
+
+        return _content_digest(f"v{HYPE_PROMPT_VERSION}\n{model}\n{count}\n{content}")
+
+    def get(self, key: str) -> list[str] | None:
+        value = super().get(key)
+        return list(value) if value is not None else None
+
+    def put(self, key: str, questions: list[str]) -> None:
+        if questions:
+            super().put(key, list(questions))
+
+
+@dataclass
+class HypeProgress:
+    completed: int
+    total: int
+    cached: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.completed / max(self.elapsed_seconds, 1e-9)
+
+
+async def _generate_for_chunk(
+    chunk: dict,
+    client: QwenClient,
+    *,
+    count: int,
+    timeout: float,
+    retry_policy: RetryPolicy,
+) -> list[str]:
+    """One chunk's questions under ``retry_policy``, with ``timeout`` per attempt.
+
+    Each attempt is a single LLM request (``a_generate_once`` when the client
+    has it), so the client's own retries do not multiply with the policy's. A
+    response without any parseable question counts as a failed attempt.
+    """
+    from src.rag.hyde import HYPE_QUESTION_PROMPT_TEMPLATE, parse_hypothetical_questions
+
+    prompt = HYPE_QUESTION_PROMPT_TEMPLATE.format(count=count, chunk=chunk["content"].strip())
+
+    async def attempt() -> list[str]:
+        async with asyncio.timeout(timeout):
+            if hasattr(client, "a_generate_once"):
+                response = await client.a_generate_once(prompt, "")
+            elif hasattr(client, "a_generate"):
+                response = await client.a_generate(prompt, "")
+            else:
+                response = await asyncio.to_thread(client.generate, prompt, "")
+        questions = parse_hypothetical_questions(response, count)
+        if not questions:
+            raise ValueError("No HyPE questions in the response")
+        return questions
+
+    return await retry_policy.acall(attempt, label="HyPE generation")
+
+
 async def generate_hype_questions_for_chunks(
     chunks: list[dict],
     client: QwenClient,
     sample_rate: float,
     max_chunks: int,
     questions_per_chunk: int,
+    *,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    max_retries: int | None = None,
+    retry_policy: RetryPolicy | None = None,
+    cache: HypeQuestionCache | None = None,
+    on_progress: Callable[[HypeProgress], Any] | None = None,
 ) -> dict[str, list[str]]:
     """Generate hypothetical questions for a sample of chunks.
 
@@ -71,42 +178,99 @@ async def generate_hype_questions_for_chunks(
         sample_rate: Fraction of chunks to sample (0.0-1.0)
         max_chunks: Maximum number of chunks to process
         questions_per_chunk: Number of questions per chunk (1-2)
+        concurrency: LLM requests in flight (default: settings.hyde.hype_concurrency)
+        timeout: Seconds per request attempt (default: settings.hyde.hype_timeout_seconds)
+        max_retries: Retries per chunk (default: settings.hyde.hype_max_retries)
+        retry_policy: Backoff and circuit breaker for those retries (default:
+            the shared Dashscope policy)
+        cache: Question cache (default: the persistent cache under data/cache);
+            only chunks that produced questions are stored
+        on_progress: Called after every completed chunk
 
     Returns:
         Dict mapping chunk_id -> list of hypothetical question strings
     """
-    from src.rag.hyde import generate_hypothetical_questions
+    from src.config import settings
 
     sampled_chunks = _weighted_sample_chunks(chunks, sample_rate, max_chunks)
     if not sampled_chunks:
         return {}
 
+    concurrency = max(1, concurrency or settings.hyde.hype_concurrency)
+    timeout = timeout or settings.hyde.hype_timeout_seconds
+    max_retries = settings.hyde.hype_max_retries if max_retries is None else max_retries
+    retry_policy = replace(retry_policy or get_retry_policy(), max_attempts=max_retries + 1)
+    count = max(1, min(2, int(questions_per_chunk)))
+    cache = cache if cache is not None else HypeQuestionCache()
+    model = getattr(client, "model", None)
+
     hype_questions: dict[str, list[str]] = {}
+    pending: list[tuple[dict, str]] = []
+    for chunk in sampled_chunks:
+        if not str(chunk.get("content", "")).strip():
+            continue
+        key = HypeQuestionCache.key(chunk["content"], model=model, count=count)
+        cached = cache.get(key)
+        if cached:
+            hype_questions[chunk["id"]] = cached
+        else:
+            pending.append((chunk, key))
+
+    cached_count = len(sampled_chunks) - len(pending)
     errors = 0
+    completed = 0
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(concurrency)
 
-    for i in range(0, len(sampled_chunks), HYPE_BATCH_SIZE):
-        batch = sampled_chunks[i : i + HYPE_BATCH_SIZE]
-        tasks = [
-            generate_hypothetical_questions(
-                chunk=chunk["content"],
-                client=client,
-                count=questions_per_chunk,
+    def report() -> None:
+        progress = HypeProgress(
+            completed=completed,
+            total=len(pending),
+            cached=cached_count,
+            failed=errors,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+        if on_progress is not None:
+            on_progress(progress)
+        if completed == len(pending) or completed % HYPE_PROGRESS_EVERY == 0:
+            logger.info(
+                "HyPE progress: %d/%d generated (%.2f chunks/s), %d cached, %d failed",
+                progress.completed,
+                progress.total,
+                progress.chunks_per_second,
+                cached_count,
+                errors,
             )
-            for chunk in batch
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for chunk, result in zip(batch, results, strict=False):
-            if isinstance(result, Exception):
-                logger.warning(f"HyPE generation failed for chunk {chunk['id']}: {result}")
+    async def run(chunk: dict, key: str) -> None:
+        nonlocal completed, errors
+        async with semaphore:
+            try:
+                questions = await _generate_for_chunk(
+                    chunk, client, count=count, timeout=timeout, retry_policy=retry_policy
+                )
+            except Exception as exc:
+                logger.warning(f"HyPE generation failed for chunk {chunk['id']}: {exc}")
                 errors += 1
-                continue
-            questions: list[str] = cast(list[str], result)
-            if questions:
+            else:
+                cache.put(key, questions)
                 hype_questions[chunk["id"]] = questions
+            completed += 1
+            report()
+
+    try:
+        await asyncio.gather(*(run(chunk, key) for chunk, key in pending))
+    finally:
+        cache.save()
 
+    elapsed = time.perf_counter() - start
     logger.info(
         f"HyPE generation complete: {len(hype_questions)} chunks with questions, "
-        f"{errors} errors out of {len(sampled_chunks)} sampled"
+        f"{cached_count} from cache, {errors} errors out of {len(sampled_chunks)} sampled "
+        f"in {elapsed:.1f}s ({len(pending) / max(elapsed, 1e-9):.2f} chunks/s)"
     )
-    return hype_questions
+    return {
+        chunk["id"]: hype_questions[chunk["id"]]
+        for chunk in sampled_chunks
+        if chunk["id"] in hype_questions
+    }
@@ -3,12 +3,30 @@
 L2: PDF Loader - multi-pass PDF text extraction with page-level metadata.
 Supports pluggable extractor strategies: pypdf/pdfplumber and PyMuPDF/pdfplumber.
 Supports Camelot for structured table extraction.
+
+The primary extractor reads every page once; pdfplumber is only opened for the
+pages whose primary text fails the quality heuristic, and Camelot is called
+once per PDF for all pages with suspected tables. PDFs are processed in a
+process pool and merged in file order. Per-PDF timings (per extractor) are
+stored in each L2 artifact and a run summary is written next to them. With a
+``StageCache``, unchanged PDFs reuse their cached artifact.
+
+Example:
+    from src.ingestion.steps.load_pdfs import PDFLoader
+
+    documents = PDFLoader().load_all_pdfs(max_workers=4)
 """
 
 from __future__ import annotations
 
 import importlib
 import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -16,8 +34,20 @@ from pypdf import PdfReader
 
 from src.config import DATA_RAW_DIR
 from src.config.context import get_runtime_state
-from src.ingestion.artifacts import SourceArtifact, persist_source_artifact
+from src.ingestion.artifacts import (
+    SourceArtifact,
+    load_source_artifact,
+    persist_run_summary,
+    persist_source_artifact,
+)
+from src.ingestion.quality_stats import (
+    cached_quality_stats,
+    pdf_quality_stats,
+    source_content_hash,
+)
+from src.ingestion.stage_cache import StageCache, file_digest, fingerprint
 from src.ingestion.steps.download_web import get_manifest_record_by_filename
+from src.ingestion.timing import rounded_timings, summarize_timings, timed
 from src.source_metadata import canonical_source_label, infer_domain, infer_domain_type
 
 logger = logging.getLogger(__name__)
@@ -46,6 +76,14 @@ except Exception:
     logger.debug("camelot.core.TableList not available")
     TableList = Any
 
+# Bump when extraction changes in a way that invalidates cached parse output.
+PDF_PARSE_CACHE_VERSION = 1
+
+
+def pdf_config_fingerprint(config: PDFProcessorConfig) -> str:
+    """Digest of the processor config (and parse version) an artifact was extracted with."""
+    return fingerprint(asdict(config), PDF_PARSE_CACHE_VERSION)
+
 
 def _pdf_extractor_strategy() -> str:
     return str(get_runtime_state().pdf_extractor_strategy)
@@ -55,6 +93,31 @@ def _pdf_table_extractor() -> str:
     return str(get_runtime_state().pdf_table_extractor)
 
 
+@dataclass(frozen=True)
+class PDFProcessorConfig:
+    """PDF processing configuration, passed explicitly to worker processes."""
+
+    extractor_strategy: str = "pypdf_pdfplumber"
+    table_extractor: str = "heuristic"
+
+    @property
+    def primary_extractor(self) -> str:
+        if self.extractor_strategy == "pymupdf_pdfplumber" and pymupdf is not None:
+            return "pymupdf"
+        return "pypdf"
+
+    @property
+    def camelot_enabled(self) -> bool:
+        return self.table_extractor == "camelot" and camelot is not None
+
+
+def get_pdf_processor_config() -> PDFProcessorConfig:
+    return PDFProcessorConfig(
+        extractor_strategy=_pdf_extractor_strategy(),
+        table_extractor=_pdf_table_extractor(),
+    )
+
+
 def get_pdf_extractor_strategy() -> str:
     return _pdf_extractor_strategy()
 
@@ -90,6 +153,14 @@ def _suspected_table_count(text: str) -> int:
     return count
 
 
+def _needs_fallback(primary_text: str) -> bool:
+    return (
+        len(primary_text.strip()) < 120
+        or primary_text.count("\ufffd") > 2
+        or len(_normalize_lines(primary_text)) < 2
+    )
+
+
 def _infer_confidence(text: str, replacement_chars: int, line_count: int) -> str:
     stripped_len = len(text.strip())
     if stripped_len >= 400 and replacement_chars == 0 and line_count >= 3:
@@ -159,7 +230,7 @@ def _build_structured_blocks(page_num: int, text: str) -> list[dict]:
 
 
 def _build_camelot_table_blocks(
-    page_num: int, tables: TableList, section_path: list[str]
+    page_num: int, tables: TableList | list[Any], section_path: list[str]
 ) -> list[dict]:
     blocks: list[dict] = []
     for idx, table in enumerate(tables):
@@ -197,6 +268,23 @@ def _build_camelot_table_blocks(
     return blocks
 
 
+def _page_count(reader: Any, primary_texts: list[str]) -> int:
+    if hasattr(reader, "page_count"):
+        return int(reader.page_count)
+    if hasattr(reader, "pages") and not callable(reader.pages):
+        return len(reader.pages)
+    return len(primary_texts)
+
+
+def _camelot_row_count(blocks: list[dict]) -> int:
+    rows = 0
+    for block in blocks:
+        table_metadata = block.get("metadata", {}).get("table_metadata", {})
+        if isinstance(table_metadata, dict):
+            rows += int(table_metadata.get("rows", 0))
+    return rows
+
+
 class PDFLoader:
     def __init__(self, data_dir: str | Path | None = None):
         self.data_dir = Path(data_dir) if data_dir is not None else DATA_RAW_DIR
@@ -211,72 +299,107 @@ class PDFLoader:
         texts = [page.get_text("text") or "" for page in reader]
         return reader, texts
 
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> list[str]:
-        if pdfplumber is None:
-            return []
-        outputs: list[str] = []
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for page in pdf.pages:
-                outputs.append((page.extract_text() or "").strip())
+    def _extract_pages_with_pdfplumber(
+        self, pdf_path: Path, page_numbers: list[int]
+    ) -> dict[int, str]:
+        """Extract only ``page_numbers`` (1-based) with pdfplumber."""
+        if pdfplumber is None or not page_numbers:
+            return {}
+        outputs: dict[int, str] = {}
+        try:
+            with pdfplumber.open(str(pdf_path)) as pdf:
+                for page_num in page_numbers:
+                    if page_num - 1 < len(pdf.pages):
+                        page = pdf.pages[page_num - 1]
+                        outputs[page_num] = (page.extract_text() or "").strip()
+        except Exception as e:
+            logger.warning("pdfplumber fallback failed for %s: %s", pdf_path.name, e)
         return outputs
 
-    def _extract_primary(self, pdf_path: Path) -> tuple[Any, list[str]]:
-        if _pdf_extractor_strategy() == "pymupdf_pdfplumber" and pymupdf is not None:
+    def _extract_primary(
+        self, pdf_path: Path, config: PDFProcessorConfig | None = None
+    ) -> tuple[Any, list[str]]:
+        config = config or get_pdf_processor_config()
+        if config.primary_extractor == "pymupdf":
             return self._extract_with_pymupdf(pdf_path)
         return self._extract_with_pypdf(pdf_path)
 
-    def _extract_tables_camelot(self, pdf_path: Path, page_num: int) -> TableList | None:
-        if _pdf_table_extractor() != "camelot" or camelot is None:
-            return None
+    def _extract_tables_camelot(
+        self, pdf_path: Path, page_numbers: list[int], config: PDFProcessorConfig | None = None
+    ) -> dict[int, list[Any]]:
+        """Run Camelot once over all ``page_numbers`` and group the tables by page."""
+        config = config or get_pdf_processor_config()
+        if not config.camelot_enabled or not page_numbers:
+            return {}
         try:
-            tables = camelot.read_pdf(str(pdf_path), pages=str(page_num), flavor="lattice")
-            return tables if tables and len(tables) > 0 else None
-        except Exception as e:
-            logger.debug(
-                "Camelot table extraction failed for %s page %s: %s", pdf_path, page_num, e
+            tables = camelot.read_pdf(
+                str(pdf_path), pages=",".join(str(n) for n in page_numbers), flavor="lattice"
             )
-            return None
+        except Exception as e:
+            logger.debug("Camelot table extraction failed for %s: %s", pdf_path, e)
+            return {}
+        by_page: dict[int, list[Any]] = defaultdict(list)
+        for table in tables or []:
+            try:
+                by_page[int(getattr(table, "page", 0))].append(table)
+            except (TypeError, ValueError):
+                continue
+        return dict(by_page)
 
     def load_pdf(self, pdf_path: str) -> str:
         _, texts = self._extract_primary(Path(pdf_path))
         return "\n".join(texts)
 
-    def load_all_pdfs(self) -> list[dict]:
-        documents = []
-        pdf_files = sorted(self.data_dir.glob("*.pdf"))
+    def _extract_document(self, pdf_file: Path, config: PDFProcessorConfig) -> SourceArtifact:
+        """Extract one PDF into its L2 artifact. Runs in worker processes."""
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+        primary_name = config.primary_extractor
+        with timed(timings, primary_name):
+            reader, primary_texts = self._extract_primary(pdf_file, config)
+
+        fallback_candidates = [
+            page_num
+            for page_num, primary_text in enumerate(primary_texts, 1)
+            if _needs_fallback(primary_text)
+        ]
+        with timed(timings, "pdfplumber"):
+            fallback_texts = self._extract_pages_with_pdfplumber(pdf_file, fallback_candidates)
+
+        selected_texts: list[str] = []
+        extractors: list[str] = []
+        for page_num, primary_text in enumerate(primary_texts, 1):
+            fallback_text = fallback_texts.get(page_num, "")
+            use_fallback = bool(fallback_text)
+            selected_texts.append(fallback_text if use_fallback else primary_text)
+            extractors.append("pdfplumber" if use_fallback else primary_name)
+
+        table_pages = [
+            page_num
+            for page_num, text in enumerate(selected_texts, 1)
+            if _suspected_table_count(text) > 0
+        ]
+        with timed(timings, "camelot"):
+            camelot_tables = self._extract_tables_camelot(
+                pdf_file, table_pages if config.camelot_enabled else [], config
+            )
 
-        for pdf_file in pdf_files:
-            reader, primary_texts = self._extract_primary(pdf_file)
-            fallback_texts = self._extract_with_pdfplumber(pdf_file)
-            pages = []
-            all_blocks: list[dict] = []
-            full_text_parts: list[str] = []
-            fallback_used = 0
-            low_conf_pages = 0
-            ocr_required_pages = 0
-            camelot_table_pages = 0
-            camelot_total_rows = 0
+        pages = []
+        all_blocks: list[dict] = []
+        full_text_parts: list[str] = []
+        fallback_used = 0
+        low_conf_pages = 0
+        ocr_required_pages = 0
+        camelot_table_pages = 0
+        camelot_total_rows = 0
 
+        with timed(timings, "blocks"):
             for page_num, primary_text in enumerate(primary_texts, 1):
-                fallback_text = (
-                    fallback_texts[page_num - 1] if page_num - 1 < len(fallback_texts) else ""
-                )
+                selected_text = selected_texts[page_num - 1]
+                extractor = extractors[page_num - 1]
+                fallback_text = fallback_texts.get(page_num, "")
                 replacement_chars = primary_text.count("\ufffd")
-                primary_lines = _normalize_lines(primary_text)
-                use_fallback = bool(fallback_text) and (
-                    len(primary_text.strip()) < 120
-                    or replacement_chars > 2
-                    or len(primary_lines) < 2
-                )
-                selected_text = fallback_text if use_fallback else primary_text
-                extractor = (
-                    "pdfplumber"
-                    if use_fallback
-                    else (
-                        "pymupdf" if _pdf_extractor_strategy() == "pymupdf_pdfplumber" else "pypdf"
-                    )
-                )
-                if use_fallback:
+                if extractor == "pdfplumber":
                     fallback_used += 1
                 line_count = len(_normalize_lines(selected_text))
                 confidence = _infer_confidence(selected_text, replacement_chars, line_count)
@@ -287,22 +410,17 @@ class PDFLoader:
 
                 section_path: list[str] = []
                 structured_blocks = _build_structured_blocks(page_num, selected_text)
+                suspected_tables = _suspected_table_count(selected_text)
 
-                if _pdf_table_extractor() == "camelot" and camelot is not None:
-                    suspected_tables = _suspected_table_count(selected_text)
-                    if suspected_tables > 0:
-                        camelot_tables = self._extract_tables_camelot(pdf_file, page_num)
-                        if camelot_tables and len(camelot_tables) > 0:
-                            camelot_blocks = _build_camelot_table_blocks(
-                                page_num, camelot_tables, section_path
-                            )
-                            if camelot_blocks:
-                                structured_blocks.extend(camelot_blocks)
-                                camelot_table_pages += 1
-                                for cb in camelot_blocks:
-                                    tm = cb.get("metadata", {}).get("table_metadata", {})
-                                    if isinstance(tm, dict):
-                                        camelot_total_rows += int(tm.get("rows", 0))
+                page_tables = camelot_tables.get(page_num)
+                if page_tables:
+                    camelot_blocks = _build_camelot_table_blocks(
+                        page_num, page_tables, section_path
+                    )
+                    if camelot_blocks:
+                        structured_blocks.extend(camelot_blocks)
+                        camelot_table_pages += 1
+                        camelot_total_rows += _camelot_row_count(camelot_blocks)
 
                 all_blocks.extend(structured_blocks)
                 full_text_parts.append(selected_text)
@@ -313,7 +431,7 @@ class PDFLoader:
                         "extractor": extractor,
                         "char_count": len(selected_text.strip()),
                         "line_count": line_count,
-                        "suspected_table_count": _suspected_table_count(selected_text),
+                        "suspected_table_count": suspected_tables,
                         "replacement_char_count": replacement_chars,
                         "confidence": confidence,
                         "ocr_required": not selected_text.strip(),
@@ -323,68 +441,135 @@ class PDFLoader:
                             "primary_char_count": len(primary_text.strip()),
                             "fallback_char_count": len(fallback_text.strip()),
                             "camelot_table_pages": (
-                                1
-                                if camelot is not None
-                                and _pdf_table_extractor() == "camelot"
-                                and _suspected_table_count(selected_text) > 0
-                                else 0
+                                1 if config.camelot_enabled and suspected_tables > 0 else 0
                             ),
                         },
                     }
                 )
+        timings["total"] = (time.perf_counter() - start) * 1000
+
+        page_count = _page_count(reader, primary_texts)
+        pymupdf_strategy = config.extractor_strategy == "pymupdf_pdfplumber"
+        return SourceArtifact(
+            source_id=pdf_file.stem,
+            source_path=str(pdf_file),
+            source_type="pdf",
+            raw_source={
+                "page_count": page_count,
+                "size_bytes": pdf_file.stat().st_size,
+                "pdf_extractor_strategy": config.extractor_strategy,
+                "pdf_table_extractor": config.table_extractor,
+            },
+            extracted_text="\n\n".join(full_text_parts).strip(),
+            structured_blocks=all_blocks,
+            best_output={
+                "extractor": (
+                    "mixed_pymupdf"
+                    if pymupdf_strategy and not fallback_used
+                    else "pymupdf"
+                    if pymupdf_strategy
+                    else "mixed"
+                    if fallback_used
+                    else "pypdf"
+                ),
+                "page_count": page_count,
+                "pages": pages,
+            },
+            fallback_output={
+                "extractor": "pdfplumber" if pdfplumber is not None else "unavailable",
+                "page_count": len(fallback_texts),
+                "pages_requested": fallback_candidates,
+            },
+            metadata={
+                "fallback_used_pages": fallback_used,
+                "fallback_extracted_pages": len(fallback_texts),
+                "low_confidence_pages": low_conf_pages,
+                "ocr_required_pages": ocr_required_pages,
+                "camelot_table_pages": camelot_table_pages,
+                "camelot_total_rows": camelot_total_rows,
+                "camelot_calls": 1 if config.camelot_enabled and table_pages else 0,
+                "pdf_extractor_strategy": config.extractor_strategy,
+                "pdf_table_extractor": config.table_extractor,
+                "timings_ms": rounded_timings(timings),
+                "quality_stats": pdf_quality_stats(
+                    source_content_hash(pdf_file),
+                    primary_texts,
+                    text_extractor=primary_name,
+                    config_fingerprint=pdf_config_fingerprint(config),
+                ),
+            },
+        )
 
-            artifact = SourceArtifact(
-                source_id=pdf_file.stem,
-                source_path=str(pdf_file),
-                source_type="pdf",
-                raw_source={
-                    "page_count": (
-                        reader.page_count
-                        if hasattr(reader, "page_count")
-                        else len(reader.pages)
-                        if hasattr(reader, "pages") and not callable(reader.pages)
-                        else len(primary_texts)
-                    ),
-                    "size_bytes": pdf_file.stat().st_size,
-                    "pdf_extractor_strategy": _pdf_extractor_strategy(),
-                    "pdf_table_extractor": _pdf_table_extractor(),
-                },
-                extracted_text="\n\n".join(full_text_parts).strip(),
-                structured_blocks=all_blocks,
-                best_output={
-                    "extractor": (
-                        "mixed_pymupdf"
-                        if _pdf_extractor_strategy() == "pymupdf_pdfplumber" and not fallback_used
-                        else "pymupdf"
-                        if _pdf_extractor_strategy() == "pymupdf_pdfplumber"
-                        else "mixed"
-                        if fallback_used
-                        else "pypdf"
-                    ),
-                    "page_count": (
-                        reader.page_count
-                        if hasattr(reader, "page_count")
-                        else len(reader.pages)
-                        if hasattr(reader, "pages") and not callable(reader.pages)
-                        else len(primary_texts)
-                    ),
-                    "pages": pages,
-                },
-                fallback_output={
-                    "extractor": "pdfplumber" if pdfplumber is not None else "unavailable",
-                    "page_count": len(fallback_texts),
-                },
-                metadata={
-                    "fallback_used_pages": fallback_used,
-                    "low_confidence_pages": low_conf_pages,
-                    "ocr_required_pages": ocr_required_pages,
-                    "camelot_table_pages": camelot_table_pages,
-                    "camelot_total_rows": camelot_total_rows,
-                    "pdf_extractor_strategy": _pdf_extractor_strategy(),
-                    "pdf_table_extractor": _pdf_table_extractor(),
-                },
-            )
-            persist_source_artifact(artifact)
+    def _extract_documents(
+        self, pdf_files: list[Path], config: PDFProcessorConfig, workers: int
+    ) -> list[SourceArtifact]:
+        """Extract PDFs in parallel; results come back in ``pdf_files`` order."""
+        if workers <= 1 or len(pdf_files) <= 1:
+            return [self._extract_document(pdf_file, config) for pdf_file in pdf_files]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._extract_document, pdf_files, repeat(config)))
+
+    def load_all_pdfs(
+        self,
+        max_workers: int | None = None,
+        cache: StageCache | None = None,
+        reuse_artifacts: bool = False,
+    ) -> list[dict]:
+        """Extract every PDF in ``data_dir`` and persist its L2 artifact.
+
+        Args:
+            max_workers: Worker processes; defaults to the CPU count (capped
+                by the number of PDFs)
+            cache: Optional stage cache; PDFs whose bytes and processor config
+                are unchanged reuse their cached artifact instead of being
+                extracted. In dry-run mode uncached PDFs are only counted.
+            reuse_artifacts: Reuse the persisted L2 artifact of PDFs whose
+                bytes and processor config are unchanged (per its quality
+                stats) and leave the ingestion run summary untouched; used by
+                the quality checks.
+        """
+        documents = []
+        pdf_files = sorted(self.data_dir.glob("*.pdf"))
+        config = get_pdf_processor_config()
+
+        cached: dict[Path, SourceArtifact] = {}
+        keys: dict[Path, str] = {}
+        if cache is not None:
+            for pdf_file in pdf_files:
+                keys[pdf_file] = fingerprint(
+                    "parse", file_digest(pdf_file), asdict(config), PDF_PARSE_CACHE_VERSION
+                )
+                value = cache.lookup("parse", keys[pdf_file], pdf_file.name)
+                if value is not None:
+                    cached[pdf_file] = SourceArtifact(**value)
+            if cache.dry_run:
+                pdf_files = [pdf_file for pdf_file in pdf_files if pdf_file in cached]
+        reused: set[Path] = set()
+        if reuse_artifacts:
+            config_fingerprint = pdf_config_fingerprint(config)
+            for pdf_file in pdf_files:
+                if pdf_file in cached:
+                    continue
+                persisted = load_source_artifact("pdf", pdf_file.stem)
+                stats = cached_quality_stats(persisted, source_content_hash(pdf_file))
+                if persisted and stats and stats.get("config_fingerprint") == config_fingerprint:
+                    cached[pdf_file] = SourceArtifact(**persisted)
+                    reused.add(pdf_file)
+        pending = [pdf_file for pdf_file in pdf_files if pdf_file not in cached]
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(pending)))
+
+        start = time.perf_counter()
+        extracted = dict(
+            zip(pending, self._extract_documents(pending, config, workers), strict=True)
+        )
+        if cache is not None:
+            for pdf_file, artifact in extracted.items():
+                cache.store("parse", keys[pdf_file], asdict(artifact))
+        artifacts = [cached.get(pdf_file) or extracted[pdf_file] for pdf_file in pdf_files]
+        persist = cache is None or not cache.dry_run
+        for pdf_file, artifact in zip(pdf_files, artifacts, strict=True):
+            if persist and pdf_file not in reused:
+                persist_source_artifact(artifact)
 
             manifest_record = get_manifest_record_by_filename(pdf_file.name)
             metadata = artifact.metadata.copy()
@@ -404,15 +589,35 @@ class PDFLoader:
                     "id": pdf_file.stem,
                     "source": str(pdf_file.name),
                     "source_type": "pdf",
-                    "pages": pages,
-                    "structured_blocks": all_blocks,
+                    "pages": artifact.best_output["pages"],
+                    "structured_blocks": artifact.structured_blocks,
                     "metadata": metadata,
                 }
             )
 
+        if pdf_files and persist and not reuse_artifacts:
+            persist_run_summary(
+                "pdf",
+                {
+                    "files": len(pdf_files),
+                    "pages": sum(int(a.best_output.get("page_count", 0)) for a in artifacts),
+                    "fallback_extracted_pages": sum(
+                        int(a.metadata.get("fallback_extracted_pages", 0)) for a in artifacts
+                    ),
+                    "workers": workers,
+                    "cached": len(cached),
+                    "pdf_extractor_strategy": config.extractor_strategy,
+                    "pdf_table_extractor": config.table_extractor,
+                    **summarize_timings(
+                        (a.metadata.get("timings_ms", {}) for a in artifacts),
+                        files=len(pdf_files),
+                        elapsed=time.perf_counter() - start,
+                    ),
+                },
+            )
         return documents
 
 
-def get_documents() -> list[dict]:
+def get_documents(reuse_artifacts: bool = False) -> list[dict]:
     loader = PDFLoader()
-    return loader.load_all_pdfs()
+    return loader.load_all_pdfs(reuse_artifacts=reuse_artifacts)
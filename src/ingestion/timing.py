@@ -0,0 +1,88 @@
+"""Lightweight wall-clock timers for ingestion steps.
+
+Conversion steps record how long each parser/extractor takes per file and
+persist the numbers with their artifacts, so regressions show up in the L1/L2
+assessment output.
+
+Retrieval marks its stages with ``stage_timer``, which records only while a
+caller collects them with ``collect_stage_timings`` (e.g. the offline
+retrieval benchmark); otherwise it is a no-op.
+
+Example:
+    timings: dict[str, float] = {}
+    with timed(timings, "parse"):
+        soup = BeautifulSoup(html, "lxml")
+    summary = summarize_timings([timings], files=1, elapsed=0.5)
+
+    with collect_stage_timings() as stages:
+        retrieve_context_with_trace(query)
+    stages["rerank_diversify"]
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_stage_timings: ContextVar[dict[str, float] | None] = ContextVar("stage_timings", default=None)
+
+
+@contextmanager
+def timed(timings: dict[str, float] | None, key: str) -> Iterator[None]:
+    """Add the elapsed milliseconds of the block to ``timings[key]``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[key] = timings.get(key, 0.0) + (time.perf_counter() - start) * 1000
+
+
+@contextmanager
+def collect_stage_timings() -> Iterator[dict[str, float]]:
+    """Collect the ``stage_timer`` milliseconds recorded in this thread or task."""
+    timings: dict[str, float] = {}
+    token = _stage_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _stage_timings.reset(token)
+
+
+@contextmanager
+def stage_timer(key: str) -> Iterator[None]:
+    """Time the block into the active ``collect_stage_timings`` dict, if any."""
+    timings = _stage_timings.get()
+    if timings is None:
+        yield
+        return
+    with timed(timings, key):
+        yield
+
+
+def rounded_timings(timings: dict[str, float]) -> dict[str, float]:
+    return {key: round(value, 3) for key, value in timings.items()}
+
+
+def summarize_timings(
+    per_file: Iterable[dict[str, float]], *, files: int, elapsed: float
+) -> dict[str, Any]:
+    """Throughput plus total/mean milliseconds per timed step across files."""
+    totals: Counter[str] = Counter()
+    timed_files = 0
+    for timings in per_file:
+        totals.update(timings)
+        timed_files += 1
+    elapsed = max(elapsed, 1e-9)
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(files / elapsed, 2),
+        "timings_ms_total": {key: round(value, 1) for key, value in sorted(totals.items())},
+        "timings_ms_mean": {
+            key: round(value / max(1, timed_files), 3) for key, value in sorted(totals.items())
+        },
+    }
@@ -0,0 +1,248 @@
+"""Token-budgeted assembly of chat history and retrieved context.
+
+The chat usecase used to concatenate the full session history and every
+retrieved chunk into the prompt. This module keeps the prompt inside a token
+budget before it reaches the LLM:
+
+    - history is filled newest-first; the oldest turns are dropped first
+    - retrieved chunks are de-duplicated (contained chunks are removed and
+      overlapping prefixes shared with a higher-ranked chunk are trimmed)
+    - chunks are kept in rank order; the first chunk that no longer fits is
+      truncated and lower-ranked chunks are dropped
+    - unused history budget is handed to the retrieved chunks
+
+Token counts use a fast local estimate (about four characters per token)
+rather than a real tokenizer, which is close enough for budgeting English
+medical text and costs nothing per request.
+
+Example:
+    from src.rag.context_assembly import ContextBudgetConfig, assemble_context
+
+    assembled = assemble_context(history, retrieved_context, ContextBudgetConfig.from_settings())
+    prompt_context = assembled.retrieved_context
+    trace.context.budget = assembled.budget
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from src.config import settings
+from src.rag.trace_models import ContextBudget
+
+CHARS_PER_TOKEN = 4
+_BLOCK_SEPARATOR = "\n\n"
+_BLOCK_SPLIT_RE = re.compile(r"\n\n(?=\[Source: )")
+_OVERLAP_PROBE_CHARS = 64
+_TRUNCATION_MARKER = " ..."
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` without loading a tokenizer."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass(frozen=True)
+class ContextBudgetConfig:
+    """Token limits for the assembled prompt context.
+
+    Attributes:
+        max_tokens: Budget for history plus retrieved context; 0 disables limits
+        history_max_tokens: Share of the budget history may use at most
+        min_chunk_tokens: Smallest truncated chunk worth keeping
+    """
+
+    max_tokens: int = 6000
+    history_max_tokens: int = 1500
+    min_chunk_tokens: int = 64
+
+    @classmethod
+    def from_settings(cls) -> ContextBudgetConfig:
+        return cls(
+            max_tokens=settings.api.chat_context_max_tokens,
+            history_max_tokens=settings.api.chat_history_max_tokens,
+            min_chunk_tokens=settings.api.chat_context_min_chunk_tokens,
+        )
+
+
+@dataclass(frozen=True)
+class AssembledContext:
+    """History and retrieved context trimmed to the budget.
+
+    ``kept_chunk_indices`` holds the rank positions of the chunks that reached
+    the prompt; they index the sources list of ``build_context_and_sources``.
+    """
+
+    history_context: str
+    retrieved_context: str
+    budget: ContextBudget
+    kept_chunk_indices: tuple[int, ...] = ()
+
+
+def split_context_blocks(retrieved_context: str) -> list[str]:
+    """Split formatted retrieval context back into ranked ``[Source: ...]`` blocks."""
+    if not retrieved_context:
+        return []
+    return [block for block in _BLOCK_SPLIT_RE.split(retrieved_context) if block.strip()]
+
+
+def _split_header(block: str) -> tuple[str, str]:
+    if block.startswith("[Source: "):
+        header, sep, body = block.partition("\n")
+        if sep:
+            return header + sep, body
+    return "", block
+
+
+def _overlap_length(previous: str, body: str) -> int:
+    """Length of the longest suffix of ``previous`` that is a prefix of ``body``."""
+    probe = body[:_OVERLAP_PROBE_CHARS]
+    if len(probe) < _OVERLAP_PROBE_CHARS:
+        return 0
+    start = previous.find(probe)
+    while start != -1:
+        tail = previous[start:]
+        if body.startswith(tail):
+            return len(tail)
+        start = previous.find(probe, start + 1)
+    return 0
+
+
+def dedupe_context_blocks(blocks: list[str]) -> tuple[list[str], int, int]:
+    """Remove duplicated and overlapping chunk text, preserving rank order.
+
+    Returns:
+        Tuple of (kept blocks, blocks removed, overlapping characters trimmed)
+    """
+    kept, removed, trimmed_chars = _dedupe_indexed(blocks)
+    return [block for _, block in kept], removed, trimmed_chars
+
+
+def _dedupe_indexed(blocks: list[str]) -> tuple[list[tuple[int, str]], int, int]:
+    kept: list[tuple[int, str]] = []
+    kept_bodies: list[str] = []
+    removed = 0
+    trimmed_chars = 0
+    for index, block in enumerate(blocks):
+        header, body = _split_header(block)
+        normalized = body.strip()
+        if not normalized or any(normalized in previous for previous in kept_bodies):
+            removed += 1
+            continue
+        for previous in kept_bodies:
+            overlap = _overlap_length(previous, normalized)
+            if overlap:
+                normalized = normalized[overlap:].lstrip()
+                trimmed_chars += overlap
+        if not normalized:
+            removed += 1
+            continue
+        kept_bodies.append(normalized)
+        kept.append((index, f"{header}{normalized}"))
+    return kept, removed, trimmed_chars
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    limit = max(0, max_tokens * CHARS_PER_TOKEN - len(_TRUNCATION_MARKER))
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    if cut <= 0:
+        cut = limit
+    return text[:cut].rstrip() + _TRUNCATION_MARKER
+
+
+def _select_history(history: list[dict[str, str]], max_tokens: int | None) -> tuple[list[str], int]:
+    lines = [f"{msg['role']}: {msg['content']}" for msg in history]
+    if max_tokens is None:
+        return lines, 0
+    kept: list[str] = []
+    used = 0
+    for line in reversed(lines):
+        cost = estimate_tokens(line) + 1
+        if used + cost > max_tokens:
+            break
+        kept.append(line)
+        used += cost
+    kept.reverse()
+    return kept, len(lines) - len(kept)
+
+
+def _select_blocks(
+    blocks: list[str], max_tokens: int | None, min_chunk_tokens: int
+) -> tuple[list[str], int, int]:
+    if max_tokens is None:
+        return blocks, 0, 0
+    kept: list[str] = []
+    used = 0
+    for index, block in enumerate(blocks):
+        cost = estimate_tokens(block) + (1 if kept else 0)
+        if used + cost <= max_tokens:
+            kept.append(block)
+            used += cost
+            continue
+        remaining = max_tokens - used - (1 if kept else 0)
+        if remaining >= min_chunk_tokens:
+            kept.append(_truncate_to_tokens(block, remaining))
+            return kept, 1, len(blocks) - index - 1
+        return kept, 0, len(blocks) - index
+    return kept, 0, 0
+
+
+def assemble_context(
+    history: list[dict[str, str]],
+    retrieved_context: str,
+    config: ContextBudgetConfig,
+) -> AssembledContext:
+    """Fit conversation history and retrieved chunks into the token budget.
+
+    Args:
+        history: Chat history messages with 'role' and 'content' keys, oldest first
+        retrieved_context: Context formatted by ``build_context_and_sources``
+        config: Token limits to enforce
+
+    Returns:
+        AssembledContext with the trimmed history/context strings, the
+        budget split for the pipeline trace and the rank positions of the
+        chunks that were kept
+    """
+    limited = config.max_tokens > 0
+    history_limit = min(config.history_max_tokens, config.max_tokens) if limited else None
+    history_lines, history_dropped = _select_history(history, history_limit)
+    history_context = "\n".join(history_lines)
+    history_tokens = estimate_tokens(history_context)
+
+    blocks = split_context_blocks(retrieved_context)
+    deduped, duplicates_removed, overlap_chars = _dedupe_indexed(blocks)
+    chunk_limit = max(0, config.max_tokens - history_tokens) if limited else None
+    kept_blocks, chunks_truncated, chunks_dropped = _select_blocks(
+        [block for _, block in deduped], chunk_limit, config.min_chunk_tokens
+    )
+    kept_indices = tuple(index for index, _ in deduped[: len(kept_blocks)])
+    trimmed_context = _BLOCK_SEPARATOR.join(kept_blocks)
+    retrieved_tokens = estimate_tokens(trimmed_context)
+
+    budget = ContextBudget(
+        max_tokens=config.max_tokens,
+        history_budget_tokens=history_limit if history_limit is not None else 0,
+        history_tokens=history_tokens,
+        history_turns_kept=len(history_lines),
+        history_turns_dropped=history_dropped,
+        retrieved_budget_tokens=chunk_limit if chunk_limit is not None else 0,
+        retrieved_tokens=retrieved_tokens,
+        chunks_kept=len(kept_blocks),
+        chunks_truncated=chunks_truncated,
+        chunks_dropped=chunks_dropped,
+        duplicate_chunks_removed=duplicates_removed,
+        overlap_chars_removed=overlap_chars,
+        total_tokens=history_tokens + retrieved_tokens,
+    )
+    return AssembledContext(
+        history_context=history_context,
+        retrieved_context=trimmed_context,
+        budget=budget,
+        kept_chunk_indices=kept_indices,
+    )
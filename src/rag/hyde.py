@@ -22,6 +22,7 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -76,7 +77,9 @@ async def generate_hypothetical_answer(
     prompt = HYPOTHETICAL_ANSWER_PROMPT_TEMPLATE.format(max_length=max_length, query=query.strip())
 
     try:
-        hypothetical = client.generate(
+        # Sync client call (with its retry backoff) runs off the event loop
+        hypothetical = await asyncio.to_thread(
+            client.generate,
             prompt=prompt,
             context="",  # No context for hypothetical answer generation
         )
@@ -252,6 +255,10 @@ def validate_hyde_config(
     return enable_hyde, validated_max_length
 
 
+# Bump whenever HYPE_QUESTION_PROMPT_TEMPLATE or the parsing below changes;
+# cached HyPE questions are keyed by it.
+HYPE_PROMPT_VERSION = 1
+
 HYPE_QUESTION_PROMPT_TEMPLATE = """Given this medical document chunk, generate {count} question(s) that this chunk would answer.
 Focus on specific medical terminology, clinical values, and guideline recommendations.
 
@@ -261,6 +268,18 @@ Document chunk:
 Generate {count} question(s), each on its own line. Be specific and use medical terminology."""
 
 
+def parse_hypothetical_questions(response: str, count: int) -> list[str]:
+    """Extract up to ``count`` questions (one per line) from an LLM response."""
+    questions = []
+    for line in response.strip().split("\n"):
+        line = line.strip()
+        if line and not line.startswith("-"):
+            line = line.lstrip("0123456789. )").strip()
+        if line and len(line) > 10:
+            questions.append(line)
+    return questions[:count]
+
+
 async def generate_hypothetical_questions(
     chunk: str,
     client: QwenClient,
@@ -288,15 +307,8 @@ async def generate_hypothetical_questions(
     prompt = HYPE_QUESTION_PROMPT_TEMPLATE.format(count=count, chunk=chunk.strip())
 
     try:
-        response = client.generate(prompt=prompt, context="")
-        questions = []
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line and not line.startswith("-"):
-                line = line.lstrip("0123456789. )").strip()
-            if line and len(line) > 10:
-                questions.append(line)
-        result = questions[:count]
+        response = await asyncio.to_thread(client.generate, prompt=prompt, context="")
+        result = parse_hypothetical_questions(response, count)
         logger.debug(f"Generated {len(result)} hypothetical questions for chunk: {chunk[:50]}...")
         return result
     except Exception as e:
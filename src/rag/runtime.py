@@ -5,12 +5,14 @@ Public API re-exports are in src/rag/__init__.py.
 
 from __future__ import annotations
 
+import copy
 import logging
 import time
 from typing import Any
 
 from src.config import settings
 from src.ingestion.indexing.chroma_store import get_vector_store
+from src.ingestion.timing import stage_timer
 from src.rag.config import (
     RetrievalDiversityConfig,
     resolve_retrieval_config,
@@ -261,16 +263,13 @@ def _build_pipeline_trace(
     )
 
 
-def retrieve_context_with_trace(
-    query: str, top_k: int = 5, retrieval_options: dict[str, Any] | None = None
-):
-    if not query or not query.strip():
-        return "", [], _empty_pipeline_trace("", top_k)
-    query, original_length, cfg, total_start, vector_store = _prepare_query(
-        query, retrieval_options
-    )
-
-    fetch_k = max(top_k, top_k * cfg.overfetch_multiplier)
+def _retrieve_candidate_pool(
+    vector_store,
+    query: str,
+    cfg,
+    fetch_k: int,
+) -> tuple[list[dict], dict, list]:
+    """Expansion + candidate retrieval: everything upstream of rerank/diversification."""
     expanded_queries, medical_expansion_trace = prepare_expanded_queries(
         query,
         enable_medical_expansion=cfg.enable_medical_expansion,
@@ -292,23 +291,74 @@ def retrieve_context_with_trace(
         cfg.search_mode,
         pre_expanded_queries=expanded_queries,
     )
+    return results, retrieval_trace, medical_expansion_trace
 
-    results, _, rerank_info, apply_div = _rerank_and_diversify(results, query, top_k, fetch_k, cfg)
 
-    return _build_pipeline_trace(
-        results=results,
-        retrieval_trace=retrieval_trace,
-        cfg=cfg,
-        medical_expansion_trace=medical_expansion_trace,
-        apply_diversification=apply_div,
-        rerank_info=rerank_info,
-        original_length=original_length,
-        query=query,
-        top_k=top_k,
-        total_start=total_start,
+def candidate_pool_key(query: str, cfg, fetch_k: int) -> tuple:
+    """Every input of ``_retrieve_candidate_pool``; equal keys give equal candidate pools."""
+    return (
+        query,
+        cfg.search_mode,
+        cfg.enable_medical_expansion,
+        cfg.medical_expansion_provider,
+        cfg.enable_hype,
+        fetch_k,
     )
 
 
+def retrieve_context_with_trace(
+    query: str,
+    top_k: int = 5,
+    retrieval_options: dict[str, Any] | None = None,
+    *,
+    candidate_pools: dict[tuple, tuple[list[dict], dict, list]] | None = None,
+):
+    """Retrieve, rerank and diversify context for ``query``.
+
+    When ``candidate_pools`` is given, the pre-rerank candidate pool is looked up
+    there by ``candidate_pool_key`` (and stored on a miss), so sweeps that only
+    vary rerank/diversification options replay the downstream stages without
+    re-running embedding, BM25 and fusion.
+    """
+    if not query or not query.strip():
+        return "", [], _empty_pipeline_trace("", top_k)
+    with stage_timer("prepare"):
+        query, original_length, cfg, total_start, vector_store = _prepare_query(
+            query, retrieval_options
+        )
+
+    fetch_k = max(top_k, top_k * cfg.overfetch_multiplier)
+    with stage_timer("candidate_retrieval"):
+        if candidate_pools is None:
+            pool = _retrieve_candidate_pool(vector_store, query, cfg, fetch_k)
+        else:
+            key = candidate_pool_key(query, cfg, fetch_k)
+            if key not in candidate_pools:
+                candidate_pools[key] = _retrieve_candidate_pool(vector_store, query, cfg, fetch_k)
+            # Reranking annotates result dicts in place; keep the stored pool pristine.
+            pool = copy.deepcopy(candidate_pools[key])
+    results, retrieval_trace, medical_expansion_trace = pool
+
+    with stage_timer("rerank_diversify"):
+        results, _, rerank_info, apply_div = _rerank_and_diversify(
+            results, query, top_k, fetch_k, cfg
+        )
+
+    with stage_timer("trace_build"):
+        return _build_pipeline_trace(
+            results=results,
+            retrieval_trace=retrieval_trace,
+            cfg=cfg,
+            medical_expansion_trace=medical_expansion_trace,
+            apply_diversification=apply_div,
+            rerank_info=rerank_info,
+            original_length=original_length,
+            query=query,
+            top_k=top_k,
+            total_start=total_start,
+        )
+
+
 async def retrieve_context_with_trace_async(
     query: str,
     top_k: int = 5,
@@ -74,6 +74,24 @@ class RetrievalStage(BaseModel):
     steps: list[RetrievalStep] = Field(default_factory=list)
 
 
+class ContextBudget(BaseModel):
+    """Token budget split applied when assembling the LLM context."""
+
+    max_tokens: int
+    history_budget_tokens: int
+    history_tokens: int
+    history_turns_kept: int
+    history_turns_dropped: int
+    retrieved_budget_tokens: int
+    retrieved_tokens: int
+    chunks_kept: int
+    chunks_truncated: int
+    chunks_dropped: int
+    duplicate_chunks_removed: int
+    overlap_chars_removed: int
+    total_tokens: int
+
+
 class ContextStage(BaseModel):
     """Metadata about the context assembly stage."""
 
@@ -81,6 +99,7 @@ class ContextStage(BaseModel):
     total_chars: int
     sources: list[str]
     preview: str
+    budget: ContextBudget | None = None
 
 
 class GenerationStage(BaseModel):
@@ -36,26 +36,15 @@ from src.app.exceptions import UpstreamServiceError
 from src.infra.llm import get_client
 from src.infra.storage.interfaces import ChatHistoryStore
 from src.rag import retrieve_context, retrieve_context_with_trace, retrieve_context_with_trace_async
+from src.rag.context_assembly import (
+    ContextBudgetConfig,
+    assemble_context,
+    split_context_blocks,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def _build_history_context(history: list[dict[str, str]]) -> str:
-    """Convert conversation history to a context string.
-
-    Args:
-        history: List of message dictionaries with 'role' and 'content' keys
-
-    Returns:
-        Formatted string with role-labeled messages joined by newlines
-
-    Example:
-        Input: [{"role": "user", "content": "Hello"}]
-        Output: "user: Hello"
-    """
-    return "\n".join(f"{msg['role']}: {msg['content']}" for msg in history)
-
-
 def _compose_full_context(history_context: str, retrieved_context: str) -> str:
     """Combine history and retrieved contexts into a single context string.
 
@@ -71,6 +60,33 @@ def _compose_full_context(history_context: str, retrieved_context: str) -> str:
     return f"{history_context}\n\nContext: {retrieved_context}"
 
 
+def _assemble_full_context(
+    history: list[dict[str, str]],
+    retrieved_context: str,
+    sources: list[Any],
+    pipeline_trace: Any,
+) -> tuple[str, list[Any]]:
+    """Fit history and retrieved context into the token budget and compose them.
+
+    Oldest history turns are dropped first, overlapping chunks are de-duplicated
+    and low-ranked chunks are truncated or dropped. The budget split is recorded
+    on ``pipeline_trace.context.budget`` when a trace is being collected.
+
+    Returns:
+        Tuple of (full context, sources of the chunks that reached the prompt)
+    """
+    assembled = assemble_context(history, retrieved_context, ContextBudgetConfig.from_settings())
+    context_stage = getattr(pipeline_trace, "context", None)
+    if context_stage is not None:
+        context_stage.budget = assembled.budget
+    if len(split_context_blocks(retrieved_context)) == len(sources):
+        sources = [sources[index] for index in assembled.kept_chunk_indices]
+    else:
+        logger.warning("Context blocks do not line up with sources; citing all sources")
+    full_context = _compose_full_context(assembled.history_context, assembled.retrieved_context)
+    return full_context, sources
+
+
 def process_chat_message(
     *,
     llm_client: Any,
@@ -97,7 +113,7 @@ def process_chat_message(
     Returns:
         Dictionary containing:
             - "response": Generated assistant response text
-            - "sources": List of retrieved document sources
+            - "sources": Sources of the retrieved chunks that fit the context budget
             - "pipeline": PipelineTrace object if include_pipeline=True, else None
 
     Pipeline trace includes:
@@ -112,7 +128,6 @@ def process_chat_message(
     """
     resolved_session_id = session_id or "default"
     history = history_store.get_history(resolved_session_id)
-    history_context = _build_history_context(history)
 
     pipeline_trace = None
     chat_start = time.time()
@@ -122,7 +137,7 @@ def process_chat_message(
     else:
         context, sources = retrieve_context(message, top_k=top_k)
 
-    full_context = _compose_full_context(history_context, context)
+    full_context, sources = _assemble_full_context(history, context, sources, pipeline_trace)
 
     gen_start = time.time()
     client = llm_client or get_client()
@@ -173,12 +188,15 @@ async def stream_chat_message(
         - content: Token string (may be empty for metadata-only events)
         - metadata: Dict with keys: done (bool), sources (list), pipeline (dict), error (str)
 
-    On completion, yields final metadata with done=True and sources.
-    On error after partial output, yields with error key set.
+    As soon as retrieval and context assembly finish (before the first token),
+    yields a metadata-only event with done=False and the sources of the chunks
+    kept under the context budget so clients can render
+    citations while tokens stream. On completion, yields final metadata with
+    done=True and sources. On error after partial output, yields with error
+    key set.
     """
     resolved_session_id = session_id or "default"
     history = await asyncio.to_thread(history_store.get_history, resolved_session_id)
-    history_context = _build_history_context(history)
 
     pipeline_trace = None
     chat_start = time.time()
@@ -192,14 +210,17 @@ async def stream_chat_message(
     if not include_pipeline:
         pipeline_trace = None
 
-    full_context = _compose_full_context(history_context, context)
+    full_context, sources = _assemble_full_context(history, context, sources, pipeline_trace)
+
+    if sources:
+        yield ("", {"done": False, "sources": sources})
 
     gen_start = time.time()
-    accumulated_response = ""
+    response_parts: list[str] = []
 
     try:
         async for token in client.a_generate_stream(prompt=message, context=full_context):
-            accumulated_response += token
+            response_parts.append(token)
             yield (token, {"done": False})
 
         gen_timing_ms = int((time.time() - gen_start) * 1000)
@@ -209,7 +230,7 @@ async def stream_chat_message(
 
         await asyncio.to_thread(history_store.save_message, resolved_session_id, "user", message)
         await asyncio.to_thread(
-            history_store.save_message, resolved_session_id, "assistant", accumulated_response
+            history_store.save_message, resolved_session_id, "assistant", "".join(response_parts)
         )
 
         yield (
@@ -231,12 +252,12 @@ async def stream_chat_message(
             await asyncio.to_thread(
                 history_store.save_message, resolved_session_id, "user", message
             )
-            if accumulated_response:
+            if response_parts:
                 await asyncio.to_thread(
                     history_store.save_message,
                     resolved_session_id,
                     "assistant",
-                    accumulated_response,
+                    "".join(response_parts),
                 )
         except asyncio.CancelledError:
             raise
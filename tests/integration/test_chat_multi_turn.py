@@ -153,9 +153,9 @@ class TestMultiTurnHistoryContextBuilding:
         store.save_message(session_id, "user", "When to do genetic testing?")
 
         history = store.get_history(session_id)
-        from src.usecases.chat import _build_history_context
+        from src.rag.context_assembly import ContextBudgetConfig, assemble_context
 
-        context = _build_history_context(history)
+        context = assemble_context(history, "", ContextBudgetConfig()).history_context
         lines = context.split("\n")
 
         assert len(lines) == 3
@@ -165,9 +165,9 @@ class TestMultiTurnHistoryContextBuilding:
 
     def test_empty_history_returns_empty_context(self, monkeypatch, tmp_path: Path):
         """Verify that empty history produces empty context string."""
-        from src.usecases.chat import _build_history_context
+        from src.rag.context_assembly import ContextBudgetConfig, assemble_context
 
-        context = _build_history_context([])
+        context = assemble_context([], "", ContextBudgetConfig()).history_context
         assert context == ""
 
     def test_full_context_composes_history_and_retrieval(self, monkeypatch, tmp_path: Path):
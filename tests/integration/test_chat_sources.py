@@ -260,6 +260,88 @@ def test_chat_route_does_not_duplicate_terminal_error_events(monkeypatch, tmp_pa
     assert final_event["error"] == "boom"
 
 
+@pytest.mark.parametrize(
+    ("query", "expected_contents"),
+    [
+        ("", ["Hello world"]),
+        ("?coalesce_ms=0", ["Hel", "lo", " world"]),
+        ("?coalesce_max_chars=5", ["Hello", " world"]),
+    ],
+)
+def test_chat_route_coalesces_tokens_per_request(
+    monkeypatch, tmp_path: Path, query, expected_contents
+):
+    async def mock_stream_chat_message(**kwargs):
+        for token in ("Hel", "lo", " world"):
+            yield token, {"done": False}
+        yield "", {"done": True, "sources": [], "pipeline": None}
+
+    monkeypatch.setattr("src.app.routes.chat.stream_chat_message", mock_stream_chat_message)
+    client = _build_client(monkeypatch, tmp_path)
+
+    response = client.post(f"/chat{query}", json={"message": "hello"})
+
+    events = [
+        json.loads(line[6:]) for line in response.text.split("\n") if line.startswith("data: ")
+    ]
+    assert [event["content"] for event in events if not event["done"]] == expected_contents
+    assert events[-1]["done"] is True
+
+
+def test_chat_route_emits_sources_event_before_tokens(monkeypatch, tmp_path: Path):
+    source = {"canonical_label": "HealthHub", "label": "HealthHub", "source": "healthhub.sg"}
+
+    async def mock_stream_chat_message(**kwargs):
+        yield "", {"done": False, "sources": [source]}
+        yield "answer", {"done": False}
+        yield "", {"done": True, "sources": [source], "pipeline": None}
+
+    monkeypatch.setattr("src.app.routes.chat.stream_chat_message", mock_stream_chat_message)
+    client = _build_client(monkeypatch, tmp_path)
+
+    response = client.post("/chat", json={"message": "hello"})
+
+    frames = [frame for frame in response.text.split("\n\n") if frame]
+    assert frames[0].startswith("event: sources\ndata: ")
+    early = json.loads(frames[0].split("data: ", 1)[1])
+    assert early["done"] is False
+    assert early["sources"][0]["canonical_label"] == "HealthHub"
+    assert json.loads(frames[1][6:])["content"] == "answer"
+    assert json.loads(frames[-1][6:])["sources"] == early["sources"]
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_message_yields_sources_before_first_token(monkeypatch, tmp_path: Path):
+    class StreamingClient:
+        async def a_generate_stream(self, prompt: str, context: str):
+            yield "ok"
+
+    sources = [{"source": "a.pdf", "label": "a"}]
+
+    async def fake_retrieve_context_with_trace_async(query: str, top_k: int = 5, **kwargs):
+        return "context", sources, None
+
+    monkeypatch.setattr(
+        "src.usecases.chat.retrieve_context_with_trace_async",
+        fake_retrieve_context_with_trace_async,
+    )
+
+    store = FileChatHistoryStore(tmp_path / "chat_history.json")
+    events = [
+        event
+        async for event in stream_chat_message(
+            llm_client=StreamingClient(),
+            history_store=store,
+            message="hello",
+            session_id="session-1",
+        )
+    ]
+
+    assert events[0] == ("", {"done": False, "sources": sources})
+    assert events[1][0] == "ok"
+    assert events[-1][1]["done"] is True
+
+
 @pytest.mark.asyncio
 async def test_stream_chat_message_uses_async_trace_path_when_pipeline_enabled(
     monkeypatch, tmp_path: Path
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.ingestion.crawler import CrawlConfig, Crawler
+from src.ingestion.steps import download_web as dw
+
+
+class _FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, pages: dict[str, str], delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _FixtureHandler)
+        self.pages = pages
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[tuple[str, str | None]] = []
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    server: _FixtureServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.requests.append((self.path, self.headers.get("If-None-Match")))
+        try:
+            if server.delay:
+                time.sleep(server.delay)
+            body = server.pages.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = f'"{abs(hash(body))}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+@pytest.fixture
+def fixture_server():
+    servers: list[_FixtureServer] = []
+
+    def start(pages: dict[str, str], delay: float = 0.0) -> _FixtureServer:
+        server = _FixtureServer(pages, delay)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def raw_dir(monkeypatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(dw, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(dw, "MANIFEST_PATH", tmp_path / "download_manifest.json")
+    return tmp_path
+
+
+def _extractor(server: _FixtureServer, *pages: tuple[str, str]):
+    async def extract() -> list[str]:
+        results = await asyncio.gather(
+            *[dw._download_and_save_html(server.url(path), name) for path, name in pages]
+        )
+        return [r for r in results if r]
+
+    return extract
+
+
+def test_crawl_sources_runs_extractors_and_revalidates_with_etags(fixture_server, raw_dir):
+    server = fixture_server(
+        {
+            "/a": "<html><body>alpha</body></html>",
+            "/b": "<html><body>beta</body></html>",
+            "/c": "<html><body>gamma</body></html>",
+        }
+    )
+    extractors = (
+        ("first", _extractor(server, ("/a", "page_a"), ("/b", "page_b"))),
+        ("second", _extractor(server, ("/c", "page_c"), ("/missing", "page_missing"))),
+    )
+    config = CrawlConfig(per_host_requests_per_second=0)
+
+    saved, summary = asyncio.run(dw.crawl_sources(extractors, config=config))
+
+    assert len(saved) == 3
+    assert summary["requests"] == 4
+    assert summary["failed"] == 1
+    manifest = dw._load_manifest()
+    downloaded = [r for r in manifest["records"] if r["status"] == "downloaded"]
+    assert len(downloaded) == 3
+    assert all(r["etag"] and r["last_modified"] for r in downloaded)
+
+    server.requests.clear()
+    saved, summary = asyncio.run(dw.crawl_sources(extractors, config=config, refresh=True))
+
+    assert saved == []
+    assert summary["not_modified"] == 3
+    assert summary["bytes_downloaded"] == 0
+    conditional = [etag for path, etag in server.requests if path != "/missing"]
+    assert len(conditional) == 3
+    assert all(conditional)
+
+
+def test_refresh_rewrites_changed_page(fixture_server, raw_dir):
+    server = fixture_server({"/a": "<html><body>v1</body></html>"})
+    extractors = (("only", _extractor(server, ("/a", "page_a"))),)
+
+    (first,), _ = asyncio.run(dw.crawl_sources(extractors))
+    server.pages["/a"] = "<html><body>v2</body></html>"
+    (second,), summary = asyncio.run(dw.crawl_sources(extractors, refresh=True))
+
+    assert second == first
+    assert "v2" in Path(second).read_text(encoding="utf-8")
+    assert summary["not_modified"] == 0
+    record = dw._manifest_indexes(dw._load_manifest())[0][dw.normalize_url(server.url("/a"))]
+    assert record["status"] == "updated"
+
+
+def test_crawl_sources_isolates_a_failing_source(fixture_server, raw_dir):
+    server = fixture_server({"/a": "<html><body>alpha</body></html>"})
+
+    async def broken() -> list[str]:
+        raise RuntimeError("extractor bug")
+
+    extractors = (
+        ("broken", broken),
+        ("working", _extractor(server, ("/a", "page_a"))),
+    )
+
+    saved, summary = asyncio.run(dw.crawl_sources(extractors))
+
+    assert len(saved) == 1
+    assert summary["failed_sources"] == ["broken"]
+
+
+def test_crawler_enforces_per_host_concurrency(fixture_server):
+    server = fixture_server({f"/{i}": "ok" for i in range(8)}, delay=0.05)
+    config = CrawlConfig(per_host_concurrency=2, per_host_requests_per_second=0)
+
+    async def crawl():
+        async with Crawler(config) as crawler:
+            results = await asyncio.gather(*[crawler.fetch(server.url(f"/{i}")) for i in range(8)])
+        return results, crawler.stats.summary()
+
+    results, summary = asyncio.run(crawl())
+
+    assert all(result.ok for result in results)
+    assert server.max_in_flight == 2
+    assert summary["requests"] == 8
+    assert summary["latency_p95_ms"] >= summary["latency_p50_ms"] > 0
+
+
+def test_crawler_spaces_requests_per_host(fixture_server):
+    server = fixture_server({"/": "ok"})
+    config = CrawlConfig(per_host_concurrency=4, per_host_requests_per_second=20)
+
+    async def crawl():
+        async with Crawler(config) as crawler:
+            start = time.perf_counter()
+            await asyncio.gather(*[crawler.fetch(server.url("/")) for _ in range(5)])
+            return time.perf_counter() - start
+
+    assert asyncio.run(crawl()) >= 0.19
@@ -1,10 +1,9 @@
 """Tests for answer evaluation caching."""
 
-import json
-
 import pytest
 
 from src.evals.assessment.answer_eval import evaluate_answer_quality_async
+from src.evals.cache_store import CACHE_DB_FILENAME, EvalCacheStore
 
 
 class _Trace:
@@ -88,15 +87,10 @@ async def test_evaluate_answer_quality_async_reuses_cached_answer(monkeypatch, t
     assert retrieval_calls == 1
     assert answer_calls == 1
     assert metric_calls == 6
-    retrieval_cache = json.loads((cache_dir / "retrieval_cache.json").read_text(encoding="utf-8"))
-    generation_cache = json.loads((cache_dir / "generation_cache.json").read_text(encoding="utf-8"))
-    metric_cache = json.loads((cache_dir / "metric_cache.json").read_text(encoding="utf-8"))
-    assert retrieval_cache["schema_version"] == 2
-    assert generation_cache["schema_version"] == 2
-    assert metric_cache["schema_version"] == 2
-    assert len(retrieval_cache["entries"]) == 1
-    assert len(generation_cache["entries"]) == 1
-    assert len(metric_cache["entries"]) == 1
+    with EvalCacheStore(cache_dir / CACHE_DB_FILENAME, schema_version=2) as store:
+        assert store.count("retrieval") == 1
+        assert store.count("generation") == 1
+        assert store.count("metric") == 1
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,67 @@
+from src.ingestion.steps.chunk_text import TextChunker, chunk_documents
+from src.ingestion.steps.chunking import core
+
+PARAGRAPH = (
+    "Hypertension management guidance for primary care clinicians. "
+    "Measure blood pressure at every visit and confirm elevated readings. "
+)
+
+
+def _documents(count: int) -> list[dict]:
+    documents: list[dict] = []
+    for index in range(count):
+        if index % 2:
+            documents.append(
+                {
+                    "id": f"guideline_{index}",
+                    "source": f"guideline_{index}.pdf",
+                    "pages": [
+                        {"page": page, "content": PARAGRAPH * (6 + index), "extractor": "pypdf"}
+                        for page in (1, 2)
+                    ],
+                    "metadata": {},
+                }
+            )
+        else:
+            documents.append(
+                {
+                    "id": f"page_{index}",
+                    "source": f"page_{index}.md",
+                    "content": f"# Topic {index}\n\n" + PARAGRAPH * (8 + index),
+                    "metadata": {},
+                }
+            )
+    return documents
+
+
+def test_parallel_chunking_matches_serial_order_and_ids():
+    documents = _documents(core.PARALLEL_CHUNKING_MIN_DOCUMENTS + 2)
+
+    serial = chunk_documents(documents, max_workers=1)
+    parallel = chunk_documents(documents, max_workers=2)
+
+    assert parallel == serial
+    assert [chunk["id"] for chunk in parallel] == [chunk["id"] for chunk in serial]
+
+
+def test_chunk_each_document_groups_chunks_by_input_document():
+    documents = _documents(4)
+
+    grouped = TextChunker().chunk_each_document(documents)
+
+    assert len(grouped) == 4
+    for document, doc_chunks in zip(documents, grouped, strict=True):
+        assert doc_chunks
+        assert {chunk["source"] for chunk in doc_chunks} == {document["source"]}
+
+
+def test_chunkers_are_reused_per_resolved_config():
+    configs = {"markdown": {"chunk_size": 300, "chunk_overlap": 30}}
+    cfg_map = TextChunker._resolve_config_map(configs)
+
+    first = TextChunker()._chunker_for(cfg_map["markdown"])
+    second = TextChunker()._chunker_for(cfg_map["markdown"])
+
+    assert first is second
+    assert first.chunk_size == 300
+    assert TextChunker()._chunker_for(cfg_map["pdf"]) is not first
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.infra.llm import client_registry
+from src.infra.llm.client_registry import (
+    aclose_pooled_clients,
+    close_pooled_clients,
+    get_async_openai_client,
+    get_openai_client,
+    pooled_client_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    close_pooled_clients()
+    yield
+    close_pooled_clients()
+
+
+def test_sync_client_is_shared_per_call_options():
+    first = get_openai_client()
+    second = get_openai_client()
+    judge = get_openai_client(timeout=90, max_retries=2)
+
+    assert first is second
+    assert judge is not first
+    assert get_openai_client(timeout=90, max_retries=2) is judge
+    assert pooled_client_stats()["sync_clients"] == 2
+
+
+def test_close_pooled_clients_releases_sync_clients():
+    first = get_openai_client()
+    close_pooled_clients()
+
+    assert pooled_client_stats()["sync_clients"] == 0
+    assert get_openai_client() is not first
+
+
+def test_http2_disabled_without_setting(monkeypatch):
+    monkeypatch.setattr(client_registry.settings.llm, "http2_enabled", False)
+    assert client_registry.http2_available() is False
+
+
+def test_async_clients_are_scoped_to_event_loop():
+    async def _resolve():
+        first = get_async_openai_client()
+        second = get_async_openai_client()
+        assert first is second
+        return first
+
+    loop_one_client = asyncio.run(_resolve())
+    loop_two_client = asyncio.run(_resolve())
+
+    assert loop_one_client is not loop_two_client
+
+
+def test_clients_requested_outside_a_loop_are_not_shared_across_loops():
+    outside = get_async_openai_client()
+
+    async def _resolve():
+        return get_async_openai_client()
+
+    assert get_async_openai_client() is not outside
+    assert pooled_client_stats()["async_clients"] == 0
+    assert asyncio.run(_resolve()) is not outside
+
+
+@pytest.mark.asyncio
+async def test_aclose_pooled_clients_closes_current_loop_clients():
+    client = get_async_openai_client()
+    assert pooled_client_stats()["async_clients"] == 1
+
+    await aclose_pooled_clients()
+
+    assert pooled_client_stats()["async_clients"] == 0
+    assert client.is_closed()
@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+
+from src.rag.context_assembly import (
+    ContextBudgetConfig,
+    assemble_context,
+    dedupe_context_blocks,
+    estimate_tokens,
+    split_context_blocks,
+)
+from src.rag.trace_models import ContextStage
+
+
+def _context(*bodies: str) -> str:
+    return "\n\n".join(f"[Source: doc{i}]\n{body}" for i, body in enumerate(bodies))
+
+
+def _history(count: int, words: int = 20) -> list[dict[str, str]]:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"turn{i} " + "x " * words}
+        for i in range(count)
+    ]
+
+
+def test_estimate_tokens_is_roughly_four_chars_per_token():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_split_context_blocks_keeps_paragraphs_inside_a_chunk():
+    context = _context("first para\n\nsecond para", "other")
+
+    assert split_context_blocks(context) == [
+        "[Source: doc0]\nfirst para\n\nsecond para",
+        "[Source: doc1]\nother",
+    ]
+
+
+def test_dedupe_removes_contained_chunks_and_trims_overlap():
+    shared = "LDL cholesterol targets depend on cardiovascular risk category and history. "
+    first = "Intro sentence. " + shared
+    second = shared + "Statins are first-line therapy."
+    blocks = split_context_blocks(_context(first, second, shared))
+
+    kept, removed, trimmed = dedupe_context_blocks(blocks)
+
+    assert removed == 1
+    assert trimmed == len(shared.strip())
+    assert kept == [
+        f"[Source: doc0]\n{first.strip()}",
+        "[Source: doc1]\nStatins are first-line therapy.",
+    ]
+
+
+def test_assemble_drops_oldest_history_first():
+    history = _history(10)
+    per_turn = estimate_tokens(f"{history[-1]['role']}: {history[-1]['content']}") + 1
+    config = ContextBudgetConfig(max_tokens=1000, history_max_tokens=per_turn * 3)
+
+    assembled = assemble_context(history, _context("chunk"), config)
+
+    assert assembled.history_context.splitlines()[0].startswith("assistant: turn7")
+    assert assembled.history_context.splitlines()[-1].startswith("assistant: turn9")
+    assert assembled.budget.history_turns_kept == 3
+    assert assembled.budget.history_turns_dropped == 7
+
+
+def test_assemble_truncates_then_drops_low_ranked_chunks():
+    bodies = ["alpha " * 100, "beta " * 100, "gamma " * 100]
+    config = ContextBudgetConfig(max_tokens=250, history_max_tokens=0, min_chunk_tokens=32)
+
+    assembled = assemble_context([], _context(*bodies), config)
+
+    blocks = split_context_blocks(assembled.retrieved_context)
+    assert len(blocks) == 2
+    assert blocks[0] == f"[Source: doc0]\n{bodies[0].strip()}"
+    assert blocks[1].startswith("[Source: doc1]\nbeta")
+    assert blocks[1].endswith(" ...")
+    assert assembled.budget.chunks_truncated == 1
+    assert assembled.budget.chunks_dropped == 1
+    assert assembled.budget.retrieved_tokens <= 250
+
+
+def test_unused_history_budget_goes_to_chunks():
+    config = ContextBudgetConfig(max_tokens=400, history_max_tokens=300)
+
+    assembled = assemble_context([], _context("word " * 500), config)
+
+    assert assembled.budget.retrieved_budget_tokens == 400
+    assert assembled.budget.chunks_truncated == 1
+
+
+def test_zero_budget_disables_limits():
+    history = _history(50, words=200)
+    context = _context("a " * 5000, "b " * 5000)
+
+    assembled = assemble_context(history, context, ContextBudgetConfig(max_tokens=0))
+
+    assert assembled.budget.history_turns_dropped == 0
+    assert assembled.budget.chunks_dropped == 0
+    assert assembled.retrieved_context == context.replace(" \n\n", "\n\n").rstrip()
+
+
+def test_chat_usecase_records_budget_on_trace(monkeypatch):
+    from src.usecases import chat
+
+    monkeypatch.setattr(
+        chat.ContextBudgetConfig,
+        "from_settings",
+        classmethod(lambda cls: cls(max_tokens=100, history_max_tokens=20)),
+    )
+    trace = SimpleNamespace(
+        context=ContextStage(total_chunks=1, total_chars=0, sources=[], preview="")
+    )
+
+    full, sources = chat._assemble_full_context(
+        _history(6, words=5), _context("reference"), ["doc0"], trace
+    )
+
+    assert sources == ["doc0"]
+    assert full.endswith("Context: [Source: doc0]\nreference")
+    assert trace.context.budget.history_turns_dropped > 0
+    assert trace.context.budget.total_tokens <= 100
+
+
+def test_chat_usecase_cites_only_chunks_kept_under_budget(monkeypatch):
+    from src.usecases import chat
+
+    monkeypatch.setattr(
+        chat.ContextBudgetConfig,
+        "from_settings",
+        classmethod(lambda cls: cls(max_tokens=40, history_max_tokens=0, min_chunk_tokens=30)),
+    )
+    bodies = ["alpha " * 20, "alpha " * 10, "gamma " * 20]
+
+    full, sources = chat._assemble_full_context([], _context(*bodies), ["a", "b", "c"], None)
+
+    assert sources == ["a"]
+    assert "gamma" not in full
@@ -0,0 +1,161 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.ingestion import artifacts
+from src.ingestion.boilerplate_stats import BoilerplateStatsStore
+from src.ingestion.steps import convert_html
+from src.ingestion.steps import download_web as dw
+
+SHARED_FOOTER = "<p>Read our privacy policy and cookie preferences here.</p>"
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        f"<html><body><nav><a href='/'>Home</a></nav><main><h1>{title}</h1>"
+        f"<p>{body}</p><ul><li>First point about {title}</li>"
+        f"<li>Second point about {title}</li></ul></main>{SHARED_FOOTER}</body></html>"
+    )
+
+
+@pytest.fixture
+def html_corpus(monkeypatch, tmp_path: Path) -> Path:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    monkeypatch.setattr(convert_html, "DATA_DIR", raw_dir)
+    monkeypatch.setattr(dw, "MANIFEST_PATH", raw_dir / "download_manifest.json")
+    monkeypatch.setattr(artifacts, "DATA_PROCESSED_DIR", tmp_path / "processed")
+    convert_html.set_html_extractor_mode("fallback_only")
+    for index, topic in enumerate(["Diabetes", "Hypertension", "Cholesterol", "Asthma"]):
+        (raw_dir / f"page_{index}.html").write_text(
+            _page(topic, f"{topic} is a long-term condition that needs regular review."),
+            encoding="utf-8",
+        )
+    yield raw_dir
+    convert_html.set_html_extractor_mode("auto")
+
+
+def _outputs(raw_dir: Path) -> dict[str, str]:
+    return {p.name: p.read_text(encoding="utf-8") for p in sorted(raw_dir.glob("*.md"))}
+
+
+def test_parallel_conversion_matches_sequential_output(html_corpus: Path):
+    convert_html.main(force=True, max_workers=1)
+    sequential = _outputs(html_corpus)
+
+    summary = convert_html.main(force=True, max_workers=2, incremental=False)
+
+    assert _outputs(html_corpus) == sequential
+    assert summary["files"] == 4
+    assert summary["converted"] == 4
+    assert summary["workers"] == 2
+    assert all("privacy policy" not in text for text in sequential.values())
+
+
+def test_conversion_records_timings_and_run_summary(html_corpus: Path):
+    summary = convert_html.main(force=True, max_workers=1)
+
+    assert summary["files_per_second"] > 0
+    assert {"parse", "classify", "beautifulsoup", "boilerplate_hash"} <= set(
+        summary["timings_ms_total"]
+    )
+    persisted = json.loads(artifacts.run_summary_path("html").read_text(encoding="utf-8"))
+    assert persisted["files"] == 4
+    artifact = artifacts.load_source_artifact("html", "page_0")
+    assert artifact is not None
+    assert artifact["metadata"]["html_parser"] == convert_html.HTML_PARSER
+    assert "parse" in artifact["metadata"]["timings_ms"]
+
+
+def test_skipped_files_still_contribute_boilerplate_hashes(html_corpus: Path):
+    convert_html.main(force=True, max_workers=1)
+    (html_corpus / "page_0.md").unlink()
+
+    summary = convert_html.main(force=False, max_workers=1)
+
+    assert summary["converted"] == 1
+    assert summary["skipped"] == 3
+    assert "privacy policy" not in (html_corpus / "page_0.md").read_text(encoding="utf-8")
+
+
+def test_document_is_parsed_once_per_conversion(monkeypatch, html_corpus: Path):
+    calls = []
+    original = convert_html.BeautifulSoup
+
+    def counting_soup(*args, **kwargs):
+        calls.append(args[1] if len(args) > 1 else kwargs.get("features"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(convert_html, "BeautifulSoup", counting_soup)
+    convert_html.convert_html_to_md(html_corpus / "page_1.html", force=True)
+
+    assert calls == [convert_html.HTML_PARSER]
+
+
+def test_incremental_rerun_only_parses_changed_files(monkeypatch, html_corpus: Path):
+    convert_html.main(force=True, max_workers=1)
+    (html_corpus / "page_2.html").write_text(
+        _page("Cholesterol", "Updated guidance on lipid testing for adults."), encoding="utf-8"
+    )
+    parsed_files = []
+    original = convert_html._analyze_html_file
+
+    def tracking_analyze(html_path, config, convert=True):
+        parsed_files.append(html_path.name)
+        return original(html_path, config, convert)
+
+    monkeypatch.setattr(convert_html, "_analyze_html_file", tracking_analyze)
+    summary = convert_html.main(max_workers=1, incremental=True)
+
+    assert parsed_files == ["page_2.html"]
+    assert summary["converted"] == 1
+    assert summary["unchanged"] == 3
+    assert summary["parsed"] == 1
+    assert "lipid testing" in (html_corpus / "page_2.md").read_text(encoding="utf-8")
+
+    parsed_files.clear()
+    summary = convert_html.main(force=True, max_workers=1)
+
+    assert sorted(parsed_files) == [f"page_{i}.html" for i in range(4)]
+    assert summary["converted"] == 4
+    assert summary["unchanged"] == 0
+
+
+def test_incremental_rerun_reconverts_when_artifact_or_extractor_changes(
+    monkeypatch, html_corpus: Path
+):
+    convert_html.main(force=True, max_workers=1)
+    (artifacts.artifact_dir_for("html", "page_1") / "artifact.json").unlink()
+
+    summary = convert_html.main(max_workers=1, incremental=True)
+
+    assert summary["converted"] == 1
+    assert artifacts.source_artifact_exists("html", "page_1")
+
+    environment = dict(convert_html._extractor_environment())
+    environment["libraries"] = {**environment["libraries"], "trafilatura": "0.0-test"}
+    monkeypatch.setattr(convert_html, "_extractor_environment", lambda: environment)
+    summary = convert_html.main(max_workers=1, incremental=True)
+
+    assert summary["converted"] == 4
+    assert summary["unchanged"] == 0
+
+
+def test_incremental_boilerplate_hashes_match_full_recount(html_corpus: Path):
+    html_files = sorted(html_corpus.glob("*.html"))
+    stats = convert_html._boilerplate_stats_store()
+    assert convert_html._compute_global_boilerplate_hashes(
+        html_files, stats
+    ) == convert_html._compute_global_boilerplate_hashes(html_files)
+
+    (html_corpus / "page_3.html").write_text("<html><body><p>Only page</p></body></html>")
+    html_files[1].unlink()
+    html_files = sorted(html_corpus.glob("*.html"))
+    stats = convert_html._boilerplate_stats_store()
+    incremental = convert_html._compute_global_boilerplate_hashes(html_files, stats)
+
+    assert incremental == convert_html._compute_global_boilerplate_hashes(html_files)
+    full = BoilerplateStatsStore(html_corpus.parent / "fresh_stats.json", version="fresh")
+    convert_html._compute_global_boilerplate_hashes(html_files, full)
+    assert stats.global_counts == full.global_counts
@@ -1,8 +1,19 @@
 """Tests for dependency injection container."""
 
+from pathlib import Path
+
+import pytest
+
+from src.config import settings
 from src.infra.di import ServiceContainer, get_container, reset_container
 
 
+@pytest.fixture(autouse=True)
+def isolated_chroma(monkeypatch, tmp_path: Path):
+    """Keep the vector index opened by these tests out of ``data/``."""
+    monkeypatch.setattr(settings.storage, "chroma_persist_directory", str(tmp_path / "chroma"))
+
+
 def test_service_container_singleton():
     """Test container maintains singleton instances."""
     container = ServiceContainer()
@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+from src.ingestion import manifest as manifest_module
+from src.ingestion.manifest import ManifestStore, content_hash
+
+
+def _record(url: str, digest: str | None = None) -> dict:
+    return {"normalized_url": url, "content_hash": digest, "status": "downloaded"}
+
+
+def test_store_indexes_records_and_flushes_in_batches(tmp_path: Path):
+    path = tmp_path / "download_manifest.json"
+    store = ManifestStore(path, tmp_path, flush_every=3)
+
+    store.add_record(_record("https://a", "h1"))
+    store.add_record(_record("https://b", "h1"))
+    assert not path.exists()
+
+    store.add_record(_record("https://c", "h2"))
+    assert len(json.loads(path.read_text())["records"]) == 3
+
+    store.add_record(_record("https://a", "h3"))
+    store.close()
+
+    reloaded = ManifestStore(path, tmp_path)
+    assert reloaded.get_by_url("https://a")["content_hash"] == "h3"
+    assert [r["normalized_url"] for r in reloaded.records_by_hash("h1")] == [
+        "https://a",
+        "https://b",
+    ]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_update_record_moves_hash_index(tmp_path: Path):
+    store = ManifestStore(tmp_path / "m.json", tmp_path)
+    record = _record("https://a", "old")
+    store.add_record(record)
+
+    store.update_record(record, content_hash="new", status="updated")
+
+    assert store.records_by_hash("old") == []
+    assert store.records_by_hash("new") == [record]
+
+
+def test_find_file_by_content_hash_reuses_cached_digests(monkeypatch, tmp_path: Path):
+    (tmp_path / "a.html").write_text("alpha", encoding="utf-8")
+    (tmp_path / "b.html").write_text("beta", encoding="utf-8")
+    hashed: list[bytes] = []
+
+    def counting_hash(data: bytes) -> str:
+        hashed.append(data)
+        return content_hash(data)
+
+    monkeypatch.setattr(manifest_module, "content_hash", counting_hash)
+    path = tmp_path / "download_manifest.json"
+
+    with ManifestStore(path, tmp_path) as store:
+        assert store.find_file_by_content_hash(content_hash(b"beta")) == tmp_path / "b.html"
+        assert store.find_file_by_content_hash(content_hash(b"missing")) is None
+    assert len(hashed) == 2
+
+    hashed.clear()
+    (tmp_path / "a.html").write_text("alpha changed", encoding="utf-8")
+    with ManifestStore(path, tmp_path) as store:
+        found = store.find_file_by_content_hash(content_hash(b"alpha changed"))
+
+    assert found == tmp_path / "a.html"
+    assert hashed == [b"alpha changed"]
+
+
+def test_hash_cache_lives_outside_the_manifest_and_migrates_legacy_key(tmp_path: Path):
+    (tmp_path / "a.html").write_text("alpha", encoding="utf-8")
+    path = tmp_path / "download_manifest.json"
+    path.write_text(
+        json.dumps({"records": [], manifest_module.FILE_HASH_CACHE_KEY: {"gone.html": {}}}),
+        encoding="utf-8",
+    )
+
+    with ManifestStore(path, tmp_path) as store:
+        store.find_file_by_content_hash(content_hash(b"alpha"))
+
+    assert manifest_module.FILE_HASH_CACHE_KEY not in json.loads(path.read_text())
+    cached = json.loads(manifest_module.hash_cache_path_for(path).read_text())
+    assert set(cached) == {"a.html"}
+
+    before = path.stat().st_mtime_ns
+    (tmp_path / "b.html").write_text("beta", encoding="utf-8")
+    with ManifestStore(path, tmp_path) as store:
+        store.find_file_by_content_hash(content_hash(b"beta"))
+    assert path.stat().st_mtime_ns == before
+
+
+def test_lookups_by_filename_and_logical_name_return_first_record(tmp_path: Path):
+    store = ManifestStore(tmp_path / "m.json", tmp_path)
+    store.add_record({"filename": "a.html", "logical_name": "a", "status": "downloaded"})
+    store.add_record({"filename": "a.html", "logical_name": "a", "status": "inventory"})
+
+    assert store.get_by_filename("a.html")["status"] == "downloaded"
+    assert store.get_by_logical_name("a")["status"] == "downloaded"
+    assert store.get_by_filename("missing.html") is None
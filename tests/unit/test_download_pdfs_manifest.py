@@ -1,6 +1,8 @@
 import asyncio
 from pathlib import Path
 
+from src.ingestion import crawler
+from src.ingestion.crawler import FetchResult
 from src.ingestion.steps import download_pdfs as dp
 from src.ingestion.steps import download_web as dw
 
@@ -26,10 +28,10 @@ def test_download_pdf_if_not_exists_retries_after_prior_failure(monkeypatch, tmp
     }
     dp._save_manifest(manifest)
 
-    async def fake_download(_: str, timeout: int = 60):
-        return b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n"
+    async def fake_fetch(url: str, timeout: int = 60, **validators):
+        return FetchResult(url=url, status_code=200, content=b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n")
 
-    monkeypatch.setattr(dp, "download_pdf", fake_download)
+    monkeypatch.setattr(dp, "fetch_pdf", fake_fetch)
     result = asyncio.run(dp.download_pdf_if_not_exists(url, "example_pdf"))
 
     assert result is not None
@@ -40,6 +42,8 @@ def test_download_pdf_if_not_exists_retries_after_prior_failure(monkeypatch, tmp
 
 def test_download_pdf_rejects_non_pdf_payload(monkeypatch):
     class FakeResponse:
+        status_code = 200
+        encoding = "utf-8"
         headers = {"content-type": "text/html"}
         content = b"<html>not-a-pdf</html>"
 
@@ -56,9 +60,58 @@ def test_download_pdf_rejects_non_pdf_payload(monkeypatch):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        async def get(self, url: str):
+        async def aclose(self):
+            return None
+
+        async def get(self, url: str, **kwargs):
             return FakeResponse()
 
-    monkeypatch.setattr(dp.httpx, "AsyncClient", FakeClient)
+    monkeypatch.setattr(crawler.httpx, "AsyncClient", FakeClient)
     content = asyncio.run(dp.download_pdf("https://example.com/file"))
     assert content is None
+
+
+def test_refresh_revalidates_pdf_with_stored_validators(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(dp, "DATA_RAW_DIR", tmp_path)
+    monkeypatch.setattr(dw, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(dw, "MANIFEST_PATH", tmp_path / "download_manifest.json")
+
+    url = "https://example.com/guide.pdf"
+    seen_validators: list[dict] = []
+    responses = iter(
+        [
+            FetchResult(
+                url=url,
+                status_code=200,
+                content=b"%PDF-1.4 v1",
+                etag='"v1"',
+                last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+            ),
+            FetchResult(url=url, status_code=304, etag='"v1"'),
+            FetchResult(url=url, status_code=200, content=b"%PDF-1.4 v2", etag='"v2"'),
+        ]
+    )
+
+    async def fake_fetch_url(url: str, timeout: float = 30, **validators):
+        seen_validators.append(validators)
+        return next(responses)
+
+    monkeypatch.setattr(dw, "fetch_url", fake_fetch_url)
+
+    async def extract_all(refresh: bool):
+        async def extractor():
+            result = await dp.download_pdf_if_not_exists(url, "guide")
+            return [result] if result else []
+
+        return await dw.crawl_sources((("pdfs", extractor),), refresh=refresh)
+
+    (path,), _ = asyncio.run(extract_all(refresh=False))
+    assert asyncio.run(extract_all(refresh=True))[0] == []
+    assert asyncio.run(extract_all(refresh=True))[0] == [path]
+
+    assert seen_validators[0] == {"etag": None, "last_modified": None}
+    assert seen_validators[1] == {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert path.read_bytes() == b"%PDF-1.4 v2"
+    record = dp._manifest_indexes(dp._load_manifest())[0][dp.normalize_url(url)]
+    assert record["status"] == "updated"
+    assert record["etag"] == '"v2"'
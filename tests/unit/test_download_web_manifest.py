@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from src.ingestion.crawler import FetchResult
 from src.ingestion.steps import convert_html
 from src.ingestion.steps import download_web as dw
 
@@ -13,10 +14,12 @@ def test_download_and_save_html_skips_duplicate_content(monkeypatch, tmp_path: P
     monkeypatch.setattr(dw, "DATA_DIR", tmp_path)
     monkeypatch.setattr(dw, "MANIFEST_PATH", tmp_path / "download_manifest.json")
 
-    async def fake_download(url: str, timeout: int = 30):
-        return "<html><body>same content</body></html>"
+    async def fake_fetch(url: str, timeout: int = 30, **validators):
+        return FetchResult(
+            url=url, status_code=200, content=b"<html><body>same content</body></html>"
+        )
 
-    monkeypatch.setattr(dw, "download_url", fake_download)
+    monkeypatch.setattr(dw, "fetch_url", fake_fetch)
 
     import asyncio
 
@@ -55,3 +58,27 @@ def test_migrate_existing_html_duplicates_marks_aliases_and_convert_skips(
     assert "c.html" in html_files
     assert len(html_files) == 2
     assert alias_names.isdisjoint(html_files)
+
+
+def test_manifest_lookups_reuse_the_loaded_manifest(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(dw, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(dw, "MANIFEST_PATH", tmp_path / "download_manifest.json")
+    monkeypatch.setattr(dw, "_manifest_snapshot", None)
+    dw._save_manifest({"records": [{"filename": "a.html", "logical_name": "a"}]})
+    loads: list[Path] = []
+    original = dw.ManifestStore
+
+    def counting_store(path, data_dir, **kwargs):
+        loads.append(path)
+        return original(path, data_dir, **kwargs)
+
+    monkeypatch.setattr(dw, "ManifestStore", counting_store)
+
+    assert dw.get_manifest_record_by_filename("a.html")["logical_name"] == "a"
+    assert dw.get_manifest_record_by_logical_name("a")["filename"] == "a.html"
+    assert dw.get_manifest_record_by_filename("b.html") is None
+    assert len(loads) == 1
+
+    dw._save_manifest({"records": [{"filename": "b.html", "logical_name": "b", "x": 1}]})
+    assert dw.get_manifest_record_by_filename("b.html")["logical_name"] == "b"
+    assert len(loads) == 2
@@ -74,3 +74,25 @@ def test_embed_texts_only_requests_uncached_texts(monkeypatch):
     assert len(embeddings) == 2
     assert stats["cache_hit_count"] == 1
     assert stats["cache_miss_count"] == 1
+
+
+def test_embed_texts_deduplicates_and_runs_batches_concurrently(monkeypatch):
+    client = _DummyClient()
+    monkeypatch.setattr(embedding, "get_embedding_client", lambda: client)
+
+    with embedding._embedding_cache_lock:
+        embedding._embedding_cache.clear()
+
+    texts = ["alpha", "beta", "alpha", "gamma", "delta", "beta"]
+    embeddings, stats = embedding.embed_texts_with_stats(
+        texts, batch_size=2, model="test-model", max_concurrency=2
+    )
+
+    requested = sorted(text for call in client.embeddings.calls for text in call["input"])
+    assert requested == ["alpha", "beta", "delta", "gamma"]
+    assert stats["batch_count"] == 2
+    assert embeddings[0] == embeddings[2]
+    assert embeddings[1] == embeddings[5]
+    assert all(
+        call["dimensions"] == embedding.EMBEDDING_DIMENSIONS for call in client.embeddings.calls
+    )
@@ -0,0 +1,63 @@
+import json
+import threading
+from pathlib import Path
+
+from src.evals.cache_store import (
+    CACHE_DB_FILENAME,
+    EvalCacheStore,
+    open_eval_cache_store,
+)
+
+
+def test_entries_round_trip_per_namespace_and_schema_version(tmp_path: Path):
+    path = tmp_path / CACHE_DB_FILENAME
+    with EvalCacheStore(path, schema_version=2) as store:
+        metrics = store.table("metric")
+        metrics["k1"] = {"metrics": {"clarity": {"score": 0.9}}, "score_updates": {}}
+
+        assert metrics.get("k1") == {"metrics": {"clarity": {"score": 0.9}}, "score_updates": {}}
+        assert store.table("retrieval").get("k1") is None
+        assert len(metrics) == 1
+
+    with EvalCacheStore(path, schema_version=3) as store:
+        assert store.table("metric").get("k1") is None
+
+
+def test_concurrent_writers_do_not_lose_entries(tmp_path: Path):
+    path = tmp_path / CACHE_DB_FILENAME
+    stores = [EvalCacheStore(path, schema_version=2) for _ in range(2)]
+
+    def write(worker: int) -> None:
+        table = stores[worker % 2].table("generation")
+        for index in range(50):
+            table[f"w{worker}-{index}"] = {"answer": f"answer {worker} {index}"}
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stores[0].count("generation") == 200
+    assert stores[1].table("generation").get("w3-49") == {"answer": "answer 3 49"}
+    for store in stores:
+        store.close()
+
+
+def test_legacy_json_caches_are_imported_once(tmp_path: Path):
+    (tmp_path / "retrieval_cache.json").write_text(
+        json.dumps({"schema_version": 2, "entries": {"a": {"query": "q"}, "b": {"query": "r"}}}),
+        encoding="utf-8",
+    )
+    (tmp_path / "metric_cache.json").write_text(
+        json.dumps({"schema_version": 1, "entries": {"stale": {}}}), encoding="utf-8"
+    )
+
+    with open_eval_cache_store(tmp_path, schema_version=2) as store:
+        assert store.table("retrieval").get("a") == {"query": "q"}
+        assert store.count("retrieval") == 2
+        assert store.count("metric") == 0
+        store.table("retrieval")["a"] = {"query": "updated"}
+
+    with open_eval_cache_store(tmp_path, schema_version=2) as store:
+        assert store.table("retrieval").get("a") == {"query": "updated"}
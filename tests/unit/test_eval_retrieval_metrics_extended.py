@@ -238,3 +238,51 @@ def test_evaluate_retrieval_reports_medical_expansion_and_rerank_metrics(monkeyp
     assert agg["rerank_candidates_mean"] == 4
     assert agg["rerank_output_mean"] == 2
     assert agg["rerank_filtered_out_mean"] == 2
+
+
+def test_concurrent_evaluate_retrieval_matches_serial_rows_and_order(monkeypatch):
+    import threading
+    import time
+
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fake_retrieve(query: str, top_k: int = 5, retrieval_options=None):
+        index = int(query.split()[-1])
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        # Later queries finish first so out-of-order completion would show up.
+        time.sleep(0.002 * (8 - index))
+        with lock:
+            active["now"] -= 1
+        docs = [
+            _Doc(id=f"c{index}", content=f"LDL target {index}", source="lipid.pdf", page=index),
+            _Doc(id="other", content="Unrelated", source="gout.pdf", page=1),
+        ]
+        return "ctx", [f"lipid.pdf page {index}"], _Trace(docs, total_time_ms=10)
+
+    import src.rag.runtime as runtime
+
+    monkeypatch.setattr(runtime, "retrieve_context_with_trace", fake_retrieve)
+    dataset = [
+        {
+            "query_id": f"q{index}",
+            "query": f"LDL target {index}",
+            "expected_sources": ["lipid" if index % 2 else "gout"],
+            "expected_chunk_id": f"c{index}",
+        }
+        for index in range(8)
+    ]
+
+    serial_rows, serial_agg = pa.evaluate_retrieval(dataset, top_k=2, max_concurrency=1)
+    rows, agg = pa.evaluate_retrieval(dataset, top_k=2, max_concurrency=4)
+
+    assert [row["query_id"] for row in rows] == [item["query_id"] for item in dataset]
+    assert [row["metrics"] for row in rows] == [row["metrics"] for row in serial_rows]
+    assert agg["mrr"] == serial_agg["mrr"]
+    assert active["max"] == 4
+    assert agg["retrieval_concurrency"] == 4
+    assert serial_agg["retrieval_concurrency"] == 1
+    assert agg["queries_per_second"] > 0
+    assert agg["wall_time_seconds"] > 0
@@ -1,10 +1,35 @@
 import json
 from pathlib import Path
 
+import pytest
+
+from src.config import settings
 from src.evals import pipeline_assessment as pa
 from src.experiments.config import load_experiment_file, resolve_experiment_runs
 
 
+@pytest.fixture(autouse=True)
+def isolated_chroma(monkeypatch, tmp_path: Path):
+    """Keep the vector index opened by these tests out of ``data/``."""
+    monkeypatch.setattr(settings.storage, "chroma_persist_directory", str(tmp_path / "chroma"))
+
+
+INDEX_METADATA = {
+    "collection_name": "medical_docs_baseline",
+    "index_config_hash": "idx-123",
+    "embedding_model": "text-embedding-v4",
+    "embedding_batch_size": 10,
+    "semantic_weight": 0.6,
+    "keyword_weight": 0.2,
+    "boost_weight": 0.2,
+    "page_classification_enabled": True,
+    "index_only_classified_pages": True,
+    "html_extractor_mode": "auto",
+    "structured_chunking_enabled": True,
+    "source_chunk_configs": {"pdf": {"chunk_size": 650}},
+}
+
+
 def _fake_step(stage: str, vector_path: str | None = None):
     aggregate = {f"{stage}_ok": True}
     if stage == "l3":
@@ -16,6 +41,7 @@ def _fake_step(stage: str, vector_path: str | None = None):
                 "source_distribution": {"demo.pdf": 2},
                 "dedupe_effect_estimate": 0,
                 "embedding_dim": 2048,
+                "index_metadata": INDEX_METADATA,
             }
         )
     return {"aggregate": aggregate, "records": [{"stage": stage}], "findings": []}
@@ -32,20 +58,6 @@ def test_run_assessment_writes_experiment_provenance(monkeypatch, tmp_path: Path
                 "embeddings": [],
                 "metadatas": [],
                 "content_hashes": [],
-                "index_metadata": {
-                    "collection_name": "medical_docs_baseline",
-                    "index_config_hash": "idx-123",
-                    "embedding_model": "text-embedding-v4",
-                    "embedding_batch_size": 10,
-                    "semantic_weight": 0.6,
-                    "keyword_weight": 0.2,
-                    "boost_weight": 0.2,
-                    "page_classification_enabled": True,
-                    "index_only_classified_pages": True,
-                    "html_extractor_mode": "auto",
-                    "structured_chunking_enabled": True,
-                    "source_chunk_configs": {"pdf": {"chunk_size": 650}},
-                },
             }
         ),
         encoding="utf-8",
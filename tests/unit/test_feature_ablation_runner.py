@@ -1,9 +1,11 @@
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
 from src.experiments.feature_ablation_runner import (
     load_reference_experiment,
     render_feature_ablation_summary,
+    run_feature_ablation_studies,
     run_feature_family,
     select_best_variant,
     write_feature_ablation_outputs,
@@ -114,3 +116,67 @@ def test_render_and_write_feature_ablation_summary(tmp_path: Path):
     assert markdown_path.exists()
     assert json_path.exists()
     assert "Feature Ablation Summary" in markdown_path.read_text(encoding="utf-8")
+
+
+def test_ablation_studies_reuse_built_collections_for_read_only_runs(tmp_path: Path):
+    calls: list[dict] = []
+    lock = threading.Lock()
+    family_summaries = {
+        "run_keyword_ablations": {
+            "keyword_ablations": {
+                "baseline": {"ndcg_at_k": 0.8, "collection_name": "ref_baseline"},
+                "both": {"ndcg_at_k": 0.9, "collection_name": "ref_both"},
+            }
+        },
+        "run_hype_ablations": {
+            "hype_ablations": {
+                "hype_disabled": {"ndcg_at_k": 0.8, "collection_name": "ref_hype_disabled"},
+                "hype_50pct": {"ndcg_at_k": 0.85, "collection_name": "ref_hype_50pct"},
+            }
+        },
+        "run_reranking_ablations": {
+            "reranking_ablations": {
+                "no_reranking": {"ndcg_at_k": 0.8},
+                "both_reranking": {"ndcg_at_k": 0.88},
+            }
+        },
+    }
+
+    def fake_run_assessment(**kwargs):
+        with lock:
+            calls.append(kwargs)
+        flag = next((flag for flag in family_summaries if kwargs.get(flag)), None)
+        summary = (
+            family_summaries[flag] if flag else {"l6_answer_quality_metrics": {"status": "ok"}}
+        )
+        run_dir = tmp_path / kwargs["name"]
+        run_dir.mkdir(parents=True, exist_ok=True)
+        return SimpleNamespace(run_dir=run_dir, summary=summary)
+
+    summary = run_feature_ablation_studies(run_assessment_fn=fake_run_assessment, max_workers=3)
+
+    ingesting = [call["name"] for call in calls if not call["skip_ingestion"]]
+    assert {call.get("stage_workers") for call in calls if call["skip_ingestion"]} == {1}
+    assert ingesting == [
+        "pymupdf_semantic_hybrid_keyword_ablation_retrieval",
+        "pymupdf_semantic_hybrid_hype_ablation_retrieval",
+    ]
+    winner_collections = {
+        call["name"]: call["experiment_config"]["embedding_index"]["collection_name"]
+        for call in calls
+        if call["include_answer_eval"]
+    }
+    assert winner_collections["pymupdf_semantic_hybrid_keyword_ablation_both_answer_eval"] == (
+        "ref_both"
+    )
+    assert winner_collections["pymupdf_semantic_hybrid_hype_ablation_hype_50pct_answer_eval"] == (
+        "ref_hype_50pct"
+    )
+    assert [study["winner_variant"] for study in summary["studies"]] == [
+        "both",
+        "hype_50pct",
+        "both_reranking",
+    ]
+    assert all(
+        study["winner_answer_eval_metrics"] == {"status": "ok"} for study in summary["studies"]
+    )
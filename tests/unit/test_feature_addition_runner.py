@@ -0,0 +1,103 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.experiments.experiment_config import ExperimentConfig, ExperimentVariant
+from src.experiments.feature_ablation_runner import load_reference_experiment
+from src.experiments.feature_addition_runner import run_feature_addition_experiment
+
+
+def _fake_assessment(calls: list[dict], tmp_path: Path):
+    lock = threading.Lock()
+
+    def fake_run_assessment(**kwargs):
+        with lock:
+            calls.append(kwargs)
+        run_dir = tmp_path / kwargs["name"]
+        run_dir.mkdir(parents=True, exist_ok=True)
+        return SimpleNamespace(
+            run_dir=run_dir,
+            summary={"retrieval_metrics": {"ndcg_at_k": 0.5}},
+        )
+
+    return fake_run_assessment
+
+
+def test_retrieval_only_variants_share_one_index(monkeypatch, tmp_path: Path):
+    experiment = load_reference_experiment()
+    monkeypatch.chdir(tmp_path)
+    calls: list[dict] = []
+    config = ExperimentConfig(
+        name="retrieval_knobs",
+        baseline=ExperimentVariant(name="baseline"),
+        variants=[
+            ExperimentVariant(name=f"mmr_{i}", retrieval_overrides={"mmr_lambda": i / 10})
+            for i in range(9)
+        ],
+    )
+
+    summary = run_feature_addition_experiment(
+        config,
+        base_experiment=experiment,
+        run_assessment_fn=_fake_assessment(calls, tmp_path),
+        max_workers=3,
+    )
+
+    builders = [call for call in calls if not call["skip_ingestion"]]
+    assert [call["name"] for call in builders] == [f"{experiment['metadata']['name']}_baseline"]
+    assert calls[0] is builders[0]
+    assert "stage_workers" not in builders[0]
+    assert {call.get("stage_workers") for call in calls if call["skip_ingestion"]} == {1}
+    shared = builders[0]["experiment_config"]["embedding_index"]["collection_name"]
+    assert {
+        call["experiment_config"]["embedding_index"]["collection_name"]
+        for call in calls
+        if call["skip_ingestion"]
+    } == {shared}
+    assert [result.variant_name for result in summary.variant_results] == [
+        f"mmr_{i}" for i in range(9)
+    ]
+    assert summary.variant_results[3].config["retrieval"]["mmr_lambda"] == 0.3
+
+
+def test_index_affecting_overrides_build_their_own_collection(monkeypatch, tmp_path: Path):
+    experiment = load_reference_experiment()
+    monkeypatch.chdir(tmp_path)
+    calls: list[dict] = []
+    config = ExperimentConfig(
+        name="chunking",
+        baseline=ExperimentVariant(name="baseline"),
+        variants=[
+            ExperimentVariant(name="small_chunks", ingestion_overrides={"chunk_size": 400}),
+            ExperimentVariant(name="rerank", retrieval_overrides={"enable_reranking": True}),
+            ExperimentVariant(
+                name="small_chunks_rerank",
+                ingestion_overrides={"chunk_size": 400},
+                retrieval_overrides={"enable_reranking": True},
+            ),
+        ],
+    )
+
+    summary = run_feature_addition_experiment(
+        config,
+        base_experiment=experiment,
+        run_assessment_fn=_fake_assessment(calls, tmp_path),
+    )
+
+    name = experiment["metadata"]["name"]
+    calls_by_variant = {call["name"].removeprefix(f"{name}_"): call for call in calls}
+    collections = {
+        variant: call["experiment_config"]["embedding_index"]["collection_name"]
+        for variant, call in calls_by_variant.items()
+    }
+    assert [call["name"] for call in calls[:2]] == [f"{name}_baseline", f"{name}_small_chunks"]
+    assert {variant: call["skip_ingestion"] for variant, call in calls_by_variant.items()} == {
+        "baseline": False,
+        "small_chunks": False,
+        "rerank": True,
+        "small_chunks_rerank": True,
+    }
+    assert collections["small_chunks_rerank"] == collections["small_chunks"]
+    assert collections["rerank"] == collections["baseline"]
+    assert collections["small_chunks"] != collections["baseline"]
+    assert len(summary.variant_results) == 3
@@ -0,0 +1,141 @@
+import asyncio
+from pathlib import Path
+
+from src.infra.llm.retry import RetryPolicy
+from src.ingestion.steps.hype import (
+    HypeQuestionCache,
+    _weighted_sample_chunks,
+    generate_hype_questions_for_chunks,
+)
+
+
+class FakeAsyncClient:
+    model = "qwen-fake"
+
+    def __init__(self, delay: float = 0.01, hang_first_call: bool = False):
+        self.delay = delay
+        self.hang_first_call = hang_first_call
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def a_generate(self, prompt: str, context: str) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.hang_first_call and self.calls == 1:
+                await asyncio.sleep(10)
+            await asyncio.sleep(self.delay)
+            return "1. What blood pressure target is recommended?\n2. When to start therapy?"
+        finally:
+            self.in_flight -= 1
+
+
+def _chunks(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"chunk_{index}",
+            "content": f"Guideline paragraph {index} about hypertension targets.",
+            "quality_score": 0.5 + (index % 5) / 10,
+        }
+        for index in range(count)
+    ]
+
+
+def _generate(chunks, client, cache, **kwargs):
+    return asyncio.run(
+        generate_hype_questions_for_chunks(
+            chunks,
+            client,
+            1.0,
+            100,
+            2,
+            cache=cache,
+            max_retries=1,
+            retry_policy=RetryPolicy(initial_delay=0.0, jitter=False),
+            **kwargs,
+        )
+    )
+
+
+def test_generation_is_bounded_by_concurrency(tmp_path: Path):
+    client = FakeAsyncClient()
+
+    questions = _generate(
+        _chunks(12), client, HypeQuestionCache(tmp_path / "q.json"), concurrency=3
+    )
+
+    assert len(questions) == 12
+    assert client.max_in_flight == 3
+    assert questions["chunk_0"] == [
+        "What blood pressure target is recommended?",
+        "When to start therapy?",
+    ]
+
+
+def test_timed_out_request_is_retried(tmp_path: Path):
+    client = FakeAsyncClient(hang_first_call=True)
+
+    questions = _generate(
+        _chunks(1), client, HypeQuestionCache(tmp_path / "q.json"), concurrency=1, timeout=0.1
+    )
+
+    assert client.calls == 2
+    assert list(questions) == ["chunk_0"]
+
+
+def test_rerun_only_generates_for_changed_chunks(tmp_path: Path):
+    chunks = _chunks(6)
+    first = _generate(chunks, FakeAsyncClient(), HypeQuestionCache(tmp_path / "q.json"))
+
+    chunks[2] = {**chunks[2], "content": chunks[2]["content"] + " Revised."}
+    client = FakeAsyncClient()
+    second = _generate(chunks, client, HypeQuestionCache(tmp_path / "q.json"))
+
+    assert client.calls == 1
+    assert second == first
+
+
+def test_sampling_is_deterministic_and_stable_for_unchanged_chunks():
+    chunks = _chunks(40)
+    sample = [chunk["id"] for chunk in _weighted_sample_chunks(chunks, 0.25, 100)]
+
+    assert sample == [chunk["id"] for chunk in _weighted_sample_chunks(chunks, 0.25, 100)]
+    assert len(set(sample)) == 10
+
+    changed = [*chunks[:-1], {**chunks[-1], "content": "Different text entirely."}]
+    resampled = {chunk["id"] for chunk in _weighted_sample_chunks(changed, 0.25, 100)}
+    assert len(resampled & set(sample)) >= 9
+
+
+class SingleAttemptClient(FakeAsyncClient):
+    """Exposes ``a_generate_once``; ``a_generate`` would retry on its own."""
+
+    def __init__(self, responses: list[str]):
+        super().__init__()
+        self.responses = responses
+
+    async def a_generate_once(self, prompt: str, context: str) -> str:
+        self.calls += 1
+        return self.responses.pop(0)
+
+    async def a_generate(self, prompt: str, context: str) -> str:
+        raise AssertionError("a_generate retries internally; use a_generate_once")
+
+
+def test_unparseable_responses_are_retried_once_and_never_cached(tmp_path: Path):
+    cache_path = tmp_path / "q.json"
+    client = SingleAttemptClient(["ok", "no", "ok"])
+
+    questions = _generate(_chunks(1), client, HypeQuestionCache(cache_path), concurrency=1)
+
+    assert questions == {}
+    assert client.calls == 2
+    assert len(HypeQuestionCache(cache_path)) == 0
+
+    retry = SingleAttemptClient(["1. Which patients need a statin?"])
+    assert _generate(_chunks(1), retry, HypeQuestionCache(cache_path)) == {
+        "chunk_0": ["Which patients need a statin?"]
+    }
+    assert len(HypeQuestionCache(cache_path)) == 1
@@ -27,10 +27,13 @@ def test_main_uses_non_parallel_pipeline_by_default(monkeypatch):
                 "skip_download": True,
                 "force_rebuild": False,
                 "force_html_convert": True,
+                "incremental_html_convert": False,
                 "enable_hype": False,
                 "enable_keyword_extraction": False,
                 "enable_chunk_summaries": False,
                 "parallel_cores": 1,
+                "dry_run": False,
+                "use_cache": True,
             },
         )
     ]
@@ -51,6 +54,8 @@ def test_main_uses_hamilton_pipeline_for_parallel_runs(monkeypatch):
     )
     monkeypatch.setattr(sys, "argv", ["ingest", "--parallel", "2"])
 
+    ingest.main()
+    monkeypatch.setattr(sys, "argv", ["ingest", "--parallel", "2", "--no-cache"])
     ingest.main()
 
     assert calls == [
@@ -63,6 +68,53 @@ def test_main_uses_hamilton_pipeline_for_parallel_runs(monkeypatch):
                 "enable_keyword_extraction": False,
                 "enable_chunk_summaries": False,
                 "parallel_cores": 2,
+                "use_cache": True,
             },
-        )
+        ),
+        (
+            "run_hamilton_pipeline",
+            {
+                "skip_download": False,
+                "force_rebuild": False,
+                "enable_hype": False,
+                "enable_keyword_extraction": False,
+                "enable_chunk_summaries": False,
+                "parallel_cores": 2,
+                "use_cache": False,
+            },
+        ),
     ]
+
+
+def test_dry_run_always_uses_cached_pipeline(monkeypatch):
+    calls: list[tuple[str, dict]] = []
+
+    monkeypatch.setattr(
+        ingest,
+        "run_pipeline",
+        lambda **kwargs: calls.append(("run_pipeline", kwargs)),
+    )
+    monkeypatch.setattr(
+        ingest,
+        "run_hamilton_pipeline",
+        lambda **kwargs: calls.append(("run_hamilton_pipeline", kwargs)),
+    )
+    monkeypatch.setattr(sys, "argv", ["ingest", "--parallel", "2", "--dry-run", "--no-cache"])
+
+    ingest.main()
+
+    assert [name for name, _ in calls] == ["run_pipeline"]
+    assert calls[0][1]["dry_run"] is True
+    assert calls[0][1]["use_cache"] is False
+
+
+def test_incremental_html_flag_reaches_the_html_conversion(monkeypatch):
+    calls: list[dict] = []
+
+    monkeypatch.setattr(ingest, "run_pipeline", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(sys, "argv", ["ingest", "--incremental-html"])
+
+    ingest.main()
+
+    assert calls[0]["incremental_html_convert"] is True
+    assert calls[0]["force_html_convert"] is False
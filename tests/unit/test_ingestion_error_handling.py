@@ -16,6 +16,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from src.config import settings
+from src.ingestion import artifacts
 from src.ingestion.indexing.vector_store import VectorStore
 from src.ingestion.steps.chunk_text import chunk_documents
 from src.ingestion.steps.convert_html import (
@@ -25,6 +27,14 @@ from src.ingestion.steps.convert_html import (
 )
 from src.ingestion.steps.load_pdfs import get_documents
 
+
+@pytest.fixture(autouse=True)
+def isolated_outputs(monkeypatch, tmp_path: Path):
+    """Keep artifacts and the vector index written by these tests out of ``data/``."""
+    monkeypatch.setattr(artifacts, "DATA_PROCESSED_DIR", tmp_path / "processed")
+    monkeypatch.setattr(settings.storage, "chroma_persist_directory", str(tmp_path / "chroma"))
+
+
 # =============================================================================
 # Network Failure Tests
 # =============================================================================
@@ -0,0 +1,208 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pymupdf
+import pytest
+
+from src.ingestion import artifacts
+from src.ingestion.stage_cache import (
+    StageCache,
+    chunk_documents_cached,
+    generate_hype_questions_cached,
+)
+from src.ingestion.steps import download_web as dw
+from src.ingestion.steps import hype
+from src.ingestion.steps.chunk_text import chunk_documents
+from src.ingestion.steps.load_pdfs import PDFLoader
+
+PARAGRAPH = (
+    "Hypertension management guidance for primary care clinicians. "
+    "Measure blood pressure at every visit and confirm elevated readings. "
+)
+
+
+def _documents() -> list[dict]:
+    return [
+        {
+            "id": f"doc_{topic}",
+            "source": f"{topic}.md",
+            "content": f"# {topic.title()}\n\n" + PARAGRAPH * 12,
+            "metadata": {},
+        }
+        for topic in ("diabetes", "asthma", "gout")
+    ]
+
+
+def _write_pdf(path: Path, text: str) -> None:
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text, fontsize=9)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def pdf_dir(monkeypatch, tmp_path: Path) -> Path:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    monkeypatch.setattr(artifacts, "DATA_PROCESSED_DIR", tmp_path / "processed")
+    monkeypatch.setattr(dw, "MANIFEST_PATH", raw_dir / "download_manifest.json")
+    _write_pdf(raw_dir / "a_guideline.pdf", PARAGRAPH)
+    _write_pdf(raw_dir / "b_guideline.pdf", PARAGRAPH + "Second guideline.")
+    return raw_dir
+
+
+def test_cached_chunking_matches_batch_and_only_rechunks_changed_documents(tmp_path: Path):
+    documents = _documents()
+    first = chunk_documents_cached(documents, StageCache(tmp_path / "cache"))
+    assert first == chunk_documents(documents)
+
+    documents[1]["content"] += "\n\nNew inhaler advice."
+    cache = StageCache(tmp_path / "cache")
+    second = chunk_documents_cached(documents, cache)
+
+    assert second == chunk_documents(documents)
+    assert cache.stats["chunk"].reused == 2
+    assert cache.stats["chunk"].recomputed_sources == ["asthma.md"]
+
+
+def test_unchanged_pdfs_are_not_extracted_again(monkeypatch, pdf_dir: Path, tmp_path: Path):
+    first = PDFLoader(pdf_dir).load_all_pdfs(max_workers=1, cache=StageCache(tmp_path / "c"))
+    _write_pdf(pdf_dir / "b_guideline.pdf", PARAGRAPH + "Revised guideline.")
+
+    extracted: list[str] = []
+    original = PDFLoader._extract_document
+
+    def spy(self, pdf_file, config):
+        extracted.append(pdf_file.name)
+        return original(self, pdf_file, config)
+
+    monkeypatch.setattr(PDFLoader, "_extract_document", spy)
+    cache = StageCache(tmp_path / "c")
+    second = PDFLoader(pdf_dir).load_all_pdfs(max_workers=1, cache=cache)
+
+    assert extracted == ["b_guideline.pdf"]
+    assert second[0] == first[0]
+    assert "Revised guideline" in second[1]["pages"][0]["content"]
+    assert cache.stats["parse"].reused == 1
+
+
+def test_dry_run_reports_changed_sources_without_computing(
+    monkeypatch, pdf_dir: Path, tmp_path: Path
+):
+    PDFLoader(pdf_dir).load_all_pdfs(max_workers=1, cache=StageCache(tmp_path / "c"))
+    _write_pdf(pdf_dir / "a_guideline.pdf", PARAGRAPH + "Revised guideline.")
+    monkeypatch.setattr(
+        PDFLoader, "_extract_document", lambda *args: pytest.fail("dry run must not extract")
+    )
+
+    cache = StageCache(tmp_path / "c", dry_run=True)
+    docs = PDFLoader(pdf_dir).load_all_pdfs(max_workers=1, cache=cache)
+    chunk_documents_cached(docs, cache)
+    summary = cache.summary()
+
+    assert [doc["source"] for doc in docs] == ["b_guideline.pdf"]
+    assert summary["parse"]["recomputed_sources"] == ["a_guideline.pdf"]
+    assert summary["chunk"]["recomputed_sources"] == ["b_guideline.pdf", "a_guideline.pdf"]
+    assert summary["embed"]["recomputed_sources"] == ["b_guideline.pdf", "a_guideline.pdf"]
+    assert not list((tmp_path / "c").glob("chunk/*/*.json"))
+
+
+def test_hype_questions_only_generated_for_changed_sources(monkeypatch, tmp_path: Path):
+    requested: list[list[str]] = []
+
+    async def fake_generate(chunks, client, sample_rate, max_chunks, questions_per_chunk):
+        requested.append([chunk["id"] for chunk in chunks])
+        return {chunk["id"]: [f"What about {chunk['id']}?"] for chunk in chunks}
+
+    monkeypatch.setattr(hype, "generate_hype_questions_for_chunks", fake_generate)
+    chunks = chunk_documents(_documents())
+    client = SimpleNamespace(model="qwen-test")
+    options = {"sample_rate": 1.0, "max_chunks": 100, "questions_per_chunk": 1}
+
+    first = asyncio.run(
+        generate_hype_questions_cached(chunks, client, StageCache(tmp_path / "c"), **options)
+    )
+    changed = [
+        {**chunk, "content": chunk["content"] + " Updated."}
+        if chunk["source"] == "gout.md"
+        else chunk
+        for chunk in chunks
+    ]
+    second = asyncio.run(
+        generate_hype_questions_cached(changed, client, StageCache(tmp_path / "c"), **options)
+    )
+
+    gout_ids = [chunk["id"] for chunk in chunks if chunk["source"] == "gout.md"]
+    assert sorted(requested[1]) == sorted(gout_ids)
+    assert second == first
+
+
+def test_hype_sampling_spans_all_sources_when_cached(monkeypatch, tmp_path: Path):
+    async def fake_generate(chunks, client, sample_rate, max_chunks, questions_per_chunk):
+        return {chunk["id"]: ["q"] for chunk in chunks}
+
+    monkeypatch.setattr(hype, "generate_hype_questions_for_chunks", fake_generate)
+    chunks = chunk_documents(_documents())
+    client = SimpleNamespace(model="qwen-test")
+    options = {"sample_rate": 0.3, "max_chunks": 100, "questions_per_chunk": 1}
+    asyncio.run(
+        generate_hype_questions_cached(chunks, client, StageCache(tmp_path / "c"), **options)
+    )
+    changed = [
+        {**chunk, "content": chunk["content"] + " Updated."}
+        if chunk["source"] == "gout.md"
+        else chunk
+        for chunk in chunks
+    ]
+
+    cached = asyncio.run(
+        generate_hype_questions_cached(changed, client, StageCache(tmp_path / "c"), **options)
+    )
+
+    expected = hype._weighted_sample_chunks(changed, 0.3, 100)
+    assert set(cached) == {chunk["id"] for chunk in expected}
+
+
+def test_sources_with_failed_chunks_are_retried(monkeypatch, tmp_path: Path):
+    requested: list[list[str]] = []
+    failing: set[str] = set()
+
+    async def fake_generate(chunks, client, sample_rate, max_chunks, questions_per_chunk):
+        requested.append([chunk["id"] for chunk in chunks])
+        return {chunk["id"]: ["q"] for chunk in chunks if chunk["id"] not in failing}
+
+    monkeypatch.setattr(hype, "generate_hype_questions_for_chunks", fake_generate)
+    chunks = chunk_documents(_documents())
+    gout_ids = [chunk["id"] for chunk in chunks if chunk["source"] == "gout.md"]
+    client = SimpleNamespace(model="qwen-test")
+    options = {"sample_rate": 1.0, "max_chunks": 100, "questions_per_chunk": 1}
+
+    def run() -> dict:
+        return asyncio.run(
+            generate_hype_questions_cached(chunks, client, StageCache(tmp_path / "c"), **options)
+        )
+
+    failing.add(gout_ids[0])
+    run()
+    failing.clear()
+    retried = run()
+    run()
+    monkeypatch.setattr("src.rag.hyde.HYPE_PROMPT_VERSION", 2)
+    run()
+
+    assert sorted(requested[1]) == sorted(gout_ids)
+    assert gout_ids[0] in retried
+    assert requested[2:] == [requested[0]]
+
+
+def test_embedding_round_trip_is_keyed_by_model(tmp_path: Path):
+    cache = StageCache(tmp_path / "c")
+    cache.put_embedding("text-embedding-v4", "abcd1234", [0.25, -1.5, 3.0])
+
+    assert cache.get_embedding("text-embedding-v4", "abcd1234") == [0.25, -1.5, 3.0]
+    assert cache.get_embedding("other/model", "abcd1234") is None
+    assert (
+        StageCache(tmp_path / "c", enabled=False).get_embedding("text-embedding-v4", "abcd1234")
+        is None
+    )
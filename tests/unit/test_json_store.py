@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from src.infra.json_store import JsonEntryStore, read_json, write_json_atomic
+
+
+def test_read_json_falls_back_on_missing_or_corrupt_files(tmp_path: Path):
+    path = tmp_path / "nested" / "cache.json"
+
+    assert read_json(path, {}) == {}
+    write_json_atomic(path, {"version": 1, "value": ["a"]})
+    assert read_json(path) == {"version": 1, "value": ["a"]}
+    assert [p.name for p in path.parent.iterdir()] == ["cache.json"]
+
+    path.write_text("{not json", encoding="utf-8")
+    assert read_json(path, {}) == {}
+
+
+def test_entry_store_only_rewrites_after_changes(tmp_path: Path):
+    path = tmp_path / "entries.json"
+    store = JsonEntryStore(path)
+    store.save()
+    assert not path.exists()
+
+    store.put("k", ["q1"])
+    store.save()
+    mtime = path.stat().st_mtime_ns
+    store.save()
+
+    assert path.stat().st_mtime_ns == mtime
+    reloaded = JsonEntryStore(path)
+    assert reloaded.get("k") == ["q1"]
+    assert len(reloaded) == 1
+
+
+def test_concurrent_entry_stores_merge_on_save(tmp_path: Path):
+    path = tmp_path / "synthetic_questions.json"
+    first = JsonEntryStore(path)
+    second = JsonEntryStore(path)
+
+    first.put("a", "from first")
+    second.put("b", "from second")
+    first.save()
+    second.save()
+
+    assert JsonEntryStore(path).get("a") == "from first"
+    assert JsonEntryStore(path).get("b") == "from second"
+    assert second.get("a") == "from first"
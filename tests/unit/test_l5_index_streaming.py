@@ -0,0 +1,99 @@
+import pytest
+
+from src.config import settings
+from src.evals.checks.l5_index import assess_l5_index_quality
+from src.ingestion.indexing.chroma_store import ChromaVectorStore, read_collection_state
+
+DOCS = [
+    {"id": "pdf1", "content": "LDL cholesterol targets for adults", "source": "lipids.pdf"},
+    {"id": "pdf2", "content": "Statin therapy after myocardial infarction", "source": "lipids.pdf"},
+    {"id": "csv1", "content": "HbA1c reference range", "source": "reference_ranges.csv"},
+]
+
+
+@pytest.fixture
+def make_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings.storage, "chroma_server_host", "")
+    monkeypatch.setattr(settings.storage, "chroma_persist_directory", str(tmp_path / "chroma"))
+
+    def make(name: str) -> ChromaVectorStore:
+        store = ChromaVectorStore(collection_name=name)
+        store._embed_with_stats = lambda texts, batch_size=10: (  # type: ignore[method-assign]
+            [[0.1, 0.2, 0.3] for _ in texts],
+            {},
+        )
+        return store
+
+    return make
+
+
+def test_index_digest_is_incremental_and_order_independent(make_store):
+    forward = make_store("digest_forward")
+    forward.add_documents(DOCS[:2])
+    forward.add_documents(DOCS[2:])
+    backward = make_store("digest_backward")
+    backward.add_documents(list(reversed(DOCS)))
+
+    assert forward.index_digest == backward.index_digest
+    assert make_store("digest_forward").index_digest == forward.index_digest
+    assert make_store("digest_empty").index_digest != forward.index_digest
+
+
+def test_l5_streams_pages_without_the_json_snapshot(make_store, tmp_path):
+    store = make_store("l5_stream")
+    store.set_index_metadata({"index_config_hash": "idx-1", "embedding_model": "demo"})
+    store.add_documents(DOCS)
+
+    report = assess_l5_index_quality(
+        vector_dir=tmp_path / "vectors", vector_store=store, page_size=2
+    )
+    aggregate = report["aggregate"]
+
+    assert aggregate["ids_count"] == aggregate["embeddings_count"] == 3
+    assert aggregate["embedding_dim"] == 3
+    assert aggregate["source_distribution"] == {"lipids.pdf": 2, "reference_ranges.csv": 1}
+    assert aggregate["index_config_hash"] == "idx-1"
+    assert aggregate["index_digest"] == store.index_digest
+    assert aggregate["index_file_size_bytes"] is None
+    assert [record["id"] for record in report["records"]] == ["pdf1", "pdf2", "csv1"]
+
+    metadata_only = assess_l5_index_quality(
+        vector_store=store, check_embeddings=False, page_size=2
+    )["aggregate"]
+    assert metadata_only["embeddings_count"] is None
+    assert metadata_only["lengths_consistent"] is True
+    assert read_collection_state("l5_stream")["count"] == 3
+    assert read_collection_state("missing_collection") is None
+
+
+def test_l5_opens_collections_read_only_and_streams_records(make_store, tmp_path):
+    store = make_store("l5_read_only")
+    store.set_index_metadata({"index_config_hash": "idx-2"})
+    store.add_documents(DOCS)
+    state = read_collection_state("l5_read_only")
+    assert state["index_metadata"] == {"index_config_hash": "idx-2"}
+    assert state["index_digest"] == store.index_digest
+    assert state["content_hashes_count"] == 3
+
+    records_path = tmp_path / "run" / "index_records.jsonl"
+    report = assess_l5_index_quality(
+        collection_name="l5_read_only", page_size=2, records_path=records_path
+    )
+    aggregate = report["aggregate"]
+    assert aggregate["index_digest"] == store.index_digest
+    assert aggregate["content_hashes_count"] == 3
+    assert aggregate["index_config_hash"] == "idx-2"
+    assert aggregate["records_path"] == str(records_path)
+    assert report["records"] == []
+    assert len(records_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    # Indexes written before the digest was persisted are digested while streamed.
+    store._collection.modify(metadata={"index_config_hash": "idx-2"})
+    assert read_collection_state("l5_read_only")["index_digest"] is None
+    legacy = assess_l5_index_quality(collection_name="l5_read_only")["aggregate"]
+    assert legacy["index_digest"] == store.index_digest
+    assert legacy["content_hashes_count"] == 3
+
+    missing = assess_l5_index_quality(collection_name="l5_never_created")
+    assert missing["aggregate"]["index_exists"] is False
+    assert read_collection_state("l5_never_created") is None
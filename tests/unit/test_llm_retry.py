@@ -0,0 +1,234 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from src.infra.llm import retry as retry_module
+from src.infra.llm.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_retryable_error,
+    retry_after_seconds,
+)
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://example.test/v1/chat/completions")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return openai.APIStatusError("upstream error", response=response, body=None)
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("initial_delay", 0.5)
+    kwargs.setdefault("jitter", False)
+    return RetryPolicy(**kwargs)
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [(429, True), (500, True), (503, True), (408, True), (400, False), (401, False), (404, False)],
+)
+def test_is_retryable_error_classifies_status_codes(status, expected):
+    assert is_retryable_error(_status_error(status)) is expected
+
+
+def test_is_retryable_error_handles_connection_and_unknown_errors():
+    request = httpx.Request("POST", "https://example.test")
+    assert is_retryable_error(openai.APIConnectionError(request=request)) is True
+    assert is_retryable_error(ValueError("Empty response")) is True
+    assert is_retryable_error(CircuitOpenError("llm", 1.0)) is False
+
+
+def test_retry_after_seconds_parses_headers():
+    assert retry_after_seconds(_status_error(429, {"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(_status_error(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(_status_error(429)) is None
+    assert retry_after_seconds(ValueError("no response")) is None
+
+
+def test_backoff_delay_honors_retry_after_and_caps():
+    policy = _policy(max_delay=5.0)
+    assert policy.backoff_delay(0) == 0.5
+    assert policy.backoff_delay(2) == 2.0
+    assert policy.backoff_delay(10) == 5.0
+    assert policy.backoff_delay(0, _status_error(429, {"retry-after": "2"})) == 2.0
+    assert policy.backoff_delay(0, _status_error(429, {"retry-after": "60"})) == 5.0
+
+
+def test_backoff_delay_jitter_stays_within_ceiling():
+    policy = _policy(jitter=True)
+    for attempt in range(4):
+        assert 0.0 <= policy.backoff_delay(attempt) <= 0.5 * 2**attempt
+
+
+def test_call_retries_transient_errors(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(retry_module.time, "sleep", sleeps.append)
+    outcomes = [_status_error(503), _status_error(429), "ok"]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert _policy(max_attempts=3).call(flaky) == "ok"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_call_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(retry_module.time, "sleep", lambda _: pytest.fail("must not sleep"))
+    calls = SimpleNamespace(count=0)
+
+    def bad_request():
+        calls.count += 1
+        raise _status_error(400)
+
+    with pytest.raises(openai.APIStatusError):
+        _policy(max_attempts=3).call(bad_request)
+    assert calls.count == 1
+
+
+@pytest.mark.asyncio
+async def test_acall_uses_async_sleep(monkeypatch):
+    monkeypatch.setattr(retry_module.time, "sleep", lambda _: pytest.fail("blocking sleep"))
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+    outcomes = [_status_error(502), "done"]
+
+    async def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert await _policy(max_attempts=2).acall(flaky) == "done"
+    assert sleeps == [0.5]
+
+
+def test_circuit_breaker_opens_and_fails_fast(monkeypatch):
+    monkeypatch.setattr(retry_module.time, "sleep", lambda _: None)
+    breaker = CircuitBreaker(name="test", failure_threshold=2, reset_timeout=60.0)
+    policy = _policy(max_attempts=2, breaker=breaker)
+    calls = SimpleNamespace(count=0)
+
+    def down():
+        calls.count += 1
+        raise _status_error(503)
+
+    with pytest.raises(openai.APIStatusError):
+        policy.call(down)
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        policy.call(down)
+    assert calls.count == 2
+
+
+def test_circuit_breaker_half_open_trial_closes_on_success(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(retry_module.time, "monotonic", lambda: clock.now)
+    breaker = CircuitBreaker(name="test", failure_threshold=1, reset_timeout=10.0)
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 11.0
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_is_released(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(retry_module.time, "monotonic", lambda: clock.now)
+    breaker = CircuitBreaker(name="test", failure_threshold=1, reset_timeout=10.0)
+    policy = _policy(max_attempts=1, breaker=breaker)
+    breaker.record_failure()
+    clock.now += 11.0
+
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    async def ok():
+        return "ok"
+
+    with pytest.raises(asyncio.CancelledError):
+        await policy.acall(cancelled)
+
+    assert breaker.state == "half_open"
+    assert await policy.acall(ok) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_unreleased_half_open_trial_expires_after_reset_timeout(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(retry_module.time, "monotonic", lambda: clock.now)
+    breaker = CircuitBreaker(name="test", failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 11.0
+    breaker.before_call()
+
+    clock.now += 5.0
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now += 5.0
+    breaker.before_call()
+
+
+@pytest.mark.asyncio
+async def test_qwen_stream_does_not_retry_after_first_token(monkeypatch):
+    from src.infra.llm import qwen_client
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    policy = _policy(max_attempts=3, breaker=breaker)
+    monkeypatch.setattr(qwen_client, "get_retry_policy", lambda: policy)
+
+    class _Stream:
+        def __aiter__(self):
+            return self
+
+        def __init__(self):
+            self.sent = False
+
+        async def __anext__(self):
+            if not self.sent:
+                self.sent = True
+                return SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content="Hi"))]
+                )
+            raise _status_error(503)
+
+    calls = SimpleNamespace(count=0)
+
+    async def fake_create(**kwargs):
+        calls.count += 1
+        return _Stream()
+
+    fake_async = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+    )
+    monkeypatch.setattr(qwen_client, "get_openai_client", lambda **_: SimpleNamespace())
+    monkeypatch.setattr(qwen_client, "get_async_openai_client", lambda **_: fake_async)
+    client = qwen_client.QwenClient()
+
+    tokens = []
+    with pytest.raises(openai.APIStatusError):
+        async for token in client.a_generate_stream("q", "ctx"):
+            tokens.append(token)
+
+    assert tokens == ["Hi"]
+    assert calls.count == 1
+    assert breaker.state == "open"
@@ -0,0 +1,98 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pymupdf
+import pytest
+
+from src.ingestion import artifacts
+from src.ingestion.steps import download_web as dw
+from src.ingestion.steps import load_pdfs
+from src.ingestion.steps.load_pdfs import PDFLoader
+
+LONG_TEXT = (
+    "Hypertension management guidance for primary care clinicians.\n"
+    "Measure blood pressure at every visit and confirm elevated readings.\n"
+    "Lifestyle changes include reducing salt intake and regular exercise.\n"
+    "Drug Dose  Frequency  Notes\n"
+    "Amlodipine 5mg  daily  first line\n"
+)
+
+
+def _write_pdf(path: Path, page_texts: list[str]) -> None:
+    doc = pymupdf.open()
+    for text in page_texts:
+        page = doc.new_page()
+        page.insert_text((72, 72), text, fontsize=9)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def pdf_dir(monkeypatch, tmp_path: Path) -> Path:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    monkeypatch.setattr(artifacts, "DATA_PROCESSED_DIR", tmp_path / "processed")
+    monkeypatch.setattr(dw, "MANIFEST_PATH", raw_dir / "download_manifest.json")
+    _write_pdf(raw_dir / "a_guideline.pdf", [LONG_TEXT, "Short", LONG_TEXT])
+    _write_pdf(raw_dir / "b_guideline.pdf", [LONG_TEXT, LONG_TEXT])
+    return raw_dir
+
+
+def test_pdfplumber_only_runs_for_pages_failing_quality_check(monkeypatch, pdf_dir: Path):
+    requested: list[tuple[str, list[int]]] = []
+    original = PDFLoader._extract_pages_with_pdfplumber
+
+    def spy(self, pdf_path, page_numbers):
+        requested.append((pdf_path.name, list(page_numbers)))
+        return original(self, pdf_path, page_numbers)
+
+    monkeypatch.setattr(PDFLoader, "_extract_pages_with_pdfplumber", spy)
+    docs = PDFLoader(pdf_dir).load_all_pdfs(max_workers=1)
+
+    assert requested == [("a_guideline.pdf", [2]), ("b_guideline.pdf", [])]
+    assert [page["extractor"] for page in docs[0]["pages"]] == ["pypdf", "pdfplumber", "pypdf"]
+    timings = docs[0]["metadata"]["timings_ms"]
+    assert {"pypdf", "pdfplumber", "camelot", "blocks", "total"} <= set(timings)
+
+
+def test_camelot_runs_once_per_pdf_for_all_table_pages(monkeypatch, pdf_dir: Path):
+    calls: list[str] = []
+
+    def read_pdf(path, pages, flavor):
+        calls.append(pages)
+        return [
+            SimpleNamespace(page=page, data=[["Drug", "Dose"], ["Amlodipine", "5mg"]])
+            for page in pages.split(",")
+        ]
+
+    monkeypatch.setattr(load_pdfs, "camelot", SimpleNamespace(read_pdf=read_pdf))
+    monkeypatch.setattr(load_pdfs, "_pdf_table_extractor", lambda: "camelot")
+    docs = PDFLoader(pdf_dir).load_all_pdfs(max_workers=1)
+
+    assert calls == ["1,3", "1,2"]
+    assert docs[0]["metadata"]["camelot_table_pages"] == 2
+    assert docs[0]["metadata"]["camelot_calls"] == 1
+    camelot_blocks = [block for block in docs[0]["structured_blocks"] if "camelot" in block["id"]]
+    assert [block["metadata"]["page"] for block in camelot_blocks] == [1, 3]
+
+
+def test_parallel_extraction_matches_sequential_and_writes_run_summary(pdf_dir: Path):
+    sequential = PDFLoader(pdf_dir).load_all_pdfs(max_workers=1)
+    parallel = PDFLoader(pdf_dir).load_all_pdfs(max_workers=2)
+
+    def strip_timings(docs):
+        return [
+            {**doc, "metadata": {k: v for k, v in doc["metadata"].items() if k != "timings_ms"}}
+            for doc in docs
+        ]
+
+    assert strip_timings(parallel) == strip_timings(sequential)
+    summary = artifacts.load_run_summary("pdf")
+    assert summary is not None
+    assert summary["files"] == 2
+    assert summary["workers"] == 2
+    assert summary["pages"] == 5
+    assert summary["files_per_second"] > 0
+    artifact = artifacts.load_source_artifact("pdf", "a_guideline")
+    assert artifact is not None
+    assert "total" in artifact["metadata"]["timings_ms"]
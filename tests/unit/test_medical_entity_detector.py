@@ -0,0 +1,123 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from src.ingestion.steps.chunking.medical_entity_detector import (
+    MedicalEntityDetector,
+    get_medical_entity_detector,
+)
+
+
+class _FakeNLP:
+    def __init__(self):
+        self.calls: list[tuple[list[str], int, int]] = []
+
+    def pipe(self, texts, batch_size, n_process):
+        texts = list(texts)
+        self.calls.append((texts, batch_size, n_process))
+        for text in texts:
+            start = text.find("aspirin")
+            ents = (
+                [
+                    SimpleNamespace(
+                        text="aspirin", label_="DRUG", start_char=start, end_char=start + 7
+                    )
+                ]
+                if start >= 0
+                else []
+            )
+            yield SimpleNamespace(
+                ents=[*ents, SimpleNamespace(text="x", label_="GPE", start_char=0, end_char=1)]
+            )
+
+
+def test_detector_is_shared_per_model():
+    assert get_medical_entity_detector("en_core_web_sm") is get_medical_entity_detector(
+        "en_core_web_sm"
+    )
+
+
+def test_batch_detection_pipes_uncached_texts_once():
+    detector = MedicalEntityDetector(batch_size=8, n_process=4)
+    nlp = _FakeNLP()
+    detector._nlp = nlp
+    texts = ["Give aspirin daily.", "No drugs here.", "Give aspirin daily."]
+
+    batched = detector.detect_entities_batch(texts)
+    single = detector.detect_entities("Give aspirin daily.")
+
+    assert [texts for texts, _, _ in nlp.calls] == [["Give aspirin daily.", "No drugs here."]]
+    assert nlp.calls[0][1:] == (8, 1)
+    assert batched[0] == batched[2] == single
+    assert [entity["label"] for entity in single] == ["DRUG"]
+    assert batched[1] == []
+
+
+def test_large_batches_use_multiple_processes():
+    detector = MedicalEntityDetector(batch_size=2, n_process=3)
+    nlp = _FakeNLP()
+    detector._nlp = nlp
+
+    detector.detect_entities_batch([f"text {index}" for index in range(4)])
+
+    assert nlp.calls[0][2] == 3
+
+
+def test_fallback_patterns_and_cached_results_are_isolated(monkeypatch):
+    detector = MedicalEntityDetector()
+    detector._use_fallback = True
+    calls: list[str] = []
+    original = detector._detect_with_fallback
+
+    def counting(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(detector, "_detect_with_fallback", counting)
+    text = "Patients with hypertension take Amlodipine 5 mg daily."
+
+    first = detector.detect_entities(text)
+    first[0]["label"] = "MUTATED"
+    second = detector.detect_entities(text)
+
+    assert calls == [text]
+    assert {entity["label"] for entity in second} == {"DRUG", "DISEASE"}
+    assert detector.should_keep_together(text)
+
+
+def _default_n_process() -> int:
+    return MedicalEntityDetector().n_process
+
+
+def test_pool_workers_default_to_one_spacy_process():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        in_worker = executor.submit(_default_n_process).result()
+
+    assert in_worker == 1
+    assert MedicalEntityDetector().n_process == (os.cpu_count() or 1)
+
+
+def test_chunk_merging_reuses_one_batched_entity_pass():
+    pytest.importorskip("chonkie")
+    from src.ingestion.steps.chunking.medical_semantic import get_medical_semantic_chunker
+
+    chunker = get_medical_semantic_chunker(chunk_overlap=0)
+    detector = MedicalEntityDetector(batch_size=8, n_process=1)
+    nlp = _FakeNLP()
+    detector._nlp = nlp
+    chunker._entity_detector = detector
+    chunks = [
+        {"id": "d_p1_chunk_0", "content": "Start aspirin"},
+        {"id": "d_p1_chunk_1", "content": "81 mg once."},
+        {"id": "d_p1_chunk_2", "content": "Review in clinic."},
+    ]
+
+    processed = chunker._post_process_chunks(chunks, {}, "")
+
+    assert [chunk["content"] for chunk in processed] == [
+        "Start aspirin 81 mg once.",
+        "Review in clinic.",
+    ]
+    assert [texts for texts, _, _ in nlp.calls] == [[chunk["content"] for chunk in chunks]]
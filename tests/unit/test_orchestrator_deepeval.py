@@ -1,12 +1,21 @@
 """Tests for DeepEval orchestrator integration."""
 
+from pathlib import Path
+
 import pytest
 
 pytestmark = pytest.mark.slow
 
+from src.config import settings
 from src.evals.assessment.orchestrator import run_assessment
 
 
+@pytest.fixture(autouse=True)
+def isolated_chroma(monkeypatch, tmp_path: Path):
+    """Keep the vector index opened by these tests out of ``data/``."""
+    monkeypatch.setattr(settings.storage, "chroma_persist_directory", str(tmp_path / "chroma"))
+
+
 def test_deepeval_import_exists():
     """Test that DeepEval function is importable."""
     from src.evals.assessment.orchestrator import evaluate_answer_quality
@@ -40,7 +49,7 @@ def test_orchestrator_runs_l6_answer_quality_evaluator(tmp_path):
         assess_l2_pdf_quality_fn=lambda: {"aggregate": {}, "records": [], "findings": []},
         assess_l3_chunking_quality_fn=lambda: {"aggregate": {}, "records": [], "findings": []},
         assess_l4_reference_quality_fn=lambda: {"aggregate": {}, "records": [], "findings": []},
-        assess_l5_index_quality_fn=lambda collection_name=None: {
+        assess_l5_index_quality_fn=lambda collection_name=None, records_path=None: {
             "aggregate": {},
             "records": [],
             "findings": [],
@@ -121,6 +130,7 @@ def test_orchestrator_uses_keyword_reingest_when_experiment_config_present(tmp_p
         assess_l2_pdf_quality_fn=lambda: {"aggregate": {}, "records": [], "findings": []},
         assess_l3_chunking_quality_fn=lambda: {"aggregate": {}, "records": [], "findings": []},
         assess_l4_reference_quality_fn=lambda: {"aggregate": {}, "records": [], "findings": []},
+        # Injected checks that predate ``records_path`` keep working.
         assess_l5_index_quality_fn=lambda collection_name=None: {
             "aggregate": {},
             "records": [],
@@ -25,7 +25,7 @@ def test_run_assessment_smoke(monkeypatch, tmp_path: Path):
     monkeypatch.setattr(pa, "assess_l2_pdf_quality", lambda: _fake_step("l2"))
     monkeypatch.setattr(pa, "assess_l3_chunking_quality", lambda: _fake_step("l3"))
     monkeypatch.setattr(pa, "assess_l4_reference_quality", lambda: _fake_step("l4"))
-    monkeypatch.setattr(pa, "assess_l5_index_quality", lambda: _fake_step("l5"))
+    monkeypatch.setattr(pa, "assess_l5_index_quality", lambda **_: _fake_step("l5"))
     monkeypatch.setattr(
         pa,
         "build_retrieval_dataset",
@@ -80,6 +80,7 @@ def test_run_assessment_smoke(monkeypatch, tmp_path: Path):
     assert (result.run_dir / "summary.md").exists()
     assert (result.run_dir / "retrieval_metrics.json").exists()
     assert (tmp_path / "evals" / "latest_run.txt").exists()
+    assert (tmp_path / "evals" / "input_provenance_index.json").exists()
 
 
 def test_artifact_store_uses_unique_run_dirs(tmp_path: Path):
@@ -93,7 +94,7 @@ def test_run_assessment_reuses_matching_completed_run(monkeypatch, tmp_path: Pat
     call_counter = {"steps": 0}
 
     def fake_step(stage: str):
-        def _inner():
+        def _inner(**_):
             call_counter["steps"] += 1
             return {
                 "aggregate": {f"{stage}_ok": True},
@@ -138,7 +139,7 @@ def test_run_assessment_reuses_matching_completed_run(monkeypatch, tmp_path: Pat
     )
     assert call_counter["steps"] == 6
 
-    def should_not_run():
+    def should_not_run(**_):
         raise AssertionError("dedup should have reused the prior completed run")
 
     monkeypatch.setattr(pa, "audit_l0_download", should_not_run)
@@ -200,7 +201,7 @@ def test_run_assessment_ignores_incomplete_matching_run(monkeypatch, tmp_path: P
     monkeypatch.setattr(pa, "assess_l2_pdf_quality", lambda: _fake_step("l2"))
     monkeypatch.setattr(pa, "assess_l3_chunking_quality", lambda: _fake_step("l3"))
     monkeypatch.setattr(pa, "assess_l4_reference_quality", lambda: _fake_step("l4"))
-    monkeypatch.setattr(pa, "assess_l5_index_quality", lambda: _fake_step("l5"))
+    monkeypatch.setattr(pa, "assess_l5_index_quality", lambda **_: _fake_step("l5"))
     monkeypatch.setattr(
         pa,
         "build_retrieval_dataset",
@@ -244,7 +245,7 @@ def test_run_assessment_dedup_invalidates_when_dataset_file_changes(monkeypatch,
     monkeypatch.setattr(pa, "assess_l2_pdf_quality", lambda: _fake_step("l2"))
     monkeypatch.setattr(pa, "assess_l3_chunking_quality", lambda: _fake_step("l3"))
     monkeypatch.setattr(pa, "assess_l4_reference_quality", lambda: _fake_step("l4"))
-    monkeypatch.setattr(pa, "assess_l5_index_quality", lambda: _fake_step("l5"))
+    monkeypatch.setattr(pa, "assess_l5_index_quality", lambda **_: _fake_step("l5"))
     monkeypatch.setattr(
         pa,
         "build_retrieval_dataset",
@@ -1,6 +1,9 @@
 from pathlib import Path
 
+import pytest
+
 from src.evals.dataset_builder import build_retrieval_dataset
+from src.ingestion import artifacts
 from src.ingestion.steps.chunk_text import TextChunker
 from src.ingestion.steps.convert_html import _compute_global_boilerplate_hashes, _fallback_extract
 from src.ingestion.steps.load_pdfs import PDFLoader
@@ -144,6 +147,19 @@ def test_dataset_builder_filters_split_and_label_confidence(tmp_path: Path):
     assert bundle["dataset"][0]["query"] == "Q1"
 
 
+@pytest.mark.asyncio
+async def test_dataset_builder_sync_entry_point_works_inside_a_running_loop(tmp_path: Path):
+    dataset_file = tmp_path / "dataset.json"
+    dataset_file.write_text(
+        '{"golden_queries": [{"query": "Q1", "expected_keywords": ["a"], "expected_sources": ["Lipid"]}]}',
+        encoding="utf-8",
+    )
+
+    bundle = build_retrieval_dataset(dataset_path=dataset_file, enable_llm_generation=False)
+
+    assert [record["query"] for record in bundle["dataset"]] == ["Q1"]
+
+
 def test_pdf_loader_marks_empty_pages_for_ocr(monkeypatch, tmp_path: Path):
     class FakePage:
         def __init__(self, text: str):
@@ -156,8 +172,11 @@ def test_pdf_loader_marks_empty_pages_for_ocr(monkeypatch, tmp_path: Path):
         def __init__(self, _path: str):
             self.pages = [FakePage("")]
 
+    monkeypatch.setattr(artifacts, "DATA_PROCESSED_DIR", tmp_path / "processed")
     monkeypatch.setattr("src.ingestion.steps.load_pdfs.PdfReader", FakeReader)
-    monkeypatch.setattr(PDFLoader, "_extract_with_pdfplumber", lambda self, path: [""])
+    monkeypatch.setattr(
+        PDFLoader, "_extract_pages_with_pdfplumber", lambda self, path, pages: {1: ""}
+    )
     pdf_path = tmp_path / "empty.pdf"
     pdf_path.write_bytes(b"%PDF-1.4\n")
 
@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.evals.artifacts import build_run_identity
+from src.evals.assessment import orchestrator
+from src.evals.assessment import provenance_index as pi
+from src.evals.assessment.reporting import sha256_file
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch):
+    monkeypatch.setattr(pi, "_RACY_WINDOW_NS", -1)
+
+
+def _raw_tree(root: Path) -> Path:
+    raw = root / "raw"
+    (raw / "web" / "nested").mkdir(parents=True)
+    (raw / ".hidden").mkdir()
+    (raw / "elsewhere").mkdir()
+    (raw / "download_manifest.json").write_text('{"records": []}', encoding="utf-8")
+    (raw / "web" / "a.html").write_text("<p>a</p>", encoding="utf-8")
+    (raw / "web" / "nested" / "b.pdf").write_bytes(b"%PDF")
+    (raw / ".hidden" / "c.txt").write_text("c", encoding="utf-8")
+    (raw / "elsewhere" / "target.txt").write_text("t", encoding="utf-8")
+    os.symlink(raw / "elsewhere", raw / "web" / "linked_dir")
+    os.symlink(raw / "elsewhere" / "target.txt", raw / "web" / "linked_file.txt")
+    return raw
+
+
+def _full_provenance(raw: Path) -> dict:
+    return orchestrator._build_input_provenance(
+        dataset_path=None, raw_data_dir=raw, sha256_file_fn=sha256_file
+    )
+
+
+def _indexed_provenance(raw: Path, index_path: Path) -> tuple[dict, pi.ProvenanceIndex]:
+    index = pi.ProvenanceIndex(index_path)
+    provenance = orchestrator._build_input_provenance(
+        dataset_path=None, raw_data_dir=raw, sha256_file_fn=sha256_file, provenance_index=index
+    )
+    index.save()
+    return provenance, index
+
+
+def test_indexed_snapshot_matches_full_walk_and_reuses_digest(tmp_path: Path):
+    raw = _raw_tree(tmp_path)
+    index_path = tmp_path / "index.json"
+
+    first, first_index = _indexed_provenance(raw, index_path)
+    second, second_index = _indexed_provenance(raw, index_path)
+
+    assert first == _full_provenance(raw)
+    assert second == first
+    assert first_index.stats["snapshot_digest_reused"] is False
+    assert second_index.stats["dirs_listed"] == 0
+    assert second_index.stats["snapshot_digest_reused"] is True
+
+
+def test_indexed_snapshot_detects_in_place_and_structural_changes(tmp_path: Path):
+    raw = _raw_tree(tmp_path)
+    index_path = tmp_path / "index.json"
+    before, _ = _indexed_provenance(raw, index_path)
+
+    (raw / "web" / "a.html").write_text("<p>rewritten in place</p>", encoding="utf-8")
+    (raw / "web" / "nested" / "new.pdf").write_bytes(b"%PDF-1.7")
+    (raw / "download_manifest.json").write_text('{"records": [1]}', encoding="utf-8")
+    after, index = _indexed_provenance(raw, index_path)
+
+    assert after == _full_provenance(raw)
+    assert after["raw_data_snapshot_sha256"] != before["raw_data_snapshot_sha256"]
+    assert after["raw_data_snapshot_sha256"] == build_run_identity(
+        config=after["raw_data_snapshot"], git_head=None
+    )
+    assert after["download_manifest_sha256"] == sha256_file(raw / "download_manifest.json")
+    assert index.stats["dirs_listed"] == 1
+
+
+def test_racy_directories_always_recompute_the_digest(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(pi, "_RACY_WINDOW_NS", 10**18)
+    raw = _raw_tree(tmp_path)
+    index_path = tmp_path / "index.json"
+    before, _ = _indexed_provenance(raw, index_path)
+
+    (raw / "web" / "nested" / "new.pdf").write_bytes(b"%PDF-1.7")
+    after, index = _indexed_provenance(raw, index_path)
+
+    assert after == _full_provenance(raw)
+    assert after["raw_data_snapshot_sha256"] != before["raw_data_snapshot_sha256"]
+    assert index.stats["snapshot_digest_reused"] is False
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from src.evals.checks import l2_pdf, l3_chunking
+from src.ingestion import artifacts
+from src.ingestion.quality_stats import cached_quality_stats, source_content_hash
+from src.ingestion.steps import download_web as dw
+from src.ingestion.steps import load_pdfs
+from src.ingestion.steps.load_pdfs import PDFLoader
+
+PAGE_TEXT = (
+    "Hypertension management guidance for primary care clinicians.\n"
+    "Measure blood pressure at every visit and confirm elevated readings.\n"
+    "Lifestyle changes include reducing salt intake and regular exercise.\n"
+)
+
+
+def _write_pdf(path: Path, page_texts: list[str]) -> None:
+    doc = pymupdf.open()
+    for text in page_texts:
+        page = doc.new_page()
+        page.insert_text((72, 72), text, fontsize=9)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def pdf_dir(monkeypatch, tmp_path: Path) -> Path:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    monkeypatch.setattr(artifacts, "DATA_PROCESSED_DIR", tmp_path / "processed")
+    monkeypatch.setattr(dw, "MANIFEST_PATH", raw_dir / "download_manifest.json")
+    monkeypatch.setattr(load_pdfs, "DATA_RAW_DIR", raw_dir)
+    _write_pdf(raw_dir / "a_guideline.pdf", [PAGE_TEXT, PAGE_TEXT * 3])
+    _write_pdf(raw_dir / "b_guideline.pdf", [PAGE_TEXT * 4])
+    return raw_dir
+
+
+def test_l2_cached_page_stats_match_a_fresh_parse(pdf_dir: Path):
+    PDFLoader(pdf_dir).load_all_pdfs(max_workers=1)
+    cached = l2_pdf.assess_l2_pdf_quality(pdf_dir)
+
+    artifact = artifacts.load_source_artifact("pdf", "a_guideline")
+    assert cached_quality_stats(artifact, source_content_hash(pdf_dir / "a_guideline.pdf"))
+    assert cached_quality_stats(artifact, "stale-hash") is None
+
+    for pdf_path in pdf_dir.glob("*.pdf"):
+        target = artifacts.artifact_dir_for("pdf", pdf_path.stem) / "artifact.json"
+        target.unlink()
+    fresh = l2_pdf.assess_l2_pdf_quality(pdf_dir)
+
+    assert cached["aggregate"]["quality_stats_hit_rate"] == 1.0
+    assert fresh["aggregate"]["quality_stats_hit_rate"] == 0.0
+    page_fields = (
+        "page_count",
+        "extracted_page_count",
+        "chars_per_page_median",
+        "chars_per_page_min",
+        "chars_per_page_max",
+        "replacement_char_count",
+    )
+    for record_cached, record_fresh in zip(cached["records"], fresh["records"], strict=True):
+        assert {k: record_cached[k] for k in page_fields} == {
+            k: record_fresh[k] for k in page_fields
+        }
+
+
+def test_l3_reuses_artifacts_and_report_without_writing_them(
+    monkeypatch, pdf_dir: Path, tmp_path: Path
+):
+    cache_dir = tmp_path / "l3_cache"
+    first = l3_chunking.assess_l3_chunking_quality(
+        chunk_size=120, chunk_overlap=20, cache_dir=cache_dir
+    )
+    targets = [
+        artifacts.artifact_dir_for("pdf", pdf_path.stem) / "artifact.json"
+        for pdf_path in sorted(pdf_dir.glob("*.pdf"))
+    ]
+    written = [target.read_bytes() for target in targets]
+
+    def no_extraction(*args, **kwargs):
+        raise AssertionError("PDF re-extracted despite a valid artifact")
+
+    def no_chunking(*args, **kwargs):
+        raise AssertionError("Corpus re-chunked despite a cached report")
+
+    monkeypatch.setattr(PDFLoader, "_extract_document", no_extraction)
+    monkeypatch.setattr(l3_chunking.TextChunker, "chunk_each_document", no_chunking)
+    second = l3_chunking.assess_l3_chunking_quality(
+        chunk_size=120, chunk_overlap=20, cache_dir=cache_dir
+    )
+
+    assert second == first
+    assert first["aggregate"]["chunk_count"] == len(first["records"]) > 0
+    assert [target.read_bytes() for target in targets] == written
+    with pytest.raises(AssertionError, match="re-chunked"):
+        l3_chunking.assess_l3_chunking_quality(
+            chunk_size=200, chunk_overlap=20, cache_dir=cache_dir
+        )
@@ -0,0 +1,120 @@
+from src.evals.assessment.thresholds import (
+    DEFAULT_BENCHMARK_THRESHOLDS,
+    evaluate_benchmark_thresholds,
+    flatten_benchmark_metrics,
+)
+from src.evals.retrieval_benchmark import (
+    BENCHMARK_STAGES,
+    StubOpenAIClient,
+    build_benchmark_corpus,
+    find_baseline_run,
+    load_benchmark_queries,
+    merge_baseline_runs,
+    run_retrieval_benchmark,
+)
+from src.ingestion.timing import collect_stage_timings, stage_timer
+
+
+def _queries() -> list[dict]:
+    return load_benchmark_queries()[:6]
+
+
+def test_stub_services_and_corpus_are_deterministic():
+    client = StubOpenAIClient(embedding_dim=16)
+    first = client.embeddings.create(model="m", input=["LDL target", "gout flare"]).data
+    second = client.embeddings.create(model="m", input=["LDL target"]).data
+
+    assert first[0].embedding == second[0].embedding
+    assert first[0].embedding != first[1].embedding
+    assert abs(sum(value * value for value in first[0].embedding) - 1.0) < 1e-9
+    assert build_benchmark_corpus(_queries(), seed=7) == build_benchmark_corpus(_queries(), seed=7)
+    assert build_benchmark_corpus(_queries(), seed=7) != build_benchmark_corpus(_queries(), seed=8)
+
+
+def test_benchmark_reports_stage_percentiles_and_is_concurrency_invariant():
+    kwargs = {"repeat": 2, "warmup": 1, "documents_per_query": 4}
+    serial = run_retrieval_benchmark(_queries(), concurrency=1, measure_memory=False, **kwargs)
+    concurrent = run_retrieval_benchmark(_queries(), concurrency=3, **kwargs)
+
+    assert concurrent["retrieval_digest"] == serial["retrieval_digest"]
+    assert concurrent["error_rate"] == 0.0
+    assert concurrent["latency_ms"]["total"]["count"] == 12
+    for stage in BENCHMARK_STAGES:
+        summary = concurrent["latency_ms"]["stages"][stage]
+        assert summary["count"] == 12
+        assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+    assert concurrent["throughput_qps"] > 0
+    assert concurrent["peak_memory_mb"] > 0
+    assert serial["peak_memory_mb"] is None
+    assert concurrent["stub_calls"]["embeddings"] > 0
+    assert concurrent["stub_calls"]["chat"] == 0
+
+    metrics = flatten_benchmark_metrics(concurrent)
+    assert set(DEFAULT_BENCHMARK_THRESHOLDS) <= set(metrics)
+    assert find_baseline_run(concurrent, [serial, concurrent]) is concurrent
+    assert evaluate_benchmark_thresholds(concurrent, baseline=concurrent) == []
+
+
+def test_stage_timer_records_only_while_collecting():
+    with stage_timer("prepare"):
+        pass
+    with collect_stage_timings() as stages:
+        with stage_timer("prepare"):
+            pass
+        with stage_timer("prepare"):
+            pass
+    with stage_timer("trace_build"):
+        pass
+
+    assert set(stages) == {"prepare"}
+    assert stages["prepare"] >= 0.0
+
+
+def _report(p95_ms: float, throughput_qps: float, error_rate: float = 0.0) -> dict:
+    return {
+        "latency_ms": {
+            "total": {"p50_ms": 20.0, "p95_ms": p95_ms, "p99_ms": 950.0, "count": 10},
+            "stages": {"rerank_diversify": {"p95_ms": 1.0, "count": 10}},
+        },
+        "throughput_qps": throughput_qps,
+        "peak_memory_mb": 1.5,
+        "error_rate": error_rate,
+    }
+
+
+def test_benchmark_thresholds_gate_ratios_against_the_baseline():
+    baseline = _report(p95_ms=400.0, throughput_qps=10.0)
+    slower = _report(p95_ms=900.0, throughput_qps=5.0, error_rate=0.1)
+
+    failed = evaluate_benchmark_thresholds(slower, baseline=baseline)
+
+    assert [failure["metric"] for failure in failed] == [
+        "retrieval_benchmark.total_p95_ms",
+        "retrieval_benchmark.throughput_qps",
+        "retrieval_benchmark.error_rate",
+    ]
+    assert failed[0]["ratio"] == 2.25
+    assert failed[0]["baseline_value"] == 400.0
+    # Absolute timings alone never fail: without a baseline only errors are gated.
+    assert [f["metric"] for f in evaluate_benchmark_thresholds(slower)] == [
+        "retrieval_benchmark.error_rate"
+    ]
+    assert (
+        evaluate_benchmark_thresholds(_report(p95_ms=450.0, throughput_qps=9.0), baseline=baseline)
+        == []
+    )
+    assert evaluate_benchmark_thresholds(slower, {}, baseline=baseline) == []
+
+
+def test_updating_the_baseline_replaces_only_the_measured_configs():
+    recorded = [
+        {"config": {"concurrency": 1}, "throughput_qps": 10.0},
+        {"config": {"concurrency": 4}, "throughput_qps": 30.0},
+    ]
+    measured = [{"config": {"concurrency": 4}, "throughput_qps": 32.0}]
+
+    merged = merge_baseline_runs(recorded, measured)
+
+    assert find_baseline_run({"config": {"concurrency": 1}}, merged) is recorded[0]
+    assert find_baseline_run({"config": {"concurrency": 4}}, merged) is measured[0]
+    assert len(merged) == 2
@@ -0,0 +1,93 @@
+from src.evals.assessment import retrieval_eval
+from src.rag import runtime
+
+TOPICS = ("ldl", "statin", "gout", "asthma")
+
+
+class StubVectorStore:
+    def __init__(self):
+        self.pool_builds = 0
+
+    def search_hypothetical_questions(self, query: str, *, limit: int = 5) -> list[str]:
+        return []
+
+    def similarity_search_with_trace(self, query: str, top_k: int, search_mode: str):
+        results = []
+        for index in range(top_k + 2):
+            topic = TOPICS[index % len(TOPICS)]
+            score = round(1.0 - index * 0.05, 4)
+            results.append(
+                {
+                    "id": f"{topic}_{index}",
+                    "content": f"{query} {topic} guidance paragraph {index % 3}",
+                    "source": f"{topic}.pdf",
+                    "page": index % 2,
+                    "semantic_score": score,
+                    "keyword_score": score / 2,
+                    "combined_score": score,
+                    "rank": index + 1,
+                }
+            )
+        return results, {"timing_ms": 1, "score_weights": {}}
+
+
+def _install_store(monkeypatch) -> StubVectorStore:
+    store = StubVectorStore()
+    build_pool = runtime._retrieve_candidate_pool
+
+    def counting_build_pool(*args, **kwargs):
+        store.pool_builds += 1
+        return build_pool(*args, **kwargs)
+
+    monkeypatch.setattr(runtime, "initialize_runtime_index", lambda: None)
+    monkeypatch.setattr(runtime, "get_vector_store", lambda: store)
+    monkeypatch.setattr(runtime, "_retrieve_candidate_pool", counting_build_pool)
+    return store
+
+
+def _dataset() -> list[dict]:
+    return [
+        {"query_id": f"q{index}", "query": f"{topic} target", "expected_sources": [topic]}
+        for index, topic in enumerate(TOPICS)
+    ]
+
+
+def test_replayed_candidates_match_full_retrieval(monkeypatch):
+    store = _install_store(monkeypatch)
+    pools: dict = {}
+    for options in (
+        {"enable_diversification": True, "mmr_lambda": 0.5, "max_chunks_per_source": 1},
+        {"enable_diversification": True, "mmr_lambda": 0.9, "max_chunks_per_source": 3},
+        {"enable_diversification": False},
+    ):
+        full_context, full_sources, full_trace = runtime.retrieve_context_with_trace(
+            "ldl target", top_k=3, retrieval_options=options
+        )
+        context, sources, trace = runtime.retrieve_context_with_trace(
+            "ldl target", top_k=3, retrieval_options=options, candidate_pools=pools
+        )
+        assert context == full_context
+        assert sources == full_sources
+        assert trace.retrieval.documents == full_trace.retrieval.documents
+
+    assert len(pools) == 1
+    assert store.pool_builds == 3 + 1
+
+
+def test_diversity_sweep_replay_matches_full_rerun(monkeypatch):
+    store = _install_store(monkeypatch)
+    sweep = {
+        "mmr_lambda_values": [0.5, 0.9],
+        "overfetch_multipliers": [2, 3],
+        "max_chunks_per_source_page_values": [1, 2],
+        "max_chunks_per_source_values": [2],
+    }
+
+    full = retrieval_eval.run_diversity_sweep(_dataset(), 3, replay_candidates=False, **sweep)
+    full_calls = store.pool_builds
+    replayed = retrieval_eval.run_diversity_sweep(_dataset(), 3, **sweep)
+
+    assert replayed == full
+    assert full_calls == 8 * len(TOPICS)
+    # One candidate pool per query and overfetch multiplier.
+    assert store.pool_builds - full_calls == 2 * len(TOPICS)
@@ -1,5 +1,6 @@
 import pytest
 
+from src.config import settings
 from src.ingestion.indexing.search import rank_documents
 from src.ingestion.indexing.vector_store import VectorStore
 from src.rag.diversification import diversify_results
@@ -42,7 +43,8 @@ def testdiversify_results_can_be_disabled():
     assert [r["id"] for r in diversified] == ["a", "b"]
 
 
-def test_search_hypothetical_questions_only_returns_query_relevant_matches():
+def test_search_hypothetical_questions_only_returns_query_relevant_matches(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings.storage, "chroma_persist_directory", str(tmp_path / "chroma"))
     store = VectorStore(collection_name="test_hype_search")
     store.clear()
     store.documents = {
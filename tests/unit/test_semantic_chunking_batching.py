@@ -0,0 +1,211 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("chonkie")
+
+from src.config.context import get_runtime_state
+from src.ingestion.steps.chunking import core, qwen_embedding_wrapper
+from src.ingestion.steps.chunking.chonkie_adapter import ChonkieChunkerAdapter
+from src.ingestion.steps.chunking.core import TextChunker
+from src.ingestion.steps.chunking.qwen_embedding_wrapper import QwenEmbeddings
+
+
+@pytest.fixture
+def api_calls(monkeypatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def fake_embed(texts, batch_size=10, model=None, max_concurrency=1):
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        calls.extend(batches)
+        return [[float(len(text)), 1.0] for text in texts], {"batch_count": len(batches)}
+
+    monkeypatch.setattr(qwen_embedding_wrapper, "embed_texts_with_stats", fake_embed)
+    return calls
+
+
+class _SentenceChunker:
+    """Embeds every sentence like chonkie's SemanticChunker and returns one chunk each."""
+
+    def __init__(self, embedder: QwenEmbeddings):
+        self.embedder = embedder
+
+    def chunk(self, text: str):
+        sentences = [part.strip() + "." for part in text.split(".") if part.strip()]
+        for sentence in sentences:
+            self.embedder.embed(sentence)
+        return [SimpleNamespace(text=sentence, token_count=1) for sentence in sentences]
+
+
+def test_dimension_does_not_call_the_api(api_calls):
+    assert QwenEmbeddings().dimension > 0
+    assert api_calls == []
+
+
+def test_chunk_texts_embeds_windows_in_batches_across_documents(api_calls):
+    adapter = ChonkieChunkerAdapter(strategy="chonkie_semantic", chunk_overlap=0)
+    assert adapter.embedder is not None
+    adapter._chunker = _SentenceChunker(adapter.embedder)
+    items = [
+        (f"Sentence {doc} one. Sentence {doc} two. Shared line.", f"{doc}.md", doc, 1)
+        for doc in ("a", "b", "c", "d")
+    ]
+
+    batched = adapter.chunk_texts(items)
+
+    assert [len(batch) for batch in api_calls] == [9]
+    assert batched == [adapter.chunk_text(*item) for item in items]
+    stats = adapter.last_batch_stats
+    assert stats["unique_embedding_texts"] == 9
+    assert stats["prefetch_api_calls"] == 1
+    assert stats["embedding_api_calls"] == 1
+    assert stats["prefetch_misses"] == 0
+    assert stats["per_document"]["a"] == {
+        "embedding_texts": 3,
+        "fallback_api_calls": 0,
+        "prefetch_misses": 0,
+    }
+
+
+class _SimilarityChunker(_SentenceChunker):
+    """Re-embeds the merged text only when real (non-uniform) vectors come back."""
+
+    def chunk(self, text: str):
+        vector = self.embedder.embed(text)
+        if vector[0] != vector[-1]:
+            self.embedder.embed(f"{text} (merged)")
+        return [SimpleNamespace(text=text, token_count=1)]
+
+
+def test_chunk_texts_counts_windows_missed_by_the_recording_pass(api_calls):
+    adapter = ChonkieChunkerAdapter(strategy="chonkie_semantic", chunk_overlap=0)
+    assert adapter.embedder is not None
+    adapter._chunker = _SimilarityChunker(adapter.embedder)
+
+    adapter.chunk_texts([("Alpha text.", "a.md", "a", 1), ("Beta text.", "b.md", "b", 1)])
+
+    stats = adapter.last_batch_stats
+    assert stats["prefetch_api_calls"] == 1
+    assert stats["prefetch_misses"] == 2
+    assert stats["embedding_api_calls"] == 3
+    assert stats["per_document"]["b"]["prefetch_misses"] == 1
+
+
+def test_chunk_each_document_batches_embedding_strategy_sources(api_calls):
+    configs = {"markdown": {"strategy": "chonkie_semantic", "chunk_size": 333, "chunk_overlap": 0}}
+    base = TextChunker()
+    semantic = base._chunker_for(TextChunker._resolve_config_map(configs)["markdown"])
+    adapter = semantic.chonkie_adapter
+    assert adapter is not None
+    assert adapter.embedder is not None
+    adapter._chunker = _SentenceChunker(adapter.embedder)
+    documents = [
+        {"id": "a", "source": "a.md", "content": "Alpha one. Alpha two.", "metadata": {}},
+        {"id": "g", "source": "g.pdf", "pages": [{"page": 1, "content": "Guideline text."}]},
+        {"id": "b", "source": "b.md", "content": "Beta one. Alpha two.", "metadata": {}},
+    ]
+
+    try:
+        grouped = base.chunk_each_document(documents, source_chunk_configs=configs)
+    finally:
+        core.chunker_for_config.cache_clear()
+
+    assert [[chunk["content"] for chunk in doc_chunks] for doc_chunks in grouped] == [
+        ["Alpha one.", "Alpha two."],
+        ["Guideline text."],
+        ["Beta one.", "Alpha two."],
+    ]
+    assert [len(batch) for batch in api_calls] == [3]
+    stats = base.last_chunking_stats
+    assert stats["documents"] == 3
+    assert stats["embedding_documents"] == 2
+    assert stats["embedding_batches"] == 1
+    assert stats["embedding_api_calls"] == 1
+    assert stats["prefetch_misses"] == 0
+
+
+def test_batched_embedding_chunks_match_per_document_chunking(api_calls, monkeypatch):
+    monkeypatch.setattr(get_runtime_state(), "structured_chunking_enabled", True)
+    configs = {"pdf": {"strategy": "chonkie_semantic", "chunk_overlap": 0, "min_chunk_size": 5}}
+    cfg_map = TextChunker._resolve_config_map(configs)
+    base = TextChunker()
+    semantic = base._chunker_for(cfg_map["pdf"])
+    adapter = semantic.chonkie_adapter
+    assert adapter is not None
+    assert adapter.embedder is not None
+    adapter._chunker = _SentenceChunker(adapter.embedder)
+    document = {
+        "id": "g",
+        "source": "g.pdf",
+        "metadata": {"logical_name": "Lipids", "source_url": "https://example.test/g"},
+        "pages": [
+            {"page": 1, "content": "Statins lower LDL. Review at six weeks.", "extractor": "pdf"},
+            {
+                "page": 2,
+                "content": "unused page text",
+                "structured_blocks": [
+                    {
+                        "id": "b1",
+                        "block_type": "paragraph",
+                        "text": "Start metformin first. Titrate monthly.",
+                        "section_path": ["Diabetes", "Treatment"],
+                        "metadata": {"page": 2, "extractor": "docling"},
+                    },
+                    {
+                        "id": "b2",
+                        "block_type": "table",
+                        "text": "| Drug | Dose |\n| --- | --- |\n| Metformin | 500 mg |",
+                        "section_path": ["Diabetes", "Doses"],
+                        "metadata": {"page": 2},
+                    },
+                ],
+            },
+        ],
+    }
+
+    try:
+        unbatched = base._chunk_document(document, cfg_map, structured=True)
+        api_calls.clear()
+        (batched,) = base.chunk_each_document([document], source_chunk_configs=configs)
+    finally:
+        core.chunker_for_config.cache_clear()
+
+    assert batched == unbatched
+    assert [len(batch) for batch in api_calls] == [4]
+    by_content = {chunk["content"]: chunk for chunk in batched}
+    assert set(by_content) >= {"Review at six weeks.", "Titrate monthly."}
+    page_chunk = by_content["Review at six weeks."]
+    assert (page_chunk["start_char"], page_chunk["end_char"]) == (19, 39)
+    assert page_chunk["extractor"] == "pdf"
+    assert page_chunk["quality_score"] == 0.8
+    assert page_chunk["metadata"] == document["metadata"]
+    block_chunk = by_content["Titrate monthly."]
+    assert block_chunk["section_path"] == ["Diabetes", "Treatment"]
+    assert block_chunk["parent_block_ids"] == ["b1"]
+    assert block_chunk["extractor"] == "docling"
+    assert [chunk["content_type"] for chunk in batched].count("table") == 1
+
+
+def test_batches_without_page_text_are_not_dispatched(api_calls, monkeypatch):
+    configs = {"pdf": {"strategy": "chonkie_semantic", "chunk_overlap": 0}}
+    base = TextChunker()
+    semantic = base._chunker_for(TextChunker._resolve_config_map(configs)["pdf"])
+    semantic.last_chunking_stats = {"embedding_api_calls": 5}
+
+    def no_dispatch(documents):
+        raise AssertionError("an empty batch was dispatched")
+
+    monkeypatch.setattr(semantic, "chunk_texts", no_dispatch)
+    documents = [
+        {"id": "e", "source": "e.pdf", "pages": [{"page": 1, "content": "   "}]},
+        {"id": "f", "source": "f.pdf", "pages": []},
+    ]
+
+    try:
+        grouped = base.chunk_each_document(documents, source_chunk_configs=configs)
+    finally:
+        core.chunker_for_config.cache_clear()
+
+    assert grouped == [[], []]
+    assert api_calls == []
+    assert base.last_chunking_stats["embedding_api_calls"] == 0
@@ -0,0 +1,132 @@
+import asyncio
+import contextvars
+import json
+
+import pytest
+
+from src.app.schemas.chat import ChatSource
+from src.app.streaming import coalesce_token_stream, encode_sse_event
+from src.ingestion.timing import collect_stage_timings, stage_timer
+
+_request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_id", default=None)
+
+
+async def _events(items, delay: float = 0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+def _tokens(*values: str):
+    return [(value, {"done": False}) for value in values]
+
+
+def test_encode_sse_event_frames_compact_json():
+    frame = encode_sse_event({"content": "héllo", "done": False})
+
+    assert frame.startswith(b"data: ")
+    assert frame.endswith(b"\n\n")
+    assert json.loads(frame[len(b"data: ") : -2]) == {"content": "héllo", "done": False}
+
+
+def test_encode_sse_event_serializes_pydantic_models():
+    source = ChatSource(canonical_label="a", display_label="a", label="a", source="a.pdf")
+    frame = encode_sse_event({"sources": [source]})
+
+    assert json.loads(frame[len(b"data: ") : -2])["sources"][0]["source"] == "a.pdf"
+
+
+def test_encode_sse_event_names_event_when_requested():
+    frame = encode_sse_event({"sources": []}, event="sources")
+
+    assert frame.startswith(b"event: sources\ndata: ")
+    assert json.loads(frame.split(b"data: ", 1)[1][:-2]) == {"sources": []}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_fast_tokens_and_flushes_before_terminal_event():
+    items = [*_tokens("Hel", "lo", " wor", "ld"), ("", {"done": True, "sources": []})]
+
+    result = await _collect(coalesce_token_stream(_events(items), window_ms=1000, max_chars=512))
+
+    assert result == [("Hello world", {"done": False}), ("", {"done": True, "sources": []})]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_on_size_limit():
+    result = await _collect(
+        coalesce_token_stream(_events(_tokens("ab", "cd", "ef")), window_ms=1000, max_chars=4)
+    )
+
+    assert result == [("abcd", {"done": False}), ("ef", {"done": False})]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_when_window_elapses_during_stall():
+    async def stalled():
+        yield ("first", {"done": False})
+        await asyncio.sleep(0.2)
+        yield ("second", {"done": False})
+
+    stream = coalesce_token_stream(stalled(), window_ms=20, max_chars=512)
+    first = await asyncio.wait_for(anext(stream), timeout=0.1)
+    rest = await _collect(stream)
+
+    assert first == ("first", {"done": False})
+    assert rest == [("second", {"done": False})]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_zero_window_passes_events_through():
+    items = _tokens("a", "b")
+
+    result = await _collect(coalesce_token_stream(_events(items), window_ms=0, max_chars=512))
+
+    assert result == items
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_buffer_before_reraising():
+    async def failing():
+        yield ("partial", {"done": False})
+        raise RuntimeError("boom")
+
+    stream = coalesce_token_stream(failing(), window_ms=1000, max_chars=512)
+
+    assert await anext(stream) == ("partial", {"done": False})
+    with pytest.raises(RuntimeError, match="boom"):
+        await anext(stream)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_passes_early_sources_event_ahead_of_tokens():
+    items = [("", {"done": False, "sources": ["s"]}), *_tokens("a", "b")]
+
+    result = await _collect(coalesce_token_stream(_events(items), window_ms=1000, max_chars=512))
+
+    assert result == [("", {"done": False, "sources": ["s"]}), ("ab", {"done": False})]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_runs_the_stream_in_the_callers_context():
+    recorded: dict[str, float] = {}
+
+    async def timed_stream():
+        with collect_stage_timings() as timings:
+            yield (_request_id.get() or "", {"done": False})
+            await asyncio.sleep(0)
+            with stage_timer("generation"):
+                yield ("b", {"done": False})
+        recorded.update(timings)
+        yield ("", {"done": True})
+
+    _request_id.set("req-1")
+    result = await _collect(coalesce_token_stream(timed_stream(), window_ms=1000, max_chars=512))
+
+    assert result == [("req-1b", {"done": False}), ("", {"done": True})]
+    assert set(recorded) == {"generation"}
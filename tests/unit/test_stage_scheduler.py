@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.config.context import get_runtime_state
+from src.evals.assessment.stage_scheduler import Stage, run_stages
+
+
+def _report(name: str) -> dict:
+    return {"aggregate": {"stage": name, "pid": os.getpid()}, "findings": []}
+
+
+def _report_structured_chunking() -> dict:
+    return {"aggregate": {"structured": get_runtime_state().structured_chunking_enabled}}
+
+
+def _count_chroma_records(path: str) -> dict:
+    import chromadb
+
+    collection = chromadb.PersistentClient(path=path).get_collection("scheduler")
+    return {"aggregate": {"records": collection.count()}}
+
+
+def _report_from_subprocess() -> dict:
+    subprocess.run([sys.executable, "-c", "sum(range(10_000_000))"], check=True)
+    return {"aggregate": {}}
+
+
+def test_cpu_time_includes_child_processes():
+    stages = [Stage("child", _report_from_subprocess), Stage("l0", _report, {"name": "l0"})]
+
+    _, inline = run_stages(stages, max_workers=1)
+    _, pooled = run_stages(stages, max_workers=2)
+
+    assert pooled["child"].executor == "process"
+    assert inline["child"].cpu_seconds >= 0.1
+    assert pooled["child"].cpu_seconds >= 0.1
+
+
+def test_independent_stages_match_serial_results():
+    stages = [Stage(f"l{index}", _report, kwargs={"name": f"l{index}"}) for index in range(4)]
+
+    serial, serial_timings = run_stages(stages, max_workers=1)
+    parallel, timings = run_stages(stages, max_workers=2)
+
+    strip = {name: result["aggregate"]["stage"] for name, result in parallel.items()}
+    assert list(parallel) == ["l0", "l1", "l2", "l3"]
+    assert strip == {name: result["aggregate"]["stage"] for name, result in serial.items()}
+    assert {timing.executor for timing in timings.values()} == {"process"}
+    assert {timing.executor for timing in serial_timings.values()} == {"inline"}
+    assert all(timing.cpu_seconds >= 0 for timing in timings.values())
+
+
+def test_dependencies_run_after_their_prerequisites():
+    finished: list[str] = []
+
+    def step(name: str, delay: float):
+        def run() -> dict:
+            time.sleep(delay)
+            finished.append(name)
+            return {"aggregate": {}}
+
+        return run
+
+    results, _ = run_stages(
+        [
+            Stage("slow", step("slow", 0.05)),
+            Stage("after_slow", step("after_slow", 0.0), depends_on=("slow",)),
+            Stage("fast", step("fast", 0.0)),
+        ],
+        max_workers=3,
+    )
+
+    assert list(results) == ["slow", "after_slow", "fast"]
+    assert finished.index("after_slow") > finished.index("slow")
+
+
+def test_worker_processes_see_parent_runtime_state():
+    state = get_runtime_state()
+    previous = state.structured_chunking_enabled
+    state.structured_chunking_enabled = not previous
+    try:
+        results, timings = run_stages(
+            [Stage("l3", _report_structured_chunking), Stage("l0", _report, {"name": "l0"})],
+            max_workers=2,
+        )
+    finally:
+        state.structured_chunking_enabled = previous
+
+    assert timings["l3"].executor == "process"
+    assert results["l3"]["aggregate"]["structured"] is (not previous)
+
+
+def test_process_stages_do_not_inherit_an_open_chroma_client(tmp_path):
+    chromadb = pytest.importorskip("chromadb")
+    client = chromadb.PersistentClient(path=str(tmp_path))
+    client.get_or_create_collection("scheduler").upsert(
+        ids=["a", "b"], documents=["alpha", "beta"], embeddings=[[0.1, 0.2], [0.3, 0.4]]
+    )
+
+    results, timings = run_stages(
+        [
+            Stage("l5", _count_chroma_records, {"path": str(tmp_path)}),
+            Stage("l0", _report, {"name": "l0"}),
+        ],
+        max_workers=2,
+    )
+
+    assert timings["l5"].executor == "process"
+    assert results["l5"]["aggregate"]["records"] == 2
+
+
+def test_cycles_and_failures_are_reported():
+    with pytest.raises(ValueError, match="cycle"):
+        run_stages(
+            [
+                Stage("a", dict, depends_on=("b",)),
+                Stage("b", dict, depends_on=("a",)),
+            ]
+        )
+
+    def boom() -> dict:
+        raise RuntimeError("index missing")
+
+    with pytest.raises(RuntimeError, match="index missing"):
+        run_stages([Stage("l5", boom), Stage("l0", dict)], max_workers=2)
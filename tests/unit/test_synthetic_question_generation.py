@@ -0,0 +1,200 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.config import settings
+from src.evals import dataset_builder, synthetic_questions
+from src.infra.llm.retry import RetryPolicy
+
+LABELS = ["alpha", "beta", "gamma", "gamma", "delta"]
+
+
+class FakeLLMServer:
+    """OpenAI-compatible chat endpoint answering from the prompt's context."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.failures: dict[str, list[int]] = {}
+        self.overrides: dict[str, dict] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["messages"][0]["content"]
+                label = re.search(r"Topic (\w+) patients", prompt).group(1)
+                with server._lock:
+                    server.requests.append(label)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    planned = server.failures.get(label) or []
+                    status = planned.pop(0) if planned else 200
+                time.sleep(0.05)
+                with server._lock:
+                    server.in_flight -= 1
+                if status != 200:
+                    self._send(status, {"error": {"message": "upstream failure"}})
+                    return
+                evidence = f"Topic {label} patients should reduce salt intake"
+                item = {
+                    "question": f"Which lifestyle change is recommended for topic {label}?",
+                    "evidence_span": evidence,
+                    "answer_summary": "reduce salt intake",
+                    "expected_keywords": ["salt"],
+                    **server.overrides.get(label, {}),
+                }
+                self._send(
+                    200,
+                    {
+                        "id": "cmpl-1",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": json.dumps(item)},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    },
+                )
+
+            def _send(self, status: int, payload: dict) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    chunks = [
+        {
+            "id": f"chunk_{i}",
+            "source": "guideline.pdf",
+            "page": 1,
+            "content_type": "paragraph",
+            "content": f"Topic {label} patients should reduce salt intake. Note {i}.",
+        }
+        for i, label in enumerate(LABELS)
+    ]
+    monkeypatch.setattr(dataset_builder, "_sample_candidate_docs", lambda *args: chunks)
+    monkeypatch.setattr(
+        synthetic_questions,
+        "get_retry_policy",
+        lambda: RetryPolicy(max_attempts=3, initial_delay=0.0, jitter=False),
+    )
+    monkeypatch.setattr(settings.llm, "dashscope_api_key", "fake-key")
+    monkeypatch.setattr(settings.deepeval, "synthetic_generation_concurrency", 2)
+    with FakeLLMServer() as server:
+        monkeypatch.setattr(settings.llm, "qwen_base_url", server.base_url)
+        yield server
+
+
+async def _generate_async(checkpoint_path):
+    return await dataset_builder._try_generate_synthetic_questions_async(
+        max_synthetic_questions=len(LABELS),
+        sample_docs_per_source_type=10,
+        seed=42,
+        checkpoint_path=checkpoint_path,
+    )
+
+
+def _generate(checkpoint_path):
+    return asyncio.run(_generate_async(checkpoint_path))
+
+
+def test_generation_is_concurrent_retried_and_deduplicated(fake_llm, tmp_path):
+    fake_llm.failures = {"beta": [503], "delta": [400]}
+
+    accepted, attempts = _generate(tmp_path / "checkpoint.json")
+
+    assert [record["query_id"] for record in accepted] == [
+        "synthetic_1",
+        "synthetic_2",
+        "synthetic_3",
+    ]
+    assert [attempt["status"] for attempt in attempts] == [
+        "accepted",
+        "accepted",
+        "accepted",
+        "rejected",
+        "error",
+    ]
+    assert attempts[3]["error"] == "near_duplicate_question"
+    assert sorted(fake_llm.requests) == sorted([*LABELS, "beta"])
+    assert 1 < fake_llm.max_in_flight <= 2
+
+
+def test_resume_only_requests_prompts_missing_from_checkpoint(fake_llm, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    fake_llm.failures = {"delta": [400]}
+    first_accepted, _ = _generate(checkpoint_path)
+    fake_llm.requests.clear()
+
+    accepted, attempts = _generate(checkpoint_path)
+
+    assert fake_llm.requests == ["delta"]
+    assert accepted[:3] == first_accepted
+    assert [record["query_id"] for record in accepted] == [
+        "synthetic_1",
+        "synthetic_2",
+        "synthetic_3",
+        "synthetic_5",
+    ]
+    assert [attempt.get("from_checkpoint", False) for attempt in attempts] == [
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_wrongly_typed_fields_fail_only_their_attempt(fake_llm, tmp_path):
+    fake_llm.overrides = {
+        "alpha": {"expected_keywords": None},
+        "beta": {"question": ["not", "a", "string"]},
+    }
+
+    async def inside_running_loop():
+        return await _generate_async(tmp_path / "checkpoint.json")
+
+    accepted, attempts = asyncio.run(inside_running_loop())
+
+    assert [attempt["status"] for attempt in attempts] == [
+        "error",
+        "error",
+        "accepted",
+        "rejected",
+        "accepted",
+    ]
+    assert "expected_keywords" in attempts[0]["error"]
+    assert "question" in attempts[1]["error"]
+    assert [record["query_id"] for record in accepted] == ["synthetic_3", "synthetic_5"]